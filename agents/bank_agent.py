@@ -3,6 +3,7 @@
 """
 
 from .base_agent import BaseAgent
+from utils.profiler import profiled
 
 class BankAgent(BaseAgent):
     """금융사 (은행) 에이전트"""
@@ -11,6 +12,7 @@ class BankAgent(BaseAgent):
         super().__init__("금융사", "PF팀", use_llm)
         self.risk_threshold = 0.20
     
+    @profiled('agent.respond.bank')
     def respond(self, issue, project, impact_result=None):
         """이슈에 대한 금융사 응답"""
         
@@ -24,7 +26,7 @@ class BankAgent(BaseAgent):
     def _monitoring_response(self, issue, project):
         """모니터링 응답"""
         if self.use_llm:
-            system_prompt = """당신은 청담동 근린생활시설 신축공사의 금융사(PF팀)입니다.
+            system_prompt = """당신은 이 프로젝트의 금융사(PF팀)입니다.
 
 역할:
 - PF 대출 관리 (대출액 14억)
@@ -39,14 +41,13 @@ class BankAgent(BaseAgent):
 말투:
 - 전문적이고 신중하게
 - 재무적 관점 강조
-- 2-3문장으로 간결하게
 
 반드시 "[금융사]"로 시작하세요."""
 
             user_message = self._build_context_message(issue, project)
             user_message += "\n\n이슈가 발생했습니다. 금융사 PF팀으로서 리스크 모니터링 의견을 제시하세요."
 
-            llm_response = self._generate_llm_response(system_prompt, user_message)
+            llm_response = self._generate_llm_response(system_prompt, user_message, issue=issue, project=project)
 
             if llm_response and llm_response.startswith('[금융사]'):
                 return llm_response
@@ -57,7 +58,7 @@ class BankAgent(BaseAgent):
     def _risk_assessment_response(self, issue, project, impact_result):
         """리스크 평가 응답"""
         if self.use_llm:
-            system_prompt = """당신은 청담동 근린생활시설 신축공사의 금융사(PF팀)입니다.
+            system_prompt = """당신은 이 프로젝트의 금융사(PF팀)입니다.
 
 역할:
 - 최종 리스크 평가 및 대출 조건 결정
@@ -73,7 +74,6 @@ class BankAgent(BaseAgent):
 말투:
 - 금융 전문 용어 사용
 - 구체적 수치 언급
-- 2-3문장으로 간결하게
 
 반드시 "[금융사]"로 시작하세요."""
 
@@ -86,7 +86,7 @@ class BankAgent(BaseAgent):
             user_message += f"- 현재 금리: {project.current_interest_rate*100:.2f}%\n"
             user_message += "\n금융사로서 최종 리스크 평가 및 대출 조건 결정을 내리세요."
 
-            llm_response = self._generate_llm_response(system_prompt, user_message)
+            llm_response = self._generate_llm_response(system_prompt, user_message, issue=issue, project=project)
 
             if llm_response and llm_response.startswith('[금융사]'):
                 return llm_response
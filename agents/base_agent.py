@@ -3,6 +3,20 @@
 """
 
 from utils.llm_client import LLMClient
+from utils.llm_usage import usage_tracker
+from utils.response_reuse import response_cache
+
+
+# 모든 에이전트 호출에 공통인 시스템 프롬프트 앞부분
+# (이슈별로 동일한 프로젝트/이슈 정보와 함께 고정 접두부를 이루어 프롬프트 캐시 재사용)
+SHARED_PREAMBLE = """건설 프로젝트 이슈 대응 회의입니다.
+참석자: 건축주(발주자), 설계사(설계팀), 시공사(현장소장), 감리사(감리팀), 금융사(PF팀)
+
+공통 규칙:
+- 자신의 역할 관점에서만 발언
+- 아래 프로젝트/이슈 정보와 제공된 수치만 사용
+- 2-3문장으로 간결하게
+- 발언은 자신의 역할 태그(예: "[건축주]")로 시작"""
 
 
 class BaseAgent:
@@ -13,6 +27,8 @@ class BaseAgent:
         self.role = role
         self.use_llm = use_llm
         self.conversation_history = []
+        self.meeting_context = ""  # 회의 중 앞선 발언 (MeetingCoordinator가 설정)
+        self.batch_slot = None     # 배치 모드 발언 자리 (수집기, 키) - MeetingCoordinator가 설정
 
         if self.use_llm:
             try:
@@ -34,31 +50,71 @@ class BaseAgent:
         })
         return message
 
-    def _generate_llm_response(self, system_prompt, user_message, temperature=None):
-        """LLM을 통한 응답 생성"""
+    def _generate_llm_response(self, system_prompt, user_message, temperature=None, issue=None, project=None):
+        """
+        LLM을 통한 응답 생성
+
+        issue/project가 주어지면 메시지를 [공통 접두부(공통 규칙 + 프로젝트/이슈), 에이전트 역할,
+        변동분(영향 분석, 이전 발언, 지시)] 순으로 구성해 같은 이슈의 호출끼리 접두부를 공유
+
+        "[에이전트명]"으로 시작하지 않는 응답(실패 메시지 포함)은 None을 반환하고
+        기본 템플릿 대체로 집계
+
+        배치 모드(batch_slot 설정)에서는 요청만 수집기에 넣고 None을 반환해
+        템플릿 문장으로 진행 (배치 결과는 회의 종료 후 키로 반영)
+        """
         if not self.use_llm:
             return None
 
+        if issue is not None and project is not None:
+            messages = [
+                {"role": "system", "content": self._build_shared_prefix(issue, project)},
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message.strip()}
+            ]
+        else:
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message}
+            ]
+
+        if self.batch_slot is not None:
+            collector, key = self.batch_slot
+            collector.add(key, messages, temperature, self.name)
+            return None
+
+        # 선택: 유사 프롬프트 응답 재사용 (response_cache.enable() 시)
+        issue_id = issue['id'] if issue is not None else None
+        bim_enabled = project.bim_enabled if project is not None else None
+        reused = response_cache.lookup(self.name, issue_id, bim_enabled, messages)
+        if reused is not None:
+            return reused
+
         try:
-            response = self.llm_client.generate_response(
-                system_prompt,
-                user_message,
-                temperature
+            response = self.llm_client.generate_with_context(
+                messages[0]['content'], messages[1:], temperature, agent=self.name,
+                expected_prefix=f"[{self.name}]"
             )
-            return response
         except Exception as e:
             print(f"[{self.name}] LLM 응답 실패: {e}")
+            response = None
+
+        if not response or not response.startswith(f"[{self.name}]"):
+            usage_tracker.record_fallback(self.name)
             return None
 
-    def _build_context_message(self, issue, project, impact_result=None):
-        """컨텍스트 메시지 생성"""
-        context = f"""
+        response_cache.store(self.name, issue_id, bim_enabled, messages, response)
+        return response
+
+    @staticmethod
+    def _build_shared_prefix(issue, project):
+        """공통 접두부 (같은 이슈의 회의 호출 10건에서 동일)"""
+        return f"""{SHARED_PREAMBLE}
+
 ## 프로젝트 정보
 - 이름: {project.name}
 - 연면적: {project.gfa}㎡
 - 예산: {project.budget:,}원
-- 현재 단계: {project.current_phase}
-- 현재 일자: Day {project.current_day}
 - BIM 적용: {'ON' if project.bim_enabled else 'OFF'}
 
 ## 발생 이슈
@@ -67,7 +123,16 @@ class BaseAgent:
 - 카테고리: {issue['category']}
 - 심각도: {issue['severity']}
 - 설명: {issue['description']}
-"""
+- 현재 단계: {project.current_phase}
+- 현재 일자: Day {project.current_day}"""
+
+    def _build_context_message(self, issue, project, impact_result=None):
+        """
+        변동분 메시지 생성 (영향 분석, 금융 영향, 회의 중 앞선 발언)
+
+        프로젝트/이슈 정보는 공통 접두부(_build_shared_prefix)에 포함
+        """
+        context = ""
 
         if impact_result:
             context += f"""
@@ -90,4 +155,7 @@ class BaseAgent:
 - 금리 인상: +{fc['rate_increase_bp']}bp
 """
 
+        if self.meeting_context:
+            context += self.meeting_context
+
         return context.strip()
\ No newline at end of file
@@ -3,6 +3,7 @@
 """
 
 from .base_agent import BaseAgent
+from utils.profiler import profiled
 
 class ContractorAgent(BaseAgent):
     """시공사 (현장 소장) 에이전트"""
@@ -10,6 +11,7 @@ class ContractorAgent(BaseAgent):
     def __init__(self, use_llm=True):
         super().__init__("시공사", "현장소장", use_llm)
     
+    @profiled('agent.respond.contractor')
     def respond(self, issue, project, impact_result=None):
         """이슈에 대한 시공사 응답"""
         
@@ -23,7 +25,7 @@ class ContractorAgent(BaseAgent):
     def _report_response(self, issue, project):
         """문제 보고 응답"""
         if self.use_llm:
-            system_prompt = """당신은 청담동 근린생활시설 신축공사의 시공사(현장소장)입니다.
+            system_prompt = """당신은 이 프로젝트의 시공사(현장소장)입니다.
 
 역할:
 - 현장 시공 책임자
@@ -38,14 +40,13 @@ class ContractorAgent(BaseAgent):
 말투:
 - 직설적이고 명확하게
 - 현장 용어 사용
-- 2-3문장으로 간결하게
 
 반드시 "[시공사]"로 시작하세요."""
 
             user_message = self._build_context_message(issue, project)
             user_message += "\n\n현장에서 위 이슈가 발생했습니다. 시공사 현장소장으로서 상황을 보고하세요."
 
-            llm_response = self._generate_llm_response(system_prompt, user_message)
+            llm_response = self._generate_llm_response(system_prompt, user_message, issue=issue, project=project)
 
             if llm_response and llm_response.startswith('[시공사]'):
                 return llm_response
@@ -65,7 +66,7 @@ class ContractorAgent(BaseAgent):
     def _execution_response(self, issue, project, impact_result):
         """실행 계획 응답"""
         if self.use_llm:
-            system_prompt = """당신은 청담동 근린생활시설 신축공사의 시공사(현장소장)입니다.
+            system_prompt = """당신은 이 프로젝트의 시공사(현장소장)입니다.
 
 역할:
 - 실행 계획 수립 및 자원 배치
@@ -81,14 +82,13 @@ class ContractorAgent(BaseAgent):
 말투:
 - 실행 가능한 방안 제시
 - 공기와 비용 명시
-- 2-3문장으로 간결하게
 
 반드시 "[시공사]"로 시작하세요."""
 
             user_message = self._build_context_message(issue, project, impact_result)
             user_message += "\n\n영향 분석이 완료되었습니다. 시공사로서 실행 계획을 제시하세요."
 
-            llm_response = self._generate_llm_response(system_prompt, user_message)
+            llm_response = self._generate_llm_response(system_prompt, user_message, issue=issue, project=project)
 
             if llm_response and llm_response.startswith('[시공사]'):
                 return llm_response
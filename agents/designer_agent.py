@@ -3,6 +3,7 @@
 """
 
 from .base_agent import BaseAgent
+from utils.profiler import profiled
 
 
 class DesignerAgent(BaseAgent):
@@ -11,6 +12,7 @@ class DesignerAgent(BaseAgent):
     def __init__(self, use_llm=True):
         super().__init__("설계사", "설계팀", use_llm)
 
+    @profiled('agent.respond.designer')
     def respond(self, issue, project, impact_result=None):
         """이슈에 대한 설계사 응답"""
 
@@ -24,7 +26,7 @@ class DesignerAgent(BaseAgent):
     def _analysis_response(self, issue, project):
         """원인 분석 응답"""
         if self.use_llm:
-            system_prompt = """당신은 청담동 근린생활시설 신축공사의 설계사(설계팀)입니다.
+            system_prompt = """당신은 이 프로젝트의 설계사(설계팀)입니다.
 
 역할:
 - 건축 설계 및 기술적 문제 해결 담당
@@ -40,14 +42,13 @@ class DesignerAgent(BaseAgent):
 말투:
 - 전문적이지만 이해하기 쉽게
 - 원인과 해결 방향 제시
-- 2-3문장으로 간결하게
 
 반드시 "[설계사]"로 시작하세요."""
 
             user_message = self._build_context_message(issue, project)
             user_message += "\n\n위 이슈에 대해 설계사로서 기술적 원인을 분석하세요."
 
-            llm_response = self._generate_llm_response(system_prompt, user_message)
+            llm_response = self._generate_llm_response(system_prompt, user_message, issue=issue, project=project)
 
             if llm_response and llm_response.startswith('[설계사]'):
                 return llm_response
@@ -66,7 +67,7 @@ class DesignerAgent(BaseAgent):
     def _solution_response(self, issue, project, impact_result):
         """해결책 제시 응답"""
         if self.use_llm:
-            system_prompt = """당신은 청담동 근린생활시설 신축공사의 설계사(설계팀)입니다.
+            system_prompt = """당신은 이 프로젝트의 설계사(설계팀)입니다.
 
 역할:
 - 기술적 문제에 대한 해결책 제시
@@ -86,14 +87,13 @@ BIM 미적용 시:
 말투:
 - 전문적이고 책임감 있게
 - 구체적 해결 방안 제시
-- 2-3문장으로 간결하게
 
 반드시 "[설계사]"로 시작하세요."""
 
             user_message = self._build_context_message(issue, project, impact_result)
             user_message += "\n\n위 영향 분석을 바탕으로 설계사로서 해결 방안을 제시하세요."
 
-            llm_response = self._generate_llm_response(system_prompt, user_message, temperature=0.7)
+            llm_response = self._generate_llm_response(system_prompt, user_message, issue=issue, project=project, temperature=0.7)
 
             if llm_response and llm_response.startswith('[설계사]'):
                 return llm_response
@@ -3,6 +3,7 @@
 """
 
 from .base_agent import BaseAgent
+from utils.profiler import profiled
 
 
 class OwnerAgent(BaseAgent):
@@ -12,6 +13,7 @@ class OwnerAgent(BaseAgent):
         super().__init__("건축주", "발주자", use_llm)
         self.risk_tolerance = 0.15
     
+    @profiled('agent.respond.owner')
     def respond(self, issue, project, impact_result=None):
         """이슈에 대한 건축주 응답"""
         
@@ -25,7 +27,7 @@ class OwnerAgent(BaseAgent):
     def _initial_response(self, issue, project):
         """초기 응답"""
         if self.use_llm:
-            system_prompt = """당신은 청담동 근린생활시설 신축공사의 건축주(발주자)입니다.
+            system_prompt = """당신은 이 프로젝트의 건축주(발주자)입니다.
 
 역할:
 - 프로젝트 소유주이자 최종 의사결정권자
@@ -40,14 +42,13 @@ class OwnerAgent(BaseAgent):
 말투:
 - 격식을 차리고 간결하게
 - 핵심을 묻는 질문 위주
-- 2-3문장 이내로 짧게
 
 반드시 "[건축주]"로 시작하세요."""
 
             user_message = self._build_context_message(issue, project)
             user_message += "\n\n위 이슈가 발생했습니다. 건축주로서 첫 반응을 보이세요."
 
-            llm_response = self._generate_llm_response(system_prompt, user_message)
+            llm_response = self._generate_llm_response(system_prompt, user_message, issue=issue, project=project)
 
             if llm_response and llm_response.startswith('[건축주]'):
                 return llm_response
@@ -58,7 +59,7 @@ class OwnerAgent(BaseAgent):
     def _decision_response(self, issue, project, impact_result):
         """의사결정 응답"""
         if self.use_llm:
-            system_prompt = """당신은 청담동 근린생활시설 신축공사의 건축주(발주자)입니다.
+            system_prompt = """당신은 이 프로젝트의 건축주(발주자)입니다.
 
 역할:
 - 최종 의사결정권자
@@ -74,14 +75,13 @@ class OwnerAgent(BaseAgent):
 말투:
 - 명확하고 단호하게
 - 승인/거부를 명시
-- 2-3문장으로 간결하게
 
 반드시 "[건축주]"로 시작하세요."""
 
             user_message = self._build_context_message(issue, project, impact_result)
             user_message += "\n\n위 영향 분석을 바탕으로 최종 의사결정을 내리세요."
 
-            llm_response = self._generate_llm_response(system_prompt, user_message, temperature=0.6)
+            llm_response = self._generate_llm_response(system_prompt, user_message, issue=issue, project=project, temperature=0.6)
 
             if llm_response and llm_response.startswith('[건축주]'):
                 return llm_response
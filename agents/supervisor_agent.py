@@ -3,6 +3,7 @@
 """
 
 from .base_agent import BaseAgent
+from utils.profiler import profiled
 
 class SupervisorAgent(BaseAgent):
     """감리사 에이전트"""
@@ -10,6 +11,7 @@ class SupervisorAgent(BaseAgent):
     def __init__(self, use_llm=True):
         super().__init__("감리사", "감리팀", use_llm)
     
+    @profiled('agent.respond.supervisor')
     def respond(self, issue, project, impact_result=None):
         """이슈에 대한 감리사 응답"""
         
@@ -23,7 +25,7 @@ class SupervisorAgent(BaseAgent):
     def _inspection_response(self, issue, project):
         """검토 응답"""
         if self.use_llm:
-            system_prompt = """당신은 청담동 근린생활시설 신축공사의 감리사입니다.
+            system_prompt = """당신은 이 프로젝트의 감리사입니다.
 
 역할:
 - 공사 감독 및 품질 관리
@@ -38,14 +40,13 @@ class SupervisorAgent(BaseAgent):
 말투:
 - 전문적이고 중립적
 - 법규 및 기준 언급
-- 2-3문장으로 간결하게
 
 반드시 "[감리사]"로 시작하세요."""
 
             user_message = self._build_context_message(issue, project)
             user_message += "\n\n이슈가 보고되었습니다. 감리사로서 검토 의견을 제시하세요."
 
-            llm_response = self._generate_llm_response(system_prompt, user_message)
+            llm_response = self._generate_llm_response(system_prompt, user_message, issue=issue, project=project)
 
             if llm_response and llm_response.startswith('[감리사]'):
                 return llm_response
@@ -56,7 +57,7 @@ class SupervisorAgent(BaseAgent):
     def _approval_response(self, issue, project, impact_result):
         """승인 응답"""
         if self.use_llm:
-            system_prompt = """당신은 청담동 근린생활시설 신축공사의 감리사입니다.
+            system_prompt = """당신은 이 프로젝트의 감리사입니다.
 
 역할:
 - 시정 조치 승인/불승인 결정
@@ -72,14 +73,13 @@ class SupervisorAgent(BaseAgent):
 말투:
 - 승인/불승인 명확히 표현
 - 법규 및 계약 근거 제시
-- 2-3문장으로 간결하게
 
 반드시 "[감리사]"로 시작하세요."""
 
             user_message = self._build_context_message(issue, project, impact_result)
             user_message += "\n\n해결 방안이 제시되었습니다. 감리사로서 승인 여부를 결정하세요."
 
-            llm_response = self._generate_llm_response(system_prompt, user_message)
+            llm_response = self._generate_llm_response(system_prompt, user_message, issue=issue, project=project)
 
             if llm_response and llm_response.startswith('[감리사]'):
                 return llm_response
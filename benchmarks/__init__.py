@@ -0,0 +1,3 @@
+"""
+시뮬레이션 핵심 경로 벤치마크
+"""
@@ -0,0 +1,216 @@
+"""
+벤치마크 케이스 정의
+
+각 케이스의 setup()은 측정할 호출 가능 객체를 반환한다.
+입력 데이터는 고정 시드로 생성해 실행마다 같은 작업량을 측정한다.
+"""
+
+import json
+import random
+import asyncio
+import numpy as np
+from models.project import Project
+from config.bim_quality_config import BIMQualityConfig
+from agents.owner_agent import OwnerAgent
+from agents.designer_agent import DesignerAgent
+from agents.contractor_agent import ContractorAgent
+from agents.supervisor_agent import SupervisorAgent
+from agents.bank_agent import BankAgent
+from config.work_dependencies import WORK_DEPENDENCIES
+from simulation.issue_manager import IssueManager
+from simulation.impact_calculator import ImpactCalculator
+from simulation.negotiation_system import NegotiationSystem
+from simulation.delay_calculator import DelayCalculator, BatchDelayCalculator
+from simulation.simulation_engine import SimulationEngine
+from simulation.schedule_network import ActivityNetwork
+from reports.report_generator import ReportGenerator
+from reports.graph_visualizer import GraphVisualizer
+from utils.llm_pool import TokenBucket
+
+SEED = 1234
+ISSUE_FILE = 'data/issue_cards.json'
+
+
+def _load_issues():
+    with open(ISSUE_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _template_agents():
+    return {
+        'owner': OwnerAgent(use_llm=False),
+        'designer': DesignerAgent(use_llm=False),
+        'contractor': ContractorAgent(use_llm=False),
+        'supervisor': SupervisorAgent(use_llm=False),
+        'bank': BankAgent(use_llm=False)
+    }
+
+
+def _construction_project(bim_enabled):
+    project = Project(bim_enabled=bim_enabled, bim_quality=BIMQualityConfig.BIM_GOOD)
+    project.current_day = 200
+    project.current_phase = '시공'
+    return project
+
+
+def _run_metrics(bim_enabled):
+    project = Project(bim_enabled=bim_enabled, bim_quality=BIMQualityConfig.BIM_GOOD)
+    return SimulationEngine(project, _template_agents(), save_logs=False, random_seed=SEED).run(verbose=False)
+
+
+def setup_check_issues():
+    """IssueManager.check_and_trigger_issues (시공 단계 하루)"""
+    manager = IssueManager(random_seed=SEED)
+    project = _construction_project(False)
+    all_issues = manager.all_issues
+
+    def run():
+        manager.pending_issues = list(all_issues)
+        manager.check_and_trigger_issues(project)
+
+    return run
+
+
+def setup_calculate_impact(bim_enabled):
+    """ImpactCalculator.calculate_impact (전체 이슈 카드 1회씩)"""
+    def setup():
+        random.seed(SEED)
+        calculator = ImpactCalculator()
+        project = _construction_project(bim_enabled)
+        issues = _load_issues()
+
+        def run():
+            for issue in issues:
+                calculator.calculate_impact(issue, project)
+
+        return run
+    return setup
+
+
+def setup_negotiate():
+    """NegotiationSystem.negotiate (전체 이슈 카드 1회씩)"""
+    negotiation = NegotiationSystem()
+    project = _construction_project(True)
+    issues = _load_issues()
+
+    def run():
+        for issue in issues:
+            negotiation.negotiate(issue, project, detected=True)
+
+    return run
+
+
+def setup_total_delay(n_issues):
+    """DelayCalculator.calculate_total_delay (동시 진행 이슈 n개)"""
+    def setup():
+        rng = random.Random(SEED)
+        work_types = list(WORK_DEPENDENCIES)
+        calculator = DelayCalculator()
+        for k in range(n_issues):
+            # 모든 공종이 한 번 이상 포함되도록 순환 배치
+            calculator.add_issue({
+                'issue_id': f'B-{k:03d}',
+                'work_type': work_types[k % len(work_types)],
+                'delay_weeks': rng.uniform(0.5, 6.0),
+                'float_days': 0,
+                'detected': rng.random() < 0.5
+            })
+        return calculator.calculate_total_delay
+    return setup
+
+
+def setup_batch_delay(n_runs):
+    """BatchDelayCalculator.calculate_total_delay (실행 n개 × 공종)"""
+    def setup():
+        rng = np.random.default_rng(SEED)
+        calculator = BatchDelayCalculator()
+        delays = rng.uniform(0.0, 3.0, (n_runs, len(calculator.work_types)))
+        counts = rng.integers(0, 12, n_runs)
+        return lambda: calculator.calculate_total_delay(delays, counts)
+    return setup
+
+
+def setup_schedule_issue(zones):
+    """ActivityNetwork.apply_issue 증분 갱신 (구역 수 × 공종 액티비티, 이슈 1건)"""
+    def setup():
+        project = Project(template='cheongdam')
+        network = ActivityNetwork.from_project(project, zones=zones)
+        phases = project.phase_durations
+        start = phases['설계'] + phases['입찰']
+        rng = random.Random(SEED)
+        work_types = ['구조', '설비', '전기', '마감', '자재', '토목', '시공관리']
+
+        def run():
+            day = start + rng.random() * phases['시공']
+            network.apply_issue(rng.choice(work_types), day, rng.uniform(0, 0.5))
+
+        return run
+    return setup
+
+
+def setup_token_bucket(n_acquires):
+    """TokenBucket.acquire (한도에 걸리지 않는 경우의 확보 비용, n회)"""
+    def setup():
+        async def acquire_all():
+            bucket = TokenBucket(60_000_000)
+            for _ in range(n_acquires):
+                await bucket.acquire()
+
+        return lambda: asyncio.run(acquire_all())
+    return setup
+
+
+def setup_engine_run(save_logs):
+    """SimulationEngine.run(verbose=False) 전체 실행"""
+    def setup():
+        agents = _template_agents()
+
+        def run():
+            project = Project(bim_enabled=True, bim_quality=BIMQualityConfig.BIM_GOOD)
+            SimulationEngine(project, agents, save_logs=save_logs, random_seed=SEED).run(verbose=False)
+
+        return run
+    return setup
+
+
+def setup_text_reports():
+    """ReportGenerator 텍스트 리포트 (비교 + 단일)"""
+    metrics_off = _run_metrics(False)
+    metrics_on = _run_metrics(True)
+
+    def run():
+        ReportGenerator.generate_comparison_report(metrics_off, metrics_on)
+        ReportGenerator.generate_single_report(metrics_on, "BIM ON")
+
+    return run
+
+
+def setup_graphs():
+    """GraphVisualizer.generate_all_graphs (PNG 4종, 캐시 없이 순차 렌더링)"""
+    metrics_off = _run_metrics(False)
+    metrics_on = _run_metrics(True)
+    visualizer = GraphVisualizer(use_cache=False, max_workers=1)
+
+    def run():
+        visualizer.generate_all_graphs(metrics_off, metrics_on)
+
+    return run
+
+
+# name: 결과 키, number: 반복 1회당 호출 수
+CASES = [
+    {'name': 'issue_manager.check_day', 'setup': setup_check_issues, 'number': 2000},
+    {'name': 'impact.calculate[bim_off]', 'setup': setup_calculate_impact(False), 'number': 200},
+    {'name': 'impact.calculate[bim_on]', 'setup': setup_calculate_impact(True), 'number': 200},
+    {'name': 'negotiation.negotiate', 'setup': setup_negotiate, 'number': 500},
+    {'name': 'delay.total[5]', 'setup': setup_total_delay(5), 'number': 5000},
+    {'name': 'delay.total[50]', 'setup': setup_total_delay(50), 'number': 2000},
+    {'name': 'delay.total[500]', 'setup': setup_total_delay(500), 'number': 500},
+    {'name': 'delay.batch[100000]', 'setup': setup_batch_delay(100_000), 'number': 10},
+    {'name': 'schedule.apply_issue[1000]', 'setup': setup_schedule_issue(1000), 'number': 500},
+    {'name': 'llm_pool.token_bucket[1000]', 'setup': setup_token_bucket(1000), 'number': 20},
+    {'name': 'engine.run[save_logs=off]', 'setup': setup_engine_run(False), 'number': 20},
+    {'name': 'engine.run[save_logs=on]', 'setup': setup_engine_run(True), 'number': 10},
+    {'name': 'report.text', 'setup': setup_text_reports, 'number': 2000},
+    {'name': 'report.graphs', 'setup': setup_graphs, 'number': 1},
+]
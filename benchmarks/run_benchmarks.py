@@ -0,0 +1,187 @@
+"""
+벤치마크 실행 및 기준선 비교
+
+사용법:
+    python benchmarks/run_benchmarks.py --save-baseline     # 기준선 저장
+    python benchmarks/run_benchmarks.py                     # 기준선 대비 회귀 확인
+    python benchmarks/run_benchmarks.py -k engine --repeat 3
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import timeit
+import warnings
+import argparse
+import platform
+import tempfile
+import contextlib
+from pathlib import Path
+from datetime import datetime
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+
+from benchmarks.cases import CASES
+from utils.text_width import pad
+
+DEFAULT_BASELINE = ROOT / 'benchmarks' / 'results' / 'baseline.json'
+DEFAULT_THRESHOLD = 0.20  # 기준선 대비 20% 이상 느려지면 회귀
+
+
+@contextlib.contextmanager
+def sandbox():
+    """임시 작업 폴더에서 실행 (로그/그래프가 저장소 output/을 건드리지 않도록)"""
+    cwd = os.getcwd()
+    tmp = tempfile.mkdtemp(prefix='bench_')
+    try:
+        os.symlink(ROOT / 'data', Path(tmp) / 'data', target_is_directory=True)
+    except OSError:
+        shutil.copytree(ROOT / 'data', Path(tmp) / 'data')
+    os.chdir(tmp)
+    try:
+        yield tmp
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def run_case(case, repeat):
+    """
+    케이스 1개 측정
+
+    Returns:
+        {'per_call': 최소 호출당 시간(초), 'median': 중앙값, 'number', 'repeat'}
+    """
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull), \
+            warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # 폰트 누락 경고 등
+        func = case['setup']()
+        func()  # 워밍업
+        timer = timeit.Timer(func)
+        totals = timer.repeat(repeat=repeat, number=case['number'])
+
+    per_call = [total / case['number'] for total in totals]
+    return {
+        'per_call': min(per_call),
+        'median': float(np.median(per_call)),
+        'number': case['number'],
+        'repeat': repeat
+    }
+
+
+def environment_info():
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'numpy': np.__version__,
+        'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    기준선 비교
+
+    Returns:
+        회귀 케이스 이름 리스트
+    """
+    regressions = []
+    print(f"\n{pad('케이스', 30)}{pad('현재', 12, 'right')}{pad('기준선', 12, 'right')}{pad('변화', 10, 'right')}")
+    print("-"*64)
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        current = result['per_call']
+        if base is None:
+            print(f"{name:<30}{_format_time(current):>12}{'-':>12}{pad('신규', 10, 'right')}")
+            continue
+
+        ratio = current / base['per_call'] - 1.0
+        flag = ''
+        if ratio > threshold:
+            flag = '  ← 회귀'
+            regressions.append(name)
+        print(f"{name:<30}{_format_time(current):>12}{_format_time(base['per_call']):>12}"
+              f"{ratio*100:>+9.1f}%{flag}")
+    return regressions
+
+
+def _format_time(seconds):
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= 1e-3:
+        return f"{seconds*1e3:.2f}ms"
+    return f"{seconds*1e6:.1f}µs"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시뮬레이션 벤치마크')
+    parser.add_argument('-k', '--filter', default=None, help='이름에 포함된 케이스만 실행')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (최소값 사용)')
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='기준선 JSON 경로')
+    parser.add_argument('--save-baseline', action='store_true', help='결과를 기준선으로 저장')
+    parser.add_argument('--output', default=None, help='결과 JSON 저장 경로')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='회귀 판정 기준 (0.2 = 20%% 느려짐)')
+    args = parser.parse_args()
+
+    cases = [case for case in CASES if not args.filter or args.filter in case['name']]
+    if not cases:
+        print(f"일치하는 케이스가 없습니다: {args.filter}")
+        return 2
+
+    results = {}
+    started = time.perf_counter()
+    with sandbox():
+        for case in cases:
+            result = run_case(case, args.repeat)
+            results[case['name']] = result
+            print(f"{case['name']:<30}{_format_time(result['per_call']):>12} "
+                  f"(중앙값 {_format_time(result['median'])}, {case['number']}회 x {args.repeat})")
+    print(f"\n총 소요 시간: {time.perf_counter() - started:.1f}초")
+
+    report = {'environment': environment_info(), 'results': results}
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        # 일부 케이스만 실행한 경우 기존 기준선에 병합
+        if baseline_path.exists():
+            with open(baseline_path, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+            report['results'] = {**previous.get('results', {}), **results}
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"[기준선 저장] {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"기준선이 없습니다. 먼저 --save-baseline으로 저장하세요: {baseline_path}")
+        return 0
+
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n성능 회귀 {len(regressions)}건 (기준 +{args.threshold*100:.0f}%): {', '.join(regressions)}")
+        return 1
+
+    print(f"\n성능 회귀 없음 (기준 +{args.threshold*100:.0f}%)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -93,4 +93,20 @@ class BIMQualityConfig:
     SIGMOID_X0 = 0.5    # 변곡점
     
     # 최대 탐지 확률
-    MAX_DETECTION_PROB = 0.98
\ No newline at end of file
+    MAX_DETECTION_PROB = 0.98
+
+    # 품질 프리셋 (CLI/포트폴리오 입력용)
+    PRESETS = {
+        'off': BIM_OFF,
+        'excellent': BIM_EXCELLENT,
+        'good': BIM_GOOD,
+        'average': BIM_AVERAGE,
+        'poor': BIM_POOR
+    }
+
+    @classmethod
+    def get_preset(cls, level):
+        """프리셋 이름으로 BIM 품질 지표 반환 (알 수 없는 이름은 ValueError)"""
+        if level not in cls.PRESETS:
+            raise ValueError(f"알 수 없는 품질 프리셋입니다: {level!r} (가능: {', '.join(cls.PRESETS)})")
+        return cls.PRESETS[level]
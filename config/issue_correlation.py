@@ -0,0 +1,19 @@
+"""
+이슈 간 발생 상관 구조 정의
+"""
+
+# 함께 발생하는 경향이 있는 이슈 클러스터
+# correlation: 클러스터 내 이슈 쌍의 잠재변수 상관계수 (0~1, Gaussian copula)
+# 각 이슈의 개별 발생 확률(occurrence_rate)은 그대로 유지되고 동시 발생 경향만 추가된다.
+ISSUE_CLUSTERS = {
+    'design_conflict': {
+        'name': '설계 조정 불량',
+        'issues': ['I-01', 'I-02', 'I-05'],  # 설비-구조 간섭, 도면 불일치, 단면-평면 불일치
+        'correlation': 0.6
+    },
+    'material_delay': {
+        'name': '자재 공급 지연',
+        'issues': ['I-22', 'I-24'],          # 수입 자재 지연, 맞춤 제작 지연
+        'correlation': 0.5
+    },
+}
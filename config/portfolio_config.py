@@ -0,0 +1,48 @@
+"""
+포트폴리오(다중 프로젝트) 시뮬레이션 설정
+"""
+
+
+class PortfolioConfig:
+    """포트폴리오 공통 충격 및 리스크 지표 설정"""
+
+    # 프로젝트 간 상관된 공통 충격
+    # 시나리오마다 probability 확률로 발생하며, 공통 달력상
+    # [window_start, window_end] 사이에서 시작해 duration_days 동안 지속된다.
+    # 충격 기간 중 해당 단계에 있는 모든 현장의 이슈 발생 확률에 rate_multiplier 적용
+    # (달력 Day 0 = 포트폴리오 기준일)
+    CORRELATED_SHOCKS = {
+        'I-11': {
+            'name': '우기 장마',
+            'probability': 0.9,
+            'window_start': 160,     # 6월 중순
+            'window_end': 200,
+            'duration_days': 60,
+            'rate_multiplier': 6.0
+        },
+        'I-23': {
+            'name': '철근 가격 급등',
+            'probability': 0.3,
+            'window_start': 0,
+            'window_end': 720,
+            'duration_days': 90,
+            'rate_multiplier': 8.0
+        },
+        'I-14': {
+            'name': '인력 수급 난항',
+            'probability': 0.25,
+            'window_start': 0,
+            'window_end': 720,
+            'duration_days': 120,
+            'rate_multiplier': 4.0
+        },
+    }
+
+    # VaR/CVaR 신뢰수준
+    VAR_LEVELS = (0.95, 0.99)
+
+    # 익스포저 집계 단위 (일)
+    EXPOSURE_BUCKET_DAYS = 30
+
+    # 청크당 최대 배열 원소 수 (실행 × 프로젝트 × 이슈)
+    MAX_CHUNK_CELLS = 1_000_000
@@ -47,31 +47,18 @@ class ProjectConfig:
         7: 100,    # 6개월 초과
     }
     
+    @classmethod
+    def get_phase_calendar(cls):
+        """기본 단계 기간(PHASE_DURATIONS)의 단계 달력 (프로젝트별 달력은 Project.calendar)"""
+        from models.phase_calendar import PhaseCalendar
+        return PhaseCalendar.for_durations(cls.PHASE_DURATIONS)
+
     @classmethod
     def get_phase_start_end(cls, phase_name):
         """단계별 시작/종료 일자 반환"""
-        phases = list(cls.PHASE_DURATIONS.keys())
-        
-        if phase_name not in phases:
-            return None, None
-        
-        start_day = 1
-        for phase in phases:
-            if phase == phase_name:
-                end_day = start_day + cls.PHASE_DURATIONS[phase] - 1
-                return start_day, end_day
-            start_day += cls.PHASE_DURATIONS[phase]
-        
-        return None, None
+        return cls.get_phase_calendar().start_end(phase_name)
     
     @classmethod
     def get_phase_by_day(cls, day):
-        """현재 일자에 해당하는 단계 반환"""
-        current_day = 1
-        
-        for phase, duration in cls.PHASE_DURATIONS.items():
-            if current_day <= day <= current_day + duration - 1:
-                return phase
-            current_day += duration
-        
-        return '준공'  # 기본값
\ No newline at end of file
+        """현재 일자에 해당하는 단계 반환 (기간 밖은 마지막 단계)"""
+        return cls.get_phase_calendar().phase_at(day)
@@ -24,18 +24,28 @@ class ProjectTemplates:
         'base_interest_rate': 0.055
     }
 
+    # 템플릿 이름 → 클래스 속성 (속성이 없는 템플릿은 아직 정의되지 않음)
+    TEMPLATE_ATTRS = {
+        'cheongdam': 'CHEONGDAM_COMMERCIAL',
+        'officetel': 'SMALL_OFFICETEL',
+        'apartment': 'MEDIUM_APARTMENT',
+        'commercial': 'SMALL_COMMERCIAL',
+        'office': 'LARGE_OFFICE',
+        'house': 'SMALL_HOUSE'
+    }
+
     @classmethod
     def get_template(cls, template_name):
-        """템플릿 반환"""
-        templates = {
-            'cheongdam': cls.CHEONGDAM_COMMERCIAL,
-            'officetel': cls.SMALL_OFFICETEL,
-            'apartment': cls.MEDIUM_APARTMENT,
-            'commercial': cls.SMALL_COMMERCIAL,
-            'office': cls.LARGE_OFFICE,
-            'house': cls.SMALL_HOUSE
-        }
-        return templates.get(template_name, cls.CHEONGDAM_COMMERCIAL)
+        """템플릿 반환 (정의되지 않은 템플릿은 ValueError)"""
+        templates = cls.defined_templates()
+        if template_name not in templates:
+            raise ValueError(f"정의되지 않은 템플릿입니다: {template_name!r} (정의됨: {templates})")
+        return getattr(cls, cls.TEMPLATE_ATTRS[template_name])
+
+    @classmethod
+    def defined_templates(cls):
+        """실제로 정의된 템플릿 이름"""
+        return [name for name, attr_name in cls.TEMPLATE_ATTRS.items() if hasattr(cls, attr_name)]
 
     @classmethod
     def list_templates(cls):
@@ -4,6 +4,7 @@ BIM 시뮬레이션 메인 실행 파일
 
 import sys
 import argparse
+import numpy as np
 from pathlib import Path
 from datetime import datetime
 from models.project import Project
@@ -16,19 +17,27 @@ from agents.contractor_agent import ContractorAgent
 from agents.supervisor_agent import SupervisorAgent
 from agents.bank_agent import BankAgent
 from simulation.simulation_engine import SimulationEngine
+from simulation.portfolio import PortfolioEngine
+from simulation.result_cache import SimulationResultCache
+from simulation.scenario_spec import Study, run_study
+from simulation.calibration import Calibration
+from simulation.bim_optimizer import BIMInvestmentOptimizer
 from reports.report_generator import ReportGenerator
+from reports.report_engine import report_engine
+from utils.text_width import pad, display_width
 from reports.visualizer import TextVisualizer
 from reports.graph_visualizer import GraphVisualizer
+from reports.distribution_plots import DistributionPlotter
 from utils.validation import ResultValidator
 
-def create_agents():
-    """에이전트 생성"""
+def create_agents(use_llm=True):
+    """에이전트 생성 (use_llm=False면 템플릿 응답 에이전트)"""
     return {
-        'owner': OwnerAgent(),
-        'designer': DesignerAgent(),
-        'contractor': ContractorAgent(),
-        'supervisor': SupervisorAgent(),
-        'bank': BankAgent()
+        'owner': OwnerAgent(use_llm=use_llm),
+        'designer': DesignerAgent(use_llm=use_llm),
+        'contractor': ContractorAgent(use_llm=use_llm),
+        'supervisor': SupervisorAgent(use_llm=use_llm),
+        'bank': BankAgent(use_llm=use_llm)
     }
 
 def save_simulation_results(metrics_off, metrics_on, template_name=None):
@@ -43,83 +52,12 @@ def save_simulation_results(metrics_off, metrics_on, template_name=None):
     filename = f"comparison_result_{timestamp}{template_suffix}.txt"
     filepath = results_dir / filename
 
-    # 상세 비교 리포트 생성
+    # 상세 비교 리포트 생성 (핵심 요약, 상세 비교표, 결론)
     content = []
-    content.append("╔" + "="*78 + "╗")
-    content.append("║" + " "*20 + "BIM 시뮬레이션 비교 결과 리포트" + " "*24 + "║")
-    content.append("╚" + "="*78 + "╝")
-    content.append("")
     content.append(f"생성 일시: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M:%S')}")
     if template_name:
         content.append(f"프로젝트 템플릿: {template_name}")
-    content.append("")
-
-    # ========== 핵심 요약 ==========
-    delay_reduction = metrics_off['delay_days'] - metrics_on['delay_days']
-    cost_reduction = metrics_off['actual_cost'] - metrics_on['actual_cost']
-    detection_improvement = metrics_on['detection_rate'] - metrics_off['detection_rate']
-
-    content.append("┌" + "─"*78 + "┐")
-    content.append("│" + " "*28 + "핵심 개선 효과 요약" + " "*30 + "│")
-    content.append("├" + "─"*78 + "┤")
-    content.append(f"│  1. 공사 기간 단축: {delay_reduction:>3}일 ({delay_reduction/7:>5.1f}주)" + " "*(80-len(f"│  1. 공사 기간 단축: {delay_reduction:>3}일 ({delay_reduction/7:>5.1f}주)")) + "│")
-    content.append(f"│  2. 비용 절감: {cost_reduction:>15,}원 ({cost_reduction/100000000:>6.2f}억원)" + " "*(80-len(f"│  2. 비용 절감: {cost_reduction:>15,}원 ({cost_reduction/100000000:>6.2f}억원)")) + "│")
-    content.append(f"│  3. 이슈 탐지율 향상: {detection_improvement*100:>5.1f}%p" + " "*(80-len(f"│  3. 이슈 탐지율 향상: {detection_improvement*100:>5.1f}%p")) + "│")
-
-    if metrics_on['actual_cost'] > 0:
-        roi = (cost_reduction / metrics_off['actual_cost']) * 100
-        content.append(f"│  4. ROI (투자 대비 절감률): {roi:>5.1f}%" + " "*(80-len(f"│  4. ROI (투자 대비 절감률): {roi:>5.1f}%")) + "│")
-
-    content.append("└" + "─"*78 + "┘")
-    content.append("")
-
-    # ========== 상세 비교표 ==========
-    content.append("┌" + "─"*78 + "┐")
-    content.append("│" + " "*30 + "상세 비교표" + " "*36 + "│")
-    content.append("├" + "─"*38 + "┬" + "─"*19 + "┬" + "─"*19 + "┤")
-    content.append("│ 항목" + " "*34 + "│ BIM OFF (전통)" + " "*4 + "│ BIM ON (적용)" + " "*5 + "│")
-    content.append("├" + "─"*38 + "┼" + "─"*19 + "┼" + "─"*19 + "┤")
-
-    # 공사 기간
-    content.append(f"│ 총 공사 기간 (일)" + " "*21 + f"│ {metrics_off['actual_duration']:>17.0f} │ {metrics_on['actual_duration']:>17.0f} │")
-    content.append(f"│ 계획 대비 지연 (일)" + " "*19 + f"│ {metrics_off['delay_days']:>17.0f} │ {metrics_on['delay_days']:>17.0f} │")
-    content.append(f"│ 지연율 (%)" + " "*28 + f"│ {metrics_off['schedule_delay_rate']*100:>16.1f}% │ {metrics_on['schedule_delay_rate']*100:>16.1f}% │")
-    content.append("├" + "─"*38 + "┼" + "─"*19 + "┼" + "─"*19 + "┤")
-
-    # 비용
-    content.append(f"│ 최종 비용 (원)" + " "*23 + f"│ {metrics_off['actual_cost']:>17,} │ {metrics_on['actual_cost']:>17,} │")
-    content.append(f"│ 계획 예산 (원)" + " "*23 + f"│ {metrics_off['planned_budget']:>17,} │ {metrics_on['planned_budget']:>17,} │")
-    content.append(f"│ 예산 초과액 (원)" + " "*21 + f"│ {metrics_off['cost_increase']:>17,} │ {metrics_on['cost_increase']:>17,} │")
-    content.append(f"│ 예산 초과율 (%)" + " "*23 + f"│ {metrics_off['budget_overrun_rate']*100:>16.1f}% │ {metrics_on['budget_overrun_rate']*100:>16.1f}% │")
-    content.append("├" + "─"*38 + "┼" + "─"*19 + "┼" + "─"*19 + "┤")
-
-    # 이슈
-    content.append(f"│ 발생 이슈 (건)" + " "*23 + f"│ {metrics_off['issues_count']:>17} │ {metrics_on['issues_count']:>17} │")
-    content.append(f"│ 조기 탐지 이슈 (건)" + " "*18 + f"│ {metrics_off['detected_count']:>17} │ {metrics_on['detected_count']:>17} │")
-    content.append(f"│ 미탐지 이슈 (건)" + " "*20 + f"│ {metrics_off['missed_count']:>17} │ {metrics_on['missed_count']:>17} │")
-    content.append(f"│ 탐지율 (%)" + " "*28 + f"│ {metrics_off['detection_rate']*100:>16.1f}% │ {metrics_on['detection_rate']*100:>16.1f}% │")
-    content.append("└" + "─"*38 + "┴" + "─"*19 + "┴" + "─"*19 + "┘")
-    content.append("")
-
-    # ========== 결론 및 권고사항 ==========
-    content.append("┌" + "─"*78 + "┐")
-    content.append("│" + " "*28 + "결론 및 권고사항" + " "*33 + "│")
-    content.append("├" + "─"*78 + "┤")
-
-    if delay_reduction > 0:
-        content.append("│ ✓ BIM 적용으로 공사 기간이 단축되어 일정 준수에 유리합니다." + " "*26 + "│")
-
-    if cost_reduction > 0:
-        cost_reduction_rate = (cost_reduction / metrics_off['actual_cost']) * 100
-        content.append(f"│ ✓ 총 비용이 {cost_reduction_rate:.1f}% 절감되어 예산 효율성이 크게 향상되었습니다." + " "*(80-len(f"│ ✓ 총 비용이 {cost_reduction_rate:.1f}% 절감되어 예산 효율성이 크게 향상되었습니다.")) + "│")
-
-    if detection_improvement > 0.2:
-        content.append("│ ✓ 이슈 조기 탐지율이 크게 향상되어 품질 관리가 강화되었습니다." + " "*22 + "│")
-
-    content.append("│" + " "*78 + "│")
-    content.append("│ [권고] BIM 적용을 통해 시공 품질 및 효율성이 입증되었습니다." + " "*25 + "│")
-    content.append("└" + "─"*78 + "┘")
-    content.append("")
+    content.append(report_engine.render_comparison(metrics_off, metrics_on, template='result'))
 
     # ========== 파일 위치 정보 ==========
     content.append("="*80)
@@ -138,7 +76,8 @@ def save_simulation_results(metrics_off, metrics_on, template_name=None):
     print(f"\n[결과 저장] {filepath}")
     return filepath
 
-def run_bim_off_scenario(verbose=True, template=None, random_seed=None):
+def run_bim_off_scenario(verbose=True, template=None, random_seed=None, checkpoint_file=None, profile_file=None,
+                         profile_format='json', result_cache=None, use_llm=True):
     """BIM OFF 시나리오 실행"""
     print("\n" + "="*70)
     print("BIM OFF (전통 방식) 시나리오")
@@ -148,14 +87,17 @@ def run_bim_off_scenario(verbose=True, template=None, random_seed=None):
         ProjectTemplates.print_template_info(template)
 
     project = Project(bim_enabled=False, template=template)
-    agents = create_agents()
+    agents = create_agents(use_llm)
 
-    engine = SimulationEngine(project, agents, random_seed=random_seed)
+    engine = SimulationEngine(project, agents, random_seed=random_seed, checkpoint_file=checkpoint_file,
+                              profile_file=profile_file, profile_format=profile_format, result_cache=result_cache)
     metrics = engine.run(verbose=verbose)
 
     return project, metrics
 
-def run_bim_on_scenario(bim_quality_level='good', verbose=True, template=None, custom_quality=None, random_seed=None):
+def run_bim_on_scenario(bim_quality_level='good', verbose=True, template=None, custom_quality=None, random_seed=None,
+                        checkpoint_file=None, profile_file=None, profile_format='json', result_cache=None,
+                        use_llm=True):
     """BIM ON 시나리오 실행"""
     print("\n" + "="*70)
 
@@ -181,7 +123,7 @@ def run_bim_on_scenario(bim_quality_level='good', verbose=True, template=None, c
         bim_quality = quality_map.get(bim_quality_level, BIMQualityConfig.BIM_GOOD)
 
     project = Project(bim_enabled=True, bim_quality=bim_quality, template=template)
-    agents = create_agents()
+    agents = create_agents(use_llm)
 
     print(f"BIM 품질 설정:")
     print(f"  경고밀도(WD): {bim_quality['warning_density']}")
@@ -193,12 +135,14 @@ def run_bim_on_scenario(bim_quality_level='good', verbose=True, template=None, c
     quality_level_text = BIMQuality.get_quality_level(bim_quality)
     print(f"  품질 점수: {quality_score:.2f} ({quality_level_text})\n")
 
-    engine = SimulationEngine(project, agents, random_seed=random_seed)
+    engine = SimulationEngine(project, agents, random_seed=random_seed, checkpoint_file=checkpoint_file,
+                              profile_file=profile_file, profile_format=profile_format, result_cache=result_cache)
     metrics = engine.run(verbose=verbose)
 
     return project, metrics
 
-def run_comparison(bim_quality_level='good', verbose=True, template=None, custom_quality=None):
+def run_comparison(bim_quality_level='good', verbose=True, template=None, custom_quality=None, result_cache=None,
+                   use_llm=True):
     """BIM ON/OFF 비교 실행"""
     print("\n" + "#"*70)
     print("BIM 적용 효과 비교 시뮬레이션")
@@ -208,11 +152,13 @@ def run_comparison(bim_quality_level='good', verbose=True, template=None, custom
     COMPARISON_SEED = 42
 
     print("1단계: BIM OFF 시나리오 실행")
-    project_off, metrics_off = run_bim_off_scenario(verbose=verbose, template=template, random_seed=COMPARISON_SEED)
+    project_off, metrics_off = run_bim_off_scenario(verbose=verbose, template=template, random_seed=COMPARISON_SEED,
+                                                      result_cache=result_cache, use_llm=use_llm)
 
     print("\n2단계: BIM ON 시나리오 실행")
     print("[알림] 동일한 조건에서 BIM 효과만 비교하기 위해 이슈 발생 패턴을 BIM OFF와 동일하게 설정합니다.\n")
-    project_on, metrics_on = run_bim_on_scenario(bim_quality_level, verbose=verbose, template=template, custom_quality=custom_quality, random_seed=COMPARISON_SEED)
+    project_on, metrics_on = run_bim_on_scenario(bim_quality_level, verbose=verbose, template=template, custom_quality=custom_quality, random_seed=COMPARISON_SEED,
+                                                   result_cache=result_cache, use_llm=use_llm)
     
     print("\n3단계: 결과 비교 및 검증")
     print("="*70)
@@ -262,14 +208,100 @@ def run_comparison(bim_quality_level='good', verbose=True, template=None, custom
 
     return metrics_off, metrics_on
 
+def run_resume(checkpoint_file, verbose=True):
+    """체크포인트에서 시뮬레이션 재개"""
+    print("\n" + "="*70)
+    print(f"체크포인트 재개: {checkpoint_file}")
+    print("="*70 + "\n")
+
+    engine = SimulationEngine.from_checkpoint(checkpoint_file, create_agents())
+    metrics = engine.run(verbose=verbose)
+
+    return engine.project, metrics
+
+def run_study_file(study_file, max_workers=None):
+    """시나리오 명세 파일의 모든 실행 명세 실행 (batch 모드 지표는 평균)"""
+    study = Study.load(study_file)
+    print("\n" + "#"*70)
+    print(f"시나리오 명세 연구: {study.name} ({len(study):,}개 실행)")
+    print("#"*70 + "\n")
+
+    rows = []
+    for spec, metrics in run_study(study, max_workers=max_workers):
+        rows.append((spec.name, *(float(np.mean(metrics[key])) for key in
+                                  ('delay_weeks', 'cost_increase', 'budget_overrun_rate'))))
+
+    width = max([display_width(row[0]) for row in rows] + [4]) + 2
+    print(f"\n{pad('실행', width)}{pad('지연(주)', 10, 'right')}{pad('비용 증가(억원)', 18, 'right')}"
+          f"{pad('예산 초과율', 14, 'right')}")
+    for name, delay, cost, overrun in rows:
+        print(f"{pad(name, width)}{delay:>10.1f}{cost/1e8:>18.2f}{overrun*100:>13.1f}%")
+    return rows
+
+def run_calibration(max_workers=None, random_seed=None, result_cache=None):
+    """벤치마크 업계 평균에 맞춘 모형 파라미터 보정 (CMA-ES, 배치 시뮬레이터)"""
+    print("\n" + "#"*70)
+    print("벤치마크 보정")
+    print("#"*70 + "\n")
+
+    calibration = Calibration(cache=result_cache)
+    print(f"파라미터: {calibration.evaluator.dimension}개 | 평가당 실행: {calibration.evaluator.n_runs:,}회")
+
+    def progress(entry):
+        if entry['generation'] % 10 == 0:
+            print(f"  세대 {entry['generation']:>3}: 최저 손실 {entry['best_loss']:.5f} (σ={entry['sigma']:.3f})")
+
+    result = calibration.run(max_workers=max_workers, seed=random_seed or 0, generations=200, progress=progress)
+    Calibration.print_summary(result)
+    print(f"저장: {calibration.save(result)}")
+
+    return result
+
+def run_bim_investment(template=None, objective='mean', max_workers=None, random_seed=None, result_cache=None):
+    """BIM 품질 설정별 투자비/순절감액 탐색 (배치 시뮬레이터, 공통 난수)"""
+    print("\n" + "#"*70)
+    print("BIM 투자 최적화")
+    print("#"*70 + "\n")
+
+    optimizer = BIMInvestmentOptimizer(objective=objective, template=template, cache=result_cache)
+    print(f"평가당 실행: {optimizer.evaluator.n_runs:,}회 | 격자 간격: {optimizer.evaluator.resolution}")
+
+    def progress(entry):
+        if entry['generation'] % 10 == 0:
+            print(f"  세대 {entry['generation']:>3}: 최고 {entry['best_score'] / 1e8:,.2f}억 "
+                  f"(평가 {entry['evaluated']:,}점)")
+
+    result = optimizer.run(max_workers=max_workers, seed=random_seed or 0, progress=progress)
+    BIMInvestmentOptimizer.print_summary(result)
+    DistributionPlotter().plot_investment_frontier(
+        result['visited'], result['best'], result['presets'],
+        key='net_cvar' if objective == 'cvar' else 'net_mean'
+    )
+
+    return result
+
+def run_portfolio(portfolio_file, n_scenarios=1000, random_seed=None):
+    """포트폴리오(다중 현장) 리스크 시뮬레이션 실행"""
+    print("\n" + "#"*70)
+    print("포트폴리오 리스크 시뮬레이션")
+    print("#"*70 + "\n")
+
+    engine = PortfolioEngine.from_csv(portfolio_file)
+    print(f"현장 수: {len(engine.projects)}개 | 시나리오: {n_scenarios:,}개")
+
+    result = engine.run(n_scenarios=n_scenarios, seed=random_seed)
+    PortfolioEngine.print_summary(result)
+
+    return result
+
 def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(description='BIM 건설 시뮬레이션')
     parser.add_argument(
         '--scenario',
-        choices=['off', 'on', 'compare'],
+        choices=['off', 'on', 'compare', 'portfolio', 'calibrate', 'optimize'],
         default='compare',
-        help='실행할 시나리오 (off: BIM OFF, on: BIM ON, compare: 비교)'
+        help='실행할 시나리오 (off: BIM OFF, on: BIM ON, compare: 비교, portfolio: 다중 현장, calibrate: 벤치마크 보정, optimize: BIM 투자 최적화)'
     )
     parser.add_argument(
         '--quality',
@@ -299,10 +331,77 @@ def main():
     )
     parser.add_argument(
         '--template',
-        choices=['cheongdam', 'officetel', 'apartment', 'commercial', 'office', 'house'],
+        choices=ProjectTemplates.defined_templates(),
         default=None,
         help='프로젝트 템플릿 선택'
     )
+    parser.add_argument(
+        '--portfolio',
+        default='data/portfolio_sample.csv',
+        help='포트폴리오 CSV 파일 (--scenario portfolio)'
+    )
+    parser.add_argument(
+        '--runs',
+        type=int,
+        default=1000,
+        help='포트폴리오 시나리오 수 (--scenario portfolio)'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='난수 시드 (--scenario portfolio/calibrate/optimize)'
+    )
+    parser.add_argument(
+        '--template-agents',
+        action='store_true',
+        help='LLM 대신 템플릿 응답 에이전트 사용 (OPENAI_API_KEY가 있어도 --result-cache 적용 가능)'
+    )
+    parser.add_argument(
+        '--checkpoint',
+        default=None,
+        help='이슈 처리마다 체크포인트 저장 경로 (--scenario off/on)'
+    )
+    parser.add_argument(
+        '--resume',
+        default=None,
+        help='체크포인트 파일에서 시뮬레이션 재개'
+    )
+    parser.add_argument(
+        '--profile',
+        default=None,
+        help='실행 시간 프로파일 저장 경로 (.json, --scenario off/on)'
+    )
+    parser.add_argument(
+        '--profile-format',
+        choices=['json', 'chrome'],
+        default='json',
+        help='프로파일 형식 (json: 구간/단계별 집계, chrome: Chrome trace)'
+    )
+    parser.add_argument(
+        '--result-cache',
+        nargs='?',
+        const='output/cache/simulation_results.sqlite3',
+        default=None,
+        help='결과 캐시 사용 (같은 입력의 템플릿 모드 실행은 저장된 결과 사용, 경로 생략 시 기본 경로)'
+    )
+    parser.add_argument(
+        '--study',
+        default=None,
+        help='시나리오 명세 파일 실행 (.json/.toml/.yaml, 예: data/study_sample.toml)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='--study/--scenario calibrate/optimize 실행 프로세스 수 (기본: CPU 수)'
+    )
+    parser.add_argument(
+        '--objective',
+        choices=['mean', 'cvar'],
+        default='mean',
+        help='BIM 투자 최적화 목적 (mean: 기대 순절감액, cvar: 하위 10%% 평균, --scenario optimize)'
+    )
     parser.add_argument(
         '--list-templates',
         action='store_true',
@@ -333,6 +432,36 @@ def main():
         return
 
     verbose = args.verbose and not args.quiet
+    result_cache = SimulationResultCache(args.result_cache) if args.result_cache else None
+
+    if args.resume:
+        project, metrics = run_resume(args.resume, verbose=verbose)
+        if args.quiet:
+            report = ReportGenerator.generate_single_report(metrics, "재개된 시뮬레이션")
+            print(report)
+        print("\n시뮬레이션 완료!")
+        return
+
+    if args.study:
+        run_study_file(args.study, max_workers=args.workers)
+        print("\n시뮬레이션 완료!")
+        return
+
+    if args.scenario == 'calibrate':
+        run_calibration(max_workers=args.workers, random_seed=args.seed, result_cache=result_cache)
+        print("\n시뮬레이션 완료!")
+        return
+
+    if args.scenario == 'optimize':
+        run_bim_investment(template=args.template, objective=args.objective, max_workers=args.workers,
+                           random_seed=args.seed, result_cache=result_cache)
+        print("\n시뮬레이션 완료!")
+        return
+
+    if args.scenario == 'portfolio':
+        run_portfolio(args.portfolio, n_scenarios=args.runs, random_seed=args.seed)
+        print("\n시뮬레이션 완료!")
+        return
 
     # Custom BIM 품질 설정 처리
     custom_quality = None
@@ -368,21 +497,28 @@ def main():
         print(f"  WD: {args.wd}, CD: {args.cd}, AF: {args.af}, PL: {args.pl}")
 
     if args.scenario == 'off':
-        project, metrics = run_bim_off_scenario(verbose=verbose, template=args.template)
+        project, metrics = run_bim_off_scenario(verbose=verbose, template=args.template,
+                                                checkpoint_file=args.checkpoint, profile_file=args.profile,
+                                                profile_format=args.profile_format, result_cache=result_cache,
+                                                use_llm=not args.template_agents)
 
         if args.quiet:
             report = ReportGenerator.generate_single_report(metrics, "BIM OFF")
             print(report)
 
     elif args.scenario == 'on':
-        project, metrics = run_bim_on_scenario(args.quality, verbose=verbose, template=args.template, custom_quality=custom_quality)
+        project, metrics = run_bim_on_scenario(args.quality, verbose=verbose, template=args.template,
+                                               custom_quality=custom_quality, checkpoint_file=args.checkpoint,
+                                               profile_file=args.profile, profile_format=args.profile_format,
+                                               result_cache=result_cache, use_llm=not args.template_agents)
 
         if args.quiet:
             report = ReportGenerator.generate_single_report(metrics, f"BIM ON ({args.quality.upper()})")
             print(report)
 
     elif args.scenario == 'compare':
-        metrics_off, metrics_on = run_comparison(args.quality, verbose=verbose, template=args.template, custom_quality=custom_quality)
+        metrics_off, metrics_on = run_comparison(args.quality, verbose=verbose, template=args.template, custom_quality=custom_quality,
+                                               result_cache=result_cache, use_llm=not args.template_agents)
 
     print("\n시뮬레이션 완료!")
 
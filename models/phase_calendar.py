@@ -0,0 +1,70 @@
+"""
+프로젝트 단계 달력 (일자 → 단계 사전 계산)
+
+phase_durations로 한 번 만들어 두고 일자별 단계 조회, 단계 시작/종료일,
+단계 전환 이벤트를 모두 O(1)로 제공한다. 같은 기간 구성은 인스턴스를 공유한다.
+"""
+
+from functools import lru_cache
+
+
+class PhaseCalendar:
+    """단계 달력 (생성 후 변경하지 않음)"""
+
+    def __init__(self, phase_durations):
+        """
+        Args:
+            phase_durations: {단계명: 기간(일)} (순서대로 진행)
+        """
+        self.phases = tuple(phase_durations)
+        self.durations = tuple(phase_durations.values())
+
+        # 단계 경계 (Day 1부터, 종료일 포함)
+        self.starts, self.ends = [], []
+        day = 1
+        for duration in self.durations:
+            self.starts.append(day)
+            self.ends.append(day + duration - 1)
+            day += duration
+        self.total_days = day - 1
+        self.bounds = {phase: (start, end) for phase, start, end in zip(self.phases, self.starts, self.ends)}
+
+        # 일자 → 단계 번호 (0일/기간 이후는 마지막 단계, 기존 get_phase_by_day 기본값과 동일)
+        last = len(self.phases) - 1
+        self.day_phase = [last] * (self.total_days + 1)
+        for index, (start, end) in enumerate(zip(self.starts, self.ends)):
+            self.day_phase[start:end + 1] = [index] * (end - start + 1)
+
+        # 단계 전환 이벤트 (전환일 = 새 단계 시작일)
+        self.transitions = [
+            {'day': start, 'phase': phase, 'previous': self.phases[index - 1], 'previous_end_day': start - 1}
+            for index, (phase, start) in enumerate(zip(self.phases, self.starts)) if index > 0
+        ]
+
+    @classmethod
+    def for_durations(cls, phase_durations):
+        """같은 단계 구성이면 캐시된 달력 반환"""
+        return _compiled(tuple(phase_durations.items()))
+
+    def phase_index(self, day):
+        """일자의 단계 번호"""
+        if 0 <= day <= self.total_days:
+            return self.day_phase[day]
+        return len(self.phases) - 1
+
+    def phase_at(self, day):
+        """일자의 단계명"""
+        return self.phases[self.phase_index(day)]
+
+    def start_end(self, phase_name):
+        """단계 시작/종료 일자 (없는 단계면 (None, None))"""
+        return self.bounds.get(phase_name, (None, None))
+
+    def iter_phases(self):
+        """(단계명, 시작일, 종료일) 순서대로"""
+        return zip(self.phases, self.starts, self.ends)
+
+
+@lru_cache(maxsize=None)
+def _compiled(items):
+    return PhaseCalendar(dict(items))
@@ -2,8 +2,10 @@
 프로젝트 모델
 """
 
+import copy
 from config.project_config import ProjectConfig
 from config.project_templates import ProjectTemplates
+from .phase_calendar import PhaseCalendar
 from simulation.delay_calculator import DelayCalculator
 
 class Project:
@@ -34,6 +36,9 @@ class Project:
             self.base_interest_rate = ProjectConfig.BASE_INTEREST_RATE
             self.phase_durations = ProjectConfig.PHASE_DURATIONS
         
+        # 단계 달력 (템플릿 단계 기간 기준)
+        self.calendar = PhaseCalendar.for_durations(self.phase_durations)
+
         self.bim_enabled = bim_enabled
         self.bim_quality = bim_quality if bim_quality else {
             'warning_density': 0.0,
@@ -66,7 +71,7 @@ class Project:
     def advance_day(self):
         """하루 진행"""
         self.current_day += 1
-        new_phase = ProjectConfig.get_phase_by_day(self.current_day)
+        new_phase = self.calendar.phase_at(self.current_day)
         
         if new_phase != self.current_phase:
             self.phase_history.append({
@@ -90,6 +95,16 @@ class Project:
         
         self.issues_occurred.append(impact_result)
     
+    def snapshot(self):
+        """현재 상태 복사본 (이후 진행에 영향받지 않도록 목록은 복사, 나머지는 얕은 복사)"""
+        state = copy.copy(self)
+        state.issues_occurred = list(self.issues_occurred)
+        state.issues_detected = list(self.issues_detected)
+        state.issues_missed = list(self.issues_missed)
+        state.interest_rate_increases = list(self.interest_rate_increases)
+        state.phase_history = list(self.phase_history)
+        return state
+
     def calculate_final_metrics(self):
         """최종 지표 계산"""
         delay_days = self.total_delay_weeks * 7
@@ -0,0 +1,298 @@
+"""
+Monte Carlo 분포 그래프 (배치 시뮬레이터 열 단위 결과용)
+
+실행별 반복 없이 NumPy 구간화(histogram/bincount)로 먼저 요약한 뒤 요약값만 그린다.
+요약 함수(*_summary)는 그리기와 분리되어 있어 미리 집계한 값으로도 그래프를 만들 수 있다.
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+from pathlib import Path
+from .graph_visualizer import _style
+
+# 지표별 축 이름 / 표시 배율
+METRIC_LABELS = {
+    'delay_days': ('공사 지연 (일)', 1.0),
+    'delay_weeks': ('공사 지연 (주)', 1.0),
+    'budget_overrun_rate': ('예산 초과율 (%)', 100.0),
+    'cost_increase': ('비용 증가 (억원)', 1e-8),
+    'financial_cost': ('금융 비용 (억원)', 1e-8),
+    'detection_rate': ('탐지율 (%)', 100.0),
+}
+
+GROUP_COLORS = ['#ff6b6b', '#51cf66', '#339af0', '#ffa94d', '#845ef7']
+
+
+def histogram_summary(values, bins=200, value_range=None):
+    """
+    히스토그램 + 구간 KDE 요약
+
+    KDE는 구간 빈도에 가우시안 커널을 합성곱해 계산 (Scott 대역폭, 실행 수와 무관한 비용)
+
+    Returns:
+        {'edges', 'centers', 'density', 'kde', 'count', 'mean'}
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    if value_range is None:
+        value_range = (values.min(), values.max())
+    if value_range[0] == value_range[1]:
+        value_range = (value_range[0] - 0.5, value_range[1] + 0.5)
+
+    counts, edges = np.histogram(values, bins=bins, range=value_range)
+    width = edges[1] - edges[0]
+    total = max(counts.sum(), 1)
+    density = counts / (total * width)
+
+    bandwidth = 1.06 * values.std() * len(values) ** -0.2
+    sigma = bandwidth / width
+    if sigma > 0.5:
+        offsets = np.arange(-int(4 * sigma), int(4 * sigma) + 1)
+        kernel = np.exp(-0.5 * (offsets / sigma) ** 2)
+        kde = np.convolve(density, kernel / kernel.sum(), mode='same')
+    else:
+        kde = density
+
+    return {
+        'edges': edges,
+        'centers': (edges[:-1] + edges[1:]) / 2,
+        'density': density,
+        'kde': kde,
+        'count': len(values),
+        'mean': values.mean()
+    }
+
+
+def cdf_summary(values, points=201):
+    """
+    누적분포 요약 (분위수 points개)
+
+    Returns:
+        {'probabilities', 'quantiles', 'count'}
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    probabilities = np.linspace(0.0, 1.0, points)
+    return {
+        'probabilities': probabilities,
+        'quantiles': np.quantile(values, probabilities),
+        'count': len(values)
+    }
+
+
+def fan_summary(issue_day, issue_values, horizon=None, step=5, percentiles=(5, 25, 50, 75, 95),
+                bins=400, chunk_size=100_000):
+    """
+    일자별 누적값(예: 누적 지연) 분위수 요약
+
+    실행을 청크로 나눠 (실행, 일자 구간) 누적 행렬을 bincount로 만들고,
+    일자 구간 × 값 구간 2차원 빈도를 누적한 뒤 빈도에서 분위수를 읽는다.
+
+    Args:
+        issue_day: (실행, [프로젝트,] 이슈) 발생일 (BatchSimulator detail=True의 issue_day)
+        issue_values: issue_day와 같은 형태의 이슈별 값 (issue_delay_weeks 등, 미발생은 0)
+        horizon: 마지막 일자 (기본: 최대 발생일)
+        step: 일자 간격
+
+    Returns:
+        {'days', 'percentiles', 'bands'} (bands: 분위수별 일자 배열)
+    """
+    # 다중 프로젝트 (실행, 프로젝트, 이슈)는 실행별 전체 합계
+    issue_day = np.asarray(issue_day).reshape(len(issue_day), -1)
+    issue_values = np.asarray(issue_values, dtype=float).reshape(len(issue_values), -1)
+    n_runs = issue_day.shape[0]
+    horizon = int(issue_day.max()) if horizon is None else horizon
+    days = np.arange(0, horizon + step, step)
+    n_days = len(days)
+
+    upper = max(issue_values.sum(axis=1).max(), 1e-9)
+    scale = bins / upper
+    histogram = np.zeros(n_days * bins, dtype=np.int64)
+
+    for begin in range(0, n_runs, chunk_size):
+        day = issue_day[begin:begin + chunk_size]
+        values = issue_values[begin:begin + chunk_size]
+        n = len(day)
+
+        # 발생일 → 해당 일자 이후 구간에 누적 (구간 i는 days[i] 이하 발생 포함, 등간격이라 올림 나눗셈)
+        slot = np.minimum(-(-day // step), n_days)
+        flat = (np.arange(n)[:, None] * (n_days + 1) + slot).ravel()
+        per_slot = np.bincount(flat, weights=values.ravel(), minlength=n * (n_days + 1))
+        cumulative = per_slot.reshape(n, n_days + 1)[:, :n_days].cumsum(axis=1)
+
+        value_bin = np.minimum((cumulative * scale).astype(np.int64), bins - 1)
+        histogram += np.bincount((np.arange(n_days) * bins + value_bin).ravel(), minlength=n_days * bins)
+
+    cumulative_counts = histogram.reshape(n_days, bins).cumsum(axis=1)
+    bands = {}
+    for percentile in percentiles:
+        target = percentile / 100 * n_runs
+        index = (cumulative_counts < target).sum(axis=1)
+        bands[percentile] = (np.minimum(index, bins - 1) + 0.5) / scale
+    return {'days': days, 'percentiles': tuple(percentiles), 'bands': bands}
+
+
+class DistributionPlotter:
+    """분포 그래프 (히스토그램/KDE, CDF, 토네이도, 팬 차트, 투자 프런티어)"""
+
+    def __init__(self, output_dir="output", dpi=150):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.dpi = dpi
+
+    def _save(self, fig, save_path, default_name):
+        save_path = Path(save_path) if save_path else self.output_dir / default_name
+        fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+        plt.close(fig)
+        print(f"그래프 저장: {save_path}")
+        return save_path
+
+    @staticmethod
+    def _label(metric):
+        return METRIC_LABELS.get(metric, (metric, 1.0))
+
+    def plot_histograms(self, groups, metrics=('delay_days', 'budget_overrun_rate'), bins=200, save_path=None):
+        """
+        지표별 히스토그램 + KDE (그룹 겹쳐 그리기, 공통 구간)
+
+        Args:
+            groups: {그룹명: 배치 결과 딕셔너리} (예: {'BIM OFF': result_off, 'BIM ON': result_on})
+        """
+        with _style():
+            fig, axes = plt.subplots(1, len(metrics), figsize=(7 * len(metrics), 5), squeeze=False)
+            fig.suptitle('지표 분포 (Monte Carlo)', fontsize=16, fontweight='bold')
+
+            for ax, metric in zip(axes[0], metrics):
+                label, factor = self._label(metric)
+                low = min(np.min(result[metric]) for result in groups.values())
+                high = max(np.max(result[metric]) for result in groups.values())
+
+                for color, (name, result) in zip(GROUP_COLORS, groups.items()):
+                    summary = histogram_summary(result[metric], bins, (low, high))
+                    centers = summary['centers'] * factor
+                    width = (summary['edges'][1] - summary['edges'][0]) * factor
+                    ax.bar(centers, summary['density'] / factor, width=width, color=color, alpha=0.3)
+                    ax.plot(centers, summary['kde'] / factor, color=color, linewidth=2,
+                            label=f"{name} (평균 {summary['mean'] * factor:,.1f})")
+
+                ax.set_xlabel(label, fontsize=12)
+                ax.set_ylabel('밀도', fontsize=12)
+                ax.legend()
+
+            fig.tight_layout()
+            return self._save(fig, save_path, "distribution_histograms.png")
+
+    def plot_cdf(self, groups, metric='delay_days', save_path=None):
+        """그룹별 누적분포 겹쳐 그리기 (P50/P90 표시)"""
+        label, factor = self._label(metric)
+        with _style():
+            fig, ax = plt.subplots(figsize=(10, 6))
+            for color, (name, result) in zip(GROUP_COLORS, groups.items()):
+                summary = cdf_summary(result[metric])
+                quantiles = summary['quantiles'] * factor
+                ax.plot(quantiles, summary['probabilities'] * 100, color=color, linewidth=2, label=name)
+                for p in (50, 90):
+                    ax.plot(quantiles[p * 2], p, 'o', color=color)
+                    ax.annotate(f"P{p} {quantiles[p * 2]:,.1f}", (quantiles[p * 2], p),
+                                textcoords='offset points', xytext=(6, -12), fontsize=9, color=color)
+
+            ax.set_xlabel(label, fontsize=12)
+            ax.set_ylabel('누적 확률 (%)', fontsize=12)
+            ax.set_title(f'{label} 누적분포', fontsize=14, fontweight='bold')
+            ax.set_ylim(0, 100)
+            ax.legend()
+            fig.tight_layout()
+            return self._save(fig, save_path, f"cdf_{metric}.png")
+
+    def plot_tornado(self, baseline, swings, metric='delay_days', save_path=None):
+        """
+        토네이도 차트 (민감도 분석)
+
+        Args:
+            baseline: 기준 지표값
+            swings: {변수명: (하한 설정 시 지표값, 상한 설정 시 지표값)} (배열이면 평균 사용)
+        """
+        label, factor = self._label(metric)
+        rows = sorted(
+            ((name, float(np.mean(low)), float(np.mean(high))) for name, (low, high) in swings.items()),
+            key=lambda row: abs(row[2] - row[1])
+        )
+        base = baseline * factor
+
+        with _style():
+            fig, ax = plt.subplots(figsize=(10, max(3, 0.5 * len(rows) + 1.5)))
+            y_pos = np.arange(len(rows))
+            lows = np.array([row[1] for row in rows]) * factor - base
+            highs = np.array([row[2] for row in rows]) * factor - base
+            ax.barh(y_pos, lows, left=base, color='#339af0', alpha=0.7, edgecolor='black', label='하한')
+            ax.barh(y_pos, highs, left=base, color='#ff6b6b', alpha=0.7, edgecolor='black', label='상한')
+            ax.axvline(base, color='black', linewidth=1)
+            ax.set_yticks(y_pos)
+            ax.set_yticklabels([row[0] for row in rows], fontsize=11)
+            ax.set_xlabel(label, fontsize=12)
+            ax.set_title(f'{label} 민감도 (기준 {base:,.1f})', fontsize=14, fontweight='bold')
+            ax.legend()
+            fig.tight_layout()
+            return self._save(fig, save_path, f"tornado_{metric}.png")
+
+    def plot_fan(self, groups, value_key='issue_delay_weeks', factor=7.0, label='누적 지연 (일)',
+                 horizon=None, save_path=None):
+        """
+        팬 차트 (일자별 누적값 분위수 띠)
+
+        Args:
+            groups: {그룹명: 배치 결과 (detail=True) 또는 fan_summary 결과}
+            value_key: 누적할 이슈별 값 (기본: 지연 주 → factor 7로 일 환산)
+        """
+        with _style():
+            fig, ax = plt.subplots(figsize=(12, 6))
+            for color, (name, result) in zip(GROUP_COLORS, groups.items()):
+                summary = result if 'bands' in result else fan_summary(
+                    result['issue_day'], result[value_key], horizon=horizon
+                )
+                days, bands = summary['days'], summary['bands']
+                percentiles = summary['percentiles']
+                for outer in range(len(percentiles) // 2):
+                    low, high = percentiles[outer], percentiles[-1 - outer]
+                    ax.fill_between(days, bands[low] * factor, bands[high] * factor, color=color,
+                                    alpha=0.15 + 0.1 * outer, linewidth=0)
+                middle = percentiles[len(percentiles) // 2]
+                ax.plot(days, bands[middle] * factor, color=color, linewidth=2, label=f"{name} (P{middle})")
+
+            ax.set_xlabel('프로젝트 일자', fontsize=12)
+            ax.set_ylabel(label, fontsize=12)
+            ax.set_title(f'{label} 추이', fontsize=14, fontweight='bold')
+            ax.legend()
+            fig.tight_layout()
+            return self._save(fig, save_path, "fan_chart.png")
+
+    def plot_investment_frontier(self, visited, best=None, presets=None, key='net_mean', save_path=None):
+        """
+        BIM 투자비 대비 순절감액 (탐색한 품질 설정 전체 + 프런티어)
+
+        Args:
+            visited: 평가 요약 리스트 (InvestmentEvaluator.visited)
+            best: 최적 설정 요약
+            presets: {프리셋명: 평가 요약}
+            key: 세로축 값 ('net_mean' 기대 순절감액, 'net_cvar' CVaR)
+        """
+        label = 'CVaR 순절감액 (억원)' if key == 'net_cvar' else '기대 순절감액 (억원)'
+        investment = np.array([summary['investment'] for summary in visited]) / 1e8
+        value = np.array([summary[key] for summary in visited]) / 1e8
+        order = np.argsort(investment)
+        frontier = order[value[order] >= np.maximum.accumulate(value[order])]
+
+        with _style():
+            fig, ax = plt.subplots(figsize=(10, 6))
+            ax.scatter(investment, value, s=12, color='#adb5bd', alpha=0.6, label=f'탐색한 설정 ({len(visited)}개)')
+            ax.plot(investment[frontier], value[frontier], color='#339af0', linewidth=2, label='프런티어')
+            for color, (name, summary) in zip(GROUP_COLORS, (presets or {}).items()):
+                ax.plot(summary['investment'] / 1e8, summary[key] / 1e8, 's', color=color, markersize=8, label=name)
+            if best is not None:
+                ax.plot(best['investment'] / 1e8, best[key] / 1e8, '*', color='black', markersize=16,
+                        label=f"최적 ({best[key] / 1e8:,.2f}억)")
+
+            ax.set_xlabel('BIM 투자비 (억원)', fontsize=12)
+            ax.set_ylabel(label, fontsize=12)
+            ax.set_title('BIM 투자 프런티어', fontsize=14, fontweight='bold')
+            ax.legend()
+            fig.tight_layout()
+            return self._save(fig, save_path, f"investment_frontier_{key}.png")
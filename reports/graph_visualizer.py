@@ -1,272 +1,411 @@
 """
 matplotlib 기반 그래프 시각화
+
+그리기(_draw_*)는 Figure만 만들고, 저장은 렌더링 파이프라인이 담당한다.
+- 스타일/폰트는 렌더링할 때만 적용 (전역 rcParams 변경 없음)
+- 지표/옵션 내용 해시로 캐시 (같은 지표의 그래프는 다시 그리지 않음)
+- 여러 그래프는 프로세스 풀(Agg 백엔드)에서 병렬 렌더링
 """
 
+import os
+import json
+import shutil
+import hashlib
+from contextlib import contextmanager
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
 import numpy as np
 from pathlib import Path
+from utils.process_pool import fork_available, process_pool
+
+STYLE = 'seaborn-v0_8-darkgrid'
+
+# 한글 폰트 후보 (설치된 첫 번째 사용, 없으면 스타일 기본 폰트)
+KOREAN_FONTS = ['Malgun Gothic', 'AppleGothic', 'NanumGothic', 'Noto Sans CJK KR']
+
+# 그리기 코드/스타일이 바뀌면 올려서 캐시 무효화
+RENDER_VERSION = 1
+
+
+def _korean_font():
+    installed = {font.name for font in fm.fontManager.ttflist}
+    return next((name for name in KOREAN_FONTS if name in installed), None)
+
+
+@contextmanager
+def _style():
+    """그래프 스타일 (렌더링 구간에만 적용)"""
+    rc = {'axes.unicode_minus': False}  # 마이너스 기호 깨짐 방지
+    font = _korean_font()
+    if font:
+        rc['font.family'] = font
+    with plt.style.context(STYLE), plt.rc_context(rc):
+        yield
+
+
+def _draw_comparison_bars(metrics_off, metrics_on, bim_cost=None):
+    """BIM ON/OFF 비교 막대 그래프"""
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig.suptitle('BIM 적용 효과 비교 분석', fontsize=16, fontweight='bold')
+
+    # 1. 공사 지연 비교
+    ax1 = axes[0, 0]
+    delays = [metrics_off['delay_weeks'], metrics_on['delay_weeks']]
+    colors = ['#ff6b6b', '#51cf66']
+    bars1 = ax1.bar(['BIM OFF', 'BIM ON'], delays, color=colors, alpha=0.7, edgecolor='black')
+    ax1.set_ylabel('지연 (주)', fontsize=12)
+    ax1.set_title('공사 지연 비교', fontsize=13, fontweight='bold')
+    ax1.grid(axis='y', alpha=0.3)
+
+    # 값 표시
+    for bar in bars1:
+        height = bar.get_height()
+        ax1.text(bar.get_x() + bar.get_width()/2., height,
+                f'{height:.1f}주',
+                ha='center', va='bottom', fontsize=11, fontweight='bold')
+
+    # 2. 예산 초과율 비교
+    ax2 = axes[0, 1]
+    overruns = [metrics_off['budget_overrun_rate']*100, metrics_on['budget_overrun_rate']*100]
+    bars2 = ax2.bar(['BIM OFF', 'BIM ON'], overruns, color=colors, alpha=0.7, edgecolor='black')
+    ax2.set_ylabel('예산 초과율 (%)', fontsize=12)
+    ax2.set_title('예산 초과율 비교', fontsize=13, fontweight='bold')
+    ax2.grid(axis='y', alpha=0.3)
+
+    for bar in bars2:
+        height = bar.get_height()
+        ax2.text(bar.get_x() + bar.get_width()/2., height,
+                f'{height:.1f}%',
+                ha='center', va='bottom', fontsize=11, fontweight='bold')
+
+    # 3. 이슈 탐지율 비교
+    ax3 = axes[1, 0]
+    detection = [metrics_off['detection_rate']*100, metrics_on['detection_rate']*100]
+    bars3 = ax3.bar(['BIM OFF', 'BIM ON'], detection, color=colors, alpha=0.7, edgecolor='black')
+    ax3.set_ylabel('탐지율 (%)', fontsize=12)
+    ax3.set_title('이슈 탐지율 비교', fontsize=13, fontweight='bold')
+    ax3.grid(axis='y', alpha=0.3)
+    ax3.set_ylim(0, 100)
+
+    for bar in bars3:
+        height = bar.get_height()
+        ax3.text(bar.get_x() + bar.get_width()/2., height,
+                f'{height:.1f}%',
+                ha='center', va='bottom', fontsize=11, fontweight='bold')
+
+    # 4. 총 비용 증가 비교
+    ax4 = axes[1, 1]
+    costs = [metrics_off['cost_increase']/1e8, metrics_on['cost_increase']/1e8]
+    bars4 = ax4.bar(['BIM OFF', 'BIM ON'], costs, color=colors, alpha=0.7, edgecolor='black')
+    ax4.set_ylabel('비용 증가 (억원)', fontsize=12)
+    ax4.set_title('총 비용 증가 비교', fontsize=13, fontweight='bold')
+    ax4.grid(axis='y', alpha=0.3)
+
+    for bar in bars4:
+        height = bar.get_height()
+        ax4.text(bar.get_x() + bar.get_width()/2., height,
+                f'{height:.2f}억',
+                ha='center', va='bottom', fontsize=11, fontweight='bold')
+
+    fig.tight_layout()
+    return fig
+
+
+def _draw_roi_analysis(metrics_off, metrics_on, bim_cost):
+    """BIM 투자 ROI 분석 그래프"""
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    fig.suptitle('BIM 투자 ROI 분석', fontsize=16, fontweight='bold')
+
+    # 1. 비용 분석
+    cost_saved = metrics_off['cost_increase'] - metrics_on['cost_increase']
+    roi = (cost_saved - bim_cost) / bim_cost * 100
+
+    categories = ['BIM OFF\n총비용', 'BIM ON\n총비용', 'BIM\n투자비', '절감액']
+    values = [
+        metrics_off['cost_increase']/1e8,
+        metrics_on['cost_increase']/1e8,
+        bim_cost/1e8,
+        cost_saved/1e8
+    ]
+    colors_bar = ['#ff6b6b', '#51cf66', '#ffd43b', '#339af0']
+
+    bars = ax1.bar(categories, values, color=colors_bar, alpha=0.7, edgecolor='black')
+    ax1.set_ylabel('금액 (억원)', fontsize=12)
+    ax1.set_title('비용 분석', fontsize=13, fontweight='bold')
+    ax1.grid(axis='y', alpha=0.3)
+
+    for bar in bars:
+        height = bar.get_height()
+        ax1.text(bar.get_x() + bar.get_width()/2., height,
+                f'{height:.2f}억',
+                ha='center', va='bottom', fontsize=10, fontweight='bold')
+
+    # 2. ROI 원형 그래프
+    if roi > 0:
+        roi_display = min(roi, 500)  # 최대 500%로 제한 (시각화)
+        colors_pie = ['#339af0', '#e9ecef']
+        explode = (0.1, 0)
+
+        ax2.pie([roi_display, 100],
+               labels=[f'ROI\n{roi:.0f}%', '투자'],
+               colors=colors_pie,
+               autopct='%1.0f%%',
+               explode=explode,
+               startangle=90,
+               textprops={'fontsize': 12, 'fontweight': 'bold'})
+        ax2.set_title(f'투자 수익률 (ROI: {roi:.1f}%)', fontsize=13, fontweight='bold')
+    else:
+        ax2.text(0.5, 0.5, f'ROI: {roi:.1f}%\n(손실)',
+                ha='center', va='center', fontsize=20, fontweight='bold', color='red',
+                transform=ax2.transAxes)
+        ax2.set_title('투자 수익률', fontsize=13, fontweight='bold')
+        ax2.axis('off')
+
+    fig.tight_layout()
+    return fig
+
+
+def _draw_timeline(metrics_off, metrics_on, bim_cost=None):
+    """공정 타임라인 비교"""
+    fig, ax = plt.subplots(figsize=(12, 6))
+
+    planned = 360  # 계획 일수
+    actual_off = metrics_off['actual_duration']
+    actual_on = metrics_on['actual_duration']
+
+    # 막대 그래프
+    y_pos = [0, 1, 2]
+    durations = [planned, actual_off, actual_on]
+    colors = ['#868e96', '#ff6b6b', '#51cf66']
+    labels = ['계획 공기', 'BIM OFF 실제', 'BIM ON 실제']
+
+    bars = ax.barh(y_pos, durations, color=colors, alpha=0.7, edgecolor='black', height=0.6)
+
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(labels, fontsize=12)
+    ax.set_xlabel('공사 기간 (일)', fontsize=12)
+    ax.set_title('공사 기간 비교', fontsize=14, fontweight='bold')
+    ax.grid(axis='x', alpha=0.3)
+
+    # 값 표시
+    for i, (bar, duration) in enumerate(zip(bars, durations)):
+        width = bar.get_width()
+        ax.text(width, bar.get_y() + bar.get_height()/2.,
+               f'{duration:.0f}일',
+               ha='left', va='center', fontsize=11, fontweight='bold',
+               bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8))
+
+    # 계획 대비 지연 표시
+    delay_off = actual_off - planned
+    delay_on = actual_on - planned
+
+    ax.text(planned + delay_off/2, 1, f'+{delay_off:.0f}일\n({metrics_off["delay_weeks"]:.1f}주)',
+           ha='center', va='center', fontsize=10, color='darkred', fontweight='bold')
+    ax.text(planned + delay_on/2, 2, f'+{delay_on:.0f}일\n({metrics_on["delay_weeks"]:.1f}주)',
+           ha='center', va='center', fontsize=10, color='darkgreen', fontweight='bold')
+
+    fig.tight_layout()
+    return fig
+
+
+def _draw_issue_breakdown(metrics_off, metrics_on, bim_cost=None):
+    """이슈 발생/탐지 분석"""
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig.suptitle('이슈 발생 및 탐지 분석', fontsize=16, fontweight='bold')
+
+    # 1. BIM OFF 이슈 분석
+    ax1 = axes[0]
+    detected_off = metrics_off['detected_count']
+    missed_off = metrics_off['missed_count']
+
+    colors1 = ['#51cf66', '#ff6b6b']
+    explode1 = (0.05, 0.05)
+    sizes1 = [detected_off, missed_off]
+    labels1 = [f'탐지\n{detected_off}건', f'미탐지\n{missed_off}건']
+
+    ax1.pie(sizes1, labels=labels1, colors=colors1, autopct='%1.1f%%',
+           explode=explode1, startangle=90,
+           textprops={'fontsize': 11, 'fontweight': 'bold'})
+    ax1.set_title(f'BIM OFF 이슈 탐지\n(총 {metrics_off["issues_count"]}건)',
+                 fontsize=13, fontweight='bold')
+
+    # 2. BIM ON 이슈 분석
+    ax2 = axes[1]
+    detected_on = metrics_on['detected_count']
+    missed_on = metrics_on['missed_count']
+
+    colors2 = ['#339af0', '#ffa94d']
+    explode2 = (0.05, 0.05)
+    sizes2 = [detected_on, missed_on]
+    labels2 = [f'탐지\n{detected_on}건', f'미탐지\n{missed_on}건']
+
+    ax2.pie(sizes2, labels=labels2, colors=colors2, autopct='%1.1f%%',
+           explode=explode2, startangle=90,
+           textprops={'fontsize': 11, 'fontweight': 'bold'})
+    ax2.set_title(f'BIM ON 이슈 탐지\n(총 {metrics_on["issues_count"]}건)',
+                 fontsize=13, fontweight='bold')
+
+    fig.tight_layout()
+    return fig
+
+
+# 그래프 종류: (그리기 함수, 기본 파일명, 그리기에 쓰는 지표 - 캐시 키에 포함)
+CHARTS = {
+    'comparison_bars': (_draw_comparison_bars, 'comparison_bars',
+                        ('delay_weeks', 'budget_overrun_rate', 'detection_rate', 'cost_increase')),
+    'roi_analysis': (_draw_roi_analysis, 'roi_analysis', ('cost_increase',)),
+    'timeline': (_draw_timeline, 'timeline_comparison', ('actual_duration', 'delay_weeks')),
+    'issue_breakdown': (_draw_issue_breakdown, 'issue_breakdown',
+                        ('detected_count', 'missed_count', 'issues_count')),
+}
+
+
+def _render(chart, metrics_off, metrics_on, bim_cost, outputs):
+    """
+    그래프 1개 렌더링 (프로세스 풀 작업 단위)
+
+    Args:
+        outputs: [(저장 경로, dpi)] (확장자로 형식 결정, 벡터 형식은 dpi 무시)
+    """
+    draw = CHARTS[chart][0]
+    with _style():
+        fig = draw(metrics_off, metrics_on, bim_cost)
+        for path, dpi in outputs:
+            fig.savefig(path, dpi=dpi, bbox_inches='tight')
+        plt.close(fig)
+    return [path for path, _ in outputs]
+
+
+def _init_worker():
+    matplotlib.use('Agg')
 
 
 class GraphVisualizer:
     """그래프 시각화 클래스"""
 
-    def __init__(self):
-        """초기화 및 한글 폰트 설정"""
-        # 한글 폰트 설정 (Windows)
-        try:
-            plt.rcParams['font.family'] = 'Malgun Gothic'  # 맑은 고딕
-            plt.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
-        except:
-            print("[Warning] 한글 폰트 설정 실패. 영문으로 표시됩니다.")
-
-        # 기본 스타일
-        plt.style.use('seaborn-v0_8-darkgrid')
-
-        self.output_dir = Path("output")
-        self.output_dir.mkdir(exist_ok=True)
+    def __init__(self, output_dir="output", dpi=300, vector_formats=(), preview_dpi=None,
+                 use_cache=True, max_workers=None):
+        """
+        Args:
+            output_dir: 그래프 저장 폴더
+            dpi: PNG 해상도
+            vector_formats: 함께 저장할 벡터 형식 (예: ('svg', 'pdf'))
+            preview_dpi: 지정 시 저해상도 미리보기 PNG(*_preview.png)도 저장
+            use_cache: 같은 지표/옵션의 그래프는 캐시(output_dir/graph_cache)에서 복사
+            max_workers: 렌더링 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차)
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.dpi = dpi
+        self.vector_formats = tuple(vector_formats)
+        self.preview_dpi = preview_dpi
+        self.use_cache = use_cache
+        self.cache_dir = self.output_dir / "graph_cache"
+        self.max_workers = max_workers
+        self.stats = {'rendered': 0, 'cached': 0}
+
+    def _outputs(self, save_path):
+        """저장 경로 → [(경로, dpi)] (PNG, 벡터, 미리보기)"""
+        save_path = Path(save_path)
+        outputs = [(save_path, self.dpi)]
+        outputs += [(save_path.with_suffix(f'.{fmt}'), self.dpi) for fmt in self.vector_formats]
+        if self.preview_dpi:
+            outputs.append((save_path.with_name(f"{save_path.stem}_preview.png"), self.preview_dpi))
+        return outputs
+
+    @staticmethod
+    def _cache_key(chart, metrics_off, metrics_on, bim_cost, dpi, suffix):
+        # 그래프가 그리는 지표만 포함 (다른 지표가 바뀌어도 캐시 유지)
+        fields = CHARTS[chart][2]
+        content = json.dumps(
+            [RENDER_VERSION, chart, [metrics_off.get(field) for field in fields],
+             [metrics_on.get(field) for field in fields], bim_cost, dpi, suffix],
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()[:32]
+
+    def render(self, jobs):
+        """
+        그래프 일괄 렌더링 (캐시 확인 후 필요한 것만 병렬 렌더링)
+
+        Args:
+            jobs: [{'chart', 'metrics_off', 'metrics_on', 'bim_cost', 'save_path'}]
+
+        Returns:
+            작업별 저장 경로 목록 (save_path 순서)
+        """
+        pending = []   # (chart, metrics_off, metrics_on, bim_cost, [(렌더링 경로, dpi)])
+        copies = []    # (캐시 경로, 저장 경로)
+        scheduled = set()  # 이번 묶음에서 렌더링할 캐시 경로 (같은 키는 한 번만)
+        for job in jobs:
+            render_outputs = []
+            for path, dpi in self._outputs(job['save_path']):
+                path.parent.mkdir(parents=True, exist_ok=True)
+                if not self.use_cache:
+                    render_outputs.append((path, dpi))
+                    continue
+                key = self._cache_key(job['chart'], job['metrics_off'], job['metrics_on'],
+                                      job.get('bim_cost'), dpi, path.suffix)
+                cached = self.cache_dir / f"{key}{path.suffix}"
+                if cached.exists() or cached in scheduled:
+                    self.stats['cached'] += 1
+                else:
+                    scheduled.add(cached)
+                    render_outputs.append((cached, dpi))
+                copies.append((cached, path))
+            if render_outputs:
+                pending.append((job['chart'], job['metrics_off'], job['metrics_on'],
+                                job.get('bim_cost'), render_outputs))
+
+        if pending:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # fork 가능한 환경만 기본 병렬 (spawn 환경은 스크립트에 __main__ 가드가 필요해 명시 지정 시만)
+            workers = self.max_workers or (os.cpu_count() if fork_available() else 1)
+            workers = min(workers, len(pending))
+            if workers > 1:
+                with process_pool(workers, initializer=_init_worker) as executor:
+                    list(executor.map(_render, *zip(*pending)))
+            else:
+                for args in pending:
+                    _render(*args)
+            self.stats['rendered'] += len(pending)
+
+        for cached, path in copies:
+            shutil.copyfile(cached, path)
+
+        return [Path(job['save_path']) for job in jobs]
+
+    def _plot(self, chart, metrics_off, metrics_on, bim_cost=None, save_path=None):
+        save_path = save_path or self.output_dir / f"{CHARTS[chart][1]}.png"
+        self.render([{'chart': chart, 'metrics_off': metrics_off, 'metrics_on': metrics_on,
+                      'bim_cost': bim_cost, 'save_path': save_path}])
+        print(f"그래프 저장: {save_path}")
+        return save_path
 
     def plot_comparison_bars(self, metrics_off, metrics_on, save_path=None):
         """BIM ON/OFF 비교 막대 그래프"""
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-        fig.suptitle('BIM 적용 효과 비교 분석', fontsize=16, fontweight='bold')
-
-        # 1. 공사 지연 비교
-        ax1 = axes[0, 0]
-        delays = [metrics_off['delay_weeks'], metrics_on['delay_weeks']]
-        colors = ['#ff6b6b', '#51cf66']
-        bars1 = ax1.bar(['BIM OFF', 'BIM ON'], delays, color=colors, alpha=0.7, edgecolor='black')
-        ax1.set_ylabel('지연 (주)', fontsize=12)
-        ax1.set_title('공사 지연 비교', fontsize=13, fontweight='bold')
-        ax1.grid(axis='y', alpha=0.3)
-
-        # 값 표시
-        for bar in bars1:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}주',
-                    ha='center', va='bottom', fontsize=11, fontweight='bold')
-
-        # 2. 예산 초과율 비교
-        ax2 = axes[0, 1]
-        overruns = [metrics_off['budget_overrun_rate']*100, metrics_on['budget_overrun_rate']*100]
-        bars2 = ax2.bar(['BIM OFF', 'BIM ON'], overruns, color=colors, alpha=0.7, edgecolor='black')
-        ax2.set_ylabel('예산 초과율 (%)', fontsize=12)
-        ax2.set_title('예산 초과율 비교', fontsize=13, fontweight='bold')
-        ax2.grid(axis='y', alpha=0.3)
-
-        for bar in bars2:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}%',
-                    ha='center', va='bottom', fontsize=11, fontweight='bold')
-
-        # 3. 이슈 탐지율 비교
-        ax3 = axes[1, 0]
-        detection = [metrics_off['detection_rate']*100, metrics_on['detection_rate']*100]
-        bars3 = ax3.bar(['BIM OFF', 'BIM ON'], detection, color=colors, alpha=0.7, edgecolor='black')
-        ax3.set_ylabel('탐지율 (%)', fontsize=12)
-        ax3.set_title('이슈 탐지율 비교', fontsize=13, fontweight='bold')
-        ax3.grid(axis='y', alpha=0.3)
-        ax3.set_ylim(0, 100)
-
-        for bar in bars3:
-            height = bar.get_height()
-            ax3.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}%',
-                    ha='center', va='bottom', fontsize=11, fontweight='bold')
-
-        # 4. 총 비용 증가 비교
-        ax4 = axes[1, 1]
-        costs = [metrics_off['cost_increase']/1e8, metrics_on['cost_increase']/1e8]
-        bars4 = ax4.bar(['BIM OFF', 'BIM ON'], costs, color=colors, alpha=0.7, edgecolor='black')
-        ax4.set_ylabel('비용 증가 (억원)', fontsize=12)
-        ax4.set_title('총 비용 증가 비교', fontsize=13, fontweight='bold')
-        ax4.grid(axis='y', alpha=0.3)
-
-        for bar in bars4:
-            height = bar.get_height()
-            ax4.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.2f}억',
-                    ha='center', va='bottom', fontsize=11, fontweight='bold')
-
-        plt.tight_layout()
-
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"\n그래프 저장: {save_path}")
-        else:
-            save_path = self.output_dir / "comparison_bars.png"
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"\n그래프 저장: {save_path}")
-
-        plt.close()
-        return save_path
+        return self._plot('comparison_bars', metrics_off, metrics_on, save_path=save_path)
 
     def plot_roi_analysis(self, metrics_off, metrics_on, bim_cost=50_000_000, save_path=None):
         """BIM 투자 ROI 분석 그래프"""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-        fig.suptitle('BIM 투자 ROI 분석', fontsize=16, fontweight='bold')
-
-        # 1. 비용 분석
-        cost_saved = metrics_off['cost_increase'] - metrics_on['cost_increase']
-        roi = (cost_saved - bim_cost) / bim_cost * 100
-
-        categories = ['BIM OFF\n총비용', 'BIM ON\n총비용', 'BIM\n투자비', '절감액']
-        values = [
-            metrics_off['cost_increase']/1e8,
-            metrics_on['cost_increase']/1e8,
-            bim_cost/1e8,
-            cost_saved/1e8
-        ]
-        colors_bar = ['#ff6b6b', '#51cf66', '#ffd43b', '#339af0']
-
-        bars = ax1.bar(categories, values, color=colors_bar, alpha=0.7, edgecolor='black')
-        ax1.set_ylabel('금액 (억원)', fontsize=12)
-        ax1.set_title('비용 분석', fontsize=13, fontweight='bold')
-        ax1.grid(axis='y', alpha=0.3)
-
-        for bar in bars:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.2f}억',
-                    ha='center', va='bottom', fontsize=10, fontweight='bold')
-
-        # 2. ROI 원형 그래프
-        if roi > 0:
-            roi_display = min(roi, 500)  # 최대 500%로 제한 (시각화)
-            colors_pie = ['#339af0', '#e9ecef']
-            explode = (0.1, 0)
-
-            ax2.pie([roi_display, 100],
-                   labels=[f'ROI\n{roi:.0f}%', '투자'],
-                   colors=colors_pie,
-                   autopct='%1.0f%%',
-                   explode=explode,
-                   startangle=90,
-                   textprops={'fontsize': 12, 'fontweight': 'bold'})
-            ax2.set_title(f'투자 수익률 (ROI: {roi:.1f}%)', fontsize=13, fontweight='bold')
-        else:
-            ax2.text(0.5, 0.5, f'ROI: {roi:.1f}%\n(손실)',
-                    ha='center', va='center', fontsize=20, fontweight='bold', color='red',
-                    transform=ax2.transAxes)
-            ax2.set_title('투자 수익률', fontsize=13, fontweight='bold')
-            ax2.axis('off')
-
-        plt.tight_layout()
-
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"그래프 저장: {save_path}")
-        else:
-            save_path = self.output_dir / "roi_analysis.png"
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"그래프 저장: {save_path}")
-
-        plt.close()
-        return save_path
+        return self._plot('roi_analysis', metrics_off, metrics_on, bim_cost, save_path)
 
     def plot_timeline(self, metrics_off, metrics_on, save_path=None):
         """공정 타임라인 비교"""
-        fig, ax = plt.subplots(figsize=(12, 6))
-
-        planned = 360  # 계획 일수
-        actual_off = metrics_off['actual_duration']
-        actual_on = metrics_on['actual_duration']
-
-        # 막대 그래프
-        y_pos = [0, 1, 2]
-        durations = [planned, actual_off, actual_on]
-        colors = ['#868e96', '#ff6b6b', '#51cf66']
-        labels = ['계획 공기', 'BIM OFF 실제', 'BIM ON 실제']
-
-        bars = ax.barh(y_pos, durations, color=colors, alpha=0.7, edgecolor='black', height=0.6)
-
-        ax.set_yticks(y_pos)
-        ax.set_yticklabels(labels, fontsize=12)
-        ax.set_xlabel('공사 기간 (일)', fontsize=12)
-        ax.set_title('공사 기간 비교', fontsize=14, fontweight='bold')
-        ax.grid(axis='x', alpha=0.3)
-
-        # 값 표시
-        for i, (bar, duration) in enumerate(zip(bars, durations)):
-            width = bar.get_width()
-            ax.text(width, bar.get_y() + bar.get_height()/2.,
-                   f'{duration:.0f}일',
-                   ha='left', va='center', fontsize=11, fontweight='bold',
-                   bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8))
-
-        # 계획 대비 지연 표시
-        delay_off = actual_off - planned
-        delay_on = actual_on - planned
-
-        ax.text(planned + delay_off/2, 1, f'+{delay_off:.0f}일\n({metrics_off["delay_weeks"]:.1f}주)',
-               ha='center', va='center', fontsize=10, color='darkred', fontweight='bold')
-        ax.text(planned + delay_on/2, 2, f'+{delay_on:.0f}일\n({metrics_on["delay_weeks"]:.1f}주)',
-               ha='center', va='center', fontsize=10, color='darkgreen', fontweight='bold')
-
-        plt.tight_layout()
-
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"그래프 저장: {save_path}")
-        else:
-            save_path = self.output_dir / "timeline_comparison.png"
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"그래프 저장: {save_path}")
-
-        plt.close()
-        return save_path
+        return self._plot('timeline', metrics_off, metrics_on, save_path=save_path)
 
     def plot_issue_breakdown(self, metrics_off, metrics_on, save_path=None):
         """이슈 발생/탐지 분석"""
-        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
-        fig.suptitle('이슈 발생 및 탐지 분석', fontsize=16, fontweight='bold')
-
-        # 1. BIM OFF 이슈 분석
-        ax1 = axes[0]
-        detected_off = metrics_off['detected_count']
-        missed_off = metrics_off['missed_count']
-
-        colors1 = ['#51cf66', '#ff6b6b']
-        explode1 = (0.05, 0.05)
-        sizes1 = [detected_off, missed_off]
-        labels1 = [f'탐지\n{detected_off}건', f'미탐지\n{missed_off}건']
-
-        ax1.pie(sizes1, labels=labels1, colors=colors1, autopct='%1.1f%%',
-               explode=explode1, startangle=90,
-               textprops={'fontsize': 11, 'fontweight': 'bold'})
-        ax1.set_title(f'BIM OFF 이슈 탐지\n(총 {metrics_off["issues_count"]}건)',
-                     fontsize=13, fontweight='bold')
-
-        # 2. BIM ON 이슈 분석
-        ax2 = axes[1]
-        detected_on = metrics_on['detected_count']
-        missed_on = metrics_on['missed_count']
-
-        colors2 = ['#339af0', '#ffa94d']
-        explode2 = (0.05, 0.05)
-        sizes2 = [detected_on, missed_on]
-        labels2 = [f'탐지\n{detected_on}건', f'미탐지\n{missed_on}건']
-
-        ax2.pie(sizes2, labels=labels2, colors=colors2, autopct='%1.1f%%',
-               explode=explode2, startangle=90,
-               textprops={'fontsize': 11, 'fontweight': 'bold'})
-        ax2.set_title(f'BIM ON 이슈 탐지\n(총 {metrics_on["issues_count"]}건)',
-                     fontsize=13, fontweight='bold')
-
-        plt.tight_layout()
-
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"그래프 저장: {save_path}")
-        else:
-            save_path = self.output_dir / "issue_breakdown.png"
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"그래프 저장: {save_path}")
-
-        plt.close()
-        return save_path
+        return self._plot('issue_breakdown', metrics_off, metrics_on, save_path=save_path)
+
+    def _chart_jobs(self, metrics_off, metrics_on, bim_cost, output_dir):
+        return [
+            {'chart': chart, 'metrics_off': metrics_off, 'metrics_on': metrics_on,
+             'bim_cost': bim_cost if chart == 'roi_analysis' else None,
+             'save_path': Path(output_dir) / f"{filename}.png"}
+            for chart, (_, filename, _) in CHARTS.items()
+        ]
 
     def generate_all_graphs(self, metrics_off, metrics_on, bim_cost=50_000_000):
         """모든 그래프 생성"""
@@ -274,26 +413,30 @@ class GraphVisualizer:
         print("그래프 생성 중...")
         print("="*70)
 
-        paths = []
-
-        # 1. 비교 막대 그래프
-        path1 = self.plot_comparison_bars(metrics_off, metrics_on)
-        paths.append(path1)
-
-        # 2. ROI 분석
-        path2 = self.plot_roi_analysis(metrics_off, metrics_on, bim_cost)
-        paths.append(path2)
-
-        # 3. 타임라인 비교
-        path3 = self.plot_timeline(metrics_off, metrics_on)
-        paths.append(path3)
-
-        # 4. 이슈 분석
-        path4 = self.plot_issue_breakdown(metrics_off, metrics_on)
-        paths.append(path4)
+        paths = self.render(self._chart_jobs(metrics_off, metrics_on, bim_cost, self.output_dir))
+        for path in paths:
+            print(f"그래프 저장: {path}")
 
         print("\n" + "="*70)
         print(f"총 {len(paths)}개 그래프 생성 완료!")
         print("="*70 + "\n")
 
         return paths
+
+    def generate_study_graphs(self, scenarios, bim_cost=50_000_000):
+        """
+        여러 시나리오 그래프 일괄 생성 (시나리오별 하위 폴더)
+
+        Args:
+            scenarios: {시나리오명: (metrics_off, metrics_on)}
+
+        Returns:
+            {시나리오명: [저장 경로]}
+        """
+        jobs = {
+            name: self._chart_jobs(metrics_off, metrics_on, bim_cost, self.output_dir / str(name))
+            for name, (metrics_off, metrics_on) in scenarios.items()
+        }
+        self.render([job for chart_jobs in jobs.values() for job in chart_jobs])
+        print(f"[그래프] 시나리오 {len(jobs)}개, 렌더링 {self.stats['rendered']}건 / 캐시 {self.stats['cached']}건")
+        return {name: [job['save_path'] for job in chart_jobs] for name, chart_jobs in jobs.items()}
@@ -0,0 +1,468 @@
+"""
+보고서 엔진 (사전 컴파일 템플릿 + 파생 지표 + 다중 출력 형식)
+
+- 파생 지표(단위 환산, ON/OFF 차이, 개선율)는 시나리오당 한 번만 계산
+- 템플릿은 섹션/표/목록 구조를 데이터로 정의하고 서식 문자열을 미리 컴파일
+- 출력 형식: text (한글 표시 폭 기준 정렬), markdown, html, csv
+- 일괄 모드: 시나리오를 하나씩 렌더링해 바로 기록 (시나리오 수와 무관한 메모리)
+"""
+
+import io
+import re
+import csv
+import html
+import string
+from pathlib import Path
+from utils.text_width import display_width, pad
+
+EOK = 100_000_000  # 억원
+
+
+# ----------------------------------------------------------------------
+# 파생 지표
+# ----------------------------------------------------------------------
+def derive_metrics(metrics):
+    """단일 시나리오 지표 + 단위 환산값 (억원)"""
+    derived = dict(metrics)
+    for key in ('planned_budget', 'actual_cost', 'cost_increase', 'direct_cost_increase', 'financial_cost'):
+        derived[f'{key}_eok'] = metrics[key] / EOK
+    return derived
+
+
+def derive_comparison(metrics_off, metrics_on):
+    """BIM OFF/ON 비교 파생 지표 ({'off', 'on', 'd'})"""
+    off, on = derive_metrics(metrics_off), derive_metrics(metrics_on)
+
+    def improvement(key):
+        return (1 - on[key] / off[key]) * 100 if off[key] > 0 else 0.0
+
+    cost_reduction = off['actual_cost'] - on['actual_cost']
+    d = {
+        'duration_reduction': off['actual_duration'] - on['actual_duration'],
+        'delay_reduction': off['delay_days'] - on['delay_days'],
+        'delay_rate_diff': off['schedule_delay_rate'] - on['schedule_delay_rate'],
+        'delay_improvement': improvement('schedule_delay_rate'),
+        'cost_saving_eok': off['cost_increase_eok'] - on['cost_increase_eok'],
+        'direct_saving_eok': off['direct_cost_increase_eok'] - on['direct_cost_increase_eok'],
+        'financial_saving_eok': off['financial_cost_eok'] - on['financial_cost_eok'],
+        'overrun_diff': off['budget_overrun_rate'] - on['budget_overrun_rate'],
+        'overrun_improvement': improvement('budget_overrun_rate'),
+        'issues_diff': off['issues_count'] - on['issues_count'],
+        'detected_gain': on['detected_count'] - off['detected_count'],
+        'missed_diff': off['missed_count'] - on['missed_count'],
+        'detection_improvement': on['detection_rate'] - off['detection_rate'],
+        'rate_diff_bp': (off['final_interest_rate'] - on['final_interest_rate']) * 10000,
+        'cost_reduction': cost_reduction,
+        'cost_reduction_eok': cost_reduction / EOK,
+        'cost_reduction_rate': cost_reduction / off['actual_cost'] * 100 if off['actual_cost'] else 0.0,
+    }
+    d['delay_reduction_weeks'] = d['delay_reduction'] / 7
+    d['delay_reduced'] = d['delay_reduction'] > 0
+    d['cost_reduced'] = cost_reduction > 0
+    d['detection_much_improved'] = d['detection_improvement'] > 0.2
+    return {'off': off, 'on': on, 'd': d}
+
+
+# ----------------------------------------------------------------------
+# 템플릿
+# ----------------------------------------------------------------------
+# 섹션: {'title', 'columns', 'align', 'rows', 'footer'} (표) 또는 {'title', 'items'} (목록)
+# 셀/항목은 str.format 서식 (컨텍스트: off/on/d 또는 m), 항목은 (조건 키, 서식)으로 조건부 표시 가능
+
+COMPARISON_TEMPLATE = {
+    'title': 'BIM 적용 효과 비교 보고서',
+    'sections': [
+        {
+            'title': '1. 공사 기간',
+            'columns': ['구분', '계획(일)', '실제(일)', '지연(일)', '지연률'],
+            'rows': [
+                ['BIM OFF', '{off[planned_duration]:.0f}', '{off[actual_duration]:.1f}',
+                 '{off[delay_days]:.1f}', '{off[schedule_delay_rate]:.1%}'],
+                ['BIM ON', '{on[planned_duration]:.0f}', '{on[actual_duration]:.1f}',
+                 '{on[delay_days]:.1f}', '{on[schedule_delay_rate]:.1%}'],
+            ],
+            'footer': [['개선 효과', '-', '{d[duration_reduction]:.1f}일 단축', '{d[delay_reduction]:.1f}일 감소',
+                        '{d[delay_rate_diff]:.1%}p']],
+        },
+        {
+            'title': '2. 공사 비용',
+            'columns': ['구분', '계획(억원)', '실제(억원)', '초과(억원)', '초과율'],
+            'rows': [
+                ['BIM OFF', '{off[planned_budget_eok]:.1f}', '{off[actual_cost_eok]:.1f}',
+                 '{off[cost_increase_eok]:.1f}', '{off[budget_overrun_rate]:.1%}'],
+                ['BIM ON', '{on[planned_budget_eok]:.1f}', '{on[actual_cost_eok]:.1f}',
+                 '{on[cost_increase_eok]:.1f}', '{on[budget_overrun_rate]:.1%}'],
+            ],
+            'footer': [['절감 효과', '-', '-', '{d[cost_saving_eok]:.1f}억원', '{d[overrun_diff]:.1%}p']],
+        },
+        {
+            'title': '3. 비용 세부 내역',
+            'columns': ['구분', '직접비용(억원)', '금융비용(억원)', '합계(억원)'],
+            'rows': [
+                ['BIM OFF', '{off[direct_cost_increase_eok]:.2f}', '{off[financial_cost_eok]:.2f}',
+                 '{off[cost_increase_eok]:.2f}'],
+                ['BIM ON', '{on[direct_cost_increase_eok]:.2f}', '{on[financial_cost_eok]:.2f}',
+                 '{on[cost_increase_eok]:.2f}'],
+            ],
+            'footer': [['절감', '{d[direct_saving_eok]:.2f}', '{d[financial_saving_eok]:.2f}',
+                        '{d[cost_saving_eok]:.2f}']],
+        },
+        {
+            'title': '4. 이슈 관리',
+            'columns': ['구분', '발생(건)', '탐지(건)', '미탐지(건)', '탐지율'],
+            'rows': [
+                ['BIM OFF', '{off[issues_count]}', '{off[detected_count]}', '{off[missed_count]}',
+                 '{off[detection_rate]:.1%}'],
+                ['BIM ON', '{on[issues_count]}', '{on[detected_count]}', '{on[missed_count]}',
+                 '{on[detection_rate]:.1%}'],
+            ],
+            'footer': [['개선', '{d[issues_diff]}', '{d[detected_gain]:+}', '{d[missed_diff]}',
+                        '{d[detection_improvement]:+.1%}p']],
+        },
+        {
+            'title': '5. 금융 지표',
+            'columns': ['구분', '최종 금리'],
+            'rows': [
+                ['BIM OFF', '{off[final_interest_rate]:.2%}'],
+                ['BIM ON', '{on[final_interest_rate]:.2%}'],
+            ],
+            'footer': [['차이', '{d[rate_diff_bp]:.0f}bp']],
+        },
+        {
+            'title': '핵심 요약',
+            'items': [
+                '공사 기간: {d[delay_reduction]:.1f}일 단축 ({d[delay_improvement]:.1f}% 개선)',
+                '공사 비용: {d[cost_saving_eok]:.2f}억원 절감 ({d[overrun_improvement]:.1f}% 개선)',
+                '이슈 탐지율: {d[detection_improvement]:.1%}p 향상',
+                '금리 인상 억제: {d[rate_diff_bp]:.0f}bp 절감',
+            ],
+        },
+    ],
+}
+
+RESULT_TEMPLATE = {
+    'title': 'BIM 시뮬레이션 비교 결과 리포트',
+    'sections': [
+        {
+            'title': '핵심 개선 효과 요약',
+            'items': [
+                '1. 공사 기간 단축: {d[delay_reduction]:.0f}일 ({d[delay_reduction_weeks]:.1f}주)',
+                '2. 비용 절감: {d[cost_reduction]:,.0f}원 ({d[cost_reduction_eok]:.2f}억원)',
+                '3. 이슈 탐지율 향상: {d[detection_improvement]:.1%}p',
+                '4. ROI (투자 대비 절감률): {d[cost_reduction_rate]:.1f}%',
+            ],
+        },
+        {
+            'title': '상세 비교표',
+            'columns': ['항목', 'BIM OFF (전통)', 'BIM ON (적용)'],
+            'rows': [
+                ['총 공사 기간 (일)', '{off[actual_duration]:.0f}', '{on[actual_duration]:.0f}'],
+                ['계획 대비 지연 (일)', '{off[delay_days]:.0f}', '{on[delay_days]:.0f}'],
+                ['지연율 (%)', '{off[schedule_delay_rate]:.1%}', '{on[schedule_delay_rate]:.1%}'],
+                ['최종 비용 (원)', '{off[actual_cost]:,.0f}', '{on[actual_cost]:,.0f}'],
+                ['계획 예산 (원)', '{off[planned_budget]:,.0f}', '{on[planned_budget]:,.0f}'],
+                ['예산 초과액 (원)', '{off[cost_increase]:,.0f}', '{on[cost_increase]:,.0f}'],
+                ['예산 초과율 (%)', '{off[budget_overrun_rate]:.1%}', '{on[budget_overrun_rate]:.1%}'],
+                ['발생 이슈 (건)', '{off[issues_count]}', '{on[issues_count]}'],
+                ['조기 탐지 이슈 (건)', '{off[detected_count]}', '{on[detected_count]}'],
+                ['미탐지 이슈 (건)', '{off[missed_count]}', '{on[missed_count]}'],
+                ['탐지율 (%)', '{off[detection_rate]:.1%}', '{on[detection_rate]:.1%}'],
+            ],
+        },
+        {
+            'title': '결론 및 권고사항',
+            'items': [
+                ('delay_reduced', '✓ BIM 적용으로 공사 기간이 단축되어 일정 준수에 유리합니다.'),
+                ('cost_reduced', '✓ 총 비용이 {d[cost_reduction_rate]:.1f}% 절감되어 예산 효율성이 크게 향상되었습니다.'),
+                ('detection_much_improved', '✓ 이슈 조기 탐지율이 크게 향상되어 품질 관리가 강화되었습니다.'),
+                '[권고] BIM 적용을 통해 시공 품질 및 효율성이 입증되었습니다.',
+            ],
+        },
+    ],
+}
+
+SINGLE_TEMPLATE = {
+    'title': '{name} 시나리오 결과 보고서',
+    'sections': [
+        {
+            'title': '1. 프로젝트 개요',
+            'items': ['프로젝트명: {project_name}', '계획 예산: {m[planned_budget_eok]:.1f}억원',
+                      '계획 공기: {m[planned_duration]}일'],
+        },
+        {
+            'title': '2. 최종 결과',
+            'items': ['실제 공기: {m[actual_duration]:.0f}일', '지연: {m[delay_days]:.0f}일 ({m[delay_weeks]:.1f}주)',
+                      '지연률: {m[schedule_delay_rate]:.1%}', '실제 비용: {m[actual_cost_eok]:.2f}억원',
+                      '초과: {m[cost_increase_eok]:.2f}억원', '초과율: {m[budget_overrun_rate]:.1%}'],
+        },
+        {
+            'title': '3. 비용 세부',
+            'items': ['직접 비용 증가: {m[direct_cost_increase_eok]:.2f}억원', '금융 비용: {m[financial_cost_eok]:.2f}억원'],
+        },
+        {
+            'title': '4. 이슈 통계',
+            'items': ['발생: {m[issues_count]}건', '탐지: {m[detected_count]}건', '미탐지: {m[missed_count]}건',
+                      '탐지율: {m[detection_rate]:.1%}'],
+        },
+        {
+            'title': '5. 금융',
+            'items': ['최종 금리: {m[final_interest_rate]:.2%}'],
+        },
+    ],
+}
+
+
+# 필드 이름 뒤 접근자 (.속성 / [키])
+_FIELD_ACCESS = re.compile(r'\.([^.\[]+)|\[([^\]]+)\]')
+_CONVERSIONS = {'r': repr, 's': str, 'a': ascii}
+
+
+def compile_format(text):
+    """
+    서식 문자열을 (문자열, 필드) 조각으로 한 번 파싱해 렌더링 함수 반환 (str.format_map과 같은 결과)
+
+    필드 이름은 이름 + .속성/[키] 접근만 지원 (서식 지정 안의 중첩 필드는 지원하지 않음)
+    """
+    segments = []
+    for literal, field, spec, conversion in string.Formatter().parse(text):
+        if field is None:
+            segments.append((literal, None))
+            continue
+        first = re.match(r'[^.\[]*', field).group()
+        if not first or '{' in spec:
+            raise ValueError(f"지원하지 않는 서식 필드입니다: {{{field}}} ({text!r})")
+        access = tuple(
+            (True, attr) if attr else (False, int(key) if key.isdigit() else key)
+            for attr, key in _FIELD_ACCESS.findall(field[len(first):])
+        )
+        segments.append((literal, (first, access, _CONVERSIONS.get(conversion), spec)))
+
+    def render(context):
+        parts = []
+        for literal, field in segments:
+            parts.append(literal)
+            if field is not None:
+                first, access, convert, spec = field
+                value = context[first]
+                for is_attr, key in access:
+                    value = getattr(value, key) if is_attr else value[key]
+                if convert:
+                    value = convert(value)
+                parts.append(format(value, spec))
+        return ''.join(parts)
+    return render
+
+
+class CompiledTemplate:
+    """서식 문자열을 미리 파싱한 템플릿 (렌더링 시 파싱 없음)"""
+
+    def __init__(self, template):
+        self.title = compile_format(template['title'])
+        self.sections = []
+        for section in template['sections']:
+            compiled = {'title': section['title']}
+            if 'items' in section:
+                compiled['items'] = [
+                    (item[0], compile_format(item[1])) if isinstance(item, tuple) else (None, compile_format(item))
+                    for item in section['items']
+                ]
+            else:
+                compiled['columns'] = section['columns']
+                compiled['rows'] = [[compile_format(cell) for cell in row] for row in section['rows']]
+                compiled['footer'] = [[compile_format(cell) for cell in row] for row in section.get('footer', [])]
+            self.sections.append(compiled)
+
+    def fill(self, context):
+        """
+        컨텍스트로 값 채우기
+
+        Returns:
+            (제목, [{'title', 'columns', 'rows', 'footer'} 또는 {'title', 'items'}])
+        """
+        conditions = context.get('d', {})
+        sections = []
+        for section in self.sections:
+            if 'items' in section:
+                items = [fmt(context) for condition, fmt in section['items']
+                         if condition is None or conditions.get(condition)]
+                sections.append({'title': section['title'], 'items': items})
+            else:
+                sections.append({
+                    'title': section['title'],
+                    'columns': section['columns'],
+                    'rows': [[fmt(context) for fmt in row] for row in section['rows']],
+                    'footer': [[fmt(context) for fmt in row] for row in section['footer']],
+                })
+        return self.title(context), sections
+
+
+# ----------------------------------------------------------------------
+# 출력 형식
+# ----------------------------------------------------------------------
+def render_text(title, sections, width=80):
+    """고정폭 텍스트 (표시 폭 기준 정렬)"""
+    lines = ['=' * width, title, '=' * width]
+    for section in sections:
+        lines.append('')
+        lines.append(section['title'])
+        lines.append('─' * width)
+        if 'items' in section:
+            lines.extend(f"  - {item}" for item in section['items'])
+            continue
+
+        table = [section['columns']] + section['rows'] + section['footer']
+        widths = [max(display_width(row[i]) for row in table) for i in range(len(section['columns']))]
+
+        def line(row):
+            cells = [pad(row[0], widths[0])] + [pad(cell, w, 'right') for cell, w in zip(row[1:], widths[1:])]
+            return ' │ '.join(cells)
+
+        lines.append(line(section['columns']))
+        lines.append('─' * width)
+        lines.extend(line(row) for row in section['rows'])
+        if section['footer']:
+            lines.append('─' * width)
+            lines.extend(line(row) for row in section['footer'])
+    lines.append('=' * width)
+    return '\n'.join(lines) + '\n'
+
+
+def render_markdown(title, sections):
+    """Markdown"""
+    lines = [f"# {title}"]
+    for section in sections:
+        lines += ['', f"## {section['title']}", '']
+        if 'items' in section:
+            lines.extend(f"- {item}" for item in section['items'])
+            continue
+        columns = section['columns']
+        lines.append('| ' + ' | '.join(columns) + ' |')
+        lines.append('|' + '|'.join([' --- '] + [' ---: '] * (len(columns) - 1)) + '|')
+        for row in section['rows'] + section['footer']:
+            lines.append('| ' + ' | '.join(cell.replace('|', '\\|') for cell in row) + ' |')
+    return '\n'.join(lines) + '\n'
+
+
+def render_html(title, sections):
+    """HTML 조각 (문서 하나 또는 일괄 파일에 그대로 삽입)"""
+    escape = html.escape
+    parts = [f"<section class=\"report\">\n<h1>{escape(title)}</h1>"]
+    for section in sections:
+        parts.append(f"<h2>{escape(section['title'])}</h2>")
+        if 'items' in section:
+            parts.append('<ul>' + ''.join(f"<li>{escape(item)}</li>" for item in section['items']) + '</ul>')
+            continue
+        head = ''.join(f"<th>{escape(column)}</th>" for column in section['columns'])
+        body = ''.join(
+            '<tr>' + ''.join(f"<td>{escape(cell)}</td>" for cell in row) + '</tr>'
+            for row in section['rows'] + section['footer']
+        )
+        parts.append(f"<table>\n<thead><tr>{head}</tr></thead>\n<tbody>{body}</tbody>\n</table>")
+    parts.append('</section>')
+    return '\n'.join(parts) + '\n'
+
+
+CSV_HEADER = ['scenario', 'section', 'row', 'column', 'value']
+
+
+def csv_rows(title, sections, scenario=''):
+    """긴 형식 행 (시나리오, 섹션, 행, 열, 값)"""
+    for section in sections:
+        if 'items' in section:
+            for index, item in enumerate(section['items']):
+                yield [scenario, section['title'], index + 1, '', item]
+            continue
+        for row in section['rows'] + section['footer']:
+            for column, cell in zip(section['columns'][1:], row[1:]):
+                yield [scenario, section['title'], row[0], column, cell]
+
+
+def render_csv(title, sections, scenario=''):
+    """CSV (헤더 포함)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    writer.writerows(csv_rows(title, sections, scenario))
+    return buffer.getvalue()
+
+
+RENDERERS = {
+    'text': (render_text, 'txt'),
+    'markdown': (render_markdown, 'md'),
+    'html': (render_html, 'html'),
+    'csv': (render_csv, 'csv'),
+}
+
+TEMPLATES = {
+    'comparison': COMPARISON_TEMPLATE,
+    'result': RESULT_TEMPLATE,
+    'single': SINGLE_TEMPLATE,
+}
+
+
+class ReportEngine:
+    """보고서 엔진 (템플릿은 처음 사용할 때 한 번 컴파일)"""
+
+    def __init__(self):
+        self.compiled = {}
+
+    def template(self, name):
+        if name not in self.compiled:
+            self.compiled[name] = CompiledTemplate(TEMPLATES[name])
+        return self.compiled[name]
+
+    def render_comparison(self, metrics_off, metrics_on, target='text', template='comparison', scenario=''):
+        """BIM OFF/ON 비교 보고서"""
+        title, sections = self.template(template).fill(derive_comparison(metrics_off, metrics_on))
+        return self._render(target, title, sections, scenario)
+
+    def render_single(self, metrics, scenario_name, target='text', project_name='청담동 근린생활시설 신축공사'):
+        """단일 시나리오 보고서"""
+        context = {'m': derive_metrics(metrics), 'name': scenario_name, 'project_name': project_name}
+        title, sections = self.template('single').fill(context)
+        return self._render(target, title, sections, scenario_name)
+
+    @staticmethod
+    def _render(target, title, sections, scenario=''):
+        renderer = RENDERERS[target][0]
+        if target == 'csv':
+            return renderer(title, sections, scenario)
+        return renderer(title, sections)
+
+    def render_batch(self, scenarios, output, target='csv', template='comparison'):
+        """
+        시나리오별 보고서 일괄 렌더링 (한 건씩 렌더링 후 바로 기록)
+
+        Args:
+            scenarios: (시나리오명, metrics_off, metrics_on) 반복자 (제너레이터 가능)
+            output: csv는 파일 경로 (전체 시나리오 한 파일), 그 외는 폴더 (시나리오별 파일)
+            target: 'text' / 'markdown' / 'html' / 'csv'
+
+        Returns:
+            처리한 시나리오 수
+        """
+        compiled = self.template(template)
+        output = Path(output)
+        count = 0
+
+        if target == 'csv':
+            output.parent.mkdir(parents=True, exist_ok=True)
+            with open(output, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_HEADER)
+                for name, metrics_off, metrics_on in scenarios:
+                    title, sections = compiled.fill(derive_comparison(metrics_off, metrics_on))
+                    writer.writerows(csv_rows(title, sections, name))
+                    count += 1
+            return count
+
+        renderer, extension = RENDERERS[target]
+        output.mkdir(parents=True, exist_ok=True)
+        for name, metrics_off, metrics_on in scenarios:
+            title, sections = compiled.fill(derive_comparison(metrics_off, metrics_on))
+            (output / f"{name}.{extension}").write_text(renderer(title, sections), encoding='utf-8')
+            count += 1
+        return count
+
+
+report_engine = ReportEngine()
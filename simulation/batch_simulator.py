@@ -0,0 +1,341 @@
+"""
+NumPy 기반 배치(Monte Carlo) 시뮬레이터
+SimulationEngine과 동일한 수치 모형을 다수 실행 × 다수 프로젝트에 대해 한 번에 계산
+"""
+
+import json
+from types import SimpleNamespace
+import numpy as np
+from config.project_config import ProjectConfig
+from models.bim_quality import BIMQuality
+from simulation.impact_calculator import ImpactCalculator
+from simulation.issue_correlation import CorrelatedIssueSampler
+from simulation.negotiation_system import NegotiationSystem
+
+# 일별 발생 확률 상한 (확률 1.0 → 위험률 무한대 방지)
+MAX_DAILY_PROB = 1.0 - 1e-12
+
+
+def daily_hazard(prob):
+    """일별 발생 확률 → 위험률(hazard) 변환: -ln(1 - p)"""
+    prob = np.clip(prob, 0.0, MAX_DAILY_PROB)
+    return -np.log1p(-prob)
+
+
+def first_trigger_day(exposure, hazard, start, end,
+                      boost_start=0, boost_end=0, boost_hazard=None):
+    """
+    일별 Bernoulli 발생 과정의 최초 발생일 (역변환 샘플링)
+
+    매일 확률 p로 발생 여부를 확인하는 과정은 누적 위험률이
+    Exp(1) 난수(exposure)를 처음 넘는 날과 분포가 같다.
+    [boost_start, boost_end) 구간에는 boost_hazard를 적용한다 (공통 충격 등).
+
+    Args:
+        exposure: Exp(1) 난수 배열
+        hazard: 기본 일별 위험률
+        start, end: 발생 가능 구간 (양 끝 포함, 프로젝트 일자)
+        boost_start, boost_end: 위험률 변경 구간 (끝 미포함)
+        boost_hazard: 변경 구간 위험률 (None이면 기본값과 동일)
+
+    Returns:
+        (trigger_day, triggered): 발생일(정수) 배열, 발생 여부 배열
+    """
+    if boost_hazard is None:
+        boost_hazard = hazard
+
+    s = np.clip(boost_start, start, end + 1)
+    e = np.clip(boost_end, s, end + 1)
+
+    h1 = (s - start) * hazard
+    h2 = h1 + (e - s) * boost_hazard
+    h3 = h2 + (end + 1 - e) * hazard
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d1 = start + np.maximum(np.ceil(exposure / hazard), 1) - 1
+        d2 = s + np.maximum(np.ceil((exposure - h1) / boost_hazard), 1) - 1
+        d3 = e + np.maximum(np.ceil((exposure - h2) / hazard), 1) - 1
+
+    day = np.where(
+        exposure <= h1, d1,
+        np.where(exposure <= h2, d2,
+                 np.where(exposure <= h3, d3, np.inf))
+    )
+    triggered = day <= end
+
+    return np.where(triggered, day, 0).astype(np.int64), triggered
+
+
+class BatchSimulator:
+    """벡터화 배치 시뮬레이터
+
+    이슈 카드와 프로젝트 조건을 한 번 컴파일한 뒤
+    (실행 수 × 프로젝트 수 × 이슈 수) 배열 연산으로 결과를 계산한다.
+    에이전트 회의는 수치에 영향을 주지 않으므로 생략한다.
+    """
+
+    def __init__(self, projects, issue_file='data/issue_cards.json', issues=None, correlation=None):
+        """
+        Args:
+            projects: Project 인스턴스 또는 Project 리스트
+            issue_file: 이슈 카드 JSON 파일 경로
+            issues: 이슈 카드 리스트 (지정 시 파일 대신 사용)
+            correlation: 이슈 간 발생 상관 구조
+                         (CorrelatedIssueSampler, True면 기본 클러스터로 컴파일, None이면 독립)
+        """
+        self.single = not isinstance(projects, (list, tuple))
+        self.projects = [projects] if self.single else list(projects)
+
+        if issues is None:
+            with open(issue_file, 'r', encoding='utf-8') as f:
+                issues = json.load(f)
+        self.issues = issues
+        self.issue_ids = [issue['id'] for issue in issues]
+
+        if correlation is True:
+            correlation = CorrelatedIssueSampler(issues)
+        self.correlation = correlation
+
+        self.negotiation_system = NegotiationSystem()
+        self._compile()
+
+    def _compile(self):
+        """이슈/프로젝트 조건을 배열로 컴파일 (실행마다 재사용)"""
+        issues = self.issues
+        projects = self.projects
+        n_proj, n_issue = len(projects), len(issues)
+
+        self.base_prob = np.array([
+            min(1.0, issue.get('occurrence_rate', 0.01)) for issue in issues
+        ])
+        self.delay_min = np.array([issue['delay_weeks_min'] for issue in issues], dtype=float)
+        self.delay_span = np.array([issue['delay_weeks_max'] for issue in issues]) - self.delay_min
+        self.cost_min = np.array([issue['cost_increase_min'] for issue in issues], dtype=float)
+        self.cost_span = np.array([issue['cost_increase_max'] for issue in issues]) - self.cost_min
+
+        # 이슈 발생 구간 (프로젝트별 단계 기간 기준)
+        self.window_start = np.ones((n_proj, n_issue), dtype=np.int64)
+        self.window_end = np.zeros((n_proj, n_issue), dtype=np.int64)
+
+        self.detection_prob = np.zeros((n_proj, n_issue))
+        self.delay_reduction = np.zeros((n_proj, n_issue))
+        self.cost_reduction = np.zeros((n_proj, n_issue))
+
+        # 협상 위치 [프로젝트, 탐지 여부, 공사 막바지 여부]
+        self.position = np.zeros((n_proj, 2, 2))
+
+        for p, project in enumerate(projects):
+            phase_start = project.calendar.bounds
+
+            for i, issue in enumerate(issues):
+                if issue['phase'] in phase_start:
+                    self.window_start[p, i], self.window_end[p, i] = phase_start[issue['phase']]
+
+                if project.bim_enabled:
+                    effectiveness = BIMQuality.calculate_effectiveness(issue['id'], project.bim_quality)
+                    self.detection_prob[p, i] = BIMQuality.calculate_detection_probability(
+                        issue, effectiveness
+                    )
+                    reduction = ImpactCalculator.REDUCTION_BY_PHASE.get(
+                        issue['bim_effect']['detection_phase'],
+                        ImpactCalculator.DEFAULT_REDUCTION
+                    )
+                    bonus = effectiveness * ImpactCalculator.QUALITY_BONUS_FACTOR
+                    self.delay_reduction[p, i] = min(ImpactCalculator.MAX_REDUCTION, reduction['delay'] + bonus)
+                    self.cost_reduction[p, i] = min(ImpactCalculator.MAX_REDUCTION, reduction['cost'] + bonus)
+
+            for detected in (0, 1):
+                for late in (0, 1):
+                    view = SimpleNamespace(
+                        name=project.name,
+                        budget=project.budget,
+                        bim_enabled=project.bim_enabled,
+                        planned_duration=project.planned_duration,
+                        current_day=project.planned_duration + 1 if late else 0
+                    )
+                    self.position[p, detected, late] = self.negotiation_system.calculate_position(
+                        view, bool(detected)
+                    )
+
+        self.bim_enabled = np.array([project.bim_enabled for project in projects])
+        self.budget = np.array([project.budget for project in projects], dtype=float)
+        self.planned_duration = np.array([project.planned_duration for project in projects], dtype=float)
+        self.late_day = self.planned_duration * 0.8
+        self.initial_rate = np.array([project.base_interest_rate for project in projects])
+
+        # 불확실성 범위 (BIM OFF / BIM ON 미탐지)
+        low = np.where(self.bim_enabled, ImpactCalculator.BIM_MISSED_UNCERTAINTY[0],
+                       ImpactCalculator.TRADITIONAL_UNCERTAINTY[0])
+        high = np.where(self.bim_enabled, ImpactCalculator.BIM_MISSED_UNCERTAINTY[1],
+                        ImpactCalculator.TRADITIONAL_UNCERTAINTY[1])
+        self.uncertainty_low = low[:, None]
+        self.uncertainty_span = (high - low)[:, None]
+
+        # 지연 개월수 → 금리 인상(bp) 표 (FinancialCalculator.get_rate_increase와 동일)
+        max_month = max(ProjectConfig.DELAY_RATE_INCREASE)
+        self.rate_table = np.array([
+            ProjectConfig.DELAY_RATE_INCREASE.get(m, 0) for m in range(max_month + 1)
+        ] + [100], dtype=float)
+
+    def run(self, n_runs=1000, seed=None, rate_multipliers=None, boost=None,
+            detail=False, chunk_size=None, progress=None):
+        """
+        배치 시뮬레이션 실행
+
+        Args:
+            n_runs: 실행(시나리오) 수
+            seed: 난수 시드 (동일 시드 → 동일 결과)
+            rate_multipliers: 발생 확률 배수, (실행, 프로젝트, 이슈)로 broadcast 가능한 배열
+                              또는 (n) → 배열을 반환하는 함수 (청크별 호출)
+            boost: 위험률 변경 구간 (start, end, multiplier) 튜플, 각 항목은 배열 또는 함수
+            detail: 이슈별 상세 배열 포함 여부
+            chunk_size: 한 번에 계산할 실행 수 (메모리 제한용)
+            progress: 청크마다 호출할 함수 (완료 실행 수, 전체 실행 수)
+
+        Returns:
+            지표명 → 배열 딕셔너리 (calculate_final_metrics와 동일한 키)
+            배열 형태: (실행, 프로젝트), 단일 프로젝트는 (실행,)
+        """
+        rng = np.random.default_rng(seed)
+
+        if chunk_size is None:
+            cells = len(self.projects) * len(self.issues)
+            chunk_size = max(1, 2_000_000 // max(1, cells))
+
+        chunks = []
+        done = 0
+        while done < n_runs:
+            n = min(chunk_size, n_runs - done)
+            chunks.append(self._simulate_chunk(rng, n, rate_multipliers, boost, detail))
+            done += n
+            if progress:
+                progress(done, n_runs)
+
+        result = {
+            key: np.concatenate([chunk[key] for chunk in chunks])
+            for key in chunks[0]
+        }
+
+        if self.single:
+            result = {key: value[:, 0] for key, value in result.items()}
+
+        return result
+
+    def _simulate_chunk(self, rng, n, rate_multipliers=None, boost=None, detail=False):
+        """n개 실행 계산"""
+        n_proj, n_issue = self.window_start.shape
+        shape = (n, n_proj, n_issue)
+
+        exposure = rng.standard_exponential(shape)
+        if self.correlation is not None and len(self.correlation.member_index):
+            exposure[..., self.correlation.member_index] = self.correlation.draw_threshold_matrix(
+                rng, (n, n_proj)
+            )
+        detect_draw = rng.random(shape)
+        uncertainty_draw = rng.random(shape)
+
+        prob = self.base_prob
+        if rate_multipliers is not None:
+            multipliers = rate_multipliers(n) if callable(rate_multipliers) else rate_multipliers
+            prob = prob * multipliers
+        hazard = daily_hazard(np.broadcast_to(prob, shape))
+
+        if boost is not None:
+            boost_start, boost_end, boost_mult = (
+                item(n) if callable(item) else item for item in boost
+            )
+            boost_hazard = daily_hazard(np.minimum(1.0, np.broadcast_to(prob, shape) * boost_mult))
+            day, triggered = first_trigger_day(
+                exposure, hazard, self.window_start, self.window_end,
+                boost_start, boost_end, boost_hazard
+            )
+        else:
+            day, triggered = first_trigger_day(
+                exposure, hazard, self.window_start, self.window_end
+            )
+
+        # BIM 조기 탐지
+        detected = triggered & (detect_draw < self.detection_prob)
+
+        # 협상 위치 (탐지 여부, 공사 막바지 여부)
+        late = day > self.late_day[:, None]
+        proj_index = np.arange(n_proj)[:, None]
+        position = self.position[proj_index, detected.astype(np.int64), late.astype(np.int64)]
+
+        negotiated_delay = self.delay_min + self.delay_span * position
+        negotiated_cost = self.cost_min + self.cost_span * position
+
+        uncertainty = self.uncertainty_low + self.uncertainty_span * uncertainty_draw
+        delay = np.where(detected, negotiated_delay * (1.0 - self.delay_reduction),
+                         negotiated_delay * uncertainty)
+        cost = np.where(detected, negotiated_cost * (1.0 - self.cost_reduction),
+                        negotiated_cost * uncertainty)
+        delay = np.where(triggered, delay, 0.0)
+        cost = np.where(triggered, cost, 0.0)
+
+        # 금융 비용 (FinancialCalculator.calculate_financial_cost와 동일)
+        delay_days = delay * 7
+        month_index = np.minimum((delay_days / 30).astype(np.int64), len(self.rate_table) - 1)
+        rate_bp = np.where(triggered, self.rate_table[month_index], 0.0)
+        budget = self.budget[:, None]
+        interest = budget * ProjectConfig.PF_RATIO * (rate_bp / 10000) * (delay_days / 365)
+        indirect = budget * ProjectConfig.DAILY_INDIRECT_COST_RATIO * delay_days
+        financial = interest + indirect
+
+        # 최종 금리: 처리 순서(발생일, 카드 순서)상 마지막 금리 인상 이슈 기준
+        order_key = np.where(triggered & (rate_bp > 0), day * n_issue + np.arange(n_issue), -1)
+        last = order_key.argmax(axis=2)
+        last_bp = np.take_along_axis(rate_bp, last[..., None], axis=2)[..., 0]
+        final_rate = np.where(
+            order_key.max(axis=2) >= 0,
+            ProjectConfig.BASE_INTEREST_RATE + last_bp / 10000,
+            self.initial_rate
+        )
+
+        result = self._final_metrics(
+            delay.sum(axis=2), cost.sum(axis=2), financial.sum(axis=2),
+            triggered.sum(axis=2), detected.sum(axis=2), final_rate
+        )
+
+        if detail:
+            result.update({
+                'issue_triggered': triggered,
+                'issue_day': day,
+                'issue_detected': detected,
+                'issue_delay_weeks': delay,
+                'issue_cost_increase': cost,
+                'issue_financial_cost': financial
+            })
+
+        return result
+
+    def _final_metrics(self, delay_weeks, cost_increase, financial_cost,
+                       issues_count, detected_count, final_rate):
+        """Project.calculate_final_metrics의 배열 버전"""
+        delay_days = delay_weeks * 7
+        direct_cost_increase = self.budget * cost_increase
+        actual_cost = self.budget + direct_cost_increase + financial_cost
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            detection_rate = np.where(issues_count > 0, detected_count / issues_count, 0.0)
+
+        return {
+            'planned_duration': np.broadcast_to(self.planned_duration, delay_days.shape),
+            'actual_duration': self.planned_duration + delay_days,
+            'delay_days': delay_days,
+            'delay_weeks': delay_weeks,
+            'schedule_delay_rate': delay_days / self.planned_duration,
+            'planned_budget': np.broadcast_to(self.budget, delay_days.shape),
+            'actual_cost': actual_cost,
+            'cost_increase': actual_cost - self.budget,
+            'budget_overrun_rate': (actual_cost - self.budget) / self.budget,
+            'direct_cost_increase': direct_cost_increase,
+            'financial_cost': financial_cost,
+            'issues_count': issues_count,
+            'detected_count': detected_count,
+            'missed_count': issues_count - detected_count,
+            'detection_rate': detection_rate,
+            'rfi_count': np.zeros_like(issues_count),
+            'rework_count': np.zeros_like(issues_count),
+            'final_interest_rate': final_rate
+        }
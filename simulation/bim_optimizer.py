@@ -0,0 +1,267 @@
+"""
+BIM 투자 최적화 (품질 설정 → 달성 비용 → 순절감액)
+
+BIM 품질 지표(WD/CD/AF/PL)마다 달성 비용 모형을 두고, 품질 설정별 BIM ON 배치 실행과
+BIM OFF 기준 실행을 같은 시드(공통 난수)로 짝지어 실행별 순절감액(절감액 - 투자비)을 계산한다.
+탐색은 정규화 품질 공간 [0, MAX_LEVEL]^4에서 CMA-ES, 후보는 격자(resolution)에 맞춰 평가하고 방문한 점은 재사용한다.
+"""
+
+import json
+import hashlib
+import numpy as np
+from config.bim_quality_config import BIMQualityConfig
+from models.bim_quality import BIMQuality
+from models.project import Project
+from simulation.batch_simulator import BatchSimulator
+from simulation.calibration import CMAES
+from simulation.parameter_space import MemoizedEvaluator
+from simulation.result_cache import canonical, code_version
+from utils.text_width import pad
+
+# 정규화 품질 키 (BIMQuality.normalize_metrics)
+LEVEL_KEYS = ('WD', 'CD', 'AF', 'PL')
+OBJECTIVES = ('mean', 'cvar')
+
+
+class BIMCostModel:
+    """BIM 품질 달성 비용 모형 (연면적 기준)
+
+    비용 = 연면적 × (도입 단가 + Σ 지표 단가 × -ln(1 - 정규화 수준))
+    남은 결함을 절반으로 줄이는 데 드는 노력이 일정하다고 보고, 완벽한 수준에 가까울수록 비용이 급증한다.
+    기본 단가는 청담동 프로젝트 양호(GOOD) 수준 ≈ 5천만원 (기존 ROI 그래프 고정 투자비)에 맞춤.
+    """
+
+    BASE_COST_PER_M2 = 20_000
+    METRIC_COST_PER_M2 = {'WD': 4_000, 'CD': 6_000, 'AF': 4_000, 'PL': 3_500}
+    MAX_LEVEL = 0.99
+
+    def __init__(self, base_cost_per_m2=None, metric_cost_per_m2=None):
+        self.base_cost_per_m2 = self.BASE_COST_PER_M2 if base_cost_per_m2 is None else base_cost_per_m2
+        self.metric_cost_per_m2 = dict(self.METRIC_COST_PER_M2, **(metric_cost_per_m2 or {}))
+
+    @staticmethod
+    def levels(bim_quality):
+        """BIM 품질 지표 → 정규화 수준 배열 (WD, CD, AF, PL)"""
+        normalized = BIMQuality.normalize_metrics(bim_quality)
+        return np.array([normalized[key] for key in LEVEL_KEYS], dtype=float)
+
+    @staticmethod
+    def quality(levels):
+        """정규화 수준 배열 → BIM 품질 지표 (normalize_metrics의 역변환)"""
+        wd, cd, af, pl = (float(level) for level in levels)
+        return {
+            'warning_density': round(2.0 * (1 - wd), 6),
+            'clash_density': round(1 - cd, 6),
+            'attribute_fill': round(af, 6),
+            'phase_link': round(pl, 6)
+        }
+
+    def cost(self, bim_quality, gfa):
+        """품질 설정 달성 비용 (원)"""
+        levels = np.minimum(self.levels(bim_quality), self.MAX_LEVEL)
+        effort = sum(self.metric_cost_per_m2[key] * -np.log1p(-level) for key, level in zip(LEVEL_KEYS, levels))
+        return float(gfa * (self.base_cost_per_m2 + effort))
+
+
+class InvestmentEvaluator(MemoizedEvaluator):
+    """품질 설정 → 순절감액 분포 요약 (BIM OFF 기준 대비, 공통 난수)"""
+
+    # 격자점 하나가 배치 실행이라 워커마다 한 묶음
+    CHUNKS_PER_WORKER = 1
+
+    def __init__(self, template=None, cost_model=None, n_runs=2000, seed=0, alpha=0.1, resolution=0.01,
+                 issue_file='data/issue_cards.json', cache=None):
+        """
+        Args:
+            template: 프로젝트 템플릿 (None이면 기본 청담동)
+            cost_model: BIMCostModel (기본 단가)
+            n_runs: 평가당 Monte Carlo 실행 수
+            seed: 모든 평가(기준 실행 포함)에 쓰는 시드
+            alpha: CVaR 꼬리 비율 (순절감액 하위 alpha 평균)
+            resolution: 정규화 수준 격자 간격 (같은 격자점은 한 번만 평가)
+            cache: 평가 결과 저장소 (SimulationResultCache, 프로세스/실행 간 공유)
+        """
+        self.template = template
+        self.cost_model = cost_model or BIMCostModel()
+        self.n_runs = n_runs
+        self.seed = seed
+        self.alpha = alpha
+        self.resolution = resolution
+        super().__init__(cache)
+        with open(issue_file, 'r', encoding='utf-8') as f:
+            self.issues = json.load(f)
+
+        baseline_project = Project(template=template)
+        self.gfa = baseline_project.gfa
+        baseline = BatchSimulator(baseline_project, issues=self.issues).run(n_runs, seed=seed)
+        self.baseline_cost = baseline['cost_increase']
+        self.baseline_delay = baseline['delay_weeks']
+
+    def grid(self, levels):
+        """정규화 수준 → 격자 정수 좌표 (0 ~ MAX_LEVEL)"""
+        levels = np.clip(np.asarray(levels, dtype=float), 0.0, self.cost_model.MAX_LEVEL)
+        return np.rint(levels / self.resolution).astype(np.int64)
+
+    def _evaluate_point(self, levels):
+        """정규화 수준 하나 평가 (현재 프로세스)"""
+        quality = self.cost_model.quality(levels)
+        project = Project(bim_enabled=True, bim_quality=quality, template=self.template)
+        result = BatchSimulator(project, issues=self.issues).run(self.n_runs, seed=self.seed)
+
+        investment = self.cost_model.cost(quality, project.gfa)
+        savings = self.baseline_cost - result['cost_increase']
+        net = savings - investment
+        tail = np.sort(net)[:max(1, int(np.ceil(self.alpha * len(net))))]
+        return {
+            'levels': [float(level) for level in levels],
+            'quality': quality,
+            'quality_level': BIMQuality.get_quality_level(quality),
+            'investment': investment,
+            'savings_mean': float(savings.mean()),
+            'net_mean': float(net.mean()),
+            'net_std': float(net.std()),
+            'net_cvar': float(tail.mean()),
+            'loss_probability': float(np.mean(net < 0)),
+            'roi': float(net.mean() / investment) if investment else 0.0,
+            'delay_saved_weeks': float((self.baseline_delay - result['delay_weeks']).mean())
+        }
+
+    def _points(self, levels):
+        # 격자점에 맞춘 정규화 수준 (같은 격자점은 같은 입력)
+        return self.grid(np.atleast_2d(levels)) * self.resolution
+
+    def _evaluate_rows(self, levels):
+        return [self._evaluate_point(row) for row in levels]
+
+    def _point_keys(self, levels):
+        """격자점별 저장 키 (비용 모형/실행 조건/코드 버전 포함)"""
+        prefix = json.dumps(canonical({
+            'version': code_version(),
+            'template': self.template,
+            'issues': self.issues,
+            'cost_model': [self.cost_model.base_cost_per_m2, self.cost_model.metric_cost_per_m2,
+                           self.cost_model.MAX_LEVEL],
+            'runs': [self.n_runs, self.seed, self.alpha, self.resolution]
+        }), sort_keys=True)
+        digest = hashlib.sha256(prefix.encode('utf-8')).hexdigest()
+        return [f"bim_investment:{digest}:{hashlib.sha256(point.tobytes()).hexdigest()}"
+                for point in self.grid(levels)]
+
+    def evaluate(self, levels, max_workers=1):
+        """
+        정규화 수준 행렬 평가 (격자점 단위로 기록/저장소 재사용)
+
+        Args:
+            levels: (평가 수, 4) 정규화 수준 (WD, CD, AF, PL)
+            max_workers: 프로세스 수 (1이면 현재 프로세스)
+
+        Returns:
+            평가 요약 딕셔너리 리스트
+        """
+        return super().evaluate(levels, max_workers)
+
+    @property
+    def visited(self):
+        """평가한 격자점 요약 (투자비 순)"""
+        return sorted(self._memo.values(), key=lambda summary: summary['investment'])
+
+
+class BIMInvestmentOptimizer:
+    """BIM 품질 설정 탐색 (기대 순절감액 또는 CVaR 최대화)"""
+
+    def __init__(self, evaluator=None, objective='mean', **evaluator_kwargs):
+        """
+        Args:
+            evaluator: InvestmentEvaluator (기본: evaluator_kwargs로 생성)
+            objective: 'mean' (기대 순절감액) 또는 'cvar' (순절감액 하위 alpha 평균, 위험 회피)
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"알 수 없는 목적 함수입니다: {objective} (가능: {', '.join(OBJECTIVES)})")
+        self.objective = objective
+        self.evaluator = evaluator or InvestmentEvaluator(**evaluator_kwargs)
+
+    def score(self, summary):
+        return summary['net_cvar'] if self.objective == 'cvar' else summary['net_mean']
+
+    def run(self, generations=40, population=None, sigma=0.25, start='average', max_workers=None, seed=0,
+            progress=None):
+        """
+        CMA-ES 탐색
+
+        Args:
+            generations: 최대 세대 수
+            population: 세대당 후보 수 (기본: 4 + 3 ln 4 = 8, 병렬 평가 단위)
+            sigma: 초기 탐색 폭 (정규화 수준 단위)
+            start: 시작 품질 (프리셋 이름 또는 BIM 품질 지표 딕셔너리)
+            max_workers: 평가 프로세스 수 (기본: CPU 수)
+            seed: CMA-ES 난수 시드
+            progress: 세대마다 호출할 함수 (history 항목)
+
+        Returns:
+            {'objective', 'best', 'presets', 'history', 'visited', 'stats'}
+        """
+        evaluator = self.evaluator
+        max_level = evaluator.cost_model.MAX_LEVEL
+
+        preset_names = [name for name in BIMQualityConfig.PRESETS if name != 'off']
+        preset_levels = [BIMCostModel.levels(BIMQualityConfig.PRESETS[name]) for name in preset_names]
+        presets = dict(zip(preset_names, evaluator.evaluate(preset_levels, max_workers=max_workers)))
+        best = max(presets.values(), key=self.score)
+
+        quality = BIMQualityConfig.get_preset(start) if isinstance(start, str) else start
+        strategy = CMAES(np.clip(BIMCostModel.levels(quality), 0, max_level) / max_level, sigma, population, seed)
+        stall = 10 + int(np.ceil(30 * strategy.dimension / strategy.population))
+        history = []
+
+        for generation in range(generations):
+            candidates = strategy.ask()
+            clipped = np.clip(candidates, 0, 1)
+            summaries = evaluator.evaluate(clipped * max_level, max_workers=max_workers)
+            scores = np.array([self.score(summary) for summary in summaries])
+            # 원 → 억원 단위로 최소화, 경계 밖 후보는 거리 벌점
+            strategy.tell(candidates, -scores / 1e8 + np.sum((candidates - clipped) ** 2, axis=1))
+
+            index = int(np.argmax(scores))
+            if scores[index] > self.score(best):
+                best = summaries[index]
+
+            history.append({'generation': generation + 1, 'best_score': self.score(best),
+                            'sigma': float(strategy.sigma), 'evaluated': evaluator.stats['evaluated']})
+            if progress:
+                progress(history[-1])
+
+            # 탐색 폭이 격자 간격보다 작거나 최고 점수가 오래 그대로면 종료
+            recent = [entry['best_score'] for entry in history[-stall:]]
+            if strategy.spread * max_level < evaluator.resolution / 2 or (
+                    len(history) >= stall and recent[-1] <= recent[0]):
+                break
+
+        return {
+            'objective': self.objective,
+            'best': best,
+            'presets': presets,
+            'history': history,
+            'visited': evaluator.visited,
+            'stats': dict(evaluator.stats)
+        }
+
+    @staticmethod
+    def print_summary(result):
+        """프리셋/최적 설정 비교 출력"""
+        key = 'net_cvar' if result['objective'] == 'cvar' else 'net_mean'
+        stats = result['stats']
+        print(f"\n{'='*86}")
+        print(f"BIM 투자 최적화 (목적: {'CVaR 순절감액' if key == 'net_cvar' else '기대 순절감액'}, "
+              f"평가 {stats['evaluated']:,}점, 재사용 {stats['memo_hits'] + stats['cache_hits']:,}회)")
+        print(f"{'='*86}")
+        # 품질 열은 정규화 수준 (0~1, 높을수록 좋음)
+        print(f"{pad('설정', 14)}{''.join(f'{key:>6}' for key in LEVEL_KEYS)}{pad('투자비', 10, 'right')}"
+              f"{pad('기대 순절감', 12, 'right')}{'CVaR':>10}{pad('손실확률', 10, 'right')}{'ROI':>8}")
+        rows = list(result['presets'].items()) + [('최적', result['best'])]
+        for name, summary in rows:
+            levels = ''.join(f"{level:>6.2f}" for level in summary['levels'])
+            print(f"{pad(name, 14)}{levels}"
+                  f"{summary['investment'] / 1e8:>8.2f}억{summary['net_mean'] / 1e8:>10.2f}억"
+                  f"{summary['net_cvar'] / 1e8:>8.2f}억{summary['loss_probability'] * 100:>9.1f}%"
+                  f"{summary['roi'] * 100:>7.0f}%")
+        print(f"{'='*86}\n")
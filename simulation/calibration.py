@@ -0,0 +1,247 @@
+"""
+벤치마크 보정 (모형 파라미터 → 업계 평균 지표)
+
+benchmark_data.json의 industry_average(전통/BIM) 예산 초과율, 일정 지연률과
+배치 시뮬레이터 평균의 상대 오차 제곱합을 최소화하는 파라미터를 CMA-ES로 찾는다.
+세대마다 후보 전체를 ParameterEvaluator로 한 번에(병렬) 평가하고, 평가한 점은 기록/저장소에서 재사용한다.
+"""
+
+import json
+from pathlib import Path
+import numpy as np
+from config.bim_quality_config import BIMQualityConfig
+from models.project import Project
+from simulation.parameter_space import ParameterEvaluator, default_parameters
+from utils.text_width import pad
+
+# 벤치마크 항목 → 배치 시뮬레이터 지표 (rfi_count/rework_rate는 배치 모형에 없음)
+TARGET_METRICS = {
+    'budget_overrun': 'budget_overrun_rate',
+    'schedule_delay': 'schedule_delay_rate',
+}
+
+# 보정 파라미터 묶음, 전체 발생 확률 배율 범위 (기본 모형은 업계 평균보다 이슈가 훨씬 많음)
+CALIBRATION_GROUPS = ('occurrence_scale', 'uncertainty', 'reduction', 'config')
+OCCURRENCE_SCALE_RANGE = (0.005, 1.5)
+
+
+def calibration_parameters(issues, spread=0.5, groups=CALIBRATION_GROUPS):
+    """보정 기본 파라미터 (default_parameters + 발생 확률 배율은 넓은 범위, 로그 척도)"""
+    return [
+        dict(param, low=OCCURRENCE_SCALE_RANGE[0], high=OCCURRENCE_SCALE_RANGE[1], log=True)
+        if param['target'] == ('occurrence_scale',) else param
+        for param in default_parameters(issues, spread, groups)
+    ]
+
+
+def default_scenarios():
+    """벤치마크 구분 → 평가 프로젝트 (전통: BIM OFF, BIM: 보통 품질)"""
+    return {
+        'traditional': Project(bim_enabled=False),
+        'bim': Project(bim_enabled=True, bim_quality=BIMQualityConfig.BIM_AVERAGE),
+    }
+
+
+class CMAES:
+    """CMA-ES (μ/μ_w, λ), 탐색 공간 [0, 1]^D (경계 밖 후보는 잘라서 평가 + 거리 벌점)"""
+
+    def __init__(self, mean, sigma=0.2, population=None, seed=None):
+        """
+        Args:
+            mean: 시작점 (단위 공간)
+            sigma: 초기 탐색 폭
+            population: 세대당 후보 수 λ (기본: 4 + 3 ln D)
+            seed: 난수 시드
+        """
+        self.mean = np.asarray(mean, dtype=float)
+        self.sigma = sigma
+        n = self.dimension = len(self.mean)
+        self.population = population or 4 + int(3 * np.log(n))
+        self.rng = np.random.default_rng(seed)
+
+        mu = self.population // 2
+        weights = np.log(mu + 0.5) - np.log(np.arange(1, mu + 1))
+        self.weights = weights / weights.sum()
+        self.mueff = 1 / np.sum(self.weights ** 2)
+
+        self.cc = (4 + self.mueff / n) / (n + 4 + 2 * self.mueff / n)
+        self.cs = (self.mueff + 2) / (n + self.mueff + 5)
+        self.c1 = 2 / ((n + 1.3) ** 2 + self.mueff)
+        self.cmu = min(1 - self.c1, 2 * (self.mueff - 2 + 1 / self.mueff) / ((n + 2) ** 2 + self.mueff))
+        self.damps = 1 + 2 * max(0, np.sqrt((self.mueff - 1) / (n + 1)) - 1) + self.cs
+        self.chi_n = np.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n ** 2))
+
+        self.pc = np.zeros(n)
+        self.ps = np.zeros(n)
+        self.cov = np.eye(n)
+        self.generation = 0
+        self._decompose()
+
+    def _decompose(self):
+        self.cov = np.triu(self.cov) + np.triu(self.cov, 1).T
+        eigenvalues, self.basis = np.linalg.eigh(self.cov)
+        self.scales = np.sqrt(np.maximum(eigenvalues, 1e-20))
+
+    def ask(self):
+        """후보 λ개 (단위 공간, 경계 밖일 수 있음)"""
+        z = self.rng.standard_normal((self.population, self.dimension))
+        return self.mean + self.sigma * (z * self.scales) @ self.basis.T
+
+    def tell(self, candidates, fitness):
+        """평가 결과로 평균/공분산/탐색 폭 갱신"""
+        n = self.dimension
+        order = np.argsort(fitness)[:len(self.weights)]
+        steps = (candidates[order] - self.mean) / self.sigma
+        step = self.weights @ steps
+        self.mean = self.mean + self.sigma * step
+        self.generation += 1
+
+        inv_sqrt = self.basis @ np.diag(1 / self.scales) @ self.basis.T
+        self.ps = (1 - self.cs) * self.ps + np.sqrt(self.cs * (2 - self.cs) * self.mueff) * inv_sqrt @ step
+        norm = np.linalg.norm(self.ps) / np.sqrt(1 - (1 - self.cs) ** (2 * self.generation))
+        hsig = norm / self.chi_n < 1.4 + 2 / (n + 1)
+        self.pc = (1 - self.cc) * self.pc + hsig * np.sqrt(self.cc * (2 - self.cc) * self.mueff) * step
+
+        rank_mu = (steps * self.weights[:, None]).T @ steps
+        self.cov = ((1 - self.c1 - self.cmu) * self.cov
+                    + self.c1 * (np.outer(self.pc, self.pc) + (1 - hsig) * self.cc * (2 - self.cc) * self.cov)
+                    + self.cmu * rank_mu)
+        self.sigma *= np.exp(self.cs / self.damps * (np.linalg.norm(self.ps) / self.chi_n - 1))
+        self._decompose()
+
+    @property
+    def spread(self):
+        """현재 좌표별 최대 탐색 폭"""
+        return self.sigma * np.sqrt(np.max(np.diag(self.cov)))
+
+
+class Calibration:
+    """벤치마크 업계 평균에 맞춘 모형 파라미터 탐색"""
+
+    def __init__(self, evaluator=None, benchmark_file='data/benchmark_data.json', scenarios=None,
+                 metrics=TARGET_METRICS, **evaluator_kwargs):
+        """
+        Args:
+            evaluator: ParameterEvaluator (기본: scenarios 프로젝트, calibration_parameters, 평가당 500회)
+            benchmark_file: 벤치마크 데이터 (industry_average 사용)
+            scenarios: 벤치마크 구분 → Project (evaluator를 직접 주면 같은 순서의 프로젝트 리스트여야 함)
+            metrics: 벤치마크 항목 → 배치 지표
+            evaluator_kwargs: 기본 평가기 인자 (n_runs, seed, cache 등)
+        """
+        with open(benchmark_file, 'r', encoding='utf-8') as f:
+            self.benchmark = json.load(f)
+        self.scenarios = scenarios or default_scenarios()
+        self.metrics = dict(metrics)
+
+        if evaluator is None:
+            evaluator_kwargs.setdefault('parameters', calibration_parameters)
+            evaluator_kwargs.setdefault('n_runs', 500)
+            evaluator = ParameterEvaluator(project=list(self.scenarios.values()),
+                                           outputs=tuple(self.metrics.values()), **evaluator_kwargs)
+        self.evaluator = evaluator
+
+        # 평가 결과 열 → 목표값
+        names = list(self.scenarios)
+        reverse = {output: key for key, output in self.metrics.items()}
+        self.targets = [
+            (names[p], reverse[output], self.benchmark['industry_average'][names[p]][reverse[output]])
+            for output, p in evaluator.columns
+        ]
+        self.target_values = np.array([target for _, _, target in self.targets])
+
+    def loss(self, simulated):
+        """(평가 수, 열 수) 지표 평균 → 목표 대비 상대 오차 제곱합"""
+        return np.sum(((np.atleast_2d(simulated) - self.target_values) / self.target_values) ** 2, axis=1)
+
+    def run(self, generations=60, population=None, sigma=0.2, max_workers=None, seed=0,
+            tol_fun=1e-8, tol_x=1e-4, progress=None):
+        """
+        CMA-ES 보정
+
+        Args:
+            generations: 최대 세대 수
+            population: 세대당 후보 수 (기본: 4 + 3 ln D, 병렬 평가 단위)
+            sigma: 초기 탐색 폭 (단위 공간)
+            max_workers: 평가 프로세스 수 (기본: CPU 수)
+            seed: CMA-ES 난수 시드
+            tol_fun: 최근 10 + 30D/λ세대 동안 최저 손실 감소가 이보다 작으면 종료
+            tol_x: 탐색 폭이 이보다 작으면 종료
+            progress: 세대마다 호출할 함수 (history 항목)
+
+        Returns:
+            {'parameters', 'values', 'loss', 'targets', 'history', 'evaluations', 'stats'}
+        """
+        evaluator = self.evaluator
+        start = evaluator.unit(evaluator.base)
+        strategy = CMAES(start, sigma, population, seed)
+        stall = 10 + int(np.ceil(30 * strategy.dimension / strategy.population))
+
+        best_unit = np.clip(start, 0, 1)
+        best_simulated = evaluator.evaluate(evaluator.scale(best_unit), max_workers=1)[0]
+        best_loss = float(self.loss(best_simulated)[0])
+        history = []
+
+        for generation in range(generations):
+            candidates = strategy.ask()
+            clipped = np.clip(candidates, 0, 1)
+            simulated = evaluator.evaluate(evaluator.scale(clipped), max_workers=max_workers)
+            loss = self.loss(simulated)
+            strategy.tell(candidates, loss + np.sum((candidates - clipped) ** 2, axis=1))
+
+            index = int(np.argmin(loss))
+            if loss[index] < best_loss:
+                best_loss, best_unit, best_simulated = float(loss[index]), clipped[index], simulated[index]
+
+            history.append({'generation': generation + 1, 'best_loss': best_loss,
+                            'mean_loss': float(np.mean(loss)), 'sigma': float(strategy.sigma)})
+            if progress:
+                progress(history[-1])
+
+            recent = [entry['best_loss'] for entry in history[-stall:]]
+            if strategy.spread < tol_x or (len(history) >= stall and recent[0] - recent[-1] < tol_fun):
+                break
+
+        return {
+            'parameters': list(evaluator.names),
+            'values': evaluator.scale(best_unit),
+            'loss': best_loss,
+            'targets': [
+                {'scenario': scenario, 'metric': metric, 'target': target, 'simulated': float(value)}
+                for (scenario, metric, target), value in zip(self.targets, best_simulated)
+            ],
+            'history': history,
+            'evaluations': sum(evaluator.stats.values()),
+            'stats': dict(evaluator.stats)
+        }
+
+    def save(self, result, path='output/calibration/calibrated_parameters.json'):
+        """보정 결과(파라미터 값, 목표 대비 지표) JSON 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'loss': result['loss'],
+            'parameters': {name: float(value) for name, value in zip(result['parameters'], result['values'])},
+            'targets': result['targets'],
+            'n_runs': self.evaluator.n_runs,
+            'seed': self.evaluator.seed
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return path
+
+    @staticmethod
+    def print_summary(result):
+        """목표 대비 지표와 보정 파라미터 출력"""
+        print(f"\n{'='*70}")
+        stats = result['stats']
+        print(f"벤치마크 보정 결과 (손실 {result['loss']:.5f}, 세대 {len(result['history'])}, "
+              f"평가 {stats['evaluated']:,}회, 재사용 {stats['memo_hits'] + stats['cache_hits']:,}회)")
+        print(f"{'='*70}")
+        print(f"{pad('구분', 16)}{pad('지표', 18)}{pad('목표', 10, 'right')}{pad('시뮬레이션', 12, 'right')}")
+        for entry in result['targets']:
+            print(f"{pad(entry['scenario'], 16)}{pad(entry['metric'], 18)}"
+                  f"{entry['target'] * 100:>9.1f}%{entry['simulated'] * 100:>11.1f}%")
+        print(f"\n{pad('파라미터', 36)}{pad('값', 12, 'right')}")
+        for name, value in zip(result['parameters'], result['values']):
+            print(f"{pad(name, 36)}{value:>12.4f}")
+        print(f"{'='*70}\n")
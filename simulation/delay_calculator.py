@@ -3,6 +3,7 @@
 Multiple overlapping issues를 Critical Path Method로 처리
 """
 
+import numpy as np
 from collections import defaultdict
 from config.work_dependencies import WORK_DEPENDENCIES, get_float_days, can_run_in_parallel
 
@@ -105,11 +106,12 @@ class DelayCalculator:
                 # 선행 없음: 현재 공종의 지연만
                 result = effective_delays.get(work_type, 0)
             else:
-                # 선행 공종들 중 최대값 + 현재 공종 지연
+                # 선행 공종들 중 최대값 + 현재 공종 지연 (지연 있는 선행 공종이 없으면 0)
                 max_dep_delay = max(
-                    get_path_length(dep)
-                    for dep in deps
-                    if dep in effective_delays or has_dependencies_with_delay(dep)
+                    (get_path_length(dep)
+                     for dep in deps
+                     if dep in effective_delays or has_dependencies_with_delay(dep)),
+                    default=0
                 )
                 result = max_dep_delay + effective_delays.get(work_type, 0)
 
@@ -173,3 +175,97 @@ class DelayCalculator:
     def clear(self):
         """이슈 리스트 초기화"""
         self.active_issues = []
+
+
+class BatchDelayCalculator:
+    """
+    여러 실행의 CPM 지연을 한 번에 계산 (NumPy 벡터 연산)
+
+    DelayCalculator.calculate_total_delay와 같은 규칙을 실행 × 공종 행렬에 적용:
+    Float 흡수 → 위상 순서 최장 경로 → 동시 이슈 오버헤드
+    """
+
+    # 동시 이슈 오버헤드: 기준 개수 초과 1건당 5%
+    OVERHEAD_THRESHOLD = 5
+    OVERHEAD_PER_ISSUE = 0.05
+
+    def __init__(self, work_types=None):
+        """
+        Args:
+            work_types: 열 순서 공종 목록 (기본: WORK_DEPENDENCIES, 없는 공종은 선행 없음/Float 기본값)
+        """
+        self.work_types = list(work_types or WORK_DEPENDENCIES)
+        self.column = {work_type: j for j, work_type in enumerate(self.work_types)}
+        self.float_weeks = np.array([get_float_days(w) / 7.0 for w in self.work_types])
+
+        # 위상 순서 및 열 번호 기준 선행 공종
+        self.order = self._topological_order()
+        self.predecessors = [
+            [self.column[dep] for dep in WORK_DEPENDENCIES.get(w, []) if dep in self.column]
+            for w in self.work_types
+        ]
+
+    def _topological_order(self):
+        order, visited = [], set()
+
+        def visit(work_type):
+            if work_type in visited:
+                return
+            visited.add(work_type)
+            for dep in WORK_DEPENDENCIES.get(work_type, []):
+                if dep in self.column:
+                    visit(dep)
+            order.append(self.column[work_type])
+
+        for work_type in self.work_types:
+            visit(work_type)
+        return order
+
+    def build_matrix(self, runs):
+        """
+        실행별 이슈 목록 → (공종별 지연 합계 행렬, 실행별 이슈 수)
+
+        Args:
+            runs: [[{'work_type', 'delay_weeks', ...}, ...], ...] (DelayCalculator.add_issue 형식)
+        """
+        delays = np.zeros((len(runs), len(self.work_types)))
+        counts = np.zeros(len(runs), dtype=np.int64)
+        for i, issues in enumerate(runs):
+            counts[i] = len(issues)
+            for issue in issues:
+                delays[i, self.column[issue['work_type']]] += issue['delay_weeks']
+        return delays, counts
+
+    def calculate_total_delay(self, delays, issue_counts):
+        """
+        실행별 총 지연 (주)
+
+        Args:
+            delays: 실행 × 공종 지연 합계 행렬 (주, 열 순서는 work_types)
+            issue_counts: 실행별 동시 진행 이슈 수 (오버헤드 계산용)
+
+        Returns:
+            길이 실행 수 배열 (이슈 없는 실행은 0)
+        """
+        delays = np.asarray(delays, dtype=float)
+
+        # Float 범위 내 지연 흡수 (열 단위 연산이 연속 메모리가 되도록 열 우선 배치)
+        effective = np.asfortranarray(np.maximum(delays - self.float_weeks, 0.0))
+
+        # 위상 순서로 최장 경로 전파 (공종 수만큼의 열 연산)
+        path = np.empty_like(effective, order='F')
+        for j in self.order:
+            deps = self.predecessors[j]
+            if not deps:
+                path[:, j] = effective[:, j]
+            else:
+                longest = path[:, deps[0]]
+                for dep in deps[1:]:
+                    longest = np.maximum(longest, path[:, dep])
+                np.add(effective[:, j], longest, out=path[:, j])
+
+        total = path.max(axis=1) if path.shape[1] else np.zeros(len(path))
+
+        # 동시 이슈 관리 오버헤드
+        excess = np.maximum(np.asarray(issue_counts) - self.OVERHEAD_THRESHOLD, 0)
+        return total * (1.0 + excess * self.OVERHEAD_PER_ISSUE)
@@ -6,14 +6,36 @@ import random
 from models.bim_quality import BIMQuality
 from models.financial import FinancialCalculator
 from simulation.negotiation_system import NegotiationSystem
+from utils.profiler import profiled
 
 class ImpactCalculator:
     """이슈 영향도 계산기"""
 
+    # 전통 방식 추가 불확실성 (예측이 어려움)
+    TRADITIONAL_UNCERTAINTY = (1.0, 1.15)
+
+    # BIM 적용 but 미탐지 시 불확실성
+    BIM_MISSED_UNCERTAINTY = (1.05, 1.15)
+
+    # 탐지 단계별 BIM 조기 탐지 추가 절감률
+    REDUCTION_BY_PHASE = {
+        '설계': {'delay': 0.70, 'cost': 0.80},      # 설계 단계 탐지 → 70% 추가 절감
+        '발주': {'delay': 0.50, 'cost': 0.60},      # 발주 단계 탐지 → 50% 추가 절감
+        '시공초기': {'delay': 0.30, 'cost': 0.40},  # 시공초기 → 30% 추가 절감
+        '시공중기': {'delay': 0.15, 'cost': 0.20},  # 시공중기 → 15% 추가 절감
+        '시공후기': {'delay': 0.05, 'cost': 0.10}   # 시공후기 → 5% 추가 절감
+    }
+    DEFAULT_REDUCTION = {'delay': 0.3, 'cost': 0.4}
+
+    # BIM 효과성 → 품질 보너스 계수, 최대 절감률
+    QUALITY_BONUS_FACTOR = 0.15
+    MAX_REDUCTION = 0.95
+
     def __init__(self):
         """협상 시스템 초기화"""
         self.negotiation_system = NegotiationSystem()
 
+    @profiled('impact.calculate')
     def calculate_impact(self, issue, project):
         """이슈의 최종 영향 계산"""
         if not project.bim_enabled:
@@ -36,7 +58,7 @@ class ImpactCalculator:
         actual_cost = negotiation_result['cost_increase']
 
         # 추가 불확실성 (전통 방식은 예측이 어려움)
-        uncertainty_multiplier = random.uniform(1.0, 1.15)
+        uncertainty_multiplier = random.uniform(*self.TRADITIONAL_UNCERTAINTY)
         actual_delay *= uncertainty_multiplier
         actual_cost *= uncertainty_multiplier
 
@@ -84,7 +106,7 @@ class ImpactCalculator:
             actual_cost = negotiation_result['cost_increase']
 
             # BIM 있어도 미탐지면 약간의 불확실성
-            uncertainty_multiplier = random.uniform(1.05, 1.15)
+            uncertainty_multiplier = random.uniform(*self.BIM_MISSED_UNCERTAINTY)
             actual_delay *= uncertainty_multiplier
             actual_cost *= uncertainty_multiplier
 
@@ -120,25 +142,17 @@ class ImpactCalculator:
         negotiated_cost = negotiation_result['cost_increase']
 
         # 2단계: BIM 조기 탐지 추가 절감 효과
-        reduction_by_phase = {
-            '설계': {'delay': 0.70, 'cost': 0.80},      # 설계 단계 탐지 → 70% 추가 절감
-            '발주': {'delay': 0.50, 'cost': 0.60},      # 발주 단계 탐지 → 50% 추가 절감
-            '시공초기': {'delay': 0.30, 'cost': 0.40},  # 시공초기 → 30% 추가 절감
-            '시공중기': {'delay': 0.15, 'cost': 0.20},  # 시공중기 → 15% 추가 절감
-            '시공후기': {'delay': 0.05, 'cost': 0.10}   # 시공후기 → 5% 추가 절감
-        }
-
-        reduction = reduction_by_phase.get(
+        reduction = self.REDUCTION_BY_PHASE.get(
             detection_phase,
-            {'delay': 0.3, 'cost': 0.4}
+            self.DEFAULT_REDUCTION
         )
 
         # BIM 품질 보너스
-        quality_bonus = bim_effectiveness * 0.15
+        quality_bonus = bim_effectiveness * self.QUALITY_BONUS_FACTOR
 
         # 최종 절감률
-        final_delay_reduction = min(0.95, reduction['delay'] + quality_bonus)
-        final_cost_reduction = min(0.95, reduction['cost'] + quality_bonus)
+        final_delay_reduction = min(self.MAX_REDUCTION, reduction['delay'] + quality_bonus)
+        final_cost_reduction = min(self.MAX_REDUCTION, reduction['cost'] + quality_bonus)
 
         # 협상된 값에서 추가 절감
         actual_delay = negotiated_delay * (1.0 - final_delay_reduction)
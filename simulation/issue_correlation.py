@@ -0,0 +1,111 @@
+"""
+상관된 이슈 발생 샘플러 (클러스터 단위 Gaussian copula)
+
+매일 확률 p로 발생을 확인하는 과정은 누적 위험률 -ln(1-p)의 합이
+Exp(1) 임계값을 처음 넘는 날 발생하는 것과 분포가 같다.
+클러스터 이슈의 임계값을 상관된 정규 잠재변수로부터 만들면
+개별 발생 확률은 유지하면서 동시 발생 경향을 줄 수 있다.
+"""
+
+import math
+import random
+import numpy as np
+from config.issue_correlation import ISSUE_CLUSTERS
+
+
+def _erfc(x):
+    """상보 오차함수 벡터 근사 (Numerical Recipes erfcc, 상대오차 < 1.2e-7)"""
+    z = np.abs(x)
+    t = 1.0 / (1.0 + 0.5 * z)
+    poly = -z * z - 1.26551223 + t * (1.00002368 + t * (0.37409196 + t * (0.09678418 + t * (
+        -0.18628806 + t * (0.27886807 + t * (-1.13520398 + t * (1.48851587 + t * (
+            -0.82215223 + t * 0.17087277))))))))
+    ans = t * np.exp(poly)
+    return np.where(x >= 0, ans, 2.0 - ans)
+
+
+class CorrelatedIssueSampler:
+    """이슈 카탈로그별로 한 번 컴파일하는 상관 발생 임계값 샘플러"""
+
+    def __init__(self, issues, clusters=None):
+        """
+        Args:
+            issues: 이슈 카드 리스트
+            clusters: 클러스터 정의 (기본: ISSUE_CLUSTERS)
+        """
+        clusters = ISSUE_CLUSTERS if clusters is None else clusters
+        issue_ids = [issue['id'] for issue in issues]
+
+        self.issue_ids = issue_ids
+        self.cluster_names = []
+        members = []      # 카탈로그 내 인덱스
+        cluster_of = []   # 클러스터 번호
+        loadings = []     # sqrt(rho)
+
+        for name, cluster in clusters.items():
+            rho = cluster['correlation']
+            if not 0.0 <= rho <= 1.0:
+                raise ValueError(f"클러스터 상관계수는 0~1 범위여야 합니다: {name}={rho}")
+
+            index = [issue_ids.index(i) for i in cluster['issues'] if i in issue_ids]
+            if not index:
+                continue
+
+            cluster_id = len(self.cluster_names)
+            self.cluster_names.append(name)
+            for i in index:
+                if i in members:
+                    raise ValueError(f"이슈 {issue_ids[i]}가 여러 클러스터에 속해 있습니다.")
+                members.append(i)
+                cluster_of.append(cluster_id)
+                loadings.append(math.sqrt(rho))
+
+        self.member_index = np.array(members, dtype=np.int64)
+        self.member_ids = [issue_ids[i] for i in members]
+        self.member_cluster = np.array(cluster_of, dtype=np.int64)
+        self.loading = np.array(loadings)
+        self.residual = np.sqrt(1.0 - self.loading ** 2)
+
+    @property
+    def n_clusters(self):
+        return len(self.cluster_names)
+
+    def draw_thresholds(self, rng=random):
+        """
+        단일 실행용 발생 임계값 추출 (클러스터 이슈만)
+
+        Args:
+            rng: random 모듈 또는 random.Random (시드 재현성 유지)
+
+        Returns:
+            {이슈 ID: Exp(1) 임계값}
+        """
+        factors = [rng.gauss(0.0, 1.0) for _ in range(self.n_clusters)]
+        thresholds = {}
+
+        for k, issue_id in enumerate(self.member_ids):
+            z = self.loading[k] * factors[self.member_cluster[k]] + self.residual[k] * rng.gauss(0.0, 1.0)
+            # 임계값 = -ln(1 - Φ(z)), 1 - Φ(z) = erfc(z/√2)/2
+            thresholds[issue_id] = -math.log(max(0.5 * math.erfc(z / math.sqrt(2.0)), 1e-300))
+
+        return thresholds
+
+    def draw_threshold_matrix(self, rng, prefix_shape):
+        """
+        배치용 발생 임계값 추출
+
+        Args:
+            rng: numpy Generator
+            prefix_shape: 앞쪽 배열 차원 (예: (실행 수, 프로젝트 수))
+
+        Returns:
+            (*prefix_shape, 클러스터 이슈 수) 배열, member_index 순서
+        """
+        prefix_shape = tuple(prefix_shape)
+        factors = rng.standard_normal(prefix_shape + (self.n_clusters,))
+        noise = rng.standard_normal(prefix_shape + (len(self.member_index),))
+
+        z = self.loading * factors[..., self.member_cluster] + self.residual * noise
+        survival = np.maximum(0.5 * _erfc(z / math.sqrt(2.0)), 1e-300)
+
+        return -np.log(survival)
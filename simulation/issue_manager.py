@@ -3,18 +3,22 @@
 """
 
 import json
+import math
 import random
 from config.project_config import ProjectConfig
+from simulation.issue_correlation import CorrelatedIssueSampler
 
 class IssueManager:
     """이슈 카드 관리"""
 
-    def __init__(self, issue_file='data/issue_cards.json', random_seed=None):
+    def __init__(self, issue_file='data/issue_cards.json', random_seed=None, correlation=None):
         """이슈 카드 로드
 
         Args:
             issue_file: 이슈 카드 JSON 파일 경로
             random_seed: 랜덤 시드 (비교 시뮬레이션 시 동일한 이슈 발생 보장)
+            correlation: 이슈 간 발생 상관 구조
+                         (CorrelatedIssueSampler, True면 기본 클러스터로 컴파일, None이면 독립)
         """
         with open(issue_file, 'r', encoding='utf-8') as f:
             self.all_issues = json.load(f)
@@ -26,6 +30,14 @@ class IssueManager:
         # 시드가 지정되면 설정
         if random_seed is not None:
             random.seed(random_seed)
+
+        # 상관 클러스터 이슈: 실행 시작 시 발생 임계값을 한 번에 추출하고
+        # 매일 누적 위험률이 임계값을 넘으면 발생 (개별 발생 확률은 독립 모형과 동일)
+        if correlation is True:
+            correlation = CorrelatedIssueSampler(self.all_issues)
+        self.correlation = correlation
+        self.trigger_thresholds = correlation.draw_thresholds() if correlation else {}
+        self.cumulative_hazard = {issue_id: 0.0 for issue_id in self.trigger_thresholds}
     
     def check_and_trigger_issues(self, project):
         """현재 단계에서 발생 가능한 이슈 확인"""
@@ -50,6 +62,12 @@ class IssueManager:
 
         occurrence_probability = self._get_occurrence_probability(issue)
 
+        if issue['id'] in self.trigger_thresholds:
+            if occurrence_probability >= 1.0:
+                return True
+            self.cumulative_hazard[issue['id']] -= math.log1p(-occurrence_probability)
+            return self.cumulative_hazard[issue['id']] >= self.trigger_thresholds[issue['id']]
+
         return random.random() < occurrence_probability
 
     def _get_occurrence_probability(self, issue):
@@ -2,11 +2,20 @@
 에이전트 회의 조율
 """
 
+import re
 from pathlib import Path
+from utils.profiler import profiled
+from utils.llm_usage import usage_tracker
+from utils.token_budget import estimate_tokens, truncate_to_tokens
 
 class MeetingCoordinator:
     """에이전트 회의 진행"""
 
+    # 앞선 발언을 LLM 프롬프트에 넣을지 (기본 꺼짐: 호출마다 최대 CONTEXT_TOKEN_BUDGET 토큰 추가)
+    SHARE_CONTEXT = False
+    # 프롬프트에 포함할 이전 발언 토큰 예산
+    CONTEXT_TOKEN_BUDGET = 300
+
     def __init__(self, agents, save_meetings=True, bim_status=""):
         """
         Args:
@@ -21,11 +30,18 @@ class MeetingCoordinator:
         self.bim_status = bim_status
         self.all_meetings_content = []  # 전체 회의록 내용 저장
 
+        # 배치 모드 (SimulationEngine이 설정): 발언 요청을 수집기에 넣고 회의록 작성은 결과 반영 후로 미룸
+        self.llm_batch = None
+        self.batch_prefix = ""
+        self.batch_requests = []      # 진행 중인 회의의 요청 (발언 순번, 키, 발언자)
+        self.deferred_meetings = []   # (meeting_record, impact_result)
+
         # 회의록 저장 폴더 생성
         if self.save_meetings:
             self.meetings_dir = Path("output/meetings")
             self.meetings_dir.mkdir(parents=True, exist_ok=True)
     
+    @profiled('meeting.conduct')
     def conduct_meeting(self, issue, project, impact_result=None):
         """회의 진행"""
         meeting_record = {
@@ -37,15 +53,25 @@ class MeetingCoordinator:
         }
         
         if impact_result is None:
+            usage_tracker.meeting_type = '초기 논의'
             meeting_record['conversations'] = self._initial_discussion(issue, project)
         else:
+            usage_tracker.meeting_type = '의사결정 회의'
             meeting_record['conversations'] = self._decision_meeting(issue, project, impact_result)
-        
+        usage_tracker.meeting_type = '기타'
+
+        if self.llm_batch is not None:
+            meeting_record['llm_requests'] = self.batch_requests
+            self.batch_requests = []
+
         self.meeting_log.append(meeting_record)
 
         # 회의록 저장
         if self.save_meetings:
-            self._save_meeting_to_file(meeting_record, impact_result)
+            if self.llm_batch is not None:
+                self.deferred_meetings.append((meeting_record, impact_result))
+            else:
+                self._save_meeting_to_file(meeting_record, impact_result)
 
         return meeting_record
     
@@ -57,25 +83,9 @@ class MeetingCoordinator:
         self.conversation_context = []
 
         # 시공사 → 설계사 → 감리사 → 건축주 → 금융사 순서
-        contractor_msg = self.agents['contractor'].respond(issue, project, None)
-        conversations.append(contractor_msg)
-        self.conversation_context.append({"speaker": "시공사", "message": contractor_msg})
-
-        designer_msg = self.agents['designer'].respond(issue, project, None)
-        conversations.append(designer_msg)
-        self.conversation_context.append({"speaker": "설계사", "message": designer_msg})
-
-        supervisor_msg = self.agents['supervisor'].respond(issue, project, None)
-        conversations.append(supervisor_msg)
-        self.conversation_context.append({"speaker": "감리사", "message": supervisor_msg})
-
-        owner_msg = self.agents['owner'].respond(issue, project, None)
-        conversations.append(owner_msg)
-        self.conversation_context.append({"speaker": "건축주", "message": owner_msg})
-
-        bank_msg = self.agents['bank'].respond(issue, project, None)
-        conversations.append(bank_msg)
-        self.conversation_context.append({"speaker": "금융사", "message": bank_msg})
+        for slot, (key, speaker) in enumerate([('contractor', '시공사'), ('designer', '설계사'), ('supervisor', '감리사'),
+                                               ('owner', '건축주'), ('bank', '금융사')]):
+            conversations.append(self._speak(slot, key, speaker, issue, project, None))
 
         return conversations
     
@@ -85,29 +95,73 @@ class MeetingCoordinator:
 
         # 이전 회의 컨텍스트 유지 (초기 논의 내용)
         # 설계사 → 시공사 → 감리사 → 금융사 → 건축주 순서
+        for slot, (key, speaker) in enumerate([('designer', '설계사'), ('contractor', '시공사'), ('supervisor', '감리사'),
+                                               ('bank', '금융사'), ('owner', '건축주')]):
+            conversations.append(self._speak(slot, key, speaker, issue, project, impact_result))
 
-        designer_msg = self.agents['designer'].respond(issue, project, impact_result)
-        conversations.append(designer_msg)
-        self.conversation_context.append({"speaker": "설계사", "message": designer_msg})
+        return conversations
 
-        contractor_msg = self.agents['contractor'].respond(issue, project, impact_result)
-        conversations.append(contractor_msg)
-        self.conversation_context.append({"speaker": "시공사", "message": contractor_msg})
+    def _speak(self, slot, key, speaker, issue, project, impact_result):
+        """
+        에이전트 발언 (LLM 모드 + SHARE_CONTEXT면 앞선 발언을 토큰 예산 내에서 전달)
 
-        supervisor_msg = self.agents['supervisor'].respond(issue, project, impact_result)
-        conversations.append(supervisor_msg)
-        self.conversation_context.append({"speaker": "감리사", "message": supervisor_msg})
+        배치 모드에서는 요청을 수집기에 넣고 템플릿 문장으로 진행하며,
+        발언 순번(slot)과 키를 기록해 apply_batch_results에서 교체
+        """
+        agent = self.agents[key]
+        share = agent.use_llm and self.SHARE_CONTEXT
+        agent.meeting_context = self.format_context_for_prompt() if share else ""
+
+        if self.llm_batch is not None and agent.use_llm:
+            request_key = f"{self.batch_prefix}/m{len(self.meeting_log)}/{key}"
+            queued = len(self.llm_batch.requests)
+            agent.batch_slot = (self.llm_batch, request_key)
+            try:
+                message = agent.respond(issue, project, impact_result)
+            finally:
+                agent.batch_slot = None
+            if len(self.llm_batch.requests) > queued:
+                self.batch_requests.append({
+                    'slot': slot,
+                    'key': request_key,
+                    'speaker': speaker,
+                    'meeting_type': usage_tracker.meeting_type
+                })
+        else:
+            message = agent.respond(issue, project, impact_result)
+        self.conversation_context.append({"speaker": speaker, "message": message})
 
-        bank_msg = self.agents['bank'].respond(issue, project, impact_result)
-        conversations.append(bank_msg)
-        self.conversation_context.append({"speaker": "금융사", "message": bank_msg})
+        return message
+    
+    def apply_batch_results(self, results):
+        """
+        배치 결과를 키로 회의 기록에 반영하고 미뤄둔 회의록 작성
 
-        owner_msg = self.agents['owner'].respond(issue, project, impact_result)
-        conversations.append(owner_msg)
-        self.conversation_context.append({"speaker": "건축주", "message": owner_msg})
+        Args:
+            results: {키: 응답 문자열} ("[발언자]"로 시작하지 않거나 없으면 템플릿 유지)
+
+        Returns:
+            {'applied': 반영 건수, 'fallbacks': 템플릿 유지 건수}
+        """
+        applied = fallbacks = 0
+        for meeting_record in self.meeting_log:
+            for request in meeting_record.get('llm_requests', []):
+                text = results.get(request['key'])
+                if text and text.startswith(f"[{request['speaker']}]"):
+                    meeting_record['conversations'][request['slot']] = text
+                    applied += 1
+                else:
+                    usage_tracker.meeting_type = request['meeting_type']
+                    usage_tracker.record_fallback(request['speaker'])
+                    fallbacks += 1
+        usage_tracker.meeting_type = '기타'
+
+        for meeting_record, impact_result in self.deferred_meetings:
+            self._save_meeting_to_file(meeting_record, impact_result)
+        self.deferred_meetings = []
+
+        return {'applied': applied, 'fallbacks': fallbacks}
 
-        return conversations
-    
     def print_meeting(self, meeting_record):
         """회의록 출력"""
         print(f"\n{'='*60}")
@@ -128,18 +182,43 @@ class MeetingCoordinator:
         """현재 대화 컨텍스트 반환"""
         return self.conversation_context
 
-    def format_context_for_prompt(self, max_messages=5):
-        """LLM 프롬프트용 컨텍스트 포맷"""
+    def format_context_for_prompt(self, max_messages=5, max_tokens=None):
+        """
+        LLM 프롬프트용 컨텍스트 포맷
+
+        Args:
+            max_messages: 최근 발언 최대 개수
+            max_tokens: 토큰 예산 (기본: CONTEXT_TOKEN_BUDGET), 최근 발언부터 채우고
+                        예산을 넘는 발언은 잘라서 포함한 뒤 중단
+        """
         if not self.conversation_context:
             return ""
 
-        recent_context = self.conversation_context[-max_messages:]
-        formatted = "\n\n## 이전 대화 내용\n"
-        for ctx in recent_context:
-            formatted += f"{ctx['message']}\n"
+        budget = self.CONTEXT_TOKEN_BUDGET if max_tokens is None else max_tokens
+        header = "\n\n## 이전 대화 내용\n"
+        budget -= estimate_tokens(header)
+
+        selected = []
+        for ctx in reversed(self.conversation_context[-max_messages:]):
+            cost = estimate_tokens(ctx['message']) + 1
+            if cost > budget:
+                if budget > 8:
+                    selected.append(truncate_to_tokens(ctx['message'], budget - 1))
+                break
+            selected.append(ctx['message'])
+            budget -= cost
+
+        if not selected:
+            return ""
+
+        # 발언 안의 빈 줄은 없앰 (구간 끝 = 첫 빈 줄, utils/response_reuse.py가 이 구간을 키에서 제외)
+        formatted = header
+        for message in reversed(selected):
+            formatted += re.sub(r'\n\s*\n', '\n', message.strip()) + "\n"
 
         return formatted
 
+    @profiled('meeting.format')
     def _save_meeting_to_file(self, meeting_record, impact_result):
         """회의록 내용을 메모리에 저장 (나중에 통합 파일로 저장)"""
         issue_id = meeting_record['issue_id']
@@ -177,6 +256,7 @@ class MeetingCoordinator:
         # 메모리에 저장
         self.all_meetings_content.append('\n'.join(content))
 
+    @profiled('writer.meetings')
     def save_all_meetings_to_file(self, project_name=""):
         """시뮬레이션 종료 시 모든 회의록을 하나의 파일로 저장"""
         if not self.save_meetings or not self.all_meetings_content:
@@ -0,0 +1,94 @@
+"""
+회의록 지연 생성 (수치 전용 실행의 이벤트 스트림 → 회의 기록)
+
+SimulationEngine(render_meetings=False)가 남긴 이벤트에서, 읽으려는 이슈의 회의만
+필요할 때 생성한다. 이슈별 회의는 서로 독립(대화 컨텍스트는 이슈마다 초기화)이므로
+스레드별 에이전트로 병렬 생성한다.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .meeting_coordinator import MeetingCoordinator
+
+
+class NarrativeRenderer:
+    """이벤트 스트림 기반 회의록 생성기"""
+
+    def __init__(self, events, agent_factory=None, max_workers=4, bim_status=""):
+        """
+        Args:
+            events: SimulationEngine.events (수치 전용 실행)
+            agent_factory: 에이전트 딕셔너리 생성 함수 (기본: 템플릿 에이전트, 스레드마다 1회 호출)
+            max_workers: 동시 생성 스레드 수 (LLM 모드에서 효과)
+            bim_status: 회의록 파일명용 "BIM_ON" / "BIM_OFF"
+        """
+        if agent_factory is None:
+            from .scenario_fork import template_agents
+            agent_factory = template_agents
+
+        self.events = events
+        self.agent_factory = agent_factory
+        self.max_workers = max_workers
+        self.bim_status = bim_status
+        self.rendered = {}   # 이벤트 번호 -> (초기 논의, 의사결정 회의)
+        self._local = threading.local()
+
+    def _agents(self):
+        if not hasattr(self._local, 'agents'):
+            self._local.agents = self.agent_factory()
+        return self._local.agents
+
+    def _render_event(self, event):
+        coordinator = MeetingCoordinator(self._agents(), save_meetings=False, bim_status=self.bim_status)
+        initial_meeting = coordinator.conduct_meeting(event['issue'], event['project_before'], None)
+        decision_meeting = coordinator.conduct_meeting(event['issue'], event['project_after'], event['impact'])
+        return initial_meeting, decision_meeting
+
+    def render(self, indices=None, issue_ids=None):
+        """
+        회의 생성 (이미 생성한 이벤트는 재사용)
+
+        Args:
+            indices: 이벤트 번호 목록 (None이면 전체)
+            issue_ids: 이슈 ID 목록 (지정 시 해당 이슈만)
+
+        Returns:
+            [(이벤트, 초기 논의 기록, 의사결정 회의 기록)] (이벤트 순서)
+        """
+        selected = self.events if indices is None else [self.events[index] for index in indices]
+        if issue_ids is not None:
+            selected = [event for event in selected if event['issue']['id'] in issue_ids]
+
+        missing = [event for event in selected if event['index'] not in self.rendered]
+        if len(missing) > 1 and self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                meetings = list(executor.map(self._render_event, missing))
+        else:
+            meetings = [self._render_event(event) for event in missing]
+
+        for event, pair in zip(missing, meetings):
+            self.rendered[event['index']] = pair
+
+        return [(event, *self.rendered[event['index']]) for event in selected]
+
+    def simulation_log(self, indices=None, issue_ids=None):
+        """SimulationEngine.simulation_log과 같은 형식의 로그 (회의 포함)"""
+        return [
+            {
+                'day': event['day'],
+                'issue': event['issue'],
+                'impact': event['impact'],
+                'initial_meeting': initial_meeting,
+                'decision_meeting': decision_meeting
+            }
+            for event, initial_meeting, decision_meeting in self.render(indices, issue_ids)
+        ]
+
+    def save_meetings(self, project_name="", indices=None, issue_ids=None):
+        """생성한 회의를 통합 회의록 파일로 저장 (output/meetings)"""
+        writer = MeetingCoordinator({}, save_meetings=True, bim_status=self.bim_status)
+        for event, initial_meeting, decision_meeting in self.render(indices, issue_ids):
+            for meeting_record, impact_result in ((initial_meeting, None), (decision_meeting, event['impact'])):
+                writer.meeting_log.append(meeting_record)
+                writer._save_meeting_to_file(meeting_record, impact_result)
+        return writer.save_all_meetings_to_file(project_name)
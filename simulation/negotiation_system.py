@@ -3,6 +3,8 @@
 에이전트들이 이슈 카드 범위 내에서 최종 지연/비용 결정
 """
 
+from utils.profiler import profiled
+
 class NegotiationSystem:
     """에이전트 협상 시스템"""
 
@@ -26,6 +28,7 @@ class NegotiationSystem:
             'bank': 0.05        # 금융사: 5%
         }
 
+    @profiled('negotiation.negotiate')
     def negotiate(self, issue, project, detected=False):
         """
         협상을 통해 최종 지연/비용 결정
@@ -47,16 +50,8 @@ class NegotiationSystem:
         cost_min = issue['cost_increase_min']
         cost_max = issue['cost_increase_max']
 
-        # 프로젝트 특성에 따른 선호도/가중치 조정
-        adjusted_prefs, adjusted_weights = self._adjust_by_project_type(
-            project, detected
-        )
-
         # 최종 위치 계산 (가중 평균)
-        final_position = sum(
-            adjusted_prefs[agent] * adjusted_weights[agent]
-            for agent in adjusted_prefs
-        )
+        final_position = self.calculate_position(project, detected)
 
         # 범위 내에서 값 결정
         agreed_delay = delay_min + (delay_max - delay_min) * final_position
@@ -76,6 +71,21 @@ class NegotiationSystem:
             'final_position': final_position  # 0.0~1.0
         }
 
+    def calculate_position(self, project, detected=False):
+        """
+        협상 최종 위치 계산 (0.0~1.0)
+
+        프로젝트 특성에 따라 조정된 선호도를 영향력으로 가중 평균
+        """
+        adjusted_prefs, adjusted_weights = self._adjust_by_project_type(
+            project, detected
+        )
+
+        return sum(
+            adjusted_prefs[agent] * adjusted_weights[agent]
+            for agent in adjusted_prefs
+        )
+
     def _adjust_by_project_type(self, project, detected):
         """
         프로젝트 특성에 따라 선호도/가중치 조정
@@ -133,6 +143,7 @@ class NegotiationSystem:
 
         return prefs, weights
 
+    @profiled('negotiation.summary')
     def _generate_summary(self, issue, project, detected, delay, cost, position):
         """협상 결과 요약 생성 (상세 버전)"""
 
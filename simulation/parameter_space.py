@@ -0,0 +1,338 @@
+"""
+모형 파라미터 공간 (민감도 분석/보정 공용)
+
+이슈 발생 확률, 탐지 단계별 절감률, 협상 가중치, 탐지 확률 Sigmoid 계수, 일 간접비율, 불확실성 배수를
+파라미터 벡터 하나로 다루고, 벡터마다 배치 시뮬레이터를 다시 컴파일해 지표 평균을 계산한다.
+모든 평가는 같은 시드(공통 난수)로 실행하므로 평가 간 차이는 파라미터 차이만 반영한다.
+"""
+
+import os
+import json
+import hashlib
+from contextlib import contextmanager
+import numpy as np
+from config.bim_quality_config import BIMQualityConfig
+from config.project_config import ProjectConfig
+from models.project import Project
+from simulation.batch_simulator import BatchSimulator
+from simulation.impact_calculator import ImpactCalculator
+from simulation.negotiation_system import NegotiationSystem
+from simulation.result_cache import canonical, code_version
+from utils.process_pool import process_pool
+
+# 클래스 속성 파라미터 (평가 중에만 값을 바꾸고 되돌림)
+CLASS_PARAMETERS = {
+    'SIGMOID_K': (BIMQualityConfig, 'SIGMOID_K'),
+    'SIGMOID_X0': (BIMQualityConfig, 'SIGMOID_X0'),
+    'DAILY_INDIRECT_COST_RATIO': (ProjectConfig, 'DAILY_INDIRECT_COST_RATIO'),
+}
+
+# 불확실성 배수 범위 (파라미터는 범위 양 끝에 곱하는 배율)
+UNCERTAINTY_PARAMETERS = {
+    'traditional': 'TRADITIONAL_UNCERTAINTY',
+    'bim_missed': 'BIM_MISSED_UNCERTAINTY',
+}
+
+# 워커 프로세스 평가기 (fork 시 부모 객체 공유)
+_WORKER_EVALUATOR = None
+
+
+def default_parameters(issues, spread=0.5, groups=('occurrence_rate', 'reduction', 'agent_weight', 'config')):
+    """
+    기본 파라미터 목록 (현재 값 기준 ±spread 비율 범위)
+
+    Args:
+        issues: 이슈 카드 리스트
+        spread: 상대 범위 (0.5 → 현재 값의 0.5~1.5배, 확률/절감률은 상한 적용)
+        groups: 포함할 파라미터 묶음 (occurrence_scale: 전체 발생 확률 배율, uncertainty: 불확실성 배수 배율)
+
+    Returns:
+        [{'name', 'target', 'base', 'low', 'high'}] (선택 'log': True → 단위 공간을 로그 척도로 변환)
+    """
+    def parameter(name, target, base, cap=None):
+        high = base * (1 + spread)
+        return {'name': name, 'target': target, 'base': base, 'low': base * (1 - spread),
+                'high': min(cap, high) if cap is not None else high}
+
+    parameters = []
+    if 'occurrence_scale' in groups:
+        parameters.append(parameter('occurrence_scale', ('occurrence_scale',), 1.0))
+    if 'occurrence_rate' in groups:
+        for issue in issues:
+            parameters.append(parameter(f"occurrence_rate[{issue['id']}]", ('occurrence_rate', issue['id']),
+                                        issue.get('occurrence_rate', 0.01), 1.0))
+    if 'reduction' in groups:
+        for phase, reduction in ImpactCalculator.REDUCTION_BY_PHASE.items():
+            for kind in ('delay', 'cost'):
+                parameters.append(parameter(f"reduction[{phase}.{kind}]", ('reduction', phase, kind),
+                                            reduction[kind], ImpactCalculator.MAX_REDUCTION))
+    if 'uncertainty' in groups:
+        for key, attr in UNCERTAINTY_PARAMETERS.items():
+            parameters.append(parameter(f"uncertainty_scale[{key}]", ('uncertainty', attr), 1.0))
+    if 'agent_weight' in groups:
+        for agent, weight in NegotiationSystem().agent_weights.items():
+            parameters.append(parameter(f"agent_weight[{agent}]", ('agent_weight', agent), weight))
+    if 'config' in groups:
+        for key, (cls, attr) in CLASS_PARAMETERS.items():
+            parameters.append(parameter(key, ('config', key), getattr(cls, attr)))
+    return parameters
+
+
+@contextmanager
+def patched_model(reductions=None, config=None, uncertainty=None):
+    """절감률 표/클래스 속성/불확실성 범위를 잠시 바꾼 뒤 되돌림 (프로세스 안 순차 평가 전용)"""
+    saved_reductions = ImpactCalculator.REDUCTION_BY_PHASE
+    saved_config = {key: getattr(*CLASS_PARAMETERS[key]) for key in config or {}}
+    saved_uncertainty = {attr: getattr(ImpactCalculator, attr) for attr in uncertainty or {}}
+    try:
+        if reductions is not None:
+            ImpactCalculator.REDUCTION_BY_PHASE = reductions
+        for key, value in (config or {}).items():
+            setattr(*CLASS_PARAMETERS[key], value)
+        for attr, value in (uncertainty or {}).items():
+            setattr(ImpactCalculator, attr, value)
+        yield
+    finally:
+        ImpactCalculator.REDUCTION_BY_PHASE = saved_reductions
+        for key, value in saved_config.items():
+            setattr(*CLASS_PARAMETERS[key], value)
+        for attr, value in saved_uncertainty.items():
+            setattr(ImpactCalculator, attr, value)
+
+
+def _init_worker(evaluator):
+    global _WORKER_EVALUATOR
+    _WORKER_EVALUATOR = evaluator
+
+
+def _evaluate_worker(rows):
+    return _WORKER_EVALUATOR._evaluate_rows(rows)
+
+
+class MemoizedEvaluator:
+    """점 단위 평가 공통 처리 (평가 기록/저장소 재사용, 남은 점만 워커 풀에서 평가)
+
+    하위 클래스는 _points(입력 → 평가할 점 배열), _point_keys(점별 저장 키),
+    _evaluate_rows(현재 프로세스 순차 평가), _collect(행별 결과 → 반환값)를 구현한다.
+    """
+
+    # 워커당 작업 묶음 수 (평가 하나가 무거우면 1)
+    CHUNKS_PER_WORKER = 4
+
+    def __init__(self, cache=None):
+        self.cache = cache
+        self.stats = {'evaluated': 0, 'memo_hits': 0, 'cache_hits': 0}
+        self._memo = {}
+
+    def __getstate__(self):
+        # 평가 기록은 부모 프로세스에만 보관
+        return dict(self.__dict__, _memo={})
+
+    def _points(self, values):
+        return np.atleast_2d(np.asarray(values, dtype=float))
+
+    def _collect(self, results):
+        return results
+
+    def evaluate(self, values, max_workers=1, chunk_size=None):
+        """
+        점 행렬 평가 (이미 평가한 점은 기록/저장소에서 재사용)
+
+        Args:
+            values: (평가 수, 차원) 평가할 점
+            max_workers: 프로세스 수 (1이면 현재 프로세스)
+            chunk_size: 워커 작업 하나의 평가 수
+
+        Returns:
+            행별 평가 결과 (_collect 형식)
+        """
+        points = self._points(values)
+        results = [None] * len(points)
+
+        missing = {}
+        for row, key in enumerate(self._point_keys(points)):
+            if key in self._memo:
+                results[row] = self._memo[key]
+                self.stats['memo_hits'] += 1
+                continue
+            cached = self.cache.get(key) if self.cache is not None else None
+            if cached is not None:
+                results[row] = self._memo[key] = cached['metrics']
+                self.stats['cache_hits'] += 1
+                continue
+            missing.setdefault(key, []).append(row)
+
+        if missing:
+            rows = [group[0] for group in missing.values()]
+            computed = self._evaluate_parallel(points[rows], max_workers, chunk_size)
+            for (key, group), result in zip(missing.items(), computed):
+                self._memo[key] = result
+                for row in group:
+                    results[row] = result
+                if self.cache is not None:
+                    self.cache.put(key, result, None)
+            self.stats['evaluated'] += len(rows)
+        return self._collect(results)
+
+    def _evaluate_parallel(self, points, max_workers=1, chunk_size=None):
+        workers = max_workers or os.cpu_count() or 1
+        if workers <= 1 or len(points) <= 1:
+            return list(self._evaluate_rows(points))
+
+        chunk_size = chunk_size or max(1, -(-len(points) // (workers * self.CHUNKS_PER_WORKER)))
+        chunks = [points[i:i + chunk_size] for i in range(0, len(points), chunk_size)]
+        with process_pool(workers, initializer=_init_worker, initargs=(self,)) as executor:
+            return [result for chunk in executor.map(_evaluate_worker, chunks) for result in chunk]
+
+
+class ParameterEvaluator(MemoizedEvaluator):
+    """파라미터 벡터 → 배치 시뮬레이터 지표 평균"""
+
+    def __init__(self, project=None, parameters=None, outputs=('budget_overrun_rate',), n_runs=1000, seed=0,
+                 issue_file='data/issue_cards.json', cache=None):
+        """
+        Args:
+            project: 평가할 Project 또는 Project 리스트 (기본: BIM ON 양호 품질, 절감률/Sigmoid가 지표에 영향)
+            parameters: 파라미터 목록 또는 이슈 카드 → 목록 함수 (기본: default_parameters)
+            outputs: 평균을 계산할 지표 (BatchSimulator 결과 키)
+            n_runs: 평가당 Monte Carlo 실행 수
+            seed: 모든 평가에 쓰는 시드 (공통 난수)
+            cache: 평가 결과 저장소 (SimulationResultCache, 프로세스/실행 간 공유)
+        """
+        self.project = project or Project(bim_enabled=True, bim_quality=BIMQualityConfig.BIM_GOOD)
+        with open(issue_file, 'r', encoding='utf-8') as f:
+            self.issues = json.load(f)
+        if callable(parameters):
+            parameters = parameters(self.issues)
+        self.parameters = parameters or default_parameters(self.issues)
+        self.names = [param['name'] for param in self.parameters]
+        self.low = np.array([param['low'] for param in self.parameters], dtype=float)
+        self.high = np.array([param['high'] for param in self.parameters], dtype=float)
+        self.base = np.array([param['base'] for param in self.parameters], dtype=float)
+        self.log = np.array([bool(param.get('log')) for param in self.parameters])
+        self.outputs = tuple(outputs)
+        self.n_runs = n_runs
+        self.seed = seed
+        super().__init__(cache)
+        self._simulator = None
+
+    def __getstate__(self):
+        # 시뮬레이터는 프로세스마다 새로 컴파일
+        return dict(super().__getstate__(), _simulator=None)
+
+    @property
+    def dimension(self):
+        return len(self.parameters)
+
+    @property
+    def projects(self):
+        return self.project if isinstance(self.project, (list, tuple)) else [self.project]
+
+    @property
+    def columns(self):
+        """evaluate 결과 열 순서 [(지표, 프로젝트 번호)]"""
+        return [(output, p) for output in self.outputs for p in range(len(self.projects))]
+
+    def scale(self, unit):
+        """[0, 1] 단위 표본 → 파라미터 값"""
+        unit = np.asarray(unit)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            geometric = self.low * (self.high / self.low) ** unit
+        return np.where(self.log, geometric, self.low + unit * (self.high - self.low))
+
+    def unit(self, values):
+        """파라미터 값 → [0, 1] 단위 좌표 (scale의 역변환)"""
+        values = np.asarray(values, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            geometric = np.log(values / self.low) / np.log(self.high / self.low)
+        return np.where(self.log, geometric, (values - self.low) / (self.high - self.low))
+
+    def _model(self, values):
+        """파라미터 값 → (이슈 카드, 절감률 표, 협상 가중치, 클래스 속성)"""
+        rates = {}
+        rate_scale = 1.0
+        uncertainty = {}
+        reductions = {phase: dict(reduction) for phase, reduction in ImpactCalculator.REDUCTION_BY_PHASE.items()}
+        weights = NegotiationSystem().agent_weights
+        config = {}
+
+        for param, value in zip(self.parameters, values):
+            kind = param['target'][0]
+            if kind == 'occurrence_rate':
+                rates[param['target'][1]] = float(value)
+            elif kind == 'occurrence_scale':
+                rate_scale = float(value)
+            elif kind == 'uncertainty':
+                attr = param['target'][1]
+                uncertainty[attr] = tuple(bound * float(value) for bound in getattr(ImpactCalculator, attr))
+            elif kind == 'reduction':
+                reductions[param['target'][1]][param['target'][2]] = float(value)
+            elif kind == 'agent_weight':
+                weights[param['target'][1]] = float(value)
+            elif kind == 'config':
+                config[param['target'][1]] = float(value)
+            else:
+                raise ValueError(f"알 수 없는 파라미터 대상입니다: {param['target']}")
+
+        issues = [dict(issue, occurrence_rate=rates[issue['id']]) if issue['id'] in rates else issue
+                  for issue in self.issues]
+        if rate_scale != 1.0:
+            issues = [dict(issue, occurrence_rate=min(1.0, issue.get('occurrence_rate', 0.01) * rate_scale))
+                      for issue in issues]
+        return issues, reductions, weights, config, uncertainty
+
+    def run(self, values, n_runs=None, **run_kwargs):
+        """파라미터 값 하나로 배치 실행 (지표 배열 전체 반환)"""
+        if self._simulator is None:
+            self._simulator = BatchSimulator(self.project, issues=self.issues)
+        simulator = self._simulator
+
+        issues, reductions, weights, config, uncertainty = self._model(values)
+        with patched_model(reductions, config, uncertainty):
+            simulator.issues = issues
+            simulator.negotiation_system.agent_weights = weights
+            simulator._compile()
+            return simulator.run(n_runs or self.n_runs, seed=self.seed, **run_kwargs)
+
+    def _evaluate_rows(self, values):
+        """현재 프로세스에서 순차 평가 → (평가 수, 열 수)"""
+        results = np.empty((len(values), len(self.columns)))
+        for row, value in enumerate(values):
+            result = self.run(value)
+            results[row] = np.concatenate([np.atleast_1d(np.mean(result[output], axis=0))
+                                           for output in self.outputs])
+        return results
+
+    def _point_keys(self, values):
+        """파라미터 값 행별 저장 키 (모형 입력/실행 조건/코드 버전 포함)"""
+        negotiation = NegotiationSystem()
+        prefix = json.dumps(canonical({
+            'version': code_version(),
+            'projects': self.projects,
+            'issues': self.issues,
+            'targets': [param['target'] for param in self.parameters],
+            'outputs': self.outputs,
+            'runs': [self.n_runs, self.seed],
+            'model': [ImpactCalculator.REDUCTION_BY_PHASE, ImpactCalculator.TRADITIONAL_UNCERTAINTY,
+                      ImpactCalculator.BIM_MISSED_UNCERTAINTY, negotiation.agent_weights,
+                      {key: getattr(*target) for key, target in CLASS_PARAMETERS.items()}]
+        }), sort_keys=True)
+        digest = hashlib.sha256(prefix.encode('utf-8')).hexdigest()
+        return [f"parameters:{digest}:{hashlib.sha256(value.tobytes()).hexdigest()}" for value in values]
+
+    def _collect(self, results):
+        return np.array(results).reshape(len(results), len(self.columns))
+
+    def evaluate(self, values, max_workers=1, chunk_size=None):
+        """
+        파라미터 값 행렬 평가 (이미 평가한 값은 기록/저장소에서 재사용)
+
+        Args:
+            values: (평가 수, 파라미터 수) 파라미터 값
+            max_workers: 프로세스 수 (1이면 현재 프로세스)
+            chunk_size: 워커 작업 하나의 평가 수
+
+        Returns:
+            (평가 수, 열 수) 지표 평균 (열 순서: columns, 단일 프로젝트면 outputs)
+        """
+        return super().evaluate(values, max_workers, chunk_size)
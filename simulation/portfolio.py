@@ -0,0 +1,233 @@
+"""
+포트폴리오 시뮬레이션 (다중 프로젝트 동시 분석)
+공통 달력 위에서 여러 현장을 한 번에 시뮬레이션하고 PF 익스포저를 집계
+"""
+
+import csv
+import numpy as np
+from config.portfolio_config import PortfolioConfig
+from config.bim_quality_config import BIMQualityConfig
+from models.project import Project
+from simulation.batch_simulator import BatchSimulator
+
+
+class PortfolioEngine:
+    """포트폴리오 엔진"""
+
+    def __init__(self, projects, start_days=None, shocks=None, issue_file='data/issue_cards.json'):
+        """
+        Args:
+            projects: Project 리스트
+            start_days: 프로젝트별 착수일 (공통 달력 기준, 기본 0)
+            shocks: 공통 충격 설정 (기본: PortfolioConfig.CORRELATED_SHOCKS, {}이면 미적용)
+            issue_file: 이슈 카드 JSON 파일 경로
+        """
+        self.projects = list(projects)
+        self.start_days = np.array(
+            start_days if start_days is not None else [0] * len(self.projects),
+            dtype=np.int64
+        )
+        self.shocks = PortfolioConfig.CORRELATED_SHOCKS if shocks is None else shocks
+
+        self.simulator = BatchSimulator(self.projects, issue_file=issue_file)
+
+        # 충격 대상 이슈 (카탈로그에 있는 것만)
+        self.shock_ids = [sid for sid in self.shocks if sid in self.simulator.issue_ids]
+        self.shock_index = [self.simulator.issue_ids.index(sid) for sid in self.shock_ids]
+
+        total_days = np.array([sum(p.phase_durations.values()) for p in self.projects])
+        self.horizon = int((self.start_days + total_days).max()) if self.projects else 0
+
+    @classmethod
+    def from_templates(cls, template_names, start_days=None, bim_enabled=False,
+                       bim_quality=None, **kwargs):
+        """템플릿 이름 리스트로 포트폴리오 생성"""
+        projects = [
+            Project(bim_enabled=bim_enabled, bim_quality=bim_quality, template=name)
+            for name in template_names
+        ]
+        return cls(projects, start_days=start_days, **kwargs)
+
+    @classmethod
+    def from_csv(cls, csv_file, **kwargs):
+        """
+        CSV 파일로 포트폴리오 생성
+
+        컬럼: project_id, template, start_day, bim, quality, budget, duration
+        (template 외에는 선택, budget/duration은 템플릿 값 덮어쓰기)
+        """
+        projects = []
+        start_days = []
+
+        with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+            for row in csv.DictReader(f):
+                bim_enabled = str(row.get('bim') or '').strip().lower() in ('1', 'true', 'on', 'y', 'yes')
+                quality = (row.get('quality') or '').strip() or 'good'
+
+                project = Project(
+                    bim_enabled=bim_enabled,
+                    bim_quality=BIMQualityConfig.get_preset(quality) if bim_enabled else None,
+                    template=(row.get('template') or '').strip() or None
+                )
+
+                if row.get('project_id'):
+                    project.name = f"{project.name} [{row['project_id'].strip()}]"
+                if row.get('budget'):
+                    project.budget = float(row['budget'])
+                    project.actual_cost = project.budget
+                if row.get('duration'):
+                    project.planned_duration = int(row['duration'])
+
+                projects.append(project)
+                start_days.append(int(row.get('start_day') or 0))
+
+        return cls(projects, start_days=start_days, **kwargs)
+
+    def run(self, n_scenarios=1000, seed=None, var_levels=None):
+        """
+        포트폴리오 시뮬레이션 실행
+
+        Args:
+            n_scenarios: 시나리오 수
+            seed: 난수 시드
+            var_levels: VaR/CVaR 신뢰수준 (기본: PortfolioConfig.VAR_LEVELS)
+
+        Returns:
+            포트폴리오 집계 결과 딕셔너리
+        """
+        var_levels = var_levels or PortfolioConfig.VAR_LEVELS
+        n_proj = len(self.projects)
+        n_issue = len(self.simulator.issue_ids)
+
+        bucket_days = PortfolioConfig.EXPOSURE_BUCKET_DAYS
+        n_buckets = self.horizon // bucket_days + 1
+
+        chunk_size = max(1, PortfolioConfig.MAX_CHUNK_CELLS // max(1, n_proj * n_issue))
+        n_chunks = -(-n_scenarios // chunk_size)
+        seeds = np.random.SeedSequence(seed).spawn(n_chunks + 1)
+        shock_rng = np.random.default_rng(seeds[-1])
+
+        project_loss = []
+        project_financial = []
+        project_delay = []
+        exposure = []
+        shock_hits = []
+
+        for chunk in range(n_chunks):
+            n = min(chunk_size, n_scenarios - chunk * chunk_size)
+            boost, hits = self._draw_shocks(shock_rng, n)
+
+            result = self.simulator.run(
+                n, seed=seeds[chunk], boost=boost, detail=True, chunk_size=n
+            )
+
+            project_loss.append(result['cost_increase'])
+            project_financial.append(result['financial_cost'])
+            project_delay.append(result['delay_days'])
+            shock_hits.append(hits)
+
+            # 공통 달력상 월별 비용 발생액
+            calendar_day = self.start_days[:, None] + result['issue_day'] - 1
+            bucket = np.clip(calendar_day // bucket_days, 0, n_buckets - 1)
+            amount = (
+                self.simulator.budget[:, None] * result['issue_cost_increase']
+                + result['issue_financial_cost']
+            )
+            flat = (np.arange(n)[:, None, None] * n_buckets + bucket).ravel()
+            monthly = np.bincount(flat, weights=amount.ravel(), minlength=n * n_buckets)
+            exposure.append(monthly.reshape(n, n_buckets))
+
+        project_loss = np.concatenate(project_loss)
+        project_financial = np.concatenate(project_financial)
+        project_delay = np.concatenate(project_delay)
+        cumulative_exposure = np.cumsum(np.concatenate(exposure), axis=1)
+        shock_hits = np.concatenate(shock_hits) if self.shock_ids else np.zeros((n_scenarios, 0), dtype=bool)
+
+        total_loss = project_loss.sum(axis=1)
+
+        var = {}
+        cvar = {}
+        tail_contribution = {}
+        for level in var_levels:
+            threshold = float(np.quantile(total_loss, level))
+            tail = total_loss >= threshold
+            var[level] = threshold
+            cvar[level] = float(total_loss[tail].mean())
+            tail_contribution[level] = project_loss[tail].mean(axis=0)
+
+        return {
+            'n_scenarios': n_scenarios,
+            'n_projects': n_proj,
+            'project_names': [p.name for p in self.projects],
+            'total_budget': float(self.simulator.budget.sum()),
+            'total_cost_increase': total_loss,
+            'total_financial_cost': project_financial.sum(axis=1),
+            'expected_loss': float(total_loss.mean()),
+            'var': var,
+            'cvar': cvar,
+            'project_expected_loss': project_loss.mean(axis=0),
+            'project_expected_delay_days': project_delay.mean(axis=0),
+            'project_tail_contribution': tail_contribution,
+            'exposure_timeline': {
+                'bucket_days': bucket_days,
+                'mean': cumulative_exposure.mean(axis=0),
+                'p95': np.quantile(cumulative_exposure, 0.95, axis=0)
+            },
+            'shock_frequency': {
+                sid: float(shock_hits[:, k].mean()) for k, sid in enumerate(self.shock_ids)
+            }
+        }
+
+    def _draw_shocks(self, rng, n):
+        """
+        시나리오별 공통 충격 추출 → BatchSimulator boost 배열
+
+        Returns:
+            ((start, end, multiplier), 발생 여부 배열 (n, 충격 수))
+        """
+        n_proj, n_issue = self.simulator.window_start.shape
+        boost_start = np.zeros((n, n_proj, n_issue), dtype=np.int64)
+        boost_end = np.zeros((n, n_proj, n_issue), dtype=np.int64)
+        boost_mult = np.ones((1, 1, n_issue))
+        hits = np.zeros((n, len(self.shock_ids)), dtype=bool)
+
+        for k, (sid, index) in enumerate(zip(self.shock_ids, self.shock_index)):
+            shock = self.shocks[sid]
+            occurred = rng.random(n) < shock['probability']
+            start = rng.integers(shock['window_start'], shock['window_end'] + 1, size=n)
+            end = start + shock['duration_days']
+
+            # 달력 일자 → 프로젝트 일자 (착수일 = 프로젝트 Day 1)
+            project_start = start[:, None] - self.start_days[None, :] + 1
+            project_end = end[:, None] - self.start_days[None, :] + 1
+            boost_start[:, :, index] = np.where(occurred[:, None], project_start, 0)
+            boost_end[:, :, index] = np.where(occurred[:, None], project_end, 0)
+            boost_mult[0, 0, index] = shock['rate_multiplier']
+            hits[:, k] = occurred
+
+        return (boost_start, boost_end, boost_mult), hits
+
+    @staticmethod
+    def print_summary(result):
+        """포트폴리오 결과 요약 출력"""
+        print(f"\n{'='*70}")
+        print(f"포트폴리오 리스크 요약 ({result['n_projects']}개 현장, {result['n_scenarios']:,}개 시나리오)")
+        print(f"{'='*70}")
+        print(f"총 사업비: {result['total_budget']/1e8:,.1f}억원")
+        print(f"기대 손실(비용 초과): {result['expected_loss']/1e8:,.2f}억원")
+        for level in result['var']:
+            print(f"VaR {level*100:.0f}%: {result['var'][level]/1e8:,.2f}억원 | "
+                  f"CVaR {level*100:.0f}%: {result['cvar'][level]/1e8:,.2f}억원")
+
+        if result['shock_frequency']:
+            print("\n[공통 충격 발생 빈도]")
+            for sid, freq in result['shock_frequency'].items():
+                print(f"  {sid}: {freq*100:.1f}%")
+
+        top = np.argsort(result['project_expected_loss'])[::-1][:5]
+        print("\n[기대 손실 상위 현장]")
+        for index in top:
+            print(f"  {result['project_names'][index]}: "
+                  f"{result['project_expected_loss'][index]/1e8:,.2f}억원 "
+                  f"(평균 지연 {result['project_expected_delay_days'][index]:.0f}일)")
+        print(f"{'='*70}\n")
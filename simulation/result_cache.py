@@ -0,0 +1,205 @@
+"""
+시뮬레이션 결과 캐시 (입력 해시 → 최종 지표 + 엔진 상태)
+
+템플릿 에이전트(use_llm=False)로 실행하는 SimulationEngine.run은 이슈 카드, 프로젝트 설정,
+BIM 품질, 협상 테이블, 실행 시작 시 난수 상태(시드), 코드 버전의 순수 함수이므로
+이 입력들의 정규형 해시를 키로 결과를 저장하고, 같은 키의 실행은 저장된 결과로 대신한다.
+저장소는 sqlite 파일 하나 (같은 장비의 여러 프로세스가 공유), 크기/개수 한도를 넘으면 오래 안 쓴 항목부터 삭제.
+"""
+
+import json
+import time
+import pickle
+import random
+import sqlite3
+import hashlib
+import zlib
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
+
+# 코드 버전 해시에 포함할 패키지 (결과에 영향을 주는 코드)
+CODE_PACKAGES = ('agents', 'config', 'models', 'simulation', 'utils')
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+@lru_cache(maxsize=1)
+def code_version():
+    """결과에 영향을 주는 소스 파일 내용 해시 (프로세스당 한 번 계산)"""
+    digest = hashlib.sha256()
+    for package in CODE_PACKAGES:
+        for path in sorted((ROOT_DIR / package).rglob('*.py')):
+            digest.update(str(path.relative_to(ROOT_DIR)).encode('utf-8'))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def canonical(value):
+    """
+    JSON 직렬화 가능한 정규형 (딕셔너리 키/집합 정렬, 객체는 클래스명 + 속성)
+
+    같은 입력이면 객체 생성 순서/메모리 주소와 무관하게 같은 값
+    """
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, dict):
+        return [[canonical(key), canonical(item)] for key, item in
+                sorted(value.items(), key=lambda pair: json.dumps(canonical(pair[0])))]
+    if isinstance(value, (list, tuple)):
+        return [canonical(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((canonical(item) for item in value), key=json.dumps)
+    if isinstance(value, np.ndarray):
+        return [str(value.dtype), list(value.shape), hashlib.sha256(value.tobytes()).hexdigest()]
+    if isinstance(value, np.generic):
+        return canonical(value.item())
+    if hasattr(value, '__dict__'):
+        return [type(value).__name__, canonical(vars(value))]
+    return repr(value)
+
+
+class SimulationResultCache:
+    """엔진 실행 결과 캐시 (sqlite, 프로세스 간 공유, LRU + 크기 한도)"""
+
+    VERSION = 1
+    MAX_BYTES = 512 * 1024 * 1024
+    MAX_ENTRIES = 10_000
+
+    def __init__(self, path='output/cache/simulation_results.sqlite3', max_bytes=None, max_entries=None):
+        """
+        Args:
+            path: 캐시 파일 경로 (같은 경로를 쓰는 프로세스끼리 공유)
+            max_bytes: 저장 크기 한도 (압축 후 바이트)
+            max_entries: 항목 수 한도
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes or self.MAX_BYTES
+        self.max_entries = max_entries or self.MAX_ENTRIES
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0, 'evicted': 0, 'bypassed': 0}
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, payload BLOB NOT NULL, size INTEGER NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL, hits INTEGER NOT NULL DEFAULT 0)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+
+    @contextmanager
+    def _connect(self):
+        # 호출마다 연결 (fork한 자식 프로세스에서도 안전), 다른 프로세스의 쓰기는 timeout까지 대기
+        conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def bypass_reason(engine):
+        """캐시를 쓸 수 없는 이유 (처음부터 실행, LLM 미사용, 체크포인트/프로파일/배치 수집 없음이면 None)"""
+        if engine.project.current_day > 0 or engine.simulation_log:
+            return '재개한 실행'
+        if any(getattr(agent, 'use_llm', True) for agent in engine.agents.values()):
+            return 'LLM 에이전트 사용 (템플릿 에이전트 필요)'
+        if any(agent.conversation_history for agent in engine.agents.values()):
+            return '대화 기록이 있는 에이전트'
+        if engine.llm_batch is not None:
+            return 'LLM 배치 요청 수집'
+        if engine.checkpoint_file is not None:
+            return '체크포인트 저장'
+        if engine.profile_file is not None:
+            return '프로파일링'
+        return None
+
+    @classmethod
+    def cacheable(cls, engine):
+        """캐시 가능한 실행인지"""
+        return cls.bypass_reason(engine) is None
+
+    def key(self, engine):
+        """실행 입력 해시 (캐시 불가능한 실행이면 None)"""
+        if not self.cacheable(engine):
+            self.stats['bypassed'] += 1
+            return None
+
+        negotiation = engine.impact_calculator.negotiation_system
+        inputs = {
+            'version': [self.VERSION, engine.CHECKPOINT_VERSION, code_version()],
+            'project': canonical(engine.project),
+            'issues': canonical(engine.issue_manager),
+            'negotiation': canonical([negotiation.agent_preferences, negotiation.agent_weights]),
+            'random_state': canonical(random.getstate()),
+            'agents': sorted((key, type(agent).__name__) for key, agent in engine.agents.items()),
+            'bim_status': engine.meeting_coordinator.bim_status,
+            'render_meetings': engine.render_meetings,
+            'schedule_network': canonical(engine.schedule_network)
+        }
+        encoded = json.dumps(inputs, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """저장된 결과 {'metrics', 'state'} (없으면 None)"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT payload FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+            conn.execute("UPDATE results SET accessed = ?, hits = hits + 1 WHERE key = ?", (time.time(), key))
+
+        self.stats['hits'] += 1
+        return pickle.loads(zlib.decompress(row[0]))
+
+    def put(self, key, metrics, state):
+        """
+        결과 저장 후 한도 초과분 삭제
+
+        Args:
+            metrics: 최종 지표
+            state: 실행 종료 시점 엔진 상태 (SimulationEngine.get_state)
+        """
+        payload = zlib.compress(pickle.dumps({'metrics': metrics, 'state': state},
+                                             protocol=pickle.HIGHEST_PROTOCOL))
+        if len(payload) > self.max_bytes:
+            return False
+
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, 0)",
+                         (key, payload, len(payload), now, now))
+            self.stats['evicted'] += self._evict(conn)
+            conn.execute("COMMIT")
+
+        self.stats['stored'] += 1
+        return True
+
+    def _evict(self, conn):
+        """개수/크기 한도를 넘는 만큼 마지막 사용이 오래된 항목부터 삭제"""
+        count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return 0
+
+        evicted = []
+        for key, size in conn.execute("SELECT key, size FROM results ORDER BY accessed"):
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            count -= 1
+            total -= size
+        conn.executemany("DELETE FROM results WHERE key = ?", evicted)
+        return len(evicted)
+
+    def info(self):
+        """저장 항목 수/크기 및 현재 프로세스 통계"""
+        with self._connect() as conn:
+            count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        return dict(self.stats, entries=count, bytes=total)
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM results")
@@ -0,0 +1,197 @@
+"""
+시나리오 분기 (실행 중 스냅샷에서 what-if 분기 병렬 실행)
+
+공통 구간(스냅샷 시점까지)은 한 번만 계산하고, 이후 구간만 분기별로 실행한다.
+모든 분기는 스냅샷의 난수 상태에서 출발하므로 공통 난수(CRN)로 비교된다.
+"""
+
+import os
+import pickle
+import random
+from agents.owner_agent import OwnerAgent
+from agents.designer_agent import DesignerAgent
+from agents.contractor_agent import ContractorAgent
+from agents.supervisor_agent import SupervisorAgent
+from agents.bank_agent import BankAgent
+from simulation.simulation_engine import SimulationEngine
+from utils.process_pool import process_pool
+from utils.text_width import pad
+
+
+# 분기에서 변경 가능한 항목
+BRANCH_KEYS = {
+    'name', 'bim_enabled', 'bim_quality', 'negotiation_preferences',
+    'negotiation_weights', 'issue_rate_multipliers', 'seed'
+}
+
+# 워커 프로세스 공유 데이터 (fork 시 부모 메모리를 copy-on-write로 공유)
+_WORKER_SNAPSHOT = None
+_WORKER_AGENT_FACTORY = None
+
+
+def template_agents():
+    """템플릿 응답 에이전트 (LLM 미사용, 분기 기본값)"""
+    return {
+        'owner': OwnerAgent(use_llm=False),
+        'designer': DesignerAgent(use_llm=False),
+        'contractor': ContractorAgent(use_llm=False),
+        'supervisor': SupervisorAgent(use_llm=False),
+        'bank': BankAgent(use_llm=False)
+    }
+
+
+def _init_worker(snapshot, agent_factory):
+    global _WORKER_SNAPSHOT, _WORKER_AGENT_FACTORY
+    _WORKER_SNAPSHOT = snapshot
+    _WORKER_AGENT_FACTORY = agent_factory
+
+
+def _run_worker(branch):
+    return run_branch(_WORKER_SNAPSHOT, branch, _WORKER_AGENT_FACTORY)
+
+
+def _check_branch(branch):
+    unknown = set(branch) - BRANCH_KEYS
+    if unknown:
+        raise ValueError(f"알 수 없는 분기 설정입니다: {sorted(unknown)}")
+
+
+def apply_branch(engine, branch):
+    """
+    분기 설정을 복원된 엔진에 적용
+
+    Args:
+        engine: 스냅샷에서 복원한 SimulationEngine
+        branch: 분기 설정 딕셔너리
+            - bim_enabled / bim_quality: BIM 적용 여부 및 품질 (분기 시점부터 적용)
+            - negotiation_preferences / negotiation_weights: 에이전트별 협상 선호도/가중치
+            - issue_rate_multipliers: {이슈 ID: 발생 확률 배수} (미발생 이슈에만 적용)
+            - seed: 지정 시 분기 시점에서 난수 재설정 (기본은 스냅샷 난수 상태 공유)
+    """
+    _check_branch(branch)
+
+    project = engine.project
+    if 'bim_enabled' in branch:
+        project.bim_enabled = branch['bim_enabled']
+        engine.meeting_coordinator.bim_status = "BIM_ON" if project.bim_enabled else "BIM_OFF"
+    if branch.get('bim_quality'):
+        project.bim_quality = branch['bim_quality']
+
+    negotiation = engine.impact_calculator.negotiation_system
+    negotiation.agent_preferences.update(branch.get('negotiation_preferences', {}))
+    negotiation.agent_weights.update(branch.get('negotiation_weights', {}))
+
+    multipliers = branch.get('issue_rate_multipliers', {})
+    if multipliers:
+        manager = engine.issue_manager
+        manager.pending_issues = [
+            dict(issue, occurrence_rate=min(1.0, issue.get('occurrence_rate', 0.01) * multipliers[issue['id']]))
+            if issue['id'] in multipliers else issue
+            for issue in manager.pending_issues
+        ]
+
+    if branch.get('seed') is not None:
+        random.seed(branch['seed'])
+
+
+def run_branch(snapshot, branch, agent_factory=template_agents, verbose=False):
+    """
+    스냅샷에서 분기 하나를 끝까지 실행
+
+    Args:
+        snapshot: pickle된 엔진 상태 (SimulationEngine.get_state)
+        branch: 분기 설정 딕셔너리 (apply_branch 참고)
+        agent_factory: 에이전트 딕셔너리 생성 함수
+        verbose: 상세 출력 여부
+
+    Returns:
+        {'name', 'branch', 'metrics', 'issue_log'}
+    """
+    engine = SimulationEngine.from_state(pickle.loads(snapshot), agent_factory(), save_logs=False)
+    fork_day = engine.project.current_day
+    apply_branch(engine, branch)
+
+    metrics = engine.run(verbose=verbose)
+
+    return {
+        'name': branch.get('name', ''),
+        'branch': branch,
+        'fork_day': fork_day,
+        'metrics': metrics,
+        'issue_log': [
+            {
+                'day': entry['day'],
+                'issue_id': entry['issue']['id'],
+                'detected': entry['impact']['detected'],
+                'delay_weeks': entry['impact']['delay_weeks'],
+                'cost_increase': entry['impact']['cost_increase']
+            }
+            for entry in engine.simulation_log
+        ]
+    }
+
+
+class ScenarioFork:
+    """실행 중인 엔진의 스냅샷에서 분기 실행"""
+
+    def __init__(self, engine):
+        """
+        Args:
+            engine: 분기 시점까지 진행한 SimulationEngine (run_until 사용)
+        """
+        self.fork_day = engine.project.current_day
+        self.snapshot = pickle.dumps(engine.get_state(), protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_day(cls, engine, fork_day, verbose=False):
+        """엔진을 fork_day까지 진행한 뒤 스냅샷"""
+        engine.run_until(fork_day, verbose)
+        return cls(engine)
+
+    def run(self, branches, agent_factory=template_agents, max_workers=None, parallel=True):
+        """
+        분기 병렬 실행
+
+        Args:
+            branches: 분기 설정 딕셔너리 리스트 ({}이면 변경 없는 기준 분기)
+            agent_factory: 에이전트 딕셔너리 생성 함수 (spawn 환경에서는 모듈 최상위 함수)
+            max_workers: 프로세스 수 (기본: CPU 수)
+            parallel: False면 현재 프로세스에서 순차 실행
+
+        Returns:
+            분기별 결과 리스트 (입력 순서)
+        """
+        branches = list(branches)
+        for branch in branches:
+            _check_branch(branch)
+
+        # 순차 실행 시 전역 난수 상태를 분기마다 스냅샷 값으로 되돌리므로 호출 전 상태를 보존
+        if not parallel or len(branches) <= 1:
+            saved_state = random.getstate()
+            try:
+                return [run_branch(self.snapshot, branch, agent_factory) for branch in branches]
+            finally:
+                random.setstate(saved_state)
+
+        # fork 가능 환경에서는 스냅샷을 복사하지 않고 자식 프로세스가 공유
+        workers = min(len(branches), max_workers or os.cpu_count() or 1)
+
+        with process_pool(workers, initializer=_init_worker, initargs=(self.snapshot, agent_factory)) as executor:
+            return list(executor.map(_run_worker, branches))
+
+    @staticmethod
+    def print_comparison(results):
+        """분기별 결과 비교 출력"""
+        print(f"\n{'='*70}")
+        print(f"시나리오 분기 비교 (Day {results[0]['fork_day']}부터 분기)" if results else "시나리오 분기 비교")
+        print(f"{'='*70}")
+        print(f"{pad('분기', 24)}{pad('지연(주)', 10, 'right')}{pad('비용 증가(억원)', 16, 'right')}"
+              f"{pad('금융 비용(억원)', 16, 'right')}{pad('이슈', 6, 'right')}")
+        for index, result in enumerate(results):
+            metrics = result['metrics']
+            name = result['name'] or f"branch-{index + 1}"
+            print(f"{pad(name, 24)}{metrics['delay_weeks']:>10.1f}"
+                  f"{metrics['cost_increase']/1e8:>16.2f}"
+                  f"{metrics['financial_cost']/1e8:>16.2f}"
+                  f"{metrics['issues_count']:>6}")
+        print(f"{'='*70}\n")
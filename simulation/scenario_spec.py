@@ -0,0 +1,447 @@
+"""
+시나리오 명세 파일 (JSON/TOML/YAML) → 컴파일된 실행 명세
+
+연구(study) 하나를 파일로 선언하고, 로드할 때 한 번만 검증/컴파일한 뒤
+시나리오 × 매트릭스 조합을 생성기로 하나씩 펼친다 (조합 수만큼 미리 만들지 않음).
+실행 명세(RunSpec)와 프로젝트 명세(ProjectSpec)는 작은 불변 객체라 워커 프로세스로 싸게 전달된다.
+
+    name: BIM 품질 민감도
+    defaults: {template: cheongdam, mode: engine, seed: 42}
+    scenarios:
+      - {name: 기준}
+      - {name: 시공사 양보, negotiation_preferences: {contractor: 0.3}}
+    matrix:
+      bim_quality: [off, poor, average, good, excellent]
+      seed: {range: [1, 101]}
+    exclude:
+      - {scenario: 시공사 양보, bim_quality: off}
+"""
+
+import os
+import json
+import itertools
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
+from config.bim_quality_config import BIMQualityConfig
+from config.project_templates import ProjectTemplates
+from models.project import Project
+from models.phase_calendar import PhaseCalendar
+from simulation.batch_simulator import BatchSimulator
+from simulation.simulation_engine import SimulationEngine
+from simulation.scenario_fork import apply_branch, template_agents
+from utils.process_pool import process_pool
+
+
+STUDY_KEYS = {'name', 'description', 'defaults', 'scenarios', 'matrix', 'exclude'}
+SPEC_FIELDS = (
+    'name', 'mode', 'template', 'bim_quality', 'project', 'seed', 'runs',
+    'negotiation_preferences', 'negotiation_weights', 'issue_rate_multipliers'
+)
+MODES = ('engine', 'batch')
+AGENT_KEYS = ('owner', 'designer', 'contractor', 'supervisor', 'bank')
+QUALITY_KEYS = ('warning_density', 'clash_density', 'attribute_fill', 'phase_link')
+PROJECT_KEYS = ('name', 'budget', 'duration', 'gfa', 'pf_ratio', 'base_interest_rate', 'phase_durations')
+
+# 명세 기본값 (main.py 비교 실행과 같은 시드)
+DEFAULTS = {
+    'mode': 'engine', 'template': None, 'bim_quality': 'off', 'project': {}, 'seed': 42, 'runs': 1000,
+    'negotiation_preferences': {}, 'negotiation_weights': {}, 'issue_rate_multipliers': {}
+}
+
+
+class _Frozen:
+    """__slots__ 불변 객체 (값 비교/해시, pickle 시 값 튜플만 전달)"""
+
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__}는 변경할 수 없습니다")
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __reduce__(self):
+        return type(self), self._values()
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other._values() == self._values()
+
+    def __hash__(self):
+        return hash(self._values())
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class ProjectSpec(_Frozen):
+    """프로젝트 명세 (템플릿, BIM 품질, 템플릿 값 덮어쓰기)"""
+
+    __slots__ = ('template', 'bim_quality', 'overrides')
+
+    def build(self):
+        """Project 생성 (실행마다 새 객체)"""
+        quality = dict(zip(QUALITY_KEYS, self.bim_quality)) if self.bim_quality else None
+        project = Project(bim_enabled=quality is not None, bim_quality=quality, template=self.template)
+
+        for key, value in self.overrides:
+            if key == 'budget':
+                project.budget = value
+                project.actual_cost = value
+            elif key == 'duration':
+                project.planned_duration = value
+            elif key == 'phase_durations':
+                project.phase_durations = dict(value)
+                project.calendar = PhaseCalendar.for_durations(project.phase_durations)
+            elif key == 'base_interest_rate':
+                project.base_interest_rate = value
+                project.current_interest_rate = value
+            else:
+                setattr(project, key, value)
+        return project
+
+
+class RunSpec(_Frozen):
+    """실행 명세 하나 (연구 객체를 참조하지 않음)"""
+
+    __slots__ = ('index', 'name', 'mode', 'project', 'seed', 'runs',
+                 'negotiation_preferences', 'negotiation_weights', 'issue_rate_multipliers')
+
+    def branch(self):
+        """scenario_fork.apply_branch 형식의 설정"""
+        branch = {}
+        for key in ('negotiation_preferences', 'negotiation_weights', 'issue_rate_multipliers'):
+            if getattr(self, key):
+                branch[key] = dict(getattr(self, key))
+        return branch
+
+    def build_engine(self, agents=None, **engine_kwargs):
+        """
+        SimulationEngine 생성 (engine 모드)
+
+        Args:
+            agents: 에이전트 딕셔너리 (기본: 템플릿 에이전트)
+            engine_kwargs: SimulationEngine 추가 인자 (save_logs 기본 False)
+        """
+        engine_kwargs.setdefault('save_logs', False)
+        engine = SimulationEngine(self.project.build(), agents or template_agents(),
+                                  random_seed=self.seed, **engine_kwargs)
+        apply_branch(engine, self.branch())
+        return engine
+
+    def run(self, agent_factory=template_agents, verbose=False, **engine_kwargs):
+        """
+        실행 후 지표 반환 (engine: 지표 딕셔너리, batch: 지표별 배열)
+        """
+        if self.mode == 'engine':
+            return self.build_engine(agent_factory(), **engine_kwargs).run(verbose=verbose)
+
+        simulator = _batch_simulator(self.project, self.negotiation_preferences, self.negotiation_weights)
+        multipliers = None
+        if self.issue_rate_multipliers:
+            factors = dict(self.issue_rate_multipliers)
+            multipliers = np.array([factors.get(issue_id, 1.0) for issue_id in simulator.issue_ids])
+        return simulator.run(self.runs, seed=self.seed, rate_multipliers=multipliers)
+
+
+@lru_cache(maxsize=64)
+def _batch_simulator(project, preferences, weights):
+    """프로젝트/협상 설정별 배치 시뮬레이터 (같은 프로세스 안에서 재사용)"""
+    simulator = BatchSimulator(project.build())
+    if preferences or weights:
+        simulator.negotiation_system.agent_preferences.update(preferences)
+        simulator.negotiation_system.agent_weights.update(weights)
+        simulator._compile()
+    return simulator
+
+
+class _Axis:
+    """매트릭스 축 (목록 값은 로드 시 컴파일, range 값은 꺼낼 때 생성)"""
+
+    def __init__(self, name, values, compile_value):
+        self.name = name
+        self.values = values
+        self.compile_value = compile_value
+        self.entries = None if isinstance(values, range) else [compile_value(value, i) for i, value in enumerate(values)]
+
+    def __len__(self):
+        return len(self.values)
+
+    def entry(self, index):
+        """(이름 표기, 원래 값, 패치)"""
+        if self.entries is not None:
+            return self.entries[index]
+        return self.compile_value(self.values[index], index)
+
+    def index_of(self, value):
+        if self.entries is None:
+            return {self.values.index(value)} if value in self.values else set()
+        return {i for i, entry in enumerate(self.entries) if entry[1] == value}
+
+
+class Study:
+    """시나리오 명세 연구 (로드 시 검증/컴파일, 실행 명세는 생성기로 펼침)"""
+
+    def __init__(self, spec, issue_file='data/issue_cards.json', source=None):
+        """
+        Args:
+            spec: 명세 딕셔너리 (파일 형식과 같은 구조)
+            issue_file: issue_rate_multipliers의 이슈 ID 검증용 이슈 카드
+            source: 오류 메시지에 표시할 파일 경로
+        """
+        self.source = source or '<study>'
+        self._check_keys(spec, STUDY_KEYS, self.source)
+        with open(issue_file, 'r', encoding='utf-8') as f:
+            self.issue_ids = {issue['id'] for issue in json.load(f)}
+        self._projects = {}
+
+        self.name = spec.get('name', Path(self.source).stem)
+        self.description = spec.get('description', '')
+        self.defaults = self._compile_patch(dict(DEFAULTS, **spec.get('defaults', {})), f"{self.source}: defaults")
+
+        scenarios = spec.get('scenarios') or [{}]
+        if not isinstance(scenarios, list):
+            raise ValueError(f"{self.source}: scenarios는 목록이어야 합니다")
+        self._scenario_count = len(scenarios)
+        self.scenarios = _Axis('scenario', scenarios, self._compile_scenario)
+
+        matrix = spec.get('matrix') or {}
+        if not isinstance(matrix, dict):
+            raise ValueError(f"{self.source}: matrix는 {{축 이름: 값 목록}}이어야 합니다")
+        self.axes = [self.scenarios] + [self._compile_axis(name, values) for name, values in matrix.items()]
+
+        self.exclude = [self._compile_exclude(rule, i) for i, rule in enumerate(spec.get('exclude') or [])]
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        """명세 파일 로드 (.json / .toml / .yaml, .yml)"""
+        path = Path(path)
+        suffix = path.suffix.lower()
+        if suffix == '.json':
+            with open(path, 'r', encoding='utf-8') as f:
+                spec = json.load(f)
+        elif suffix == '.toml':
+            import tomllib
+            with open(path, 'rb') as f:
+                spec = tomllib.load(f)
+        elif suffix in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("YAML 명세에는 PyYAML이 필요합니다 (pip install pyyaml, 또는 JSON/TOML 사용)")
+            with open(path, 'r', encoding='utf-8') as f:
+                spec = yaml.safe_load(f) or {}
+        else:
+            raise ValueError(f"지원하지 않는 명세 형식입니다: {path.suffix} (.json/.toml/.yaml)")
+        return cls(spec, source=str(path), **kwargs)
+
+    # ---------- 컴파일 (로드 시 한 번) ----------
+
+    @staticmethod
+    def _check_keys(value, allowed, where):
+        if not isinstance(value, dict):
+            raise ValueError(f"{where}: 딕셔너리여야 합니다")
+        unknown = set(value) - set(allowed)
+        if unknown:
+            raise ValueError(f"{where}: 알 수 없는 항목입니다: {sorted(unknown)}")
+
+    @staticmethod
+    def _number(value, where, low=None, high=None, integer=False):
+        valid_type = int if integer else (int, float)
+        if not isinstance(value, valid_type) or isinstance(value, bool):
+            raise ValueError(f"{where}: {'정수' if integer else '숫자'}여야 합니다: {value!r}")
+        if (low is not None and value < low) or (high is not None and value > high):
+            bounds = f"{low if low is not None else ''}~{high if high is not None else ''}"
+            raise ValueError(f"{where}: {bounds} 범위여야 합니다: {value!r}")
+        return value
+
+    def _mapping(self, value, where, keys, low=None, high=None):
+        self._check_keys(value, keys, where)
+        return tuple(sorted((key, float(self._number(item, f"{where}.{key}", low, high)))
+                            for key, item in value.items()))
+
+    def _compile_field(self, field, value, where):
+        """필드 값 검증 → 불변 값"""
+        if field == 'name':
+            if not isinstance(value, str):
+                raise ValueError(f"{where}: 문자열이어야 합니다")
+            return value
+        if field == 'mode':
+            if value not in MODES:
+                raise ValueError(f"{where}: {MODES} 중 하나여야 합니다: {value!r}")
+            return value
+        if field == 'template':
+            if value is not None:
+                try:
+                    ProjectTemplates.get_template(value)
+                except ValueError as e:
+                    raise ValueError(f"{where}: {e}") from None
+            return value
+        if field == 'bim_quality':
+            # YAML 1.1은 off를 false로 읽음
+            if value is None or value is False or value == 'off':
+                return None
+            if isinstance(value, str):
+                if value not in BIMQualityConfig.PRESETS:
+                    raise ValueError(f"{where}: 알 수 없는 품질 프리셋입니다: {value!r}")
+                value = BIMQualityConfig.PRESETS[value]
+            self._check_keys(value, QUALITY_KEYS, where)
+            if set(value) != set(QUALITY_KEYS):
+                raise ValueError(f"{where}: {QUALITY_KEYS} 모두 필요합니다")
+            return tuple(
+                float(self._number(value[key], f"{where}.{key}", 0.0, 1.0 if key in ('attribute_fill', 'phase_link') else None))
+                for key in QUALITY_KEYS
+            )
+        if field == 'project':
+            self._check_keys(value, PROJECT_KEYS, where)
+            overrides = []
+            for key, item in value.items():
+                if key == 'name':
+                    overrides.append((key, self._compile_field('name', item, f"{where}.name")))
+                elif key == 'phase_durations':
+                    if not isinstance(item, dict) or not item:
+                        raise ValueError(f"{where}.phase_durations: {{단계명: 기간(일)}}이어야 합니다")
+                    overrides.append((key, tuple(
+                        (phase, self._number(days, f"{where}.phase_durations.{phase}", 1, integer=True))
+                        for phase, days in item.items()
+                    )))
+                elif key == 'duration':
+                    overrides.append((key, self._number(item, f"{where}.duration", 1, integer=True)))
+                else:
+                    overrides.append((key, float(self._number(item, f"{where}.{key}", 0.0))))
+            return tuple(sorted(overrides))
+        if field == 'seed':
+            return self._number(value, where, 0, integer=True)
+        if field == 'runs':
+            return self._number(value, where, 1, integer=True)
+        if field == 'negotiation_preferences':
+            return self._mapping(value, where, AGENT_KEYS, 0.0, 1.0)
+        if field == 'negotiation_weights':
+            return self._mapping(value, where, AGENT_KEYS, 0.0)
+        if field == 'issue_rate_multipliers':
+            return self._mapping(value, where, self.issue_ids, 0.0)
+        raise ValueError(f"{where}: 알 수 없는 항목입니다: {field}")
+
+    def _compile_patch(self, values, where):
+        self._check_keys(values, SPEC_FIELDS, where)
+        return {field: self._compile_field(field, value, f"{where}.{field}") for field, value in values.items()}
+
+    def _compile_scenario(self, scenario, index):
+        patch = self._compile_patch(scenario, f"{self.source}: scenarios[{index}]")
+        name = patch.pop('name', f"S{index + 1}" if self._scenario_count > 1 else '')
+        return name, name, patch
+
+    def _compile_axis(self, name, values):
+        where = f"{self.source}: matrix.{name}"
+        if isinstance(values, dict) and set(values) == {'range'}:
+            values = range(*values['range'])
+        elif not isinstance(values, list) or not values:
+            raise ValueError(f"{where}: 값 목록 또는 {{range: [시작, 끝(미포함), 간격]}}이어야 합니다")
+
+        if name in SPEC_FIELDS:
+            # 필드 축: 값 하나가 필드 하나
+            def compile_value(value, index):
+                compiled = self._compile_field(name, value, f"{where}[{index}]")
+                shown = 'off' if name == 'bim_quality' and compiled is None else value
+                return f"{name}={shown}", value, {name: compiled}
+            if isinstance(values, range) and len(values):
+                compile_value(values[0], 0), compile_value(values[-1], len(values) - 1)   # 범위 양 끝 검증
+        else:
+            # 묶음 축: 값 하나가 여러 필드 ({name, ...})
+            if isinstance(values, range):
+                raise ValueError(f"{where}: range는 필드 축에서만 사용할 수 있습니다")
+
+            def compile_value(value, index):
+                patch = self._compile_patch(value, f"{where}[{index}]")
+                label = patch.pop('name', f"{name}{index + 1}")
+                return label, label, patch
+        return _Axis(name, values, compile_value)
+
+    def _compile_exclude(self, rule, index):
+        """제외 규칙 → {축 위치: 제외할 값 번호 집합}"""
+        where = f"{self.source}: exclude[{index}]"
+        names = {axis.name: position for position, axis in enumerate(self.axes)}
+        self._check_keys(rule, names, where)
+        compiled = {}
+        for name, value in rule.items():
+            indexes = self.axes[names[name]].index_of(value)
+            if not indexes:
+                raise ValueError(f"{where}.{name}: 축에 없는 값입니다: {value!r}")
+            compiled[names[name]] = indexes
+        return compiled
+
+    # ---------- 펼치기 ----------
+
+    def _combinations(self):
+        for combo in itertools.product(*(range(len(axis)) for axis in self.axes)):
+            if not any(all(combo[position] in indexes for position, indexes in rule.items())
+                       for rule in self.exclude):
+                yield combo
+
+    def __len__(self):
+        if not self.exclude:
+            return int(np.prod([len(axis) for axis in self.axes]))
+        return sum(1 for _ in self._combinations())
+
+    def __iter__(self):
+        return self.run_specs()
+
+    def run_specs(self):
+        """실행 명세 생성기 (기본값 < 시나리오 < 매트릭스 순으로 덮어씀)"""
+        for index, combo in enumerate(self._combinations()):
+            fields = dict(self.defaults)
+            labels = []
+            for axis, position in zip(self.axes, combo):
+                label, _, patch = axis.entry(position)
+                if label:
+                    labels.append(label)
+                if 'project' in patch and fields['project']:
+                    patch = dict(patch, project=tuple(sorted(dict(fields['project'], **dict(patch['project'])).items())))
+                fields.update(patch)
+            yield self._run_spec(index, ' / '.join(labels) or self.name, fields)
+
+    def _run_spec(self, index, name, fields):
+        key = (fields['template'], fields['bim_quality'], fields['project'])
+        project = self._projects.get(key)
+        if project is None:
+            project = self._projects[key] = ProjectSpec(*key)
+        return RunSpec(index, name, fields['mode'], project, fields['seed'], fields['runs'],
+                       fields['negotiation_preferences'], fields['negotiation_weights'],
+                       fields['issue_rate_multipliers'])
+
+
+def _run_spec_worker(spec):
+    return spec, spec.run()
+
+
+def run_study(study, max_workers=None, window=None):
+    """
+    연구 실행 (워커 프로세스 병렬, 명세 순서대로 결과 반환)
+
+    실행 명세는 필요한 만큼만 펼쳐 제출하므로(최대 window개 대기) 큰 매트릭스도 메모리에 올리지 않음
+
+    Yields:
+        (RunSpec, 지표)
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers <= 1:
+        for spec in study:
+            yield spec, spec.run()
+        return
+
+    window = window or workers * 4
+
+    with process_pool(workers) as executor:
+        pending = deque()
+        for spec in study:
+            pending.append(executor.submit(_run_spec_worker, spec))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
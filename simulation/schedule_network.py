@@ -0,0 +1,408 @@
+"""
+공정 네트워크 (액티비티/선후행 관계/자원 기반 CPM)
+
+액티비티 간 FS(종료-시작)/SS(시작-시작) 관계와 지연(lag)으로 전진/후진 계산을 하고,
+이슈로 특정 액티비티가 늘어나면 영향받는 선행/후행 액티비티만 다시 계산한다
+(전파는 조회 구간까지만 처리하는 지연 방식이라 일별 루프 안에서 써도 된다).
+
+- 전진 계산: ES(j) = max(FS: EF(i) + lag, SS: ES(i) + lag), EF = ES + 기간
+- 후진 계산: 잔여 경로 길이 tail(i)(액티비티 시작부터 준공까지 최장 경로)를 유지하면
+  LS = 준공일 - tail, 총 여유 = LS - ES (준공일이 바뀌어도 tail은 그대로)
+"""
+
+import bisect
+import heapq
+import numpy as np
+from config.project_config import ProjectConfig
+
+FS = 'FS'
+SS = 'SS'
+
+
+class ActivityNetwork:
+    """공정 네트워크"""
+
+    def __init__(self):
+        self.activities = []     # {'id', 'name', 'work_type', 'phase', 'resources'}
+        self.index = {}          # 액티비티 ID -> 번호
+        self.duration = []       # 기간 (일, 지연 반영)
+        self.preds = []          # 번호 -> [(선행 번호, 관계, lag)]
+        self.succs = []          # 번호 -> [(후행 번호, 관계, lag)]
+        self.es = []             # 최조 시작일 (프로젝트 시작 = 0)
+        self.tail = []           # 시작부터 준공까지 최장 경로 길이
+        self.order = []          # 위상 순서 (계획 ES 오름차순)
+        self.position = []       # 번호 -> 위상 순서 위치
+        self.planned_es = []     # 위상 순서 위치별 계획 ES (compile 시점)
+        self.by_work_type = {}   # 공종 -> 번호 목록 (위상 순서)
+        self.finish = 0.0
+        self.compiled = False
+        self._forward = []       # 전진 재계산 대기 (위치, 번호)
+        self._backward = []      # 후진 재계산 대기 (-위치, 번호)
+        self._queued_forward = set()
+        self._queued_backward = set()
+
+    # ------------------------------------------------------------------
+    # 구성
+    # ------------------------------------------------------------------
+    def add_activity(self, activity_id, duration, work_type=None, phase=None, name=None, resources=None):
+        """
+        액티비티 추가
+
+        Args:
+            activity_id: 고유 ID
+            duration: 기간 (일)
+            work_type: 공종 (이슈 카드 work_type과 대응)
+            phase: 단계 (설계/입찰/시공/준공)
+            resources: {자원명: 투입량}
+        """
+        if activity_id in self.index:
+            raise ValueError(f"중복된 액티비티 ID입니다: {activity_id}")
+
+        self.index[activity_id] = len(self.activities)
+        self.activities.append({
+            'id': activity_id,
+            'name': name or activity_id,
+            'work_type': work_type,
+            'phase': phase,
+            'resources': resources or {}
+        })
+        self.duration.append(float(duration))
+        self.preds.append([])
+        self.succs.append([])
+        self.compiled = False
+
+    def add_relation(self, pred_id, succ_id, relation=FS, lag=0.0):
+        """선후행 관계 추가 (relation: 'FS' 또는 'SS', lag: 0 이상 일수)"""
+        if relation not in (FS, SS):
+            raise ValueError(f"지원하지 않는 관계입니다: {relation}")
+        if lag < 0:
+            raise ValueError(f"음수 lag는 지원하지 않습니다: {pred_id} -> {succ_id}")
+        i, j = self.index[pred_id], self.index[succ_id]
+        self.preds[j].append((i, relation, float(lag)))
+        self.succs[i].append((j, relation, float(lag)))
+        self.compiled = False
+
+    def compile(self):
+        """위상 정렬(ES 오름차순) 후 전체 전진/후진 계산"""
+        n = len(self.activities)
+        self.es = [0.0] * n
+        self.tail = [0.0] * n
+        indegree = [len(p) for p in self.preds]
+        ready = [(0.0, i) for i in range(n) if indegree[i] == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            start, i = heapq.heappop(ready)
+            self.es[i] = start
+            order.append(i)
+            for j, _, _ in self.succs[i]:
+                indegree[j] -= 1
+                if indegree[j] == 0:
+                    heapq.heappush(ready, (self._early_start(j), j))
+        if len(order) != n:
+            raise ValueError("공정 네트워크에 순환 관계가 있습니다")
+
+        self.order = order
+        self.position = [0] * n
+        for pos, i in enumerate(order):
+            self.position[i] = pos
+        self.planned_es = [self.es[i] for i in order]
+        self.by_work_type = {}
+        for i in order:
+            self.by_work_type.setdefault(self.activities[i]['work_type'], []).append(i)
+
+        for i in reversed(order):
+            self.tail[i] = self._tail(i)
+        self.finish = max((self.es[i] + self.duration[i] for i in range(n)), default=0.0)
+        self._forward, self._backward = [], []
+        self._queued_forward, self._queued_backward = set(), set()
+        self.compiled = True
+        return self
+
+    def _early_start(self, j):
+        start = 0.0
+        for i, relation, lag in self.preds[j]:
+            candidate = self.es[i] + lag + (self.duration[i] if relation == FS else 0.0)
+            if candidate > start:
+                start = candidate
+        return start
+
+    def _tail(self, i):
+        length = self.duration[i]
+        for j, relation, lag in self.succs[i]:
+            candidate = lag + self.tail[j] + (self.duration[i] if relation == FS else 0.0)
+            if candidate > length:
+                length = candidate
+        return length
+
+    # ------------------------------------------------------------------
+    # 증분 갱신
+    # ------------------------------------------------------------------
+    def _sync_forward(self, upto):
+        """위상 위치 upto까지 대기 중인 ES 갱신 처리 (ES가 그대로면 그 뒤로 전파 안 함)"""
+        heap, queued, es, succs, position = self._forward, self._queued_forward, self.es, self.succs, self.position
+        while heap and heap[0][0] <= upto:
+            _, j = heapq.heappop(heap)
+            queued.discard(j)
+            start = self._early_start(j)
+            if start == es[j]:
+                continue
+            es[j] = start
+            for k, _, _ in succs[j]:
+                if k not in queued:
+                    queued.add(k)
+                    heapq.heappush(heap, (position[k], k))
+
+    def _sync_backward(self, downto):
+        """위상 위치 downto까지 (역순) 대기 중인 tail 갱신 처리"""
+        heap, queued, tail, preds, position = self._backward, self._queued_backward, self.tail, self.preds, self.position
+        while heap and -heap[0][0] >= downto:
+            _, i = heapq.heappop(heap)
+            queued.discard(i)
+            length = self._tail(i)
+            if length == tail[i]:
+                continue
+            tail[i] = length
+            for p, _, _ in preds[i]:
+                if p not in queued:
+                    queued.add(p)
+                    heapq.heappush(heap, (-position[p], p))
+
+    def _flush(self):
+        if not self.compiled:
+            self.compile()
+        self._sync_forward(len(self.order))
+        self._sync_backward(-1)
+
+    def delay_activity(self, activity_id, days):
+        """
+        액티비티 기간 증가 (이슈 지연 반영)
+
+        준공일은 즉시 갱신하고(지연 액티비티를 지나는 최장 경로 = ES + tail),
+        후행 ES / 선행 tail 전파는 대기열에 두었다가 해당 구간을 조회할 때 처리한다.
+        일별 루프처럼 시간 순서로 이슈가 들어오면 갱신 1건이 네트워크 크기와 무관하게 끝난다.
+
+        Returns:
+            준공일 변화량 (일, 여유 범위 내 지연이면 0)
+        """
+        if not self.compiled:
+            self.compile()
+
+        a = self.index[activity_id]
+        pos = self.position[a]
+        self._sync_forward(pos)
+        self._sync_backward(pos + 1)
+        before = self.finish
+        self.duration[a] = max(0.0, self.duration[a] + days)
+
+        if days < 0:
+            # 단축은 준공일이 줄어들 수 있어 전체 재계산
+            self.compile()
+            return self.finish - before
+
+        # 전진: EF 증가는 FS 후행에만 영향
+        for j, relation, _ in self.succs[a]:
+            if relation == FS and j not in self._queued_forward:
+                self._queued_forward.add(j)
+                heapq.heappush(self._forward, (self.position[j], j))
+
+        # 후진: a의 tail 갱신 후 선행 대기
+        length = self._tail(a)
+        if length != self.tail[a]:
+            self.tail[a] = length
+            for p, _, _ in self.preds[a]:
+                if p not in self._queued_backward:
+                    self._queued_backward.add(p)
+                    heapq.heappush(self._backward, (-self.position[p], p))
+
+        self.finish = max(before, self.es[a] + self.tail[a])
+        return self.finish - before
+
+    def find_activity(self, work_type, day):
+        """
+        이슈가 영향을 주는 액티비티 (발생 시점 기준)
+
+        같은 공종 중 계획 순서상 day에 아직 끝나지 않은 첫 액티비티 (진행 중 또는 다음 착수),
+        모두 끝났으면 None
+        """
+        if not self.compiled:
+            self.compile()
+
+        # 지연으로 ES는 늘기만 하므로 day 이전에 끝났을 수 있는 건 계획 ES <= day인 액티비티뿐
+        bound = bisect.bisect_right(self.planned_es, day) - 1
+        self._sync_forward(bound)
+        for i in self.by_work_type.get(work_type, []):
+            if self.position[i] > bound or day < self.es[i] + self.duration[i]:
+                return self.activities[i]['id']
+        return None
+
+    def apply_issue(self, work_type, day, delay_days):
+        """
+        이슈 지연을 발생 시점의 해당 공종 액티비티에 반영
+
+        Returns:
+            {'activity', 'float_days', 'finish_shift_days'} (해당 액티비티가 없으면 activity None, 변화 0)
+        """
+        activity_id = self.find_activity(work_type, day)
+        if activity_id is None:
+            return {'activity': None, 'float_days': None, 'finish_shift_days': 0.0}
+
+        slack = self.total_float(activity_id)
+        shift = self.delay_activity(activity_id, delay_days)
+        return {'activity': activity_id, 'float_days': slack, 'finish_shift_days': shift}
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def dates(self, activity_id):
+        """{'es', 'ef', 'ls', 'lf', 'total_float'}"""
+        i = self.index[activity_id]
+        total_float = self.total_float(activity_id)
+        return {
+            'es': self.es[i],
+            'ef': self.es[i] + self.duration[i],
+            'ls': self.es[i] + total_float,
+            'lf': self.es[i] + total_float + self.duration[i],
+            'total_float': total_float
+        }
+
+    def total_float(self, activity_id):
+        """총 여유 (일)"""
+        if not self.compiled:
+            self.compile()
+        i = self.index[activity_id]
+        self._sync_forward(self.position[i])
+        self._sync_backward(self.position[i])
+        return self.finish - self.tail[i] - self.es[i]
+
+    def critical_path(self, tolerance=1e-6):
+        """총 여유 0인 액티비티 ID (위상 순서)"""
+        self._flush()
+        return [
+            self.activities[i]['id'] for i in self.order
+            if self.finish - self.tail[i] - self.es[i] <= tolerance
+        ]
+
+    def phase_windows(self):
+        """단계별 (최조 시작일, 최조 종료일) - 현재 지연 반영"""
+        self._flush()
+        windows = {}
+        for i, activity in enumerate(self.activities):
+            phase = activity['phase']
+            if phase is None:
+                continue
+            start, end = self.es[i], self.es[i] + self.duration[i]
+            if phase in windows:
+                windows[phase] = (min(windows[phase][0], start), max(windows[phase][1], end))
+            else:
+                windows[phase] = (start, end)
+        return windows
+
+    def resource_profile(self, resource, horizon=None):
+        """
+        일별 자원 투입량 (최조 일정 기준)
+
+        Returns:
+            길이 horizon(기본: 준공일) 배열
+        """
+        self._flush()
+        horizon = int(np.ceil(self.finish if horizon is None else horizon))
+        profile = np.zeros(horizon + 1)
+        for i, activity in enumerate(self.activities):
+            amount = activity['resources'].get(resource)
+            if not amount:
+                continue
+            start = int(self.es[i])
+            end = int(np.ceil(self.es[i] + self.duration[i]))
+            profile[max(0, start):max(0, min(end, horizon + 1))] += amount
+        return profile[:horizon]
+
+    # ------------------------------------------------------------------
+    # 템플릿 네트워크
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_project(cls, project, zones=None):
+        """
+        프로젝트(템플릿)의 단계별 기간으로 표준 공정 네트워크 생성
+
+        - 설계: 기본설계 → 실시설계 → 인허가
+        - 입찰: 입찰/계약
+        - 시공: 토공 → 구역별 [자재 조달 → 골조 → 설비/전기(병행) → 마감], 구역 간 작업조 연속(FS),
+          설비/전기는 골조 착수 후 골조 기간 절반의 SS lag로 착수, 시공관리(LOE)
+        - 준공: 준공검사
+        시공 구간은 최장 경로가 단계 기간과 같도록 기간/lag를 비례 조정
+
+        Args:
+            project: Project (phase_durations, gfa 사용)
+            zones: 시공 구역 수 (기본: 연면적 150㎡당 1개)
+        """
+        phases = getattr(project, 'phase_durations', None) or ProjectConfig.PHASE_DURATIONS
+        zones = zones or max(1, round(project.gfa / 150))
+        design, bidding = phases.get('설계', 90), phases.get('입찰', 20)
+        construction, closeout = phases.get('시공', 300), phases.get('준공', 20)
+
+        network = cls()
+        network.add_activity('D-01', design * 0.35, '설계', '설계', '기본설계', {'설계팀': 1})
+        network.add_activity('D-02', design * 0.50, '설계', '설계', '실시설계', {'설계팀': 1})
+        network.add_activity('D-03', design * 0.15, '설계', '설계', '인허가')
+        network.add_relation('D-01', 'D-02')
+        network.add_relation('D-02', 'D-03')
+        network.add_activity('B-01', bidding, '계약', '입찰', '입찰/계약')
+        network.add_relation('D-03', 'B-01')
+
+        # 시공 구간 (단위 기간으로 만든 뒤 비례 조정)
+        construction_ids = []
+
+        def add(activity_id, duration, work_type, name, resources=None):
+            network.add_activity(activity_id, duration, work_type, '시공', name, resources)
+            construction_ids.append(activity_id)
+
+        unit = 1.0 / zones
+        add('C-EW', 0.15, '토목', '토공/기초', {'토목팀': 1})
+        network.add_relation('B-01', 'C-EW')
+        for z in range(zones):
+            tag = f"{z + 1:04d}"
+            add(f'C-MT-{tag}', 0.10, '자재', f'자재 조달 {z + 1}구역')
+            add(f'C-ST-{tag}', 0.45 * unit, '구조', f'골조 {z + 1}구역', {'골조팀': 1})
+            add(f'C-ME-{tag}', 0.30 * unit, '설비', f'설비 {z + 1}구역', {'설비팀': 1})
+            add(f'C-EL-{tag}', 0.25 * unit, '전기', f'전기 {z + 1}구역', {'전기팀': 1})
+            add(f'C-FN-{tag}', 0.30 * unit, '마감', f'마감 {z + 1}구역', {'마감팀': 1})
+
+            network.add_relation('B-01', f'C-MT-{tag}', lag=0.5 * z * unit)
+            network.add_relation(f'C-MT-{tag}', f'C-ST-{tag}')
+            network.add_relation('C-EW' if z == 0 else f'C-ST-{z:04d}', f'C-ST-{tag}')
+            network.add_relation(f'C-ST-{tag}', f'C-ME-{tag}', SS, 0.5 * 0.45 * unit)
+            network.add_relation(f'C-ST-{tag}', f'C-EL-{tag}', SS, 0.5 * 0.45 * unit)
+            network.add_relation(f'C-ST-{tag}', f'C-FN-{tag}')
+            network.add_relation(f'C-ME-{tag}', f'C-FN-{tag}')
+            network.add_relation(f'C-EL-{tag}', f'C-FN-{tag}')
+            if z > 0:
+                network.add_relation(f'C-ME-{z:04d}', f'C-ME-{tag}')
+                network.add_relation(f'C-EL-{z:04d}', f'C-EL-{tag}')
+                network.add_relation(f'C-FN-{z:04d}', f'C-FN-{tag}')
+
+        # 단위 기간의 최장 경로를 시공 기간에 맞춤 (시공관리는 시공 기간 - 7일 LOE)
+        network.compile()
+        span = network.finish - (design + bidding)
+        scale = construction / span
+        for activity_id in construction_ids:
+            i = network.index[activity_id]
+            network.duration[i] *= scale
+            network.preds[i] = [(p, relation, lag * scale) for p, relation, lag in network.preds[i]]
+        network._sync_successor_lags()
+
+        add('C-CM', construction - 7, '시공관리', '현장 관리', {'관리팀': 1})
+        network.add_relation('B-01', 'C-CM')
+
+        network.add_activity('F-01', closeout, '준공', '준공', '준공검사')
+        network.add_relation(f'C-FN-{zones:04d}', 'F-01')
+        network.add_relation('C-CM', 'F-01')
+
+        return network.compile()
+
+    def _sync_successor_lags(self):
+        """preds 기준으로 succs 재구성 (lag 조정 후)"""
+        self.succs = [[] for _ in self.activities]
+        for j, preds in enumerate(self.preds):
+            for i, relation, lag in preds:
+                self.succs[i].append((j, relation, lag))
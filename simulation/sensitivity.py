@@ -0,0 +1,128 @@
+"""
+전역 민감도 분석 (Saltelli 표본 + Sobol 지수)
+
+파라미터 공간(simulation/parameter_space.py)에서 A, B 표본과 A의 i번째 열만 B로 바꾼 AB_i 표본을 만들고
+N × (D + 2)개 파라미터 벡터를 배치 시뮬레이터로 병렬 평가한 뒤
+1차 지수(Saltelli 2010)와 총 지수(Jansen)를 계산한다. 신뢰구간은 표본 행 부트스트랩.
+"""
+
+import numpy as np
+from simulation.parameter_space import ParameterEvaluator
+from utils.text_width import pad
+
+
+def saltelli_sample(n_base, dimension, seed=None):
+    """
+    Saltelli 표본 (단위 초입방체)
+
+    Returns:
+        (A, B, AB) - A, B: (N, D), AB: (D, N, D) (AB[i]는 A의 i열을 B의 i열로 교체)
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.random((n_base, dimension))
+    b = rng.random((n_base, dimension))
+    ab = np.repeat(a[None], dimension, axis=0)
+    index = np.arange(dimension)
+    ab[index, :, index] = b.T
+    return a, b, ab
+
+
+def _indices(f_a, f_b, f_ab):
+    """f_a, f_b: (..., N), f_ab: (D, ..., N) → (S1, ST) 각 (D, ...)"""
+    variance = np.concatenate([f_a, f_b], axis=-1).var(axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        first = np.mean(f_b * (f_ab - f_a), axis=-1) / variance
+        total = 0.5 * np.mean((f_a - f_ab) ** 2, axis=-1) / variance
+    return np.nan_to_num(first), np.nan_to_num(total)
+
+
+def sobol_indices(f_a, f_b, f_ab, n_boot=200, confidence=0.95, seed=None):
+    """
+    Sobol 1차/총 지수와 부트스트랩 신뢰구간
+
+    Args:
+        f_a, f_b: (N,) A, B 표본의 모형 출력
+        f_ab: (D, N) AB_i 표본의 모형 출력
+        n_boot: 부트스트랩 반복 수 (0이면 신뢰구간 생략)
+
+    Returns:
+        {'S1', 'ST', 'S1_ci', 'ST_ci'} (ci: (D, 2) 하한/상한)
+    """
+    f_a, f_b, f_ab = np.asarray(f_a, float), np.asarray(f_b, float), np.asarray(f_ab, float)
+    first, total = _indices(f_a, f_b, f_ab)
+    result = {'S1': first, 'ST': total}
+
+    if n_boot:
+        rng = np.random.default_rng(seed)
+        rows = rng.integers(0, len(f_a), size=(n_boot, len(f_a)))
+        boot_first, boot_total = _indices(f_a[rows], f_b[rows], f_ab[:, rows])
+        tail = (1 - confidence) / 2 * 100
+        result['S1_ci'] = np.percentile(boot_first, (tail, 100 - tail), axis=1).T
+        result['ST_ci'] = np.percentile(boot_total, (tail, 100 - tail), axis=1).T
+    return result
+
+
+class SobolAnalysis:
+    """모형 파라미터 전역 민감도 분석"""
+
+    def __init__(self, evaluator=None, **evaluator_kwargs):
+        """
+        Args:
+            evaluator: ParameterEvaluator (기본: 기본 파라미터 공간, evaluator_kwargs 전달)
+        """
+        self.evaluator = evaluator or ParameterEvaluator(**evaluator_kwargs)
+
+    def run(self, n_base=256, n_boot=200, confidence=0.95, max_workers=None, seed=None):
+        """
+        Sobol 지수 계산
+
+        Args:
+            n_base: 기본 표본 수 N (평가 수 = N × (D + 2))
+            n_boot: 부트스트랩 반복 수
+            confidence: 신뢰수준
+            max_workers: 평가 프로세스 수 (기본: CPU 수)
+            seed: 표본/부트스트랩 시드
+
+        Returns:
+            {'parameters', 'n_base', 'evaluations',
+             'outputs': {지표: {'mean', 'variance', 'S1', 'ST', 'S1_ci', 'ST_ci'}}}
+        """
+        evaluator = self.evaluator
+        dimension = evaluator.dimension
+        a, b, ab = saltelli_sample(n_base, dimension, seed)
+
+        unit = np.concatenate([a, b, ab.reshape(-1, dimension)])
+        outputs = evaluator.evaluate(evaluator.scale(unit), max_workers=max_workers)
+
+        f_a, f_b = outputs[:n_base], outputs[n_base:2 * n_base]
+        f_ab = outputs[2 * n_base:].reshape(dimension, n_base, -1)
+
+        result = {
+            'parameters': list(evaluator.names),
+            'n_base': n_base,
+            'confidence': confidence,
+            'evaluations': len(unit),
+            'outputs': {}
+        }
+        for k, name in enumerate(evaluator.outputs):
+            indices = sobol_indices(f_a[:, k], f_b[:, k], f_ab[:, :, k], n_boot, confidence, seed)
+            indices['mean'] = float(np.concatenate([f_a[:, k], f_b[:, k]]).mean())
+            indices['variance'] = float(np.concatenate([f_a[:, k], f_b[:, k]]).var())
+            result['outputs'][name] = indices
+        return result
+
+    @staticmethod
+    def print_summary(result, top=10):
+        """지표별 총 지수 상위 파라미터 출력"""
+        confidence_label = f"{result['confidence'] * 100:.0f}%"
+        for output, indices in result['outputs'].items():
+            print(f"\n{'='*70}")
+            print(f"Sobol 민감도: {output} (N={result['n_base']}, 평가 {result['evaluations']:,}회)")
+            print(f"{'='*70}")
+            print(f"{pad('파라미터', 36)}{'S1':>8}{f'{confidence_label} CI':>18}{'ST':>8}")
+            for index in np.argsort(indices['ST'])[::-1][:top]:
+                ci = indices.get('S1_ci')
+                interval = f"[{ci[index, 0]:.3f}, {ci[index, 1]:.3f}]" if ci is not None else ''
+                print(f"{pad(result['parameters'][index], 36)}{indices['S1'][index]:>8.3f}"
+                      f"{interval:>18}{indices['ST'][index]:>8.3f}")
+            print(f"{'='*70}\n")
@@ -0,0 +1,499 @@
+"""
+로컬 시뮬레이션 서비스 (asyncio HTTP 서버 + 워커 프로세스 풀 + sqlite 작업 저장소)
+
+대시보드가 요청마다 인터프리터를 새로 띄우지 않고 시뮬레이션을 조회할 수 있도록
+작업(JSON)을 받아 미리 모듈을 올려 둔 워커 프로세스에서 실행한다.
+같은 파라미터의 작업은 파라미터 해시(작업 ID)로 중복 제거하고, 결과는 저장소에서 바로 반환한다.
+
+    python -m simulation.service --port 8765
+
+    POST /jobs              {"template": "cheongdam", "bim_quality": "good", "seeds": [1, 2], "runs": 10000}
+    GET  /jobs              최근 작업 목록
+    GET  /jobs/<id>         작업 상태/결과
+    GET  /jobs/<id>/events  진행률 스트림 (text/event-stream, 완료 시 결과 포함 후 종료)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import asyncio
+import hashlib
+import argparse
+import threading
+from functools import lru_cache
+from http import HTTPStatus
+from pathlib import Path
+import numpy as np
+from config.bim_quality_config import BIMQualityConfig
+from config.project_templates import ProjectTemplates
+from models.project import Project
+from simulation.batch_simulator import BatchSimulator
+from simulation.simulation_engine import SimulationEngine
+from simulation.scenario_fork import template_agents
+from utils.process_pool import pool_context, process_pool
+
+
+MODES = ('batch', 'engine')
+JOB_KEYS = {'mode', 'template', 'bim_quality', 'seeds', 'seed', 'runs'}
+MAX_RUNS = 1_000_000
+MAX_SEEDS = 100
+
+# 결과 요약 지표 (평균/표준편차/분위수)
+SUMMARY_METRICS = (
+    'delay_days', 'delay_weeks', 'cost_increase', 'budget_overrun_rate',
+    'financial_cost', 'detection_rate', 'issues_count'
+)
+
+DEFAULT_STORE = 'output/service/jobs.sqlite3'
+
+# 워커 프로세스 진행률 큐 (initializer로 전달)
+_PROGRESS_QUEUE = None
+
+
+def normalize_job(payload):
+    """
+    작업 파라미터 검증 및 정규화 (같은 의미의 요청은 같은 딕셔너리)
+
+    Args:
+        payload: 요청 JSON 딕셔너리
+            - mode: batch (NumPy Monte Carlo, 기본) / engine (일별 엔진, 시드별 1회, 템플릿 에이전트)
+            - template: 프로젝트 템플릿 (기본 cheongdam, 정의된 템플릿만 허용)
+            - bim_quality: off (BIM 미적용, 기본) / excellent / good / average / poor
+            - seeds: 시드 리스트 (또는 seed 하나, 기본 [0])
+            - runs: 시드별 실행 수 (batch 모드, 기본 1000)
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("작업은 JSON 객체여야 합니다")
+    unknown = set(payload) - JOB_KEYS
+    if unknown:
+        raise ValueError(f"알 수 없는 작업 항목입니다: {sorted(unknown)}")
+
+    mode = payload.get('mode') or 'batch'
+    if mode not in MODES:
+        raise ValueError(f"mode는 {MODES} 중 하나여야 합니다")
+    template = payload.get('template') or 'cheongdam'
+    ProjectTemplates.get_template(template)
+    quality = payload.get('bim_quality') or 'off'
+    if quality not in BIMQualityConfig.PRESETS:
+        raise ValueError(f"bim_quality는 {tuple(BIMQualityConfig.PRESETS)} 중 하나여야 합니다")
+
+    seeds = payload.get('seeds', [payload.get('seed', 0)])
+    if not isinstance(seeds, list) or not 1 <= len(seeds) <= MAX_SEEDS or \
+            not all(isinstance(seed, int) and not isinstance(seed, bool) and seed >= 0 for seed in seeds):
+        raise ValueError(f"seeds는 0 이상 정수 1~{MAX_SEEDS}개여야 합니다")
+
+    runs = payload.get('runs', 1000)
+    if not isinstance(runs, int) or isinstance(runs, bool) or not 1 <= runs <= MAX_RUNS:
+        raise ValueError(f"runs는 1~{MAX_RUNS} 정수여야 합니다")
+
+    return {
+        'mode': mode,
+        'template': template,
+        'bim_quality': quality,
+        'seeds': seeds,
+        'runs': runs if mode == 'batch' else 1
+    }
+
+
+def job_id(params):
+    """정규화한 파라미터 해시 (작업 ID, 중복 제거 키)"""
+    canonical = json.dumps(params, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+def _project(template, bim_quality):
+    bim_enabled = bim_quality != 'off'
+    return Project(
+        bim_enabled=bim_enabled,
+        bim_quality=BIMQualityConfig.get_preset(bim_quality) if bim_enabled else None,
+        template=template
+    )
+
+
+@lru_cache(maxsize=32)
+def _simulator(template, bim_quality):
+    """템플릿/품질별 배치 시뮬레이터 (워커 안에서 재사용)"""
+    return BatchSimulator(_project(template, bim_quality))
+
+
+def _summarize(columns):
+    """지표별 평균/표준편차/분위수"""
+    summary = {}
+    for metric in SUMMARY_METRICS:
+        values = np.asarray(columns[metric], dtype=float)
+        p5, p50, p95 = np.percentile(values, (5, 50, 95))
+        summary[metric] = {
+            'mean': float(values.mean()), 'std': float(values.std()),
+            'p5': float(p5), 'p50': float(p50), 'p95': float(p95)
+        }
+    return summary
+
+
+def run_job(params, progress=None):
+    """
+    작업 실행 (워커 프로세스 또는 현재 프로세스)
+
+    Args:
+        params: normalize_job 결과
+        progress: 진행률(0~1) 콜백
+
+    Returns:
+        {'metrics': 지표별 요약, 'seeds': 시드별 지표 (batch: 평균), 'runs', 'elapsed_seconds'}
+    """
+    start = time.perf_counter()
+    seeds, runs = params['seeds'], params['runs']
+    columns = {metric: [] for metric in SUMMARY_METRICS}
+    per_seed = {}
+
+    for index, seed in enumerate(seeds):
+        if params['mode'] == 'batch':
+            # 시드당 최대 20번 진행률 보고
+            chunk_size = min(max(1, -(-runs // 20)), 100_000)
+            result = _simulator(params['template'], params['bim_quality']).run(
+                runs, seed=seed, chunk_size=chunk_size,
+                progress=progress and (lambda done, total: progress((index + done / total) / len(seeds)))
+            )
+            per_seed[str(seed)] = {metric: float(result[metric].mean()) for metric in SUMMARY_METRICS}
+        else:
+            engine = SimulationEngine(_project(params['template'], params['bim_quality']), template_agents(),
+                                      save_logs=False, random_seed=seed, render_meetings=False)
+            result = engine.run(verbose=False)
+            per_seed[str(seed)] = {key: value for key, value in result.items() if isinstance(value, (int, float))}
+            if progress:
+                progress((index + 1) / len(seeds))
+
+        for metric in SUMMARY_METRICS:
+            columns[metric].append(np.ravel(result[metric]))
+
+    return {
+        'metrics': _summarize({metric: np.concatenate(values) for metric, values in columns.items()}),
+        'seeds': per_seed,
+        'runs': runs * len(seeds),
+        'elapsed_seconds': round(time.perf_counter() - start, 3)
+    }
+
+
+def _init_worker(progress_queue):
+    global _PROGRESS_QUEUE
+    _PROGRESS_QUEUE = progress_queue
+
+
+def _run_worker(key, params):
+    return run_job(params, lambda fraction: _PROGRESS_QUEUE.put((key, fraction)))
+
+
+class JobStore:
+    """작업 저장소 (sqlite, 서비스 재시작 후에도 결과 유지)"""
+
+    COLUMNS = ('id', 'params', 'status', 'progress', 'result', 'error', 'created', 'updated')
+
+    def __init__(self, path=DEFAULT_STORE):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, params TEXT NOT NULL, status TEXT NOT NULL, progress REAL NOT NULL, "
+            "result TEXT, error TEXT, created REAL NOT NULL, updated REAL NOT NULL)"
+        )
+        self.conn.commit()
+
+    def _row(self, row):
+        job = dict(zip(self.COLUMNS, row))
+        job['params'] = json.loads(job['params'])
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        return job
+
+    def get(self, key):
+        row = self.conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM jobs WHERE id = ?", (key,)).fetchone()
+        return self._row(row) if row else None
+
+    def recent(self, limit=50):
+        rows = self.conn.execute(
+            f"SELECT {', '.join(self.COLUMNS)} FROM jobs ORDER BY updated DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [self._row(row) for row in rows]
+
+    def unfinished(self):
+        """대기/실행 중 작업 (재시작 시 다시 대기열에 넣음)"""
+        rows = self.conn.execute(
+            f"SELECT {', '.join(self.COLUMNS)} FROM jobs WHERE status IN ('queued', 'running') ORDER BY created"
+        ).fetchall()
+        return [self._row(row) for row in rows]
+
+    def submit(self, key, params):
+        """
+        작업 등록 (같은 ID가 있으면 기존 작업, 실패한 작업은 다시 대기)
+
+        Returns:
+            (작업, 새로 대기열에 넣어야 하는지 여부)
+        """
+        job = self.get(key)
+        if job and job['status'] != 'failed':
+            return job, False
+
+        now = time.time()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO jobs VALUES (?, ?, 'queued', 0, NULL, NULL, ?, ?)",
+            (key, json.dumps(params, sort_keys=True), now, now)
+        )
+        self.conn.commit()
+        return self.get(key), True
+
+    def update(self, key, **fields):
+        if 'result' in fields:
+            fields['result'] = json.dumps(fields['result'])
+        fields['updated'] = time.time()
+        self.conn.execute(
+            f"UPDATE jobs SET {', '.join(f'{name} = ?' for name in fields)} WHERE id = ?",
+            (*fields.values(), key)
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+class SimulationService:
+    """로컬 시뮬레이션 HTTP 서비스"""
+
+    MAX_BODY_BYTES = 1 << 20
+
+    def __init__(self, store_path=DEFAULT_STORE, host='127.0.0.1', port=8765, max_workers=None):
+        """
+        Args:
+            store_path: 작업 저장소(sqlite) 경로
+            host / port: 수신 주소 (port 0이면 빈 포트, 시작 후 self.port)
+            max_workers: 워커 프로세스 수 (기본: CPU 수)
+        """
+        self.store_path = store_path
+        self.host = host
+        self.port = port
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.store = None
+        self.server = None
+        self._pool = None
+        self._progress_queue = None
+        self._progress_thread = None
+        self._subscribers = {}
+        self._tasks = set()
+
+    async def start(self):
+        """저장소/워커 풀/서버 시작, 끝나지 않은 작업 다시 대기열에 넣기"""
+        self._loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self.store = JobStore(self.store_path)
+
+        # fork 가능 환경에서는 부모에 올린 모듈/데이터를 워커가 그대로 공유
+        context = pool_context()
+        self._progress_queue = context.Queue()
+        self._pool = process_pool(self.max_workers, initializer=_init_worker, initargs=(self._progress_queue,),
+                                  context=context)
+        self._progress_thread = threading.Thread(target=self._read_progress, daemon=True)
+        self._progress_thread.start()
+
+        for job in self.store.unfinished():
+            self.store.update(job['id'], status='queued', progress=0.0)
+            self._enqueue(job['id'], job['params'])
+
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+        for task in list(self._tasks):
+            task.cancel()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._progress_queue.put(None)
+        self._progress_thread.join()
+        self.store.close()
+
+    def submit(self, payload):
+        """
+        작업 등록
+
+        Returns:
+            (작업, 중복 여부) - 같은 파라미터의 작업이 있으면 새로 실행하지 않음
+        """
+        params = normalize_job(payload)
+        key = job_id(params)
+        job, created = self.store.submit(key, params)
+        if created:
+            self._enqueue(key, params)
+        return job, not created
+
+    def _enqueue(self, key, params):
+        task = self._loop.create_task(self._execute(key, params))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, key, params):
+        # 빈 워커가 생길 때까지는 queued 상태 유지
+        async with self._slots:
+            self.store.update(key, status='running')
+            self._publish(key)
+            try:
+                result = await self._loop.run_in_executor(self._pool, _run_worker, key, params)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.store.update(key, status='failed', error=f"{type(e).__name__}: {e}")
+            else:
+                self.store.update(key, status='done', progress=1.0, result=result)
+            self._publish(key)
+
+    def _read_progress(self):
+        """워커 진행률 큐 → 이벤트 루프 (별도 스레드)"""
+        while True:
+            item = self._progress_queue.get()
+            if item is None:
+                return
+            self._loop.call_soon_threadsafe(self._on_progress, *item)
+
+    def _on_progress(self, key, fraction):
+        job = self.store.get(key)
+        # 완료 후 늦게 도착한 진행률은 무시
+        if job and job['status'] == 'running':
+            self.store.update(key, progress=round(fraction, 4))
+            self._publish(key)
+
+    def _publish(self, key):
+        for queue in self._subscribers.get(key, ()):
+            queue.put_nowait(True)
+
+    async def _handle(self, reader, writer):
+        try:
+            try:
+                method, path, body = await self._read_request(reader)
+            except ValueError as e:
+                await self._send_json(writer, HTTPStatus.BAD_REQUEST, {'error': str(e)})
+                return
+            await self._route(writer, method, path, body)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader):
+        request_line = (await reader.readline()).decode('latin-1').split()
+        if len(request_line) != 3:
+            raise ValueError("잘못된 요청입니다")
+        method, target, _ = request_line
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1')
+            if line in ('\r\n', '\n', ''):
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get('content-length') or 0)
+        if length > self.MAX_BODY_BYTES:
+            raise ValueError("요청 본문이 너무 큽니다")
+        body = await reader.readexactly(length) if length else b''
+        return method, target.split('?', 1)[0].rstrip('/') or '/', body
+
+    async def _route(self, writer, method, path, body):
+        parts = path.strip('/').split('/')
+
+        if path == '/health':
+            await self._send_json(writer, HTTPStatus.OK, {'status': 'ok', 'workers': self.max_workers})
+        elif parts[0] != 'jobs' or len(parts) > 3 or (len(parts) == 3 and parts[2] != 'events'):
+            await self._send_json(writer, HTTPStatus.NOT_FOUND, {'error': f"알 수 없는 경로입니다: {path}"})
+        elif len(parts) == 1:
+            if method == 'POST':
+                try:
+                    job, duplicate = self.submit(json.loads(body or b'{}'))
+                except ValueError as e:
+                    await self._send_json(writer, HTTPStatus.BAD_REQUEST, {'error': str(e)})
+                    return
+                status = HTTPStatus.OK if job['status'] == 'done' else HTTPStatus.ACCEPTED
+                await self._send_json(writer, status, dict(job, deduplicated=duplicate))
+            elif method == 'GET':
+                jobs = [{key: job[key] for key in ('id', 'params', 'status', 'progress', 'updated')}
+                        for job in self.store.recent()]
+                await self._send_json(writer, HTTPStatus.OK, {'jobs': jobs})
+            else:
+                await self._send_json(writer, HTTPStatus.METHOD_NOT_ALLOWED, {'error': method})
+        elif method != 'GET':
+            await self._send_json(writer, HTTPStatus.METHOD_NOT_ALLOWED, {'error': method})
+        elif self.store.get(parts[1]) is None:
+            await self._send_json(writer, HTTPStatus.NOT_FOUND, {'error': f"작업이 없습니다: {parts[1]}"})
+        elif len(parts) == 2:
+            await self._send_json(writer, HTTPStatus.OK, self.store.get(parts[1]))
+        else:
+            await self._stream(writer, parts[1])
+
+    async def _stream(self, writer, key):
+        """진행률 스트림 (progress 이벤트 반복, 마지막에 done/failed 이벤트에 작업 전체)"""
+        queue = asyncio.Queue()
+        self._subscribers.setdefault(key, set()).add(queue)
+        try:
+            writer.write(self._head(HTTPStatus.OK, 'text/event-stream', extra='Cache-Control: no-cache\r\n'))
+            last = None
+            while True:
+                job = self.store.get(key)
+                if job['status'] in ('done', 'failed'):
+                    writer.write(self._event(job['status'], job))
+                    await writer.drain()
+                    return
+                state = (job['status'], job['progress'])
+                if state != last:
+                    writer.write(self._event('progress', {'id': key, 'status': job['status'],
+                                                          'progress': job['progress']}))
+                    await writer.drain()
+                    last = state
+                await queue.get()
+        finally:
+            self._subscribers[key].discard(queue)
+            if not self._subscribers[key]:
+                del self._subscribers[key]
+
+    @staticmethod
+    def _head(status, content_type, length=None, extra=''):
+        head = f"HTTP/1.1 {status.value} {status.phrase}\r\nContent-Type: {content_type}\r\n"
+        if length is not None:
+            head += f"Content-Length: {length}\r\n"
+        return (head + extra + "Connection: close\r\n\r\n").encode('latin-1')
+
+    @staticmethod
+    def _event(name, payload):
+        return f"event: {name}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n".encode('utf-8')
+
+    async def _send_json(self, writer, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        writer.write(self._head(status, 'application/json; charset=utf-8', len(body)) + body)
+        await writer.drain()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 시뮬레이션 서비스')
+    parser.add_argument('--host', default='127.0.0.1', help='수신 주소')
+    parser.add_argument('--port', type=int, default=8765, help='수신 포트')
+    parser.add_argument('--store', default=DEFAULT_STORE, help='작업 저장소(sqlite) 경로')
+    parser.add_argument('--workers', type=int, default=None, help='워커 프로세스 수 (기본: CPU 수)')
+    args = parser.parse_args()
+
+    async def serve():
+        service = await SimulationService(args.store, args.host, args.port, args.workers).start()
+        print(f"시뮬레이션 서비스: http://{service.host}:{service.port} (저장소 {args.store})")
+        try:
+            await service.serve_forever()
+        finally:
+            await service.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
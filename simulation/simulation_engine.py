@@ -2,86 +2,354 @@
 시뮬레이션 메인 엔진
 """
 
+import os
+import pickle
+import random
 from pathlib import Path
 from datetime import datetime
 from .issue_manager import IssueManager
 from .meeting_coordinator import MeetingCoordinator
 from .impact_calculator import ImpactCalculator
-from config.project_config import ProjectConfig
+from utils.profiler import profiler, profiled
+from utils.llm_usage import usage_tracker
 
 class SimulationEngine:
     """시뮬레이션 엔진"""
 
-    def __init__(self, project, agents, save_logs=True, random_seed=None):
+    CHECKPOINT_VERSION = 1
+
+    def __init__(self, project, agents, save_logs=True, random_seed=None, issue_correlation=None,
+                 checkpoint_file=None, checkpoint_days=None, profile_file=None, profile_format='json',
+                 llm_batch=None, render_meetings=True, schedule_network=None, result_cache=None):
         """
         Args:
             project: Project 인스턴스
             agents: 에이전트 딕셔너리
             save_logs: 시뮬레이션 로그 자동 저장 여부
             random_seed: 랜덤 시드 (비교 시 동일 이슈 발생)
+            issue_correlation: 이슈 간 발생 상관 구조 (IssueManager 참고, None이면 독립)
+            checkpoint_file: 체크포인트 저장 경로 (None이면 저장 안 함)
+            checkpoint_days: K일마다 체크포인트 저장 (None이면 이슈 처리 직후마다 저장)
+            profile_file: 실행 시간 프로파일 저장 경로 (None이면 계측 안 함)
+            profile_format: 'json' (구간/단계별 집계) 또는 'chrome' (Chrome trace)
+            llm_batch: LLMBatchCollector (지정 시 발언 요청만 수집, apply_llm_batch로 회의록 반영)
+            render_meetings: False면 회의 없이 수치만 계산하고 이벤트(events)만 기록
+                             (회의록은 필요할 때 NarrativeRenderer로 생성)
+            schedule_network: ActivityNetwork (지정 시 이슈 지연을 해당 공종 액티비티에 반영하고
+                              영향 결과에 'schedule' 항목으로 여유/준공일 변화 기록, 지표는 그대로)
+            result_cache: SimulationResultCache (지정 시 같은 입력의 실행은 저장된 지표/최종 상태로 대신,
+                          템플릿 에이전트로 처음부터 실행하는 경우만 적용)
         """
         self.project = project
         self.agents = agents
-        self.issue_manager = IssueManager(random_seed=random_seed)
+        self.issue_manager = IssueManager(random_seed=random_seed, correlation=issue_correlation)
 
         # BIM 상태를 MeetingCoordinator에 전달
         bim_status = "BIM_ON" if project.bim_enabled else "BIM_OFF"
         self.meeting_coordinator = MeetingCoordinator(agents, save_meetings=save_logs, bim_status=bim_status)
         self.impact_calculator = ImpactCalculator()
 
+        self.llm_batch = llm_batch
+        if llm_batch is not None:
+            self.meeting_coordinator.llm_batch = llm_batch
+            self.meeting_coordinator.batch_prefix = llm_batch.register_run(bim_status)
+
         self.simulation_log = []
         self.save_logs = save_logs
 
+        # 수치 전용 모드의 이벤트 스트림 (이슈별 발생 시점/영향/회의 재구성용 프로젝트 상태)
+        self.render_meetings = render_meetings
+        self.events = []
+
+        self.schedule_network = schedule_network
+        self.result_cache = result_cache
+
+        # 체크포인트 (당일 발생했지만 아직 처리하지 않은 이슈 포함)
+        self.checkpoint_file = checkpoint_file
+        self.checkpoint_days = checkpoint_days
+        self.pending_today = []
+        self.day_open = False
+
+        self.profile_file = profile_file
+        self.profile_format = profile_format
+        self.llm_usage = None
+
         # 로그 저장 폴더 생성
         if self.save_logs:
             self.logs_dir = Path("output/logs")
             self.logs_dir.mkdir(parents=True, exist_ok=True)
     
     def run(self, verbose=True):
-        """시뮬레이션 실행"""
+        """시뮬레이션 실행 (체크포인트에서 복원한 경우 이어서 실행)"""
         print(f"\n{'='*70}")
-        print(f"시뮬레이션 시작: {self.project.name}")
+        if self.project.current_day > 0:
+            print(f"시뮬레이션 재개: {self.project.name} (Day {self.project.current_day}부터)")
+        else:
+            print(f"시뮬레이션 시작: {self.project.name}")
         print(f"BIM 적용: {'ON' if self.project.bim_enabled else 'OFF'}")
         print(f"{'='*70}\n")
-        
-        for phase_name, duration in ProjectConfig.PHASE_DURATIONS.items():
+
+        if self.profile_file:
+            profiler.enable(trace=self.profile_format == 'chrome')
+        try:
+            usage_tracker.reset()
+
+            cache_key = self.result_cache.key(self) if self.result_cache is not None else None
+            if self.result_cache is not None and cache_key is None:
+                # 캐시를 지정했지만 쓸 수 없는 실행은 조용히 넘어가지 않고 이유를 알림
+                print(f"[결과 캐시] 사용 안 함: {self.result_cache.bypass_reason(self)}")
+            cached = self.result_cache.get(cache_key) if cache_key else None
+            if cached:
+                # 같은 입력의 실행 결과: 최종 상태(프로젝트, 로그, 회의록, 난수 상태)를 그대로 복원
+                self._restore_state(cached['state'])
+                metrics = cached['metrics']
+                if verbose:
+                    print(f"[결과 캐시] 저장된 결과 사용 ({cache_key[:12]})")
+            else:
+                self.run_until(None, verbose)
+
+                profiler.phase = '종료'
+                metrics = self.project.calculate_final_metrics()
+                if cache_key:
+                    self.result_cache.put(cache_key, metrics, self.get_state())
+
             if verbose:
-                print(f"\n[{phase_name} 단계 시작]")
-            
-            for day_in_phase in range(duration):
-                self.project.advance_day()
-                
-                triggered_issues = self.issue_manager.check_and_trigger_issues(self.project)
-                
-                for issue in triggered_issues:
-                    self._process_issue(issue, verbose)
-                
-                if self.project.current_day % 30 == 0 and verbose:
-                    self._periodic_review()
-            
+                print(f"\n{'='*70}")
+                print("시뮬레이션 완료")
+                print(f"{'='*70}")
+                print(self.project.get_summary())
+
+            # 로그 및 회의록 저장 (배치 모드는 결과 반영 후 저장)
+            if self.llm_batch is not None:
+                print(f"[LLM 배치] 발언 요청 {len(self.llm_batch.requests)}건 수집 (apply_llm_batch로 회의록 반영)")
+            elif self.save_logs:
+                self._save_simulation_log()
+                self.meeting_coordinator.save_all_meetings_to_file(self.project.name)
+
+            if self.profile_file:
+                self._save_profile(verbose)
+        finally:
+            # 실행 중 예외가 나도 계측을 끔 (전역 계측기가 켜진 채로 남지 않게)
+            if self.profile_file:
+                profiler.disable()
+
+        # LLM 사용량 (템플릿 모드에서는 기록 없음)
+        self.llm_usage = usage_tracker.get_summary()
+        if usage_tracker.has_activity:
             if verbose:
-                print(f"[{phase_name} 단계 완료]\n")
-        
-        metrics = self.project.calculate_final_metrics()
+                usage_tracker.print_summary()
+            if self.save_logs:
+                self._save_llm_usage()
 
-        if verbose:
-            print(f"\n{'='*70}")
-            print("시뮬레이션 완료")
-            print(f"{'='*70}")
-            print(self.project.get_summary())
+        return metrics
+    
+    def apply_llm_batch(self, results):
+        """
+        배치 결과를 회의 기록(시뮬레이션 로그 포함)에 반영하고 로그/회의록 저장
+
+        Args:
+            results: {키: 응답 문자열} (LLMBatchCollector.wait 결과, 여러 실행 결과가 섞여 있어도 됨)
+
+        Returns:
+            {'applied', 'fallbacks'}
+        """
+        stats = self.meeting_coordinator.apply_batch_results(results)
 
-        # 로그 및 회의록 저장
         if self.save_logs:
             self._save_simulation_log()
             self.meeting_coordinator.save_all_meetings_to_file(self.project.name)
 
-        return metrics
-    
+        return stats
+
+    def run_until(self, stop_day=None, verbose=True):
+        """
+        지정 일자까지 진행 (최종 집계/로그 저장 없음)
+
+        Args:
+            stop_day: 마지막으로 처리할 일자 (None이면 전체 기간)
+            verbose: 상세 출력 여부
+        """
+        # 이슈 처리 도중 저장된 경우 그날 남은 이슈부터 처리
+        if self.day_open:
+            self._finish_day(verbose)
+
+        for phase_name, phase_start, phase_end in self.project.calendar.iter_phases():
+            if self.project.current_day >= phase_end:
+                continue
+            if stop_day is not None and self.project.current_day >= stop_day:
+                break
+
+            if verbose and self.project.current_day < phase_start:
+                print(f"\n[{phase_name} 단계 시작]")
+
+            last_day = phase_end if stop_day is None else min(phase_end, stop_day)
+            while self.project.current_day < last_day:
+                self.project.advance_day()
+                profiler.phase = self.project.current_phase
+
+                self.pending_today = self.issue_manager.check_and_trigger_issues(self.project)
+                self.day_open = True
+                self._finish_day(verbose)
+
+            if verbose and self.project.current_day == phase_end:
+                print(f"[{phase_name} 단계 완료]\n")
+
+    def _finish_day(self, verbose):
+        """당일 이슈 처리 및 정기 검토"""
+        while self.pending_today:
+            issue = self.pending_today.pop(0)
+            self._process_issue(issue, verbose)
+
+            if self.checkpoint_file and not self.checkpoint_days:
+                self.save_checkpoint()
+
+        if self.project.current_day % 30 == 0 and verbose:
+            self._periodic_review()
+
+        self.day_open = False
+
+        if self.checkpoint_file and self.checkpoint_days \
+                and self.project.current_day % self.checkpoint_days == 0:
+            self.save_checkpoint()
+
+    def save_checkpoint(self, filepath=None):
+        """
+        엔진 상태 스냅샷 저장 (pickle)
+
+        프로젝트, 이슈 관리자(대기 이슈), 난수 상태, 회의 컨텍스트,
+        에이전트 대화 이력, 시뮬레이션 로그, 당일 미처리 이슈를 포함
+        """
+        filepath = Path(filepath or self.checkpoint_file)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        # 임시 파일에 쓴 뒤 교체 (저장 도중 중단되어도 이전 스냅샷 유지)
+        tmp_path = filepath.with_name(filepath.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(self.get_state(), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, filepath)
+
+        return filepath
+
+    def get_state(self):
+        """엔진 상태 스냅샷 (체크포인트/분기 공용, 에이전트 객체 제외)"""
+        negotiation = self.impact_calculator.negotiation_system
+        return {
+            'version': self.CHECKPOINT_VERSION,
+            'project': self.project,
+            'issue_manager': self.issue_manager,
+            'random_state': random.getstate(),
+            'meeting': {
+                'meeting_log': self.meeting_coordinator.meeting_log,
+                'conversation_context': self.meeting_coordinator.conversation_context,
+                'all_meetings_content': self.meeting_coordinator.all_meetings_content
+            },
+            'agent_history': {
+                key: agent.conversation_history for key, agent in self.agents.items()
+            },
+            'simulation_log': self.simulation_log,
+            'negotiation': {
+                'agent_preferences': negotiation.agent_preferences,
+                'agent_weights': negotiation.agent_weights
+            },
+            'pending_today': self.pending_today,
+            'day_open': self.day_open,
+            'render_meetings': self.render_meetings,
+            'events': self.events,
+            'schedule_network': self.schedule_network
+        }
+
+    @classmethod
+    def from_checkpoint(cls, filepath, agents, save_logs=True, checkpoint_days=None):
+        """
+        체크포인트에서 엔진 복원
+
+        Args:
+            filepath: 체크포인트 파일 경로 (이후 체크포인트도 같은 경로에 저장)
+            agents: 에이전트 딕셔너리 (대화 이력은 스냅샷으로 복원)
+            save_logs: 시뮬레이션 로그 자동 저장 여부
+            checkpoint_days: K일마다 체크포인트 저장 (None이면 이슈 처리 직후마다 저장)
+
+        Returns:
+            run()으로 이어서 실행할 SimulationEngine
+        """
+        with open(filepath, 'rb') as f:
+            state = pickle.load(f)
+
+        return cls.from_state(state, agents, save_logs=save_logs,
+                              checkpoint_file=filepath, checkpoint_days=checkpoint_days)
+
+    @classmethod
+    def from_state(cls, state, agents, save_logs=True, checkpoint_file=None, checkpoint_days=None):
+        """get_state() 스냅샷에서 엔진 복원 (전역 난수 상태도 복원)"""
+        if state.get('version') != cls.CHECKPOINT_VERSION:
+            raise ValueError(f"지원하지 않는 체크포인트 버전입니다: {state.get('version')}")
+
+        engine = cls(state['project'], agents, save_logs=save_logs,
+                     checkpoint_file=checkpoint_file, checkpoint_days=checkpoint_days)
+        engine._restore_state(state)
+
+        return engine
+
+    def _restore_state(self, state):
+        """스냅샷 상태를 현재 엔진에 적용 (프로젝트는 같은 객체를 갱신)"""
+        if state['project'] is not self.project:
+            self.project.__dict__.update(state['project'].__dict__)
+        self.issue_manager = state['issue_manager']
+
+        meeting = state['meeting']
+        self.meeting_coordinator.meeting_log = meeting['meeting_log']
+        self.meeting_coordinator.conversation_context = meeting['conversation_context']
+        self.meeting_coordinator.all_meetings_content = meeting['all_meetings_content']
+
+        for key, history in state['agent_history'].items():
+            if key in self.agents:
+                self.agents[key].conversation_history = history
+
+        if 'negotiation' in state:
+            negotiation = self.impact_calculator.negotiation_system
+            negotiation.agent_preferences = state['negotiation']['agent_preferences']
+            negotiation.agent_weights = state['negotiation']['agent_weights']
+
+        self.simulation_log = state['simulation_log']
+        self.pending_today = state['pending_today']
+        self.day_open = state['day_open']
+        self.render_meetings = state.get('render_meetings', True)
+        self.events = state.get('events', [])
+        self.schedule_network = state.get('schedule_network')
+
+        random.setstate(state['random_state'])
+
+    def _save_profile(self, verbose):
+        """실행 시간 프로파일 저장 (계측 종료는 run의 finally)"""
+        if self.profile_format == 'chrome':
+            filepath = profiler.export_chrome_trace(self.profile_file)
+        else:
+            filepath = profiler.export_json(self.profile_file)
+
+        if verbose:
+            profiler.print_summary()
+        print(f"[프로파일 저장] {filepath}")
+        return filepath
+
+    @profiled('writer.llm_usage')
+    def _save_llm_usage(self):
+        """LLM 사용량 JSON 저장"""
+        bim_status = "BIM_ON" if self.project.bim_enabled else "BIM_OFF"
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = usage_tracker.export_json(self.logs_dir / f"llm_usage_{bim_status}_{timestamp}.json")
+        print(f"[LLM 사용량 저장] {filepath}")
+        return filepath
+
+    @profiled('engine.process_issue')
     def _process_issue(self, issue, verbose):
         """이슈 처리 프로세스"""
         if verbose:
             print(f"\n>>> 이슈 발생: {issue['name']} (Day {self.project.current_day})")
-        
+
+        if not self.render_meetings:
+            self._process_issue_numeric(issue, verbose)
+            return
+
         initial_meeting = self.meeting_coordinator.conduct_meeting(
             issue, self.project, None
         )
@@ -100,6 +368,8 @@ class SimulationEngine:
             self._print_impact_summary(impact_result)
         
         self.project.apply_impact(impact_result)
+        self._apply_schedule(issue, impact_result)
+        profiler.count('issues')
         
         self.simulation_log.append({
             'day': self.project.current_day,
@@ -109,6 +379,56 @@ class SimulationEngine:
             'decision_meeting': decision_meeting
         })
     
+    def _process_issue_numeric(self, issue, verbose):
+        """
+        수치 전용 이슈 처리 (회의 생략)
+
+        에이전트 발언은 수치에 영향이 없으므로 영향 계산만 하고, 회의 재구성에 필요한
+        프로젝트 상태(초기 논의 시점/의사결정 회의 시점)를 이벤트로 남긴다.
+        """
+        project_before = self.project.snapshot()
+        impact_result = self.impact_calculator.calculate_impact(issue, self.project)
+        project_after = self.project.snapshot()
+
+        if verbose:
+            self._print_impact_summary(impact_result)
+
+        self.project.apply_impact(impact_result)
+        self._apply_schedule(issue, impact_result)
+        profiler.count('issues')
+
+        self.events.append({
+            'index': len(self.events),
+            'day': self.project.current_day,
+            'phase': self.project.current_phase,
+            'issue': issue,
+            'impact': impact_result,
+            'project_before': project_before,
+            'project_after': project_after
+        })
+        self.simulation_log.append({
+            'day': self.project.current_day,
+            'issue': issue,
+            'impact': impact_result,
+            'initial_meeting': None,
+            'decision_meeting': None
+        })
+
+    def _apply_schedule(self, issue, impact_result):
+        """공정 네트워크에 이슈 지연 반영 (발생일 기준 해당 공종 액티비티)"""
+        if self.schedule_network is None:
+            return
+        impact_result['schedule'] = self.schedule_network.apply_issue(
+            issue.get('work_type'), self.project.current_day, impact_result['delay_weeks'] * 7
+        )
+
+    def narrative_renderer(self, agent_factory=None, max_workers=4):
+        """수치 전용 실행(render_meetings=False)의 이벤트로 회의록 생성기 생성"""
+        from .narrative import NarrativeRenderer
+
+        return NarrativeRenderer(self.events, agent_factory=agent_factory, max_workers=max_workers,
+                                 bim_status=self.meeting_coordinator.bim_status)
+
     def _print_impact_summary(self, impact_result):
         """영향 요약 출력"""
         print(f"\n--- 영향 요약 ---")
@@ -132,6 +452,7 @@ class SimulationEngine:
         
         print(f"--- 영향 요약 끝 ---\n")
     
+    @profiled('engine.periodic_review')
     def _periodic_review(self):
         """정기 검토"""
         print(f"\n{'*'*60}")
@@ -152,6 +473,7 @@ class SimulationEngine:
         """시뮬레이션 로그 반환"""
         return self.simulation_log
 
+    @profiled('writer.simulation_log')
     def _save_simulation_log(self):
         """시뮬레이션 로그를 파일로 저장"""
         bim_status = "BIM_ON" if self.project.bim_enabled else "BIM_OFF"
@@ -212,6 +534,12 @@ class SimulationEngine:
 
             content.append("")
 
+            # 회의 내용 (수치 전용 실행은 회의록 없음)
+            if log_entry['initial_meeting'] is None:
+                content.append("-"*80)
+                content.append("")
+                continue
+
             # 초기 회의 내용
             initial_meeting = log_entry['initial_meeting']
             content.append("### 초기 회의 (문제 인식)")
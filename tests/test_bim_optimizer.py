@@ -0,0 +1,86 @@
+"""
+BIM 투자 최적화 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from config.bim_quality_config import BIMQualityConfig
+from models.project import Project
+from simulation.batch_simulator import BatchSimulator
+from simulation.bim_optimizer import BIMCostModel, InvestmentEvaluator, BIMInvestmentOptimizer
+
+
+def test_cost_model():
+    """비용 모형: 품질이 높을수록 비용 증가, 품질 지표 ↔ 정규화 수준 왕복"""
+    print("\n=== BIM 비용 모형 테스트 ===")
+
+    model = BIMCostModel()
+    costs = [model.cost(BIMQualityConfig.get_preset(level), 883.5)
+             for level in ('poor', 'average', 'good', 'excellent')]
+    assert costs == sorted(costs) and 45e6 < costs[2] < 55e6, costs
+    quality = BIMQualityConfig.BIM_AVERAGE
+    assert BIMCostModel.quality(BIMCostModel.levels(quality)) == quality
+    print("✓ BIM 비용 모형 테스트 통과\n")
+
+
+def test_investment_evaluator():
+    """평가: 같은 시드 기준 실행과 짝지은 순절감액, 격자점 재사용, 병렬 = 순차"""
+    print("\n=== 투자 평가 테스트 ===")
+
+    evaluator = InvestmentEvaluator(n_runs=300, seed=5)
+    levels = BIMCostModel.levels(BIMQualityConfig.BIM_GOOD)
+    summary = evaluator.evaluate(levels)[0]
+
+    off = BatchSimulator(Project()).run(300, seed=5)['cost_increase']
+    on = BatchSimulator(Project(bim_enabled=True, bim_quality=BIMQualityConfig.BIM_GOOD)).run(300, seed=5)['cost_increase']
+    investment = evaluator.cost_model.cost(BIMQualityConfig.BIM_GOOD, 883.5)
+    assert np.isclose(summary['net_mean'], np.mean(off - on) - investment)
+
+    evaluator.evaluate(levels + 0.001)
+    assert evaluator.stats == {'evaluated': 1, 'memo_hits': 1, 'cache_hits': 0}
+
+    points = np.random.default_rng(0).random((4, 4)) * 0.99
+    parallel = InvestmentEvaluator(n_runs=300, seed=5).evaluate(points, max_workers=2)
+    sequential = InvestmentEvaluator(n_runs=300, seed=5).evaluate(points, max_workers=1)
+    assert parallel == sequential
+    print("✓ 투자 평가 테스트 통과\n")
+
+
+def test_optimizer():
+    """최적화: 최적 설정 점수 ≥ 프리셋 최고 점수, 잘못된 목적 함수 오류"""
+    print("\n=== BIM 투자 최적화 테스트 ===")
+
+    optimizer = BIMInvestmentOptimizer(objective='cvar', n_runs=300)
+    result = optimizer.run(generations=5, max_workers=1)
+    assert optimizer.score(result['best']) >= max(optimizer.score(s) for s in result['presets'].values())
+    assert len(result['visited']) == result['stats']['evaluated']
+    BIMInvestmentOptimizer.print_summary(result)
+
+    try:
+        BIMInvestmentOptimizer(objective='median', evaluator=optimizer.evaluator)
+        assert False, "잘못된 목적 함수가 허용됨"
+    except ValueError:
+        pass
+    print("✓ BIM 투자 최적화 테스트 통과\n")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "="*50)
+    print("BIM 투자 최적화 테스트 시작")
+    print("="*50)
+
+    test_cost_model()
+    test_investment_evaluator()
+    test_optimizer()
+
+    print("="*50)
+    print("모든 테스트 통과!")
+    print("="*50 + "\n")
+
+
+if __name__ == '__main__':
+    run_all_tests()
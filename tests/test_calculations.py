@@ -6,7 +6,10 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import random
 from utils.calculations import sigmoid, normalize_value, calculate_weighted_average
+from simulation.delay_calculator import DelayCalculator, BatchDelayCalculator
+from config.work_dependencies import WORK_DEPENDENCIES
 
 def test_sigmoid():
     """Sigmoid 함수 테스트"""
@@ -55,6 +58,32 @@ def test_weighted_average():
     assert abs(result - expected) < 0.001, "가중 평균 계산 오류"
     print("✓ 가중 평균 테스트 통과\n")
 
+def test_batch_delay_calculator():
+    """배치 CPM 지연 = 실행별 DelayCalculator 결과"""
+    print("\n=== 배치 CPM 지연 계산 테스트 ===")
+
+    rng = random.Random(7)
+    work_types = list(WORK_DEPENDENCIES)
+    runs = [
+        [{'work_type': rng.choice(work_types), 'delay_weeks': rng.uniform(0, 6)} for _ in range(rng.randint(0, 12))]
+        for _ in range(500)
+    ]
+    runs.append([{'work_type': '토목', 'delay_weeks': 2.0}])   # 선행 공종에 지연 없음
+
+    batch = BatchDelayCalculator()
+    delays, counts = batch.build_matrix(runs)
+    totals = batch.calculate_total_delay(delays, counts)
+
+    for issues, total in zip(runs, totals):
+        calculator = DelayCalculator()
+        for issue in issues:
+            calculator.add_issue(issue)
+        assert abs(calculator.calculate_total_delay() - total) < 1e-9, "배치 계산 불일치"
+
+    assert totals[-1] == 2.0, "선행 공종 지연 없을 때 계산 오류"
+    print(f"✓ {len(runs)}개 실행 일치")
+
+
 def run_all_tests():
     """모든 테스트 실행"""
     print("\n" + "="*50)
@@ -64,6 +93,7 @@ def run_all_tests():
     test_sigmoid()
     test_normalize_value()
     test_weighted_average()
+    test_batch_delay_calculator()
     
     print("="*50)
     print("모든 테스트 통과!")
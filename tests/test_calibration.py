@@ -0,0 +1,72 @@
+"""
+벤치마크 보정 테스트
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from simulation.calibration import CMAES, Calibration
+from simulation.result_cache import SimulationResultCache
+
+
+def test_cmaes():
+    """CMA-ES: 이동/회전된 2차 함수 최소점 수렴"""
+    print("\n=== CMA-ES 테스트 ===")
+
+    optimum = np.array([0.2, 0.7, 0.4, 0.9])
+    hessian = np.diag([1.0, 10.0, 100.0, 1000.0])
+    strategy = CMAES(np.full(4, 0.5), sigma=0.3, seed=1)
+    for _ in range(150):
+        candidates = strategy.ask()
+        offset = candidates - optimum
+        strategy.tell(candidates, np.einsum('ij,jk,ik->i', offset, hessian, offset))
+    assert np.allclose(strategy.mean, optimum, atol=1e-3), strategy.mean
+    print("✓ CMA-ES 테스트 통과\n")
+
+
+def test_calibration():
+    """보정: 손실 감소, 결과 형태, 평가점 재사용 (같은 실행 기록/프로세스 간 저장소)"""
+    print("\n=== 벤치마크 보정 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SimulationResultCache(os.path.join(tmp, 'cache.sqlite3'))
+        calibration = Calibration(n_runs=200, cache=cache)
+        evaluator = calibration.evaluator
+        assert np.allclose(evaluator.scale(evaluator.unit(evaluator.base)), evaluator.base)
+
+        initial = calibration.loss(evaluator.evaluate(evaluator.base))[0]
+        result = calibration.run(generations=8, max_workers=2, seed=0)
+        assert result['loss'] < initial
+        assert [entry['metric'] for entry in result['targets']] == \
+            ['budget_overrun', 'budget_overrun', 'schedule_delay', 'schedule_delay']
+        assert np.all((result['values'] >= evaluator.low - 1e-12) & (result['values'] <= evaluator.high + 1e-12))
+
+        evaluated = evaluator.stats['evaluated']
+        again = calibration.run(generations=8, max_workers=2, seed=0)
+        assert evaluator.stats['evaluated'] == evaluated and again['loss'] == result['loss']
+
+        restored = Calibration(n_runs=200, cache=cache).run(generations=8, max_workers=1, seed=0)
+        assert restored['stats']['evaluated'] == 0 and restored['loss'] == result['loss']
+        Calibration.print_summary(result)
+    print("✓ 벤치마크 보정 테스트 통과\n")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "="*50)
+    print("벤치마크 보정 테스트 시작")
+    print("="*50)
+
+    test_cmaes()
+    test_calibration()
+
+    print("="*50)
+    print("모든 테스트 통과!")
+    print("="*50 + "\n")
+
+
+if __name__ == '__main__':
+    run_all_tests()
@@ -0,0 +1,102 @@
+"""
+체크포인트/재개 테스트
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.project import Project
+from config.bim_quality_config import BIMQualityConfig
+from agents.owner_agent import OwnerAgent
+from agents.designer_agent import DesignerAgent
+from agents.contractor_agent import ContractorAgent
+from agents.supervisor_agent import SupervisorAgent
+from agents.bank_agent import BankAgent
+from simulation.simulation_engine import SimulationEngine
+
+
+def _template_agents():
+    return {
+        'owner': OwnerAgent(use_llm=False),
+        'designer': DesignerAgent(use_llm=False),
+        'contractor': ContractorAgent(use_llm=False),
+        'supervisor': SupervisorAgent(use_llm=False),
+        'bank': BankAgent(use_llm=False)
+    }
+
+
+class _Crash(Exception):
+    pass
+
+
+def _run_with_crash(checkpoint_file, crash_after, checkpoint_days=None):
+    """crash_after번째 이슈 처리 중 중단되는 실행"""
+    project = Project(bim_enabled=True, bim_quality=BIMQualityConfig.BIM_GOOD)
+    engine = SimulationEngine(project, _template_agents(), save_logs=False, random_seed=42,
+                              checkpoint_file=checkpoint_file, checkpoint_days=checkpoint_days)
+
+    original = engine._process_issue
+    count = [0]
+
+    def process_issue(issue, verbose):
+        count[0] += 1
+        if count[0] == crash_after:
+            raise _Crash()
+        original(issue, verbose)
+
+    engine._process_issue = process_issue
+    try:
+        engine.run(verbose=False)
+    except _Crash:
+        return True
+    return False
+
+
+def test_resume_bit_identical():
+    """중단 후 재개 결과 = 한 번에 실행한 결과"""
+    print("\n=== 체크포인트 재개 테스트 ===")
+
+    project = Project(bim_enabled=True, bim_quality=BIMQualityConfig.BIM_GOOD)
+    engine = SimulationEngine(project, _template_agents(), save_logs=False, random_seed=42)
+    expected = engine.run(verbose=False)
+    expected_log = [(entry['day'], entry['issue']['id']) for entry in engine.simulation_log]
+    print(f"발생 이슈: {len(expected_log)}건")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for checkpoint_days in [None, 7]:
+            checkpoint_file = os.path.join(tmp, f'run_{checkpoint_days}.pkl')
+            crashed = _run_with_crash(checkpoint_file, crash_after=len(expected_log) // 2 + 1,
+                                      checkpoint_days=checkpoint_days)
+            assert crashed, "중단 시나리오 실패"
+
+            engine = SimulationEngine.from_checkpoint(checkpoint_file, _template_agents(),
+                                                      save_logs=False, checkpoint_days=checkpoint_days)
+            print(f"재개 시점 (K={checkpoint_days}): Day {engine.project.current_day}, "
+                  f"처리 완료 {len(engine.simulation_log)}건")
+            resumed = engine.run(verbose=False)
+            resumed_log = [(entry['day'], entry['issue']['id']) for entry in engine.simulation_log]
+
+            assert resumed_log == expected_log, "이슈 발생 이력 불일치"
+            for key, value in expected.items():
+                assert resumed[key] == value, f"{key} 불일치"
+
+    print("✓ 체크포인트 재개 테스트 통과\n")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "="*50)
+    print("체크포인트 테스트 시작")
+    print("="*50)
+
+    test_resume_bit_identical()
+
+    print("="*50)
+    print("모든 테스트 통과!")
+    print("="*50 + "\n")
+
+
+if __name__ == '__main__':
+    run_all_tests()
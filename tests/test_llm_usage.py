@@ -0,0 +1,472 @@
+"""
+LLM 사용량 집계 테스트 (가짜 API 응답 사용, 네트워크 호출 없음)
+"""
+
+import sys
+import os
+import re
+import time
+import types
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+import openai
+import utils.llm_client as llm_client_module
+from utils.llm_client import LLMClient
+from utils.llm_usage import usage_tracker
+from models.project import Project
+from agents.owner_agent import OwnerAgent
+from agents.designer_agent import DesignerAgent
+from agents.contractor_agent import ContractorAgent
+from agents.supervisor_agent import SupervisorAgent
+from agents.bank_agent import BankAgent
+from simulation.simulation_engine import SimulationEngine
+from simulation.meeting_coordinator import MeetingCoordinator
+from utils.token_budget import estimate_tokens
+from utils.llm_pool import TokenBucket
+from utils.llm_batch import LLMBatchCollector, LocalBatchBackend
+from simulation.scenario_fork import template_agents
+from utils.response_reuse import ResponseReuseCache, response_cache
+
+
+class _FakeCompletions:
+    """첫 호출은 타임아웃, 금융사는 형식 불일치 응답"""
+
+    def __init__(self):
+        self.calls = 0
+        self.requests = []
+
+    def create(self, model, messages, temperature, max_tokens):
+        self.calls += 1
+        self.requests.append(messages)
+        if self.calls == 1:
+            raise openai.APITimeoutError(request=httpx.Request('POST', 'https://example.invalid'))
+
+        persona = messages[1]['content']
+        prefix = re.search(r'"(\[[^\]]+\])"로 시작하세요', persona).group(1)
+        text = "형식 없는 응답" if prefix == '[금융사]' else f"{prefix} 확인했습니다."
+        return types.SimpleNamespace(
+            choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=text))],
+            usage=types.SimpleNamespace(prompt_tokens=100, completion_tokens=20)
+        )
+
+
+def test_usage_accounting():
+    """에이전트/회의 유형별 토큰, 재시도, 템플릿 대체 집계"""
+    print("\n=== LLM 사용량 집계 테스트 ===")
+
+    fake = _FakeCompletions()
+    original_key = os.environ.get('OPENAI_API_KEY')
+    original_time = llm_client_module.time
+    original_openai = llm_client_module.OpenAI
+    os.environ['OPENAI_API_KEY'] = 'test-key'
+    LLMClient._instance = None
+    llm_client_module.time = types.SimpleNamespace(perf_counter=time.perf_counter, sleep=lambda s: None)
+    llm_client_module.OpenAI = lambda **kwargs: types.SimpleNamespace(
+        chat=types.SimpleNamespace(completions=fake)
+    )
+
+    try:
+        agents = {
+            'owner': OwnerAgent(),
+            'designer': DesignerAgent(),
+            'contractor': ContractorAgent(),
+            'supervisor': SupervisorAgent(),
+            'bank': BankAgent()
+        }
+
+        engine = SimulationEngine(Project(), agents, save_logs=False, random_seed=11)
+        metrics = engine.run(verbose=False)
+        summary = engine.llm_usage
+        usage_tracker.print_summary()
+    finally:
+        llm_client_module.time = original_time
+        llm_client_module.OpenAI = original_openai
+        LLMClient._instance = None
+        if original_key is None:
+            os.environ.pop('OPENAI_API_KEY', None)
+        else:
+            os.environ['OPENAI_API_KEY'] = original_key
+
+    issues = metrics['issues_count']
+    total = summary['total']
+    assert total['calls'] == 10 * issues, "호출 수 불일치"
+    assert total['retries'] == 1, "재시도 집계 오류"
+    assert total['prompt_tokens'] == 100 * total['calls'], "토큰 집계 오류"
+    assert summary['by_agent']['금융사']['fallbacks'] == 2 * issues, "템플릿 대체 집계 오류"
+    assert summary['by_agent']['건축주']['fallbacks'] == 0, "정상 응답이 대체로 집계됨"
+    assert set(summary['by_meeting_type']) == {'초기 논의', '의사결정 회의'}, "회의 유형 집계 오류"
+    assert sum(total['latency_ms']['histogram']) == total['calls'], "히스토그램 오류"
+
+    # 공통 접두부: 같은 이슈의 호출 10건은 첫 시스템 메시지가 동일, 역할/변동분은 뒤에 위치
+    first_issue = fake.requests[1:11]
+    assert len({messages[0]['content'] for messages in first_issue}) == 1, "공통 접두부 불일치"
+    assert [m['role'] for m in first_issue[0]] == ['system', 'system', 'user'], "메시지 구성 오류"
+    assert '## 발생 이슈' in first_issue[0][0]['content'], "이슈 정보가 접두부에 없음"
+    assert '## 영향 분석 결과' in first_issue[-1][2]['content'], "영향 분석이 변동분에 없음"
+
+    print("✓ LLM 사용량 집계 테스트 통과\n")
+
+
+def test_context_token_budget():
+    """이전 발언 컨텍스트 토큰 예산"""
+    print("=== 컨텍스트 토큰 예산 테스트 ===")
+
+    coordinator = MeetingCoordinator({}, save_meetings=False)
+    coordinator.conversation_context = [
+        {'speaker': '시공사', 'message': f"[시공사] {'현장 상황 보고 ' * 10}{k}"} for k in range(5)
+    ]
+
+    unlimited = coordinator.format_context_for_prompt(max_tokens=100_000)
+    limited = coordinator.format_context_for_prompt(max_tokens=200)
+    print(f"토큰: 전체 {estimate_tokens(unlimited)} → 예산 적용 {estimate_tokens(limited)}")
+
+    assert estimate_tokens(limited) <= 200, "토큰 예산 초과"
+    assert limited.rstrip().endswith('4'), "최근 발언이 우선 포함되지 않음"
+    assert estimate_tokens(unlimited) > estimate_tokens(limited), "잘림 없음"
+
+    # 구간 안에는 빈 줄이 없음 (빈 줄 = 구간 끝)
+    coordinator.conversation_context.append({'speaker': '설계사', 'message': "[설계사] 첫 문단\n\n둘째 문단"})
+    assert "\n\n" not in coordinator.format_context_for_prompt().strip(), "이전 대화 구간에 빈 줄"
+
+    # 앞선 발언은 SHARE_CONTEXT를 켰을 때만 프롬프트에 전달
+    agent = types.SimpleNamespace(use_llm=True, meeting_context="", respond=lambda *args: "[설계사] 응답")
+    coordinator.agents = {'designer': agent}
+    coordinator._speak(0, 'designer', '설계사', None, None, None)
+    assert agent.meeting_context == "", "기본 설정에서 이전 발언이 프롬프트에 포함됨"
+    coordinator.SHARE_CONTEXT = True
+    coordinator._speak(0, 'designer', '설계사', None, None, None)
+    assert '## 이전 대화 내용' in agent.meeting_context, "SHARE_CONTEXT 설정 시 이전 발언 누락"
+
+    print("✓ 컨텍스트 토큰 예산 테스트 통과\n")
+
+
+class _FakeAsyncCompletions:
+    """동시 실행 수 추적, 첫 호출은 429, '지연' 요청은 기한 초과"""
+
+    def __init__(self):
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    async def create(self, model, messages, temperature, max_tokens):
+        with self.lock:
+            self.calls += 1
+            first = self.calls == 1
+        if first:
+            request = httpx.Request('POST', 'https://example.invalid')
+            raise openai.RateLimitError(
+                "rate limited", body=None,
+                response=httpx.Response(429, headers={'retry-after': '0'}, request=request)
+            )
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(1.0 if messages[-1]['content'] == '지연' else 0.02)
+        finally:
+            self.in_flight -= 1
+
+        return types.SimpleNamespace(
+            choices=[types.SimpleNamespace(message=types.SimpleNamespace(content="[시공사] 확인"))],
+            usage=types.SimpleNamespace(prompt_tokens=50, completion_tokens=10, total_tokens=60)
+        )
+
+
+def test_pooled_client():
+    """풀 모드: 동시 실행 제한, 429 재시도, 호출 기한"""
+    print("=== LLM 풀 모드 테스트 ===")
+
+    fake = _FakeAsyncCompletions()
+    saved_env = {key: os.environ.get(key) for key in ('OPENAI_API_KEY', 'LLM_CLIENT_MODE', 'LLM_MAX_CONCURRENCY')}
+    original_async = llm_client_module.AsyncOpenAI
+    os.environ.update({'OPENAI_API_KEY': 'test-key', 'LLM_CLIENT_MODE': 'pooled', 'LLM_MAX_CONCURRENCY': '3'})
+    LLMClient._instance = None
+    llm_client_module.AsyncOpenAI = lambda **kwargs: types.SimpleNamespace(
+        chat=types.SimpleNamespace(completions=fake)
+    )
+    usage_tracker.reset()
+
+    try:
+        client = LLMClient()
+        client.pool.BACKOFF_BASE = 0.001
+        with ThreadPoolExecutor(max_workers=12) as executor:
+            responses = list(executor.map(
+                lambda k: client.generate_response("시스템", f"요청 {k}", agent='시공사'), range(12)
+            ))
+
+        client.pool.deadline = 0.2
+        timed_out = client.generate_response("시스템", "지연", agent='시공사')
+        client.pool.close()
+    finally:
+        llm_client_module.AsyncOpenAI = original_async
+        LLMClient._instance = None
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+    total = usage_tracker.get_summary()['total']
+    usage_tracker.reset()
+    print(f"최대 동시 요청: {fake.max_in_flight}, 재시도: {total['retries']}, 실패: {total['failures']}")
+
+    assert all(response == "[시공사] 확인" for response in responses), "응답 오류"
+    assert fake.max_in_flight == 3, "동시 실행 제한 오류"
+    assert total['retries'] == 1, "429 재시도 집계 오류"
+    assert timed_out.startswith("[LLM 응답 생성 실패"), "호출 기한 미적용"
+    assert total['calls'] == 13 and total['failures'] == 1, "호출 집계 오류"
+
+    print("✓ LLM 풀 모드 테스트 통과\n")
+
+
+def test_token_bucket():
+    """분당 한도 토큰 버킷 대기 (확보 비용은 benchmarks의 llm_pool.token_bucket)"""
+    print("=== 토큰 버킷 테스트 ===")
+
+    async def acquire_all():
+        bucket = TokenBucket(600, capacity=2)   # 초당 10회, 버스트 2회
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(acquire_all())
+    print(f"4회 확보 소요: {elapsed:.3f}초")
+
+    # 버스트 2회 후 2회는 보충(0.1초 간격)을 기다려야 함 (상한은 실행 환경 속도에 좌우되므로 검사하지 않음)
+    assert elapsed >= 0.15, "속도 제한 오류"
+
+    print("✓ 토큰 버킷 테스트 통과\n")
+
+
+def test_batch_mode():
+    """배치 모드: 실행 중 API 호출 없이 요청 수집, 결과를 키로 회의록에 반영"""
+    print("=== LLM 배치 모드 테스트 ===")
+
+    fake = _FakeCompletions()
+    original_key = os.environ.get('OPENAI_API_KEY')
+    original_openai = llm_client_module.OpenAI
+    os.environ['OPENAI_API_KEY'] = 'test-key'
+    LLMClient._instance = None
+    llm_client_module.OpenAI = lambda **kwargs: types.SimpleNamespace(
+        chat=types.SimpleNamespace(completions=fake)
+    )
+
+    def complete(request):
+        persona = request['messages'][1]['content']
+        tag = re.search(r'"(\[[^\]]+\])"로 시작하세요', persona).group(1)
+        return "형식 없는 응답" if tag == '[금융사]' else f"{tag} 배치 응답 {request['key']}"
+
+    try:
+        agents = {
+            'owner': OwnerAgent(),
+            'designer': DesignerAgent(),
+            'contractor': ContractorAgent(),
+            'supervisor': SupervisorAgent(),
+            'bank': BankAgent()
+        }
+        collector = LLMBatchCollector(LocalBatchBackend(complete))
+        engine = SimulationEngine(Project(), agents, save_logs=False, random_seed=11, llm_batch=collector)
+        metrics = engine.run(verbose=False)
+        api_calls = fake.calls
+
+        results = collector.wait(poll_interval=0)
+        stats = engine.apply_llm_batch(results)
+    finally:
+        llm_client_module.OpenAI = original_openai
+        LLMClient._instance = None
+        if original_key is None:
+            os.environ.pop('OPENAI_API_KEY', None)
+        else:
+            os.environ['OPENAI_API_KEY'] = original_key
+
+    baseline = SimulationEngine(Project(), template_agents(), save_logs=False, random_seed=11).run(verbose=False)
+    issues = metrics['issues_count']
+    decision = engine.simulation_log[0]['decision_meeting']
+    print(f"요청 {len(collector.requests)}건, 반영 {stats['applied']}건, 템플릿 유지 {stats['fallbacks']}건")
+
+    assert api_calls == 0, "실행 중 API 호출 발생"
+    assert metrics == baseline, "배치 모드가 수치 결과에 영향"
+    assert len({request['key'] for request in collector.requests}) == 10 * issues, "요청 키 중복/누락"
+    assert stats == {'applied': 8 * issues, 'fallbacks': 2 * issues}, "결과 반영 집계 오류"
+    assert decision['conversations'][0].startswith("[설계사] 배치 응답 run1-BIM_OFF/m1/designer"), "키 반영 오류"
+    assert decision['conversations'][3].startswith("[금융사]") and "배치 응답" not in decision['conversations'][3], \
+        "형식 불일치 응답이 반영됨"
+
+    print("✓ LLM 배치 모드 테스트 통과\n")
+
+
+def test_response_reuse():
+    """변동 수치 정규화 후 응답 재사용, 탐지 여부가 다르면 재사용 안 함"""
+    print("=== 응답 재사용 테스트 ===")
+
+    def messages(day, delay, detected, instruction="영향 분석이 완료되었습니다. 시공사로서 실행 계획을 제시하세요."):
+        return [
+            {'role': 'system', 'content': f"## 발생 이슈\n- ID: I-05\n- 현재 일자: Day {day}"},
+            {'role': 'system', 'content': '당신은 이 프로젝트의 시공사입니다.'},
+            {'role': 'user', 'content': f"## 영향 분석 결과\n- 지연: {delay:.1f}주\n- 비용 증가: 1.2%\n"
+                                        f"- 탐지 여부: {'예' if detected else '아니오'}\n\n"
+                                        f"## 이전 대화 내용\n[설계사] 발언 {day}\n\n{instruction}"}
+        ]
+
+    cache = ResponseReuseCache()
+    cache.enable()
+    cache.store('시공사', 'I-05', False, messages(137, 3.24, False), "[시공사] 저장된 응답")
+
+    assert cache.lookup('시공사', 'I-05', False, messages(140, 3.1, False)) == "[시공사] 저장된 응답", \
+        "정규화 후 재사용 실패"
+    assert cache.lookup('시공사', 'I-05', False, messages(140, 3.1, True)) is None, "탐지 여부가 다른데 재사용"
+    assert cache.lookup('시공사', 'I-05', True, messages(140, 3.1, False)) is None, "BIM 여부가 다른데 재사용"
+    # 이전 대화 뒤의 지시문은 키에 남음
+    assert cache.lookup('시공사', 'I-05', False, messages(140, 3.1, False, "상황을 보고하세요.")) is None, \
+        "지시문이 다른데 재사용"
+
+    # 실행 여러 건: 같은 이슈/에이전트의 호출은 대부분 재사용
+    fake = _FakeCompletions()
+    fake.calls = 1   # 첫 호출 타임아웃 생략
+    original_key = os.environ.get('OPENAI_API_KEY')
+    original_openai = llm_client_module.OpenAI
+    os.environ['OPENAI_API_KEY'] = 'test-key'
+    LLMClient._instance = None
+    llm_client_module.OpenAI = lambda **kwargs: types.SimpleNamespace(
+        chat=types.SimpleNamespace(completions=fake)
+    )
+    response_cache.clear()
+    response_cache.enable()
+
+    try:
+        turns = 0
+        for seed in range(10):
+            agents = {
+                'owner': OwnerAgent(),
+                'designer': DesignerAgent(),
+                'contractor': ContractorAgent(),
+                'supervisor': SupervisorAgent(),
+                'bank': BankAgent()
+            }
+            metrics = SimulationEngine(Project(), agents, save_logs=False, random_seed=seed).run(verbose=False)
+            turns += 10 * metrics['issues_count']
+        stats = response_cache.get_stats()
+    finally:
+        response_cache.disable()
+        response_cache.clear()
+        llm_client_module.OpenAI = original_openai
+        LLMClient._instance = None
+        if original_key is None:
+            os.environ.pop('OPENAI_API_KEY', None)
+        else:
+            os.environ['OPENAI_API_KEY'] = original_key
+
+    api_calls = len(fake.requests)
+    print(f"발언 {turns}건 중 API 호출 {api_calls}건 (재사용률 {stats['reuse_rate']*100:.0f}%)")
+
+    assert stats['lookups'] == turns, "조회 집계 오류"
+    assert api_calls == stats['misses'], "재사용된 발언에서 API 호출 발생"
+    assert stats['reuse_rate'] > 0.4, "재사용 효과 없음"   # 금융사는 형식 불일치로 저장되지 않아 매번 호출
+
+    print("✓ 응답 재사용 테스트 통과\n")
+
+
+class _FakeStream:
+    """4글자씩 나누어 보내는 스트림 (소비한 조각 수 기록)"""
+
+    def __init__(self, text):
+        self.pieces = [text[i:i + 4] for i in range(0, len(text), 4)]
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        for piece in self.pieces:
+            if self.closed:
+                return
+            self.consumed += 1
+            yield types.SimpleNamespace(
+                choices=[types.SimpleNamespace(delta=types.SimpleNamespace(content=piece))], usage=None
+            )
+
+    def close(self):
+        self.closed = True
+
+
+def test_streaming_cutoff():
+    """스트리밍: 태그 불일치 즉시 중단, 문장 수 도달 시 중단"""
+    print("=== 스트리밍 조기 종료 테스트 ===")
+
+    streams = []
+    replies = {
+        '[시공사]': "[시공사] 첫째 문장입니다. 지연은 3.5주입니다. 셋째 문장입니다. 넷째 문장입니다. 다섯째 문장입니다.",
+        '[금융사]': "죄송하지만 역할 태그 없이 길게 답변을 이어가는 응답입니다. 계속 이어집니다."
+    }
+
+    def create(model, messages, temperature, max_tokens, stream=False, stream_options=None):
+        assert stream and stream_options == {"include_usage": True}, "스트리밍 요청 아님"
+        streams.append(_FakeStream(replies[messages[-1]['content']]))
+        return streams[-1]
+
+    saved_env = {key: os.environ.get(key) for key in ('OPENAI_API_KEY', 'LLM_STREAM', 'LLM_MAX_SENTENCES')}
+    original_openai = llm_client_module.OpenAI
+    os.environ.update({'OPENAI_API_KEY': 'test-key', 'LLM_STREAM': '1', 'LLM_MAX_SENTENCES': '3'})
+    LLMClient._instance = None
+    llm_client_module.OpenAI = lambda **kwargs: types.SimpleNamespace(
+        chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create))
+    )
+    usage_tracker.reset()
+
+    try:
+        client = LLMClient()
+        contractor = client.generate_with_context(
+            "시스템", [{"role": "user", "content": '[시공사]'}], agent='시공사', expected_prefix='[시공사]'
+        )
+        bank = client.generate_with_context(
+            "시스템", [{"role": "user", "content": '[금융사]'}], agent='금융사', expected_prefix='[금융사]'
+        )
+    finally:
+        llm_client_module.OpenAI = original_openai
+        LLMClient._instance = None
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+    total = usage_tracker.get_summary()['total']
+    usage_tracker.reset()
+    print(f"시공사: {contractor}")
+    print(f"조각 소비: 시공사 {streams[0].consumed}/{len(streams[0].pieces)}, "
+          f"금융사 {streams[1].consumed}/{len(streams[1].pieces)}")
+
+    assert contractor == "[시공사] 첫째 문장입니다. 지연은 3.5주입니다. 셋째 문장입니다.", "문장 수 제한 오류"
+    assert streams[0].closed and streams[0].consumed < len(streams[0].pieces), "문장 수 도달 후 계속 수신"
+    assert not bank.startswith('[금융사]') and streams[1].consumed == 1, "태그 불일치 즉시 중단 안 됨"
+    assert total['early_stops'] == {'prefix': 1, 'sentences': 1}, "조기 종료 집계 오류"
+    assert total['completion_tokens'] > 0, "토큰 근사치 미기록"
+
+    print("✓ 스트리밍 조기 종료 테스트 통과\n")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "="*50)
+    print("LLM 사용량 테스트 시작")
+    print("="*50)
+
+    test_usage_accounting()
+    test_context_token_budget()
+    test_pooled_client()
+    test_token_bucket()
+    test_batch_mode()
+    test_response_reuse()
+    test_streaming_cutoff()
+
+    print("="*50)
+    print("모든 테스트 통과!")
+    print("="*50 + "\n")
+
+
+if __name__ == '__main__':
+    run_all_tests()
@@ -0,0 +1,65 @@
+"""
+수치/회의록 2단계 실행 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.project import Project
+from config.bim_quality_config import BIMQualityConfig
+from simulation.simulation_engine import SimulationEngine
+from simulation.scenario_fork import template_agents
+
+
+def test_numeric_then_render():
+    """수치 전용 실행 결과 = 전체 실행, 지연 생성한 회의 = 실행 중 회의"""
+    print("\n=== 수치/회의록 분리 테스트 ===")
+
+    def project():
+        return Project(bim_enabled=True, bim_quality=BIMQualityConfig.BIM_GOOD)
+
+    full = SimulationEngine(project(), template_agents(), save_logs=False, random_seed=5)
+    expected = full.run(verbose=False)
+
+    numeric = SimulationEngine(project(), template_agents(), save_logs=False, random_seed=5,
+                               render_meetings=False)
+    metrics = numeric.run(verbose=False)
+
+    assert metrics == expected, "수치 전용 실행 결과가 다름"
+    assert len(numeric.events) == metrics['issues_count'], "이벤트 누락"
+    assert numeric.meeting_coordinator.meeting_log == [], "수치 전용 실행에서 회의 진행됨"
+
+    renderer = numeric.narrative_renderer(max_workers=4)
+    target = numeric.events[-1]['issue']['id']
+    partial = renderer.simulation_log(issue_ids=[target])
+    print(f"이벤트 {len(numeric.events)}건 중 {len(renderer.rendered)}건 회의 생성 ({target})")
+    assert len(renderer.rendered) == len(partial), "요청하지 않은 이슈까지 생성"
+
+    rendered = renderer.simulation_log()
+    for lazy, eager in zip(rendered, full.simulation_log):
+        assert lazy['impact'] == eager['impact'], "영향 불일치"
+        assert lazy['initial_meeting']['conversations'] == eager['initial_meeting']['conversations'], \
+            "초기 논의 불일치"
+        assert lazy['decision_meeting']['conversations'] == eager['decision_meeting']['conversations'], \
+            "의사결정 회의 불일치"
+        assert lazy['decision_meeting']['phase'] == eager['decision_meeting']['phase'], "회의 단계 불일치"
+
+    print("✓ 수치/회의록 분리 테스트 통과\n")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "="*50)
+    print("수치/회의록 분리 테스트 시작")
+    print("="*50)
+
+    test_numeric_then_render()
+
+    print("="*50)
+    print("모든 테스트 통과!")
+    print("="*50 + "\n")
+
+
+if __name__ == '__main__':
+    run_all_tests()
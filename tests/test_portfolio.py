@@ -0,0 +1,180 @@
+"""
+배치/포트폴리오 시뮬레이션 테스트
+"""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from models.project import Project
+from config.bim_quality_config import BIMQualityConfig
+from agents.owner_agent import OwnerAgent
+from agents.designer_agent import DesignerAgent
+from agents.contractor_agent import ContractorAgent
+from agents.supervisor_agent import SupervisorAgent
+from agents.bank_agent import BankAgent
+from simulation.simulation_engine import SimulationEngine
+from simulation.impact_calculator import ImpactCalculator
+from simulation.batch_simulator import BatchSimulator, first_trigger_day, daily_hazard
+from simulation.portfolio import PortfolioEngine
+from simulation.issue_correlation import CorrelatedIssueSampler
+
+
+def _template_agents():
+    return {
+        'owner': OwnerAgent(use_llm=False),
+        'designer': DesignerAgent(use_llm=False),
+        'contractor': ContractorAgent(use_llm=False),
+        'supervisor': SupervisorAgent(use_llm=False),
+        'bank': BankAgent(use_llm=False)
+    }
+
+
+def test_batch_matches_engine():
+    """확정적 조건에서 배치 결과 = 엔진 결과"""
+    print("\n=== 배치 시뮬레이터 일치 테스트 ===")
+
+    with open('data/issue_cards.json', 'r', encoding='utf-8') as f:
+        issues = json.load(f)
+    for issue in issues:
+        issue['occurrence_rate'] = 1.0  # 단계 첫날 모두 발생
+
+    original = ImpactCalculator.TRADITIONAL_UNCERTAINTY
+    ImpactCalculator.TRADITIONAL_UNCERTAINTY = (1.0, 1.0)
+    try:
+        project = Project(bim_enabled=False)
+        engine = SimulationEngine(project, _template_agents(), save_logs=False, random_seed=1)
+        engine.issue_manager.pending_issues = list(issues)
+        expected = engine.run(verbose=False)
+
+        batch = BatchSimulator(Project(bim_enabled=False), issues=issues).run(3, seed=1)
+    finally:
+        ImpactCalculator.TRADITIONAL_UNCERTAINTY = original
+
+    for key in ['delay_weeks', 'cost_increase', 'financial_cost', 'issues_count', 'final_interest_rate']:
+        print(f"{key}: 엔진 {expected[key]:.4f} / 배치 {batch[key][0]:.4f}")
+        assert np.allclose(batch[key], expected[key]), f"{key} 불일치"
+
+    print("✓ 배치 시뮬레이터 일치 테스트 통과\n")
+
+
+def test_first_trigger_day_distribution():
+    """역변환 샘플링 발생일 분포 확인"""
+    print("=== 발생일 샘플링 테스트 ===")
+
+    rng = np.random.default_rng(0)
+    p = 0.02
+    day, triggered = first_trigger_day(
+        rng.standard_exponential(200_000), daily_hazard(p), 11, 110
+    )
+
+    expected = 1 - (1 - p) ** 100
+    print(f"발생 비율: {triggered.mean():.4f} (이론값 {expected:.4f})")
+    assert abs(triggered.mean() - expected) < 0.01, "발생 확률 불일치"
+    assert day[triggered].min() >= 11 and day[triggered].max() <= 110, "발생 구간 오류"
+
+    print("✓ 발생일 샘플링 테스트 통과\n")
+
+
+def test_portfolio_run():
+    """포트폴리오 실행 및 리스크 지표"""
+    print("=== 포트폴리오 테스트 ===")
+
+    projects = [
+        Project(bim_enabled=bool(i % 2), bim_quality=BIMQualityConfig.BIM_GOOD)
+        for i in range(6)
+    ]
+    engine = PortfolioEngine(projects, start_days=[0, 30, 60, 90, 120, 150])
+    result = engine.run(n_scenarios=400, seed=7)
+
+    PortfolioEngine.print_summary(result)
+
+    assert result['total_cost_increase'].shape == (400,), "시나리오 배열 크기 오류"
+    assert result['var'][0.99] >= result['var'][0.95], "VaR 순서 오류"
+    assert result['cvar'][0.95] >= result['var'][0.95], "CVaR < VaR"
+    assert np.all(np.diff(result['exposure_timeline']['mean']) >= 0), "누적 익스포저 감소"
+
+    # 동일 시드 → 동일 결과
+    again = engine.run(n_scenarios=400, seed=7)
+    assert np.array_equal(result['total_cost_increase'], again['total_cost_increase']), "재현성 오류"
+
+    print("✓ 포트폴리오 테스트 통과\n")
+
+
+def test_portfolio_from_csv():
+    """CSV 포트폴리오 로드"""
+    print("=== 포트폴리오 CSV 테스트 ===")
+
+    engine = PortfolioEngine.from_csv('data/portfolio_sample.csv')
+    print(f"현장 수: {len(engine.projects)}개")
+
+    assert len(engine.projects) > 0, "CSV 로드 실패"
+    assert any(p.bim_enabled for p in engine.projects), "BIM 설정 누락"
+
+    # 정의되지 않은 템플릿/알 수 없는 품질 프리셋은 기본값으로 바꾸지 않고 오류
+    with tempfile.TemporaryDirectory() as tmp:
+        bad_file = os.path.join(tmp, 'portfolio.csv')
+        for row in ("P1,officetel,0,1,good", "P1,cheongdam,0,1,excelent"):
+            with open(bad_file, 'w', encoding='utf-8') as f:
+                f.write(f"project_id,template,start_day,bim,quality\n{row}\n")
+            try:
+                PortfolioEngine.from_csv(bad_file)
+                assert False, f"잘못된 행 허용: {row}"
+            except ValueError as e:
+                print(f"  검증 오류: {e}")
+
+    print("✓ 포트폴리오 CSV 테스트 통과\n")
+
+
+def test_correlated_issue_sampler():
+    """상관 클러스터: 개별 발생률 유지 + 동시 발생 증가"""
+    print("=== 상관 이슈 발생 테스트 ===")
+
+    with open('data/issue_cards.json', 'r', encoding='utf-8') as f:
+        issues = json.load(f)
+    clusters = {'test': {'issues': ['I-01', 'I-02'], 'correlation': 0.8}}
+    sampler = CorrelatedIssueSampler(issues, clusters=clusters)
+
+    # 임계값 주변분포는 Exp(1): P(T <= t) = 1 - e^-t
+    thresholds = sampler.draw_threshold_matrix(np.random.default_rng(0), (100_000,))
+    t = daily_hazard(0.01) * 30
+    marginal = (thresholds <= t).mean(axis=0)
+    joint = (thresholds <= t).all(axis=1).mean()
+    expected = 1 - np.exp(-t)
+    print(f"개별 발생률: {marginal.round(4)} (이론값 {expected:.4f})")
+    print(f"동시 발생률: {joint:.4f} (독립 시 {expected**2:.4f})")
+
+    assert np.allclose(marginal, expected, atol=0.005), "개별 발생률 변경됨"
+    assert joint > 2 * expected ** 2, "동시 발생 경향 없음"
+
+    try:
+        CorrelatedIssueSampler(issues, clusters={'bad': {'issues': ['I-01'], 'correlation': 1.5}})
+        assert False, "잘못된 상관계수 허용"
+    except ValueError:
+        pass
+
+    print("✓ 상관 이슈 발생 테스트 통과\n")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "="*50)
+    print("배치/포트폴리오 테스트 시작")
+    print("="*50)
+
+    test_batch_matches_engine()
+    test_first_trigger_day_distribution()
+    test_portfolio_run()
+    test_portfolio_from_csv()
+    test_correlated_issue_sampler()
+
+    print("="*50)
+    print("모든 테스트 통과!")
+    print("="*50 + "\n")
+
+
+if __name__ == '__main__':
+    run_all_tests()
@@ -0,0 +1,78 @@
+"""
+실행 시간 계측 테스트
+"""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.project import Project
+from simulation.simulation_engine import SimulationEngine
+from simulation.scenario_fork import template_agents
+from utils.profiler import profiler
+
+
+def test_profile_by_phase():
+    """비활성 시 기록 없음, 활성 시 단계별 집계 및 내보내기"""
+    print("\n=== 실행 시간 계측 테스트 ===")
+
+    profiler.reset()
+    SimulationEngine(Project(), template_agents(), save_logs=False, random_seed=5).run(verbose=False)
+    assert not profiler.enabled and not profiler.stats, "비활성 상태에서 기록됨"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_file = os.path.join(tmp, 'profile.json')
+        engine = SimulationEngine(Project(), template_agents(), save_logs=False, random_seed=5,
+                                  profile_file=json_file)
+        metrics = engine.run(verbose=False)
+
+        with open(json_file, 'r', encoding='utf-8') as f:
+            profile = json.load(f)
+
+        sections = profile['sections']
+        print(f"구간 수: {len(sections)}개, 단계: {list(profile['phases'])}")
+        assert sections['engine.process_issue']['calls'] == metrics['issues_count'], "이슈 처리 횟수 불일치"
+        assert sections['impact.calculate']['calls'] == metrics['issues_count'], "영향 계산 횟수 불일치"
+        assert sections['agent.respond.owner']['calls'] == 2 * metrics['issues_count'], "응답 횟수 불일치"
+        assert profile['counters']['issues']['total'] == metrics['issues_count'], "카운터 불일치"
+        assert set(profile['phases']) <= {'설계', '입찰', '시공', '준공', '종료'}, "단계 집계 오류"
+        assert not profiler.enabled, "실행 후 계측이 꺼지지 않음"
+
+        trace_file = os.path.join(tmp, 'trace.json')
+        SimulationEngine(Project(), template_agents(), save_logs=False, random_seed=5,
+                         profile_file=trace_file, profile_format='chrome').run(verbose=False)
+        with open(trace_file, 'r', encoding='utf-8') as f:
+            trace = json.load(f)
+        assert trace['traceEvents'] and trace['traceEvents'][0]['ph'] == 'X', "Chrome trace 형식 오류"
+
+        # 실행 중 예외가 나도 계측은 꺼짐
+        failing = SimulationEngine(Project(), template_agents(), save_logs=False, random_seed=5,
+                                   profile_file=json_file)
+        failing.run_until = None
+        try:
+            failing.run(verbose=False)
+            assert False, "예외가 전파되지 않음"
+        except TypeError:
+            pass
+        assert not profiler.enabled, "예외 후 계측이 꺼지지 않음"
+
+    print("✓ 실행 시간 계측 테스트 통과\n")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "="*50)
+    print("계측 테스트 시작")
+    print("="*50)
+
+    test_profile_by_phase()
+
+    print("="*50)
+    print("모든 테스트 통과!")
+    print("="*50 + "\n")
+
+
+if __name__ == '__main__':
+    run_all_tests()
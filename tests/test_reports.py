@@ -0,0 +1,141 @@
+"""
+리포트/그래프 생성 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import numpy as np
+from pathlib import Path
+from models.project import Project
+from config.bim_quality_config import BIMQualityConfig
+from simulation.batch_simulator import BatchSimulator
+from reports.graph_visualizer import GraphVisualizer
+from reports.distribution_plots import DistributionPlotter, histogram_summary, fan_summary
+from reports.report_engine import report_engine, compile_format
+from utils.text_width import display_width
+
+METRICS_OFF = {
+    'delay_weeks': 12.0, 'budget_overrun_rate': 0.25, 'detection_rate': 0.3,
+    'cost_increase': 400_000_000, 'actual_duration': 444, 'issues_count': 10,
+    'detected_count': 3, 'missed_count': 7
+}
+METRICS_ON = dict(METRICS_OFF, delay_weeks=6.0, budget_overrun_rate=0.12, detection_rate=0.8,
+                  cost_increase=150_000_000, actual_duration=402, detected_count=8, missed_count=2)
+
+
+def test_graph_cache():
+    """같은 지표의 그래프는 캐시에서 복사, 미리보기/벡터 출력 생성"""
+    print("\n=== 그래프 캐시 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        visualizer = GraphVisualizer(output_dir=tmp, dpi=60, vector_formats=('svg',), preview_dpi=30,
+                                     max_workers=1)
+        paths = visualizer.generate_all_graphs(METRICS_OFF, METRICS_ON)
+        assert visualizer.stats == {'rendered': 4, 'cached': 0}
+        for path in paths:
+            assert path.exists() and path.with_suffix('.svg').exists()
+            assert path.with_name(f"{path.stem}_preview.png").exists()
+
+        study = GraphVisualizer(output_dir=tmp, dpi=60, max_workers=2)
+        results = study.generate_study_graphs({
+            'same': (METRICS_OFF, METRICS_ON),
+            'unused_field': (dict(METRICS_OFF, final_interest_rate=0.07), METRICS_ON),
+            'changed': (dict(METRICS_OFF, delay_weeks=20.0), METRICS_ON),
+            'changed_copy': (dict(METRICS_OFF, delay_weeks=20.0), METRICS_ON)
+        })
+        # 지연이 바뀌면 지연을 그리는 그래프(비교 막대, 타임라인)만, 같은 키는 한 번만 렌더링
+        assert study.stats['rendered'] == 2
+        assert all(path.exists() for paths in results.values() for path in paths)
+        assert (Path(tmp) / 'same' / 'comparison_bars.png').read_bytes() == paths[0].read_bytes()
+        print("✓ 그래프 캐시 테스트 통과\n")
+
+
+def test_distribution_plots():
+    """배치 결과 분포 요약 및 그래프 (히스토그램/CDF/토네이도/팬 차트)"""
+    print("\n=== 분포 그래프 테스트 ===")
+
+    result_off = BatchSimulator(Project()).run(20_000, seed=3, detail=True)
+    result_on = BatchSimulator(Project(bim_enabled=True, bim_quality=BIMQualityConfig.BIM_GOOD)).run(20_000, seed=3)
+
+    summary = histogram_summary(result_off['delay_days'])
+    width = summary['edges'][1] - summary['edges'][0]
+    assert abs(summary['density'].sum() * width - 1.0) < 1e-9
+    assert abs(summary['kde'].sum() * width - 1.0) < 0.01
+
+    # 구간화 분위수 = 실제 분위수 (값 구간 폭 이내)
+    fan = fan_summary(result_off['issue_day'], result_off['issue_delay_weeks'])
+    k = len(fan['days']) // 2
+    day, delay = result_off['issue_day'], result_off['issue_delay_weeks']
+    cumulative = (delay * (day <= fan['days'][k])).sum(axis=1)
+    bin_width = delay.sum(axis=1).max() / 400
+    for percentile in fan['percentiles']:
+        assert abs(fan['bands'][percentile][k] - np.percentile(cumulative, percentile)) <= bin_width
+
+    groups = {'BIM OFF': result_off, 'BIM ON': result_on}
+    with tempfile.TemporaryDirectory() as tmp:
+        plotter = DistributionPlotter(output_dir=tmp, dpi=40)
+        paths = [
+            plotter.plot_histograms(groups),
+            plotter.plot_cdf(groups),
+            plotter.plot_tornado(60.0, {'발생 확률 ×0.5/×1.5': (40.0, 85.0), 'BIM 품질': (55.0, 70.0)}),
+            plotter.plot_fan({'BIM OFF': fan})
+        ]
+        assert all(path.exists() for path in paths)
+    print("✓ 분포 그래프 테스트 통과\n")
+
+
+def test_report_engine():
+    """표시 폭 정렬, 출력 형식, 일괄 CSV"""
+    print("\n=== 보고서 엔진 테스트 ===")
+
+    metrics_off = dict(METRICS_OFF, planned_duration=360, delay_days=84.0, schedule_delay_rate=0.233,
+                       planned_budget=2_030_000_000, actual_cost=2_430_000_000,
+                       direct_cost_increase=300_000_000, financial_cost=100_000_000, final_interest_rate=0.057)
+    metrics_on = dict(metrics_off, **METRICS_ON, delay_days=42.0, schedule_delay_rate=0.117,
+                      actual_cost=2_180_000_000, direct_cost_increase=100_000_000, financial_cost=50_000_000)
+
+    # 한글 열 이름이 있어도 열 구분선 위치(표시 폭)가 행마다 같음
+    text = report_engine.render_comparison(metrics_off, metrics_on, template='result')
+    table = [line for line in text.splitlines() if '│' in line]
+    positions = {tuple(display_width(line[:i]) for i, ch in enumerate(line) if ch == '│') for line in table}
+    assert len(table) == 12 and len(positions) == 1, "표 정렬 오류"
+    assert '총 비용이 10.3% 절감' in text
+
+    # 미리 파싱한 서식 = str.format_map
+    fmt = '{name} {m[delay_days]:.0f}일 {m[budget_overrun_rate]:+.1%} {m[cost_increase]:,}원'
+    context = {'name': 'BIM OFF', 'm': metrics_off}
+    assert compile_format(fmt)(context) == fmt.format_map(context)
+
+    html = report_engine.render_comparison(metrics_off, metrics_on, 'html')
+    assert '<table>' in html and '<td>BIM OFF</td>' in html
+    assert '| BIM ON |' in report_engine.render_comparison(metrics_off, metrics_on, 'markdown')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scenarios = ((f"S{i:03d}", metrics_off, metrics_on) for i in range(50))
+        assert report_engine.render_batch(scenarios, Path(tmp) / 'all.csv') == 50
+        lines = (Path(tmp) / 'all.csv').read_text(encoding='utf-8').splitlines()
+        single = report_engine.render_comparison(metrics_off, metrics_on, 'csv').splitlines()
+        assert len(lines) == 1 + 50 * (len(single) - 1)
+    print("✓ 보고서 엔진 테스트 통과\n")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "="*50)
+    print("리포트 테스트 시작")
+    print("="*50)
+
+    test_graph_cache()
+    test_distribution_plots()
+    test_report_engine()
+
+    print("="*50)
+    print("모든 테스트 통과!")
+    print("="*50 + "\n")
+
+
+if __name__ == '__main__':
+    run_all_tests()
@@ -0,0 +1,77 @@
+"""
+시뮬레이션 결과 캐시 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import tempfile
+from pathlib import Path
+from models.project import Project
+from config.bim_quality_config import BIMQualityConfig
+from simulation.simulation_engine import SimulationEngine
+from simulation.scenario_fork import template_agents
+from simulation.result_cache import SimulationResultCache
+
+
+def _engine(cache, seed=3, **kwargs):
+    project = Project(bim_enabled=True, bim_quality=BIMQualityConfig.BIM_GOOD)
+    return SimulationEngine(project, template_agents(), save_logs=False, random_seed=seed,
+                            result_cache=cache, **kwargs)
+
+
+def test_result_cache():
+    """같은 입력은 저장된 결과/최종 상태 반환, 입력이 바뀌면 재계산, LRU 삭제"""
+    print("\n=== 결과 캐시 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SimulationResultCache(Path(tmp) / 'results.sqlite3', max_entries=2)
+
+        first = _engine(cache)
+        metrics = first.run(verbose=False)
+        after_run = random.getstate()
+
+        # 다른 프로세스와 같은 파일 공유 (새 인스턴스로 조회)
+        shared = SimulationResultCache(Path(tmp) / 'results.sqlite3', max_entries=2)
+        second = _engine(shared)
+        assert second.run(verbose=False) == metrics and shared.stats['hits'] == 1
+        assert second.simulation_log == first.simulation_log
+        assert second.project.total_delay_weeks == first.project.total_delay_weeks
+        assert random.getstate() == after_run, "난수 상태가 실제 실행 후와 다름"
+
+        # 협상 테이블/시드가 다르면 다른 키
+        changed = _engine(cache)
+        changed.impact_calculator.negotiation_system.agent_preferences['contractor'] = 0.3
+        assert cache.key(changed) != cache.key(_engine(cache))
+        changed.run(verbose=False)
+        _engine(cache, seed=4).run(verbose=False)
+        assert cache.stats['misses'] == 3 and cache.info()['entries'] == 2
+
+        # 가장 오래 안 쓴 항목(seed 3 기본)이 삭제됨
+        assert cache.get(cache.key(_engine(cache))) is None
+
+        # 체크포인트/LLM 에이전트 실행은 캐시하지 않음 (이유 제공)
+        assert cache.key(_engine(cache, checkpoint_file=Path(tmp) / 'run.pkl')) is None
+        llm = _engine(cache)
+        llm.agents['owner'].use_llm = True
+        assert cache.key(llm) is None and 'LLM' in cache.bypass_reason(llm)
+    print("✓ 결과 캐시 테스트 통과\n")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "="*50)
+    print("결과 캐시 테스트 시작")
+    print("="*50)
+
+    test_result_cache()
+
+    print("="*50)
+    print("모든 테스트 통과!")
+    print("="*50 + "\n")
+
+
+if __name__ == '__main__':
+    run_all_tests()
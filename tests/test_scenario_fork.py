@@ -0,0 +1,71 @@
+"""
+시나리오 분기 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.project import Project
+from config.bim_quality_config import BIMQualityConfig
+from simulation.simulation_engine import SimulationEngine
+from simulation.scenario_fork import ScenarioFork, apply_branch, template_agents
+
+
+def test_fork_branches():
+    """기준 분기 = 전체 실행, 분기 간 공통 구간 공유"""
+    print("\n=== 시나리오 분기 테스트 ===")
+
+    full = SimulationEngine(Project(), template_agents(), save_logs=False, random_seed=3)
+    expected = full.run(verbose=False)
+
+    engine = SimulationEngine(Project(), template_agents(), save_logs=False, random_seed=3)
+    fork = ScenarioFork.from_day(engine, 200)
+
+    branches = [
+        {'name': '기준'},
+        {'name': 'BIM 적용', 'bim_enabled': True, 'bim_quality': BIMQualityConfig.BIM_EXCELLENT},
+        {'name': '시공사 양보', 'negotiation_preferences': {'contractor': 0.3}},
+    ]
+    results = fork.run(branches, max_workers=2)
+    ScenarioFork.print_comparison(results)
+
+    base, bim, contractor = results
+    assert base['metrics'] == expected, "기준 분기가 전체 실행과 다름"
+    assert bim['metrics']['cost_increase'] < base['metrics']['cost_increase'], "BIM 분기 효과 없음"
+    assert contractor['metrics']['delay_weeks'] < base['metrics']['delay_weeks'], "협상 분기 효과 없음"
+
+    # 분기 이전 이슈는 모든 분기에서 동일
+    prefix = [entry for entry in base['issue_log'] if entry['day'] <= 200]
+    for result in results:
+        assert result['issue_log'][:len(prefix)] == prefix, "공통 구간 불일치"
+
+    # 병렬/순차 결과 동일
+    sequential = fork.run(branches, parallel=False)
+    assert [r['metrics'] for r in sequential] == [r['metrics'] for r in results], "병렬 실행 결과 불일치"
+
+    # 발생 확률이 없는 이슈 카드는 기본값(0.01) 기준으로 배수 적용
+    engine = SimulationEngine(Project(), template_agents(), save_logs=False, random_seed=3)
+    issue = engine.issue_manager.pending_issues[0]
+    engine.issue_manager.pending_issues[0] = {key: value for key, value in issue.items() if key != 'occurrence_rate'}
+    apply_branch(engine, {'issue_rate_multipliers': {issue['id']: 2.0}})
+    assert engine.issue_manager.pending_issues[0]['occurrence_rate'] == 0.02, "기본 발생 확률 미적용"
+
+    print("✓ 시나리오 분기 테스트 통과\n")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "="*50)
+    print("시나리오 분기 테스트 시작")
+    print("="*50)
+
+    test_fork_branches()
+
+    print("="*50)
+    print("모든 테스트 통과!")
+    print("="*50 + "\n")
+
+
+if __name__ == '__main__':
+    run_all_tests()
@@ -0,0 +1,99 @@
+"""
+시나리오 명세 로더 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import pickle
+import tempfile
+from pathlib import Path
+from models.project import Project
+from config.bim_quality_config import BIMQualityConfig
+from simulation.simulation_engine import SimulationEngine
+from simulation.scenario_fork import template_agents
+from simulation.scenario_spec import Study, run_study
+
+SPEC = {
+    'name': '테스트 연구',
+    'defaults': {'template': 'cheongdam', 'seed': 7},
+    'scenarios': [
+        {'name': '기준'},
+        {'name': '시공사 양보', 'negotiation_preferences': {'contractor': 0.3}, 'project': {'budget': 2.5e9}}
+    ],
+    'matrix': {
+        'bim_quality': ['off', 'good'],
+        'seed': {'range': [1, 4]},
+        'mode': ['engine', 'batch']
+    },
+    'exclude': [{'scenario': '시공사 양보', 'bim_quality': 'off'}]
+}
+
+
+def test_study_expansion():
+    """조합 펼치기/제외, 불변 명세, 직접 실행과 같은 결과"""
+    print("\n=== 시나리오 명세 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'study.json'
+        path.write_text(json.dumps(SPEC, ensure_ascii=False), encoding='utf-8')
+        study = Study.load(path)
+
+    specs = list(study)
+    assert len(study) == len(specs) == 2 * 2 * 3 * 2 - 6
+    assert len({spec.project for spec in specs}) == 3, "같은 프로젝트 명세를 공유하지 않음"
+    assert pickle.loads(pickle.dumps(specs[-1])) == specs[-1]
+    try:
+        specs[0].seed = 3
+        assert False, "명세가 변경됨"
+    except AttributeError:
+        pass
+
+    # 명세 실행 = 같은 설정의 직접 실행
+    spec = next(s for s in specs if s.name == '시공사 양보 / bim_quality=good / seed=2 / mode=engine')
+    assert spec.project.build().budget == 2.5e9
+    project = Project(bim_enabled=True, bim_quality=BIMQualityConfig.BIM_GOOD)
+    project.budget = project.actual_cost = 2.5e9
+    engine = SimulationEngine(project, template_agents(), save_logs=False, random_seed=2)
+    engine.impact_calculator.negotiation_system.agent_preferences['contractor'] = 0.3
+    expected = engine.run(verbose=False)
+    assert spec.run() == expected
+
+    # 병렬 실행 결과는 명세 순서대로
+    engine_specs = Study(dict(SPEC, matrix=dict(SPEC['matrix'], mode=['engine'])))
+    results = list(run_study(engine_specs, max_workers=2))
+    assert [s for s, _ in results] == list(engine_specs)
+    assert results[0][1] == next(iter(engine_specs)).run()
+
+    assert len(Study.load('data/study_sample.toml')) == 140
+
+    for bad in ({'defaults': {'template': 'officetel'}},          # 정의되지 않은 템플릿
+                {'matrix': {'bim_quality': ['great']}},
+                {'defaults': {'issue_rate_multipliers': {'I-99': 2.0}}},
+                {'exclude': [{'unknown_axis': 1}]},
+                {'matrix': {'bim_quality': ['off', 'good']}, 'exclude': [{'bim_quality': 'great'}]}):
+        try:
+            Study(bad)
+            assert False, f"검증 실패: {bad}"
+        except ValueError as e:
+            print(f"  검증 오류: {e}")
+    print("✓ 시나리오 명세 테스트 통과\n")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "="*50)
+    print("시나리오 명세 테스트 시작")
+    print("="*50)
+
+    test_study_expansion()
+
+    print("="*50)
+    print("모든 테스트 통과!")
+    print("="*50 + "\n")
+
+
+if __name__ == '__main__':
+    run_all_tests()
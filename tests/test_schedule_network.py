@@ -0,0 +1,91 @@
+"""
+공정 네트워크 (증분 CPM) 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import copy
+import random
+from models.project import Project
+from simulation.schedule_network import ActivityNetwork, SS
+from simulation.simulation_engine import SimulationEngine
+from simulation.scenario_fork import template_agents
+
+
+def test_forward_backward_pass():
+    """FS/SS 관계 일정 계산 및 여유 범위 내 지연"""
+    print("\n=== 전진/후진 계산 테스트 ===")
+
+    network = ActivityNetwork()
+    network.add_activity('A', 10)
+    network.add_activity('B', 5)
+    network.add_activity('C', 8)
+    network.add_activity('D', 4)
+    network.add_relation('A', 'B')
+    network.add_relation('A', 'C', SS, 3)
+    network.add_relation('B', 'D')
+    network.add_relation('C', 'D')
+    network.compile()
+
+    # A 0-10, B 10-15, C 3-11 (여유 4), D 15-19
+    assert network.finish == 19
+    assert network.dates('C') == {'es': 3, 'ef': 11, 'ls': 7, 'lf': 15, 'total_float': 4}
+    assert network.critical_path() == ['A', 'B', 'D']
+
+    assert network.delay_activity('C', 3) == 0, "여유 범위 내 지연은 준공일 불변"
+    assert network.delay_activity('C', 2) == 1
+    assert network.critical_path() == ['A', 'C', 'D']
+    print("✓ 전진/후진 계산 테스트 통과\n")
+
+
+def test_incremental_update():
+    """증분 갱신 결과 = 전체 재계산 (소요 시간은 benchmarks의 schedule.apply_issue)"""
+    print("\n=== 증분 갱신 테스트 ===")
+
+    project = Project(template='cheongdam')
+    network = ActivityNetwork.from_project(project, zones=1000)
+    phases = project.phase_durations
+    assert abs(network.finish - sum(phases.values())) < 1e-6, "템플릿 단계 기간과 불일치"
+
+    rng = random.Random(7)
+    work_types = ['구조', '설비', '전기', '마감', '자재', '토목', '시공관리']
+    count = 500
+    for k in range(count):
+        day = phases['설계'] + phases['입찰'] + k * phases['시공'] / count
+        network.apply_issue(rng.choice(work_types), day, rng.uniform(0, 0.5))
+
+    reference = copy.deepcopy(network).compile()
+    network.critical_path()
+    assert abs(reference.finish - network.finish) < 1e-6
+    assert all(abs(a - b) < 1e-6 for a, b in zip(reference.es, network.es)), "ES 불일치"
+    assert all(abs(a - b) < 1e-6 for a, b in zip(reference.tail, network.tail)), "tail 불일치"
+
+    print(f"액티비티 {len(network.activities)}개, 이슈 {count}건, 준공 {network.finish:.1f}일")
+
+    # 시뮬레이션 일별 루프 연동 (지표는 그대로, 영향 결과에 일정 변화 기록)
+    expected = SimulationEngine(Project(), template_agents(), save_logs=False, random_seed=5).run(verbose=False)
+    engine = SimulationEngine(Project(), template_agents(), save_logs=False, random_seed=5,
+                              schedule_network=ActivityNetwork.from_project(Project()))
+    assert engine.run(verbose=False) == expected
+    assert all('schedule' in entry['impact'] for entry in engine.simulation_log)
+    print("✓ 증분 갱신 테스트 통과\n")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "="*50)
+    print("공정 네트워크 테스트 시작")
+    print("="*50)
+
+    test_forward_backward_pass()
+    test_incremental_update()
+
+    print("="*50)
+    print("모든 테스트 통과!")
+    print("="*50 + "\n")
+
+
+if __name__ == '__main__':
+    run_all_tests()
@@ -0,0 +1,73 @@
+"""
+전역 민감도 분석 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from config.bim_quality_config import BIMQualityConfig
+from simulation.impact_calculator import ImpactCalculator
+from simulation.batch_simulator import BatchSimulator
+from simulation.parameter_space import ParameterEvaluator, default_parameters
+from simulation.sensitivity import SobolAnalysis, saltelli_sample, sobol_indices
+
+
+def _ishigami(unit):
+    x = -np.pi + 2 * np.pi * unit
+    return np.sin(x[..., 0]) + 7 * np.sin(x[..., 1]) ** 2 + 0.1 * x[..., 2] ** 4 * np.sin(x[..., 0])
+
+
+def test_sobol_estimator():
+    """Ishigami 함수 해석해와 비교"""
+    print("\n=== Sobol 지수 추정 테스트 ===")
+
+    a, b, ab = saltelli_sample(20_000, 3, seed=1)
+    indices = sobol_indices(_ishigami(a), _ishigami(b), _ishigami(ab), n_boot=50, seed=1)
+    assert np.allclose(indices['S1'], [0.314, 0.442, 0.0], atol=0.04), indices['S1']
+    assert np.allclose(indices['ST'], [0.558, 0.442, 0.244], atol=0.04), indices['ST']
+    assert np.all(indices['S1_ci'][:, 0] <= indices['S1']) and np.all(indices['S1'] <= indices['S1_ci'][:, 1])
+    print("✓ Sobol 지수 추정 테스트 통과\n")
+
+
+def test_parameter_evaluator():
+    """기준값 평가 = 기본 배치 실행, 평가 후 클래스 속성 복원, 병렬 = 순차"""
+    print("\n=== 파라미터 평가 테스트 ===")
+
+    evaluator = ParameterEvaluator(n_runs=300, outputs=('budget_overrun_rate', 'delay_weeks'))
+    reference = BatchSimulator(evaluator.project).run(300, seed=0)
+    base = evaluator.evaluate(evaluator.base)[0]
+    assert np.allclose(base, [reference['budget_overrun_rate'].mean(), reference['delay_weeks'].mean()])
+
+    evaluator.evaluate(evaluator.high)
+    assert BIMQualityConfig.SIGMOID_K == 10 and ImpactCalculator.REDUCTION_BY_PHASE['설계']['delay'] == 0.70
+
+    parameters = [p for p in default_parameters(evaluator.issues) if p['target'][0] != 'occurrence_rate']
+    sequential = SobolAnalysis(ParameterEvaluator(parameters=parameters, n_runs=200)).run(
+        n_base=16, n_boot=20, max_workers=1, seed=3)
+    parallel = SobolAnalysis(ParameterEvaluator(parameters=parameters, n_runs=200)).run(
+        n_base=16, n_boot=20, max_workers=2, seed=3)
+    assert sequential['evaluations'] == 16 * (len(parameters) + 2)
+    first = sequential['outputs']['budget_overrun_rate']
+    assert np.array_equal(first['ST'], parallel['outputs']['budget_overrun_rate']['ST'])
+    SobolAnalysis.print_summary(sequential, top=5)
+    print("✓ 파라미터 평가 테스트 통과\n")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "="*50)
+    print("민감도 분석 테스트 시작")
+    print("="*50)
+
+    test_sobol_estimator()
+    test_parameter_evaluator()
+
+    print("="*50)
+    print("모든 테스트 통과!")
+    print("="*50 + "\n")
+
+
+if __name__ == '__main__':
+    run_all_tests()
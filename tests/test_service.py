@@ -0,0 +1,104 @@
+"""
+로컬 시뮬레이션 서비스 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import asyncio
+import tempfile
+import threading
+import urllib.request
+from urllib.error import HTTPError
+from pathlib import Path
+from simulation.service import SimulationService, normalize_job, job_id, run_job
+
+
+def _request(port, path, payload=None):
+    data = None if payload is None else json.dumps(payload).encode('utf-8')
+    request = urllib.request.Request(f"http://127.0.0.1:{port}{path}", data=data,
+                                     headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            body = response.read().decode('utf-8')
+            return response.status, body if path.endswith('/events') else json.loads(body)
+    except HTTPError as e:
+        return e.code, json.loads(e.read().decode('utf-8'))
+
+
+class _Running:
+    """별도 스레드 이벤트 루프에서 서비스 실행"""
+
+    def __init__(self, store_path):
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        self.service = self._call(SimulationService(store_path, port=0, max_workers=1).start())
+
+    def _call(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout=120)
+
+    def close(self):
+        self._call(self.service.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+def test_service_jobs():
+    """작업 실행/진행률 스트림/중복 제거/재시작 후 저장소 결과"""
+    print("\n=== 시뮬레이션 서비스 테스트 ===")
+
+    job = {'template': 'cheongdam', 'bim_quality': 'good', 'seeds': [1, 2], 'runs': 4000}
+    assert job_id(normalize_job(job)) == job_id(normalize_job(dict(job, mode='batch')))
+    assert job_id(normalize_job(job)) != job_id(normalize_job(dict(job, runs=4001)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = Path(tmp) / 'jobs.sqlite3'
+        running = _Running(store)
+        port = running.service.port
+        try:
+            status, first = _request(port, '/jobs', job)
+            assert status == 202 and not first['deduplicated']
+            status, second = _request(port, '/jobs', dict(job, mode='batch'))
+            assert second['id'] == first['id'] and second['deduplicated']
+
+            # 스트림은 진행률 이벤트 후 결과를 보내고 종료
+            status, events = _request(port, f"/jobs/{first['id']}/events")
+            assert status == 200 and 'event: progress' in events and 'event: done' in events
+            done = _request(port, f"/jobs/{first['id']}")[1]
+            assert done['status'] == 'done' and done['result']['runs'] == 8000
+            # 워커 결과 = 현재 프로세스에서 실행한 결과
+            expected = run_job(normalize_job(job))
+            assert done['result']['metrics'] == expected['metrics'] and done['result']['seeds'] == expected['seeds']
+
+            assert _request(port, '/jobs', dict(job, runs=0))[0] == 400
+            assert _request(port, '/jobs', dict(job, template='officetel'))[0] == 400
+            assert _request(port, '/jobs/unknown')[0] == 404
+        finally:
+            running.close()
+
+        # 재시작 후에도 같은 작업은 저장소에서 바로 반환
+        running = _Running(store)
+        try:
+            status, again = _request(running.service.port, '/jobs', job)
+            assert status == 200 and again['deduplicated'] and again['result'] == done['result']
+        finally:
+            running.close()
+    print("✓ 시뮬레이션 서비스 테스트 통과\n")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "="*50)
+    print("시뮬레이션 서비스 테스트 시작")
+    print("="*50)
+
+    test_service_jobs()
+
+    print("="*50)
+    print("모든 테스트 통과!")
+    print("="*50 + "\n")
+
+
+if __name__ == '__main__':
+    run_all_tests()
@@ -8,6 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.project import Project
 from models.bim_quality import BIMQuality
+from models.phase_calendar import PhaseCalendar
+from config.project_config import ProjectConfig
 from config.bim_quality_config import BIMQualityConfig
 from agents.owner_agent import OwnerAgent
 from agents.designer_agent import DesignerAgent
@@ -29,6 +31,29 @@ def test_project_initialization():
     assert project_on.bim_enabled == True, "BIM ON 설정 오류"
     print("✓ BIM ON 프로젝트 초기화 성공\n")
 
+def test_phase_calendar():
+    """프로젝트별 단계 달력 테스트 (템플릿 단계 기간 반영)"""
+    print("=== 단계 달력 테스트 ===")
+
+    project = Project()
+    project.phase_durations = {'설계': 30, '입찰': 10, '시공': 100, '준공': 10}
+    project.calendar = PhaseCalendar.for_durations(project.phase_durations)
+    assert project.calendar.start_end('시공') == (41, 140)
+    assert [t['day'] for t in project.calendar.transitions] == [31, 41, 141]
+
+    phases = []
+    for _ in range(150):
+        project.advance_day()
+        phases.append(project.current_phase)
+    assert phases.count('설계') == 30 and phases.count('시공') == 100, "단계 전환 오류"
+    assert [h['end_day'] for h in project.phase_history] == [30, 40, 140]
+
+    # 기본 달력은 기존 ProjectConfig 조회와 동일
+    assert ProjectConfig.get_phase_by_day(111) == '시공' and ProjectConfig.get_phase_by_day(0) == '준공'
+    assert ProjectConfig.get_phase_start_end('입찰') == (91, 110)
+    assert ProjectConfig.get_phase_start_end('없음') == (None, None)
+    print("✓ 단계 달력 테스트 통과\n")
+
 def test_bim_quality_calculation():
     """BIM 품질 계산 테스트"""
     print("=== BIM 품질 계산 테스트 ===")
@@ -106,6 +131,7 @@ def run_all_tests():
     print("="*50)
     
     test_project_initialization()
+    test_phase_calendar()
     test_bim_quality_calculation()
     test_issue_manager()
     test_impact_calculation()
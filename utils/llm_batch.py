@@ -0,0 +1,187 @@
+"""
+LLM 배치 생성 (보관 실행의 회의록 일괄 재생성용)
+
+실행 중에는 에이전트 발언 요청만 키와 함께 모으고(발언 자리는 템플릿 문장으로 진행),
+실행이 끝난 뒤 한 번의 배치 작업으로 제출해 결과를 키로 회의록에 반영한다.
+수치 시뮬레이션은 문장 생성을 기다리지 않는다.
+"""
+
+import io
+import os
+import json
+import time
+from .llm_usage import usage_tracker
+
+
+class LocalBatchBackend:
+    """로컬 대체 백엔드 (요청을 현재 프로세스에서 순서대로 실행)"""
+
+    def __init__(self, complete=None):
+        """
+        Args:
+            complete: 요청 1건 -> 응답 문자열 함수 (기본: LLMClient, 테스트 시 교체)
+        """
+        self.complete = complete or self._complete_with_client
+        self.jobs = {}
+
+    @staticmethod
+    def _complete_with_client(request):
+        from .llm_client import LLMClient
+
+        messages = request['messages']
+        return LLMClient().generate_with_context(
+            messages[0]['content'], messages[1:], request['temperature'], agent=request['agent']
+        )
+
+    def submit(self, requests):
+        """배치 제출 (즉시 실행) 후 작업 ID 반환"""
+        results = {}
+        for request in requests:
+            usage_tracker.meeting_type = request['meeting_type']
+            results[request['key']] = self.complete(request)
+        usage_tracker.meeting_type = '기타'
+
+        job_id = f"local-{len(self.jobs) + 1}"
+        self.jobs[job_id] = results
+        return job_id
+
+    def status(self, job_id):
+        return 'completed'
+
+    def results(self, job_id):
+        """{키: 응답 문자열}"""
+        return self.jobs[job_id]
+
+
+class OpenAIBatchBackend:
+    """OpenAI Batch API 백엔드 (24시간 내 완료, 일반 호출 대비 비용 할인)"""
+
+    ENDPOINT = '/v1/chat/completions'
+
+    def __init__(self, client=None, completion_window='24h'):
+        """
+        Args:
+            client: openai.OpenAI 인스턴스 (기본: 환경 변수 설정으로 생성)
+            completion_window: 배치 완료 기한
+        """
+        if client is None:
+            from openai import OpenAI
+            client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'), max_retries=2)
+        self.client = client
+        self.model = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+        self.temperature = float(os.getenv('LLM_TEMPERATURE', '0.7'))
+        self.max_tokens = int(os.getenv('LLM_MAX_TOKENS', '500'))
+        self.completion_window = completion_window
+        self.requests = {}
+
+    def submit(self, requests):
+        """요청을 JSONL로 올리고 배치 작업 생성"""
+        lines = []
+        for request in requests:
+            lines.append(json.dumps({
+                'custom_id': request['key'],
+                'method': 'POST',
+                'url': self.ENDPOINT,
+                'body': {
+                    'model': self.model,
+                    'messages': request['messages'],
+                    'temperature': request['temperature'] if request['temperature'] is not None else self.temperature,
+                    'max_tokens': self.max_tokens
+                }
+            }, ensure_ascii=False))
+
+        upload = self.client.files.create(
+            file=('llm_batch.jsonl', io.BytesIO('\n'.join(lines).encode('utf-8'))),
+            purpose='batch'
+        )
+        job = self.client.batches.create(
+            input_file_id=upload.id, endpoint=self.ENDPOINT, completion_window=self.completion_window
+        )
+        self.requests[job.id] = {request['key']: request for request in requests}
+        return job.id
+
+    def status(self, job_id):
+        """'completed', 'failed', 'expired', 'cancelled' 또는 진행 중 상태"""
+        return self.client.batches.retrieve(job_id).status
+
+    def results(self, job_id):
+        """완료된 배치의 출력 파일을 읽어 {키: 응답 문자열} 반환 (실패 요청은 None)"""
+        job = self.client.batches.retrieve(job_id)
+        requests = self.requests.get(job_id, {})
+        results = {key: None for key in requests}
+        if not job.output_file_id:
+            return results
+
+        for line in self.client.files.content(job.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            key = record['custom_id']
+            request = requests.get(key, {'agent': '-', 'meeting_type': '기타'})
+            body = (record.get('response') or {}).get('body') or {}
+            usage = body.get('usage') or {}
+            ok = bool(body.get('choices'))
+
+            usage_tracker.meeting_type = request['meeting_type']
+            usage_tracker.record_call(request['agent'], body.get('model', self.model),
+                                      usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0),
+                                      0.0, 0, ok)
+            results[key] = body['choices'][0]['message']['content'].strip() if ok else None
+
+        usage_tracker.meeting_type = '기타'
+        return results
+
+
+class LLMBatchCollector:
+    """에이전트 발언 요청 수집기 (실행 1회 또는 여러 실행을 묶은 연구 단위)"""
+
+    def __init__(self, backend=None):
+        """
+        Args:
+            backend: 배치 백엔드 (기본: LocalBatchBackend)
+        """
+        self.backend = backend or LocalBatchBackend()
+        self.requests = []
+        self.runs = 0
+        self.job_id = None
+
+    def register_run(self, label):
+        """실행별 키 접두어 발급"""
+        self.runs += 1
+        return f"run{self.runs}-{label}"
+
+    def add(self, key, messages, temperature, agent):
+        """발언 요청 1건 추가"""
+        self.requests.append({
+            'key': key,
+            'agent': agent,
+            'meeting_type': usage_tracker.meeting_type,
+            'messages': messages,
+            'temperature': temperature
+        })
+
+    def submit(self):
+        """모은 요청을 배치 작업 하나로 제출"""
+        self.job_id = self.backend.submit(self.requests)
+        return self.job_id
+
+    def wait(self, poll_interval=60, timeout=None):
+        """
+        배치 완료까지 대기 후 결과 반환
+
+        Returns:
+            {키: 응답 문자열 또는 None}
+        """
+        if self.job_id is None:
+            self.submit()
+
+        start = time.monotonic()
+        while True:
+            status = self.backend.status(self.job_id)
+            if status == 'completed':
+                return self.backend.results(self.job_id)
+            if status in ('failed', 'expired', 'cancelled'):
+                raise RuntimeError(f"LLM 배치 작업 {self.job_id} 종료 상태: {status}")
+            if timeout is not None and time.monotonic() - start > timeout:
+                raise TimeoutError(f"LLM 배치 작업 {self.job_id} 대기 시간 초과")
+            time.sleep(poll_interval)
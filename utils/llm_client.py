@@ -1,13 +1,24 @@
 """
-OpenAI ChatGPT API 클라이언트
+OpenAI ChatGPT API 클라이언트 (동기 모드 / 풀 모드)
 """
 
 import os
-from openai import OpenAI
+import time
+import atexit
+import random
+import httpx
+from openai import OpenAI, AsyncOpenAI
 from dotenv import load_dotenv
+from .profiler import profiled
+from .llm_usage import usage_tracker
+from .llm_pool import LLMPool, RETRYABLE_ERRORS
+from .llm_stream import StreamCutoff
 
 load_dotenv()
 
+# 재시도 대기 시간 지터 (시뮬레이션 전역 난수 상태와 분리)
+_jitter = random.Random()
+
 
 class LLMClient:
     """ChatGPT API 클라이언트 싱글톤"""
@@ -28,6 +39,11 @@ class LLMClient:
         self.model = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
         self.temperature = float(os.getenv('LLM_TEMPERATURE', '0.7'))
         self.max_tokens = int(os.getenv('LLM_MAX_TOKENS', '500'))
+        self.max_retries = int(os.getenv('LLM_MAX_RETRIES', '2'))
+        self.timeout = float(os.getenv('LLM_TIMEOUT', '30'))
+        self.mode = os.getenv('LLM_CLIENT_MODE', 'sync')
+        self.stream = os.getenv('LLM_STREAM', '0') == '1'
+        self.max_sentences = int(os.getenv('LLM_MAX_SENTENCES', '3')) or None
 
         if not self.api_key:
             raise ValueError(
@@ -36,10 +52,41 @@ class LLMClient:
                 "See .env.example for reference."
             )
 
-        self.client = OpenAI(api_key=self.api_key)
+        if self.mode not in ('sync', 'pooled'):
+            raise ValueError(f"LLM_CLIENT_MODE는 sync 또는 pooled여야 합니다: {self.mode}")
+
+        # 재시도는 직접 처리해 횟수를 집계 (SDK 자체 재시도 끔)
+        self.pool = None
+        if self.mode == 'pooled':
+            self.pool = self._create_pool()
+            atexit.register(self.pool.close)
+        else:
+            self.client = OpenAI(api_key=self.api_key, max_retries=0, timeout=self.timeout)
         self._initialized = True
 
-    def generate_response(self, system_prompt, user_message, temperature=None):
+    def _create_pool(self):
+        """비동기 연결 풀 클라이언트 (LLM_CLIENT_MODE=pooled)"""
+        max_concurrency = int(os.getenv('LLM_MAX_CONCURRENCY', '8'))
+
+        def client_factory():
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=max_concurrency,
+                                    max_keepalive_connections=max_concurrency),
+                timeout=self.timeout
+            )
+            return AsyncOpenAI(api_key=self.api_key, max_retries=0, http_client=http_client)
+
+        return LLMPool(
+            client_factory, self.model,
+            max_concurrency=max_concurrency,
+            rpm_limit=int(os.getenv('LLM_RPM_LIMIT', '0')),
+            tpm_limit=int(os.getenv('LLM_TPM_LIMIT', '0')),
+            max_retries=self.max_retries,
+            deadline=float(os.getenv('LLM_CALL_DEADLINE', '90'))
+        )
+
+    @profiled('llm.generate_response')
+    def generate_response(self, system_prompt, user_message, temperature=None, agent=None):
         """
         ChatGPT로 응답 생성
 
@@ -47,28 +94,19 @@ class LLMClient:
             system_prompt: 시스템 프롬프트 (역할 정의)
             user_message: 사용자 메시지 (상황 설명)
             temperature: 창의성 수준 (0.0~2.0, 기본값은 설정값 사용)
+            agent: 호출 에이전트 이름 (사용량 집계용)
 
         Returns:
             생성된 응답 문자열
         """
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ],
-                temperature=temperature if temperature is not None else self.temperature,
-                max_tokens=self.max_tokens
-            )
-
-            return response.choices[0].message.content.strip()
-
-        except Exception as e:
-            print(f"[LLM Error] {str(e)}")
-            return f"[LLM 응답 생성 실패: {str(e)}]"
-
-    def generate_with_context(self, system_prompt, messages, temperature=None):
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message}
+        ]
+        return self._complete(messages, temperature, agent)
+
+    @profiled('llm.generate_with_context')
+    def generate_with_context(self, system_prompt, messages, temperature=None, agent=None, expected_prefix=None):
         """
         대화 컨텍스트를 포함하여 응답 생성
 
@@ -76,22 +114,85 @@ class LLMClient:
             system_prompt: 시스템 프롬프트
             messages: 대화 이력 리스트 [{"role": "user/assistant", "content": "..."}]
             temperature: 창의성 수준
+            agent: 호출 에이전트 이름 (사용량 집계용)
+            expected_prefix: 스트리밍 모드에서 첫 토큰으로 검증할 응답 시작 문자열
 
         Returns:
             생성된 응답 문자열
         """
-        try:
-            full_messages = [{"role": "system", "content": system_prompt}] + messages
-
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=full_messages,
-                temperature=temperature if temperature is not None else self.temperature,
-                max_tokens=self.max_tokens
+        full_messages = [{"role": "system", "content": system_prompt}] + messages
+        return self._complete(full_messages, temperature, agent, expected_prefix)
+
+    def _complete(self, messages, temperature, agent, expected_prefix=None):
+        """API 호출 (일시적 오류 재시도, 토큰/지연 시간 기록)"""
+        start = time.perf_counter()
+        retries = 0
+        cutoff = StreamCutoff(expected_prefix, self.max_sentences) if self.stream else None
+
+        if self.pool is not None:
+            response, retries, error = self.pool.complete(
+                messages, temperature if temperature is not None else self.temperature, self.max_tokens,
+                cutoff=cutoff
             )
-
-            return response.choices[0].message.content.strip()
-
-        except Exception as e:
-            print(f"[LLM Error] {str(e)}")
-            return f"[LLM 응답 생성 실패: {str(e)}]"
+            if error is not None:
+                return self._failed(error, agent, start, retries)
+            return self._succeeded(response, agent, start, retries)
+
+        while True:
+            try:
+                if cutoff is None:
+                    response = self.client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        temperature=temperature if temperature is not None else self.temperature,
+                        max_tokens=self.max_tokens
+                    )
+                else:
+                    stream = self.client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        temperature=temperature if temperature is not None else self.temperature,
+                        max_tokens=self.max_tokens,
+                        stream=True,
+                        stream_options={"include_usage": True}
+                    )
+                break
+
+            except RETRYABLE_ERRORS as e:
+                if retries >= self.max_retries:
+                    return self._failed(e, agent, start, retries)
+                retries += 1
+                time.sleep(min(8.0, 0.5 * 2 ** retries) * _jitter.uniform(0.5, 1.0))
+
+            except Exception as e:
+                return self._failed(e, agent, start, retries)
+
+        if cutoff is not None:
+            # 태그 불일치 또는 문장 수 도달 시 연결을 닫아 나머지 생성 중단
+            try:
+                for chunk in stream:
+                    if cutoff.feed_chunk(chunk):
+                        stream.close()
+                        break
+            except Exception as e:
+                return self._failed(e, agent, start, retries)
+            response = cutoff.result(messages)
+
+        return self._succeeded(response, agent, start, retries)
+
+    def _succeeded(self, response, agent, start, retries):
+        usage = getattr(response, 'usage', None)
+        usage_tracker.record_call(
+            agent, self.model,
+            getattr(usage, 'prompt_tokens', 0) or 0,
+            getattr(usage, 'completion_tokens', 0) or 0,
+            (time.perf_counter() - start) * 1000, retries, True,
+            stop_reason=getattr(response, 'stop_reason', None)
+        )
+
+        return response.choices[0].message.content.strip()
+
+    def _failed(self, error, agent, start, retries):
+        usage_tracker.record_call(agent, self.model, 0, 0, (time.perf_counter() - start) * 1000, retries, False)
+        print(f"[LLM Error] {str(error)}")
+        return f"[LLM 응답 생성 실패: {str(error)}]"
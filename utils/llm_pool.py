@@ -0,0 +1,191 @@
+"""
+LLM 동시 호출 풀 (동시 실행 제한, RPM/TPM 속도 제한, 재시도, 호출 기한)
+
+백그라운드 이벤트 루프 스레드 하나에서 비동기 클라이언트(연결 풀 공유)를 실행하고,
+어느 스레드에서든 complete()로 호출을 제출한다. 여러 시뮬레이션이 같은 프로세스에서
+동시에 실행되어도 하나의 API 할당량을 함께 사용한다.
+"""
+
+import time
+import random
+import asyncio
+import threading
+import openai
+from .token_budget import estimate_tokens
+
+# 재시도 대상 오류 (일시적 장애)
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+
+class TokenBucket:
+    """분당 한도 토큰 버킷 (이벤트 루프 스레드 전용)"""
+
+    def __init__(self, rate_per_minute, capacity=None):
+        """
+        Args:
+            rate_per_minute: 분당 보충량 (요청 수 또는 토큰 수)
+            capacity: 최대 누적량 (기본: 분당 보충량, 즉 1분치 버스트 허용)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount=1):
+        """amount만큼 확보될 때까지 대기 (용량보다 큰 요청은 용량으로 제한)"""
+        amount = min(amount, self.capacity)
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def adjust(self, amount):
+        """사후 정산 (실제 사용량 - 예상 사용량, 음수면 환급)"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class LLMPool:
+    """비동기 LLM 호출 풀"""
+
+    # 재시도 대기 시간 (초): 0.5 * 2^n, 최대 8초, 지터 50~100%
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 8.0
+
+    def __init__(self, client_factory, model, max_concurrency=8, rpm_limit=0, tpm_limit=0,
+                 max_retries=2, deadline=90.0):
+        """
+        Args:
+            client_factory: 비동기 클라이언트 생성 함수 (이벤트 루프 스레드에서 호출)
+            model: 모델명
+            max_concurrency: 동시 요청 수 상한 (연결 풀 크기)
+            rpm_limit / tpm_limit: 분당 요청/토큰 한도 (0이면 제한 없음)
+            max_retries: 일시적 오류 재시도 횟수
+            deadline: 호출 1건의 전체 기한 (대기/재시도 포함, 초)
+        """
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.deadline = deadline
+        self.rpm_bucket = TokenBucket(rpm_limit) if rpm_limit else None
+        self.tpm_bucket = TokenBucket(tpm_limit) if tpm_limit else None
+        self._jitter = random.Random()
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name='llm-pool', daemon=True)
+        self._thread.start()
+        self.semaphore = None
+        self.client = self._run(self._setup(client_factory))
+
+    async def _setup(self, client_factory):
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        return client_factory()
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def complete(self, messages, temperature, max_tokens, cutoff=None):
+        """
+        호출 제출 후 결과 대기 (임의 스레드에서 호출 가능)
+
+        cutoff(StreamCutoff)가 주어지면 스트리밍으로 받으며 조기 종료
+
+        Returns:
+            (response, retries, error) - 성공 시 error는 None, 실패 시 response는 None
+        """
+        state = {'retries': 0}
+        try:
+            response = self._run(asyncio.wait_for(
+                self._complete(messages, temperature, max_tokens, state, cutoff), self.deadline
+            ))
+            return response, state['retries'], None
+        except TimeoutError:
+            return None, state['retries'], TimeoutError(f"호출 기한 {self.deadline:.0f}초 초과")
+        except Exception as e:
+            return None, state['retries'], e
+
+    async def _complete(self, messages, temperature, max_tokens, state, cutoff=None):
+        # TPM은 입력 추정치 + 최대 출력으로 선점하고 응답 후 실제 사용량으로 정산
+        reserved = sum(estimate_tokens(m['content']) for m in messages) + max_tokens
+
+        while True:
+            try:
+                async with self.semaphore:
+                    if self.rpm_bucket:
+                        await self.rpm_bucket.acquire()
+                    if self.tpm_bucket:
+                        await self.tpm_bucket.acquire(reserved)
+
+                    if cutoff is None:
+                        response = await self.client.chat.completions.create(
+                            model=self.model,
+                            messages=messages,
+                            temperature=temperature,
+                            max_tokens=max_tokens
+                        )
+                    else:
+                        response = await self._stream(messages, temperature, max_tokens, cutoff)
+
+                if self.tpm_bucket:
+                    used = getattr(getattr(response, 'usage', None), 'total_tokens', None)
+                    if used is not None:
+                        self.tpm_bucket.adjust(used - reserved)
+                return response
+
+            except RETRYABLE_ERRORS as e:
+                if state['retries'] >= self.max_retries:
+                    raise
+                state['retries'] += 1
+                await asyncio.sleep(self._backoff(state['retries'], e))
+
+    async def _stream(self, messages, temperature, max_tokens, cutoff):
+        cutoff.reset()
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        async for chunk in stream:
+            if cutoff.feed_chunk(chunk):
+                await stream.close()
+                break
+        return cutoff.result(messages)
+
+    def _backoff(self, retries, error):
+        delay = min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** retries) * self._jitter.uniform(0.5, 1.0)
+
+        # 429 응답의 Retry-After 헤더가 더 길면 따름
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        try:
+            return max(delay, float(retry_after)) if retry_after else delay
+        except ValueError:
+            return delay
+
+    def close(self):
+        """연결 풀 종료 및 이벤트 루프 정지"""
+        if not self.loop.is_running():
+            return
+        close = getattr(self.client, 'close', None)
+        if close is not None:
+            try:
+                self._run(close())
+            except Exception:
+                pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
@@ -0,0 +1,87 @@
+"""
+스트리밍 응답 조기 종료 (역할 태그 검증, 문장 수 제한)
+
+회의 발언은 "[에이전트명]"으로 시작하는 2-3문장이면 충분하므로, 첫 토큰에서 태그가
+틀리면 바로 중단하고(템플릿 대체) 문장 수에 도달하면 나머지 생성을 기다리지 않는다.
+"""
+
+import re
+import types
+from .token_budget import estimate_tokens
+
+# 문장 끝: 마침표/물음표/느낌표 뒤 공백 (스트림 조각 끝의 "3." 같은 소수점은 제외)
+_SENTENCE_END = re.compile(r'[.!?](?=\s)')
+
+
+class StreamCutoff:
+    """스트림 조각을 받아 중단 여부 판단"""
+
+    def __init__(self, expected_prefix=None, max_sentences=None):
+        """
+        Args:
+            expected_prefix: 응답이 시작해야 하는 문자열 (예: "[금융사]")
+            max_sentences: 최대 문장 수 (None이면 제한 없음)
+        """
+        self.expected_prefix = expected_prefix
+        self.max_sentences = max_sentences
+        self.reset()
+
+    def reset(self):
+        """재시도 시 이전 조각 폐기"""
+        self.text = ""
+        self.prefix_checked = self.expected_prefix is None
+        self.stop_reason = None   # 'prefix' (태그 불일치) / 'sentences' (문장 수 도달)
+        self.usage = None
+
+    def feed(self, delta):
+        """
+        조각 추가
+
+        Returns:
+            True면 스트림 중단
+        """
+        self.text += delta
+        stripped = self.text.lstrip()
+
+        if not self.prefix_checked:
+            checked = min(len(stripped), len(self.expected_prefix))
+            if stripped[:checked] != self.expected_prefix[:checked]:
+                self.stop_reason = 'prefix'
+                return True
+            self.prefix_checked = checked == len(self.expected_prefix)
+
+        if self.max_sentences:
+            ends = list(_SENTENCE_END.finditer(self.text))
+            if len(ends) >= self.max_sentences:
+                self.text = self.text[:ends[self.max_sentences - 1].end()]
+                self.stop_reason = 'sentences'
+                return True
+
+        return False
+
+    def feed_chunk(self, chunk):
+        """ChatCompletionChunk 처리 (usage 조각 포함)"""
+        if getattr(chunk, 'usage', None) is not None:
+            self.usage = chunk.usage
+        if chunk.choices:
+            return self.feed(chunk.choices[0].delta.content or "")
+        return False
+
+    def result(self, messages):
+        """
+        일반 응답과 같은 형태로 변환
+
+        중단해서 usage 조각을 받지 못한 경우 토큰 수는 근사치
+        (입력은 전체 메시지, 출력은 받은 조각 기준)
+        """
+        usage = self.usage
+        if usage is None:
+            prompt_tokens = sum(estimate_tokens(message['content']) for message in messages)
+            completion_tokens = estimate_tokens(self.text)
+            usage = types.SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+                                          total_tokens=prompt_tokens + completion_tokens)
+        return types.SimpleNamespace(
+            choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=self.text))],
+            usage=usage,
+            stop_reason=self.stop_reason
+        )
@@ -0,0 +1,198 @@
+"""
+LLM 사용량 집계 (토큰, 지연 시간, 재시도, 템플릿 대체)
+
+LLMClient와 BaseAgent가 호출마다 기록하고, SimulationEngine이 실행 종료 시
+에이전트별/회의 유형별 요약을 출력하고 JSON으로 저장한다.
+"""
+
+import json
+import threading
+from pathlib import Path
+from utils.text_width import pad
+
+
+class LLMUsageTracker:
+    """LLM 호출 사용량 집계기 (모듈 전역 인스턴스 usage_tracker 사용)"""
+
+    # 지연 시간 히스토그램 구간 상한 (ms, 마지막 구간은 무한대)
+    LATENCY_BUCKETS_MS = (250, 500, 1000, 2000, 4000, 8000, 16000)
+
+    # 모델별 1M 토큰당 가격 (USD, 입력/출력) - 예산 추정용
+    PRICE_PER_1M_TOKENS = {
+        'gpt-4o-mini': (0.15, 0.60),
+        'gpt-4o': (2.50, 10.00),
+    }
+
+    def __init__(self):
+        self._local = threading.local()
+        self.reset()
+
+    @property
+    def meeting_type(self):
+        """현재 스레드의 회의 유형 (회의록을 여러 스레드에서 동시에 생성해도 섞이지 않음)"""
+        return getattr(self._local, 'meeting_type', '기타')
+
+    @meeting_type.setter
+    def meeting_type(self, value):
+        self._local.meeting_type = value
+
+    def reset(self):
+        """집계 초기화"""
+        self.calls = []       # 호출별 기록
+        self.fallbacks = {}   # (에이전트, 회의 유형) -> 템플릿 대체 횟수
+
+    def record_call(self, agent, model, prompt_tokens, completion_tokens, latency_ms, retries, ok,
+                    stop_reason=None):
+        """
+        LLM 호출 1건 기록
+
+        Args:
+            agent: 호출 에이전트 이름 (없으면 '-')
+            model: 모델명
+            prompt_tokens / completion_tokens: response.usage 토큰 수 (실패 시 0)
+            latency_ms: 재시도 포함 전체 소요 시간
+            retries: 재시도 횟수
+            ok: 응답 수신 성공 여부
+            stop_reason: 스트리밍 조기 종료 사유 ('prefix' 태그 불일치, 'sentences' 문장 수 도달)
+        """
+        self.calls.append({
+            'agent': agent or '-',
+            'meeting_type': self.meeting_type,
+            'model': model,
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'latency_ms': latency_ms,
+            'retries': retries,
+            'ok': ok,
+            'stop_reason': stop_reason
+        })
+
+    def record_fallback(self, agent):
+        """LLM 응답 대신 기본 템플릿 사용 (실패 또는 형식 불일치)"""
+        key = (agent, self.meeting_type)
+        self.fallbacks[key] = self.fallbacks.get(key, 0) + 1
+
+    @property
+    def has_activity(self):
+        return bool(self.calls or self.fallbacks)
+
+    def _aggregate(self, calls, fallbacks):
+        latencies = sorted(call['latency_ms'] for call in calls)
+        prompt_tokens = sum(call['prompt_tokens'] for call in calls)
+        completion_tokens = sum(call['completion_tokens'] for call in calls)
+
+        histogram = [0] * (len(self.LATENCY_BUCKETS_MS) + 1)
+        for latency in latencies:
+            index = 0
+            while index < len(self.LATENCY_BUCKETS_MS) and latency > self.LATENCY_BUCKETS_MS[index]:
+                index += 1
+            histogram[index] += 1
+
+        def percentile(q):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+        return {
+            'calls': len(calls),
+            'failures': sum(1 for call in calls if not call['ok']),
+            'retries': sum(call['retries'] for call in calls),
+            'fallbacks': fallbacks,
+            'early_stops': {
+                reason: sum(1 for call in calls if call.get('stop_reason') == reason)
+                for reason in ('prefix', 'sentences')
+            },
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'estimated_cost_usd': self._estimate_cost(calls),
+            'latency_ms': {
+                'total': sum(latencies),
+                'mean': sum(latencies) / len(latencies) if latencies else 0.0,
+                'p50': percentile(0.5),
+                'p95': percentile(0.95),
+                'max': latencies[-1] if latencies else 0.0,
+                'histogram': histogram
+            }
+        }
+
+    def _estimate_cost(self, calls):
+        cost = 0.0
+        for call in calls:
+            price = self.PRICE_PER_1M_TOKENS.get(call['model'])
+            if price:
+                cost += (call['prompt_tokens'] * price[0] + call['completion_tokens'] * price[1]) / 1e6
+        return cost
+
+    def get_summary(self):
+        """
+        사용량 요약
+
+        Returns:
+            {'total', 'by_agent', 'by_meeting_type', 'by_agent_meeting', 'latency_buckets_ms'}
+        """
+        def group(key_func):
+            keys = {key_func(call['agent'], call['meeting_type']) for call in self.calls}
+            keys |= {key_func(agent, meeting) for agent, meeting in self.fallbacks}
+            return {
+                key: self._aggregate(
+                    [c for c in self.calls if key_func(c['agent'], c['meeting_type']) == key],
+                    sum(n for (a, m), n in self.fallbacks.items() if key_func(a, m) == key)
+                )
+                for key in sorted(keys)
+            }
+
+        return {
+            'total': self._aggregate(self.calls, sum(self.fallbacks.values())),
+            'by_agent': group(lambda agent, meeting: agent),
+            'by_meeting_type': group(lambda agent, meeting: meeting),
+            'by_agent_meeting': {
+                f"{agent}/{meeting}": value
+                for (agent, meeting), value in group(lambda agent, meeting: (agent, meeting)).items()
+            },
+            'latency_buckets_ms': list(self.LATENCY_BUCKETS_MS) + ['inf']
+        }
+
+    def export_json(self, filepath, include_calls=True):
+        """요약(및 호출별 기록) JSON 저장"""
+        data = self.get_summary()
+        if include_calls:
+            data['calls'] = self.calls
+
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return filepath
+
+    def print_summary(self):
+        """에이전트별 사용량 요약 출력"""
+        summary = self.get_summary()
+        total = summary['total']
+
+        print(f"\n{'='*70}")
+        print("LLM 사용량 요약")
+        print(f"{'='*70}")
+        print(f"호출: {total['calls']}건 (실패 {total['failures']}, 재시도 {total['retries']}, "
+              f"템플릿 대체 {total['fallbacks']})")
+        print(f"토큰: 입력 {total['prompt_tokens']:,} / 출력 {total['completion_tokens']:,} "
+              f"(추정 비용 ${total['estimated_cost_usd']:.4f})")
+        print(f"지연: 평균 {total['latency_ms']['mean']:.0f}ms, p95 {total['latency_ms']['p95']:.0f}ms, "
+              f"누적 {total['latency_ms']['total']/1000:.1f}초")
+        if any(total['early_stops'].values()):
+            print(f"스트리밍 조기 종료: 태그 불일치 {total['early_stops']['prefix']}, "
+                  f"문장 수 도달 {total['early_stops']['sentences']}")
+
+        print(f"\n{pad('에이전트', 10)}{pad('호출', 6, 'right')}{pad('입력 토큰', 12, 'right')}"
+              f"{pad('출력 토큰', 12, 'right')}{pad('평균(ms)', 10, 'right')}{'p95(ms)':>10}{pad('대체', 6, 'right')}")
+        for agent, entry in summary['by_agent'].items():
+            print(f"{pad(agent, 10)}{entry['calls']:>6}{entry['prompt_tokens']:>12,}{entry['completion_tokens']:>12,}"
+                  f"{entry['latency_ms']['mean']:>10.0f}{entry['latency_ms']['p95']:>10.0f}{entry['fallbacks']:>6}")
+
+        print("\n[회의 유형별]")
+        for meeting, entry in summary['by_meeting_type'].items():
+            print(f"  {meeting}: {entry['calls']}건, 토큰 {entry['prompt_tokens'] + entry['completion_tokens']:,}, "
+                  f"누적 {entry['latency_ms']['total']/1000:.1f}초")
+        print(f"{'='*70}\n")
+
+
+usage_tracker = LLMUsageTracker()
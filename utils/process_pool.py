@@ -0,0 +1,33 @@
+"""
+프로세스 풀 생성 (병렬 평가/실행 공용)
+
+fork 가능한 환경에서는 fork로 워커를 띄워 부모에 올린 모듈/데이터(스냅샷, 이슈 카드, 평가기)를
+복사 없이 공유하고, 그렇지 않으면 플랫폼 기본 방식(spawn)을 쓴다.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def fork_available():
+    """fork 시작 방식을 쓸 수 있는지"""
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def pool_context():
+    """워커 시작 컨텍스트 (fork 가능하면 fork, 아니면 기본)"""
+    return multiprocessing.get_context('fork' if fork_available() else None)
+
+
+def process_pool(max_workers, initializer=None, initargs=(), context=None):
+    """
+    워커 프로세스 풀
+
+    Args:
+        max_workers: 프로세스 수
+        initializer: 워커 시작 시 호출할 함수 (모듈 전역에 공유 객체 등록)
+        initargs: initializer 인자
+        context: 시작 컨텍스트 (기본: pool_context(), 큐 등을 같은 컨텍스트로 만들 때 지정)
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context or pool_context(),
+                               initializer=initializer, initargs=initargs)
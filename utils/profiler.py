@@ -0,0 +1,219 @@
+"""
+실행 시간 계측 (핵심 경로 타이머/카운터)
+
+비활성 상태에서는 플래그 확인 한 번으로 원래 함수를 그대로 호출한다.
+활성화하면 구간별 호출 수/누적 시간을 단계(설계/입찰/시공/준공)별로 집계하고
+JSON 프로파일 또는 Chrome trace(chrome://tracing, Perfetto) 파일로 내보낸다.
+"""
+
+import os
+import json
+import functools
+from time import perf_counter_ns
+from pathlib import Path
+from utils.text_width import pad
+
+
+class _NullSection:
+    """비활성 시 사용하는 빈 구간"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    """활성 시 구간 타이머"""
+
+    __slots__ = ('profiler', 'name', 'phase', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.phase = self.profiler.phase
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = perf_counter_ns() - self.start
+        self.profiler._record(self.name, self.phase, self.start, elapsed)
+        return False
+
+
+class Profiler:
+    """구간 계측기 (모듈 전역 인스턴스 profiler 사용)"""
+
+    # Chrome trace 이벤트 최대 보관 수 (초과분은 집계만)
+    MAX_TRACE_EVENTS = 200_000
+
+    def __init__(self):
+        self.enabled = False
+        self.trace = False
+        self.reset()
+
+    def reset(self):
+        """집계 초기화"""
+        self.phase = '-'
+        self.stats = {}       # (phase, name) -> [호출 수, 누적 ns, 최대 ns]
+        self.counters = {}    # (phase, name) -> 값
+        self.events = []      # (name, phase, 시작 ns, 소요 ns)
+        self.origin = perf_counter_ns()
+
+    def enable(self, trace=False):
+        """
+        계측 시작
+
+        Args:
+            trace: True면 Chrome trace용 개별 이벤트도 기록
+        """
+        self.reset()
+        self.enabled = True
+        self.trace = trace
+
+    def disable(self):
+        self.enabled = False
+
+    def section(self, name):
+        """계측 구간 (with profiler.section('이름'): ...)"""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def count(self, name, value=1):
+        """카운터 증가"""
+        if not self.enabled:
+            return
+        key = (self.phase, name)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def _record(self, name, phase, start, elapsed):
+        stat = self.stats.get((phase, name))
+        if stat is None:
+            self.stats[(phase, name)] = [1, elapsed, elapsed]
+        else:
+            stat[0] += 1
+            stat[1] += elapsed
+            if elapsed > stat[2]:
+                stat[2] = elapsed
+
+        if self.trace and len(self.events) < self.MAX_TRACE_EVENTS:
+            self.events.append((name, phase, start, elapsed))
+
+    def get_profile(self):
+        """
+        집계 결과
+
+        Returns:
+            {'wall_time_ms', 'sections': {이름: {...}}, 'phases': {단계: {이름: {...}}}, 'counters'}
+        """
+        sections = {}
+        phases = {}
+        for (phase, name), (calls, total, longest) in self.stats.items():
+            entry = {'calls': calls, 'total_ms': total / 1e6, 'max_ms': longest / 1e6}
+            phases.setdefault(phase, {})[name] = entry
+
+            merged = sections.setdefault(name, {'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            merged['calls'] += calls
+            merged['total_ms'] += entry['total_ms']
+            merged['max_ms'] = max(merged['max_ms'], entry['max_ms'])
+
+        for entry in sections.values():
+            entry['mean_ms'] = entry['total_ms'] / entry['calls']
+
+        counters = {}
+        for (phase, name), value in self.counters.items():
+            counters.setdefault(name, {'total': 0, 'by_phase': {}})
+            counters[name]['total'] += value
+            counters[name]['by_phase'][phase] = value
+
+        return {
+            'wall_time_ms': (perf_counter_ns() - self.origin) / 1e6,
+            'sections': dict(sorted(sections.items(), key=lambda kv: -kv[1]['total_ms'])),
+            'phases': phases,
+            'counters': counters
+        }
+
+    def export_json(self, filepath):
+        """집계 결과 JSON 저장"""
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.get_profile(), f, ensure_ascii=False, indent=2)
+        return filepath
+
+    def export_chrome_trace(self, filepath):
+        """Chrome trace 이벤트 형식 저장 (trace=True로 활성화한 경우 구간별 이벤트 포함)"""
+        pid = os.getpid()
+        events = [
+            {
+                'name': name,
+                'cat': phase,
+                'ph': 'X',
+                'ts': (start - self.origin) / 1e3,
+                'dur': elapsed / 1e3,
+                'pid': pid,
+                'tid': 0,
+                'args': {'phase': phase}
+            }
+            for name, phase, start, elapsed in self.events
+        ]
+
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms',
+                       'otherData': {'profile': self.get_profile()}}, f, ensure_ascii=False)
+        return filepath
+
+    def print_summary(self, top=15):
+        """구간별 시간 요약 출력"""
+        profile = self.get_profile()
+        print(f"\n{'='*70}")
+        print(f"실행 시간 프로파일 (전체 {profile['wall_time_ms']:,.1f}ms)")
+        print(f"{'='*70}")
+        print(f"{pad('구간', 36)}{pad('호출', 8, 'right')}"
+              f"{pad('누적(ms)', 12, 'right')}{pad('평균(ms)', 12, 'right')}")
+        for name, entry in list(profile['sections'].items())[:top]:
+            print(f"{pad(name, 36)}{entry['calls']:>8}{entry['total_ms']:>12.2f}{entry['mean_ms']:>12.3f}")
+
+        print("\n[단계별 누적 시간 (ms)]")
+        for phase, entries in profile['phases'].items():
+            parts = ', '.join(
+                f"{name} {entry['total_ms']:.1f}"
+                for name, entry in sorted(entries.items(), key=lambda kv: -kv[1]['total_ms'])[:3]
+            )
+            print(f"  {phase}: {parts}")
+
+        if profile['counters']:
+            print("\n[카운터]")
+            for name, counter in profile['counters'].items():
+                print(f"  {name}: {counter['total']}")
+        print(f"{'='*70}\n")
+
+
+profiler = Profiler()
+
+
+def profiled(name):
+    """
+    함수 계측 데코레이터 (비활성 시 원래 함수 직접 호출)
+
+    Args:
+        name: 구간 이름 (예: 'engine.process_issue')
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            with _Section(profiler, name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
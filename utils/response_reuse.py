@@ -0,0 +1,167 @@
+"""
+에이전트 응답 재사용 (유사 프롬프트의 LLM 응답 재사용, 선택 사항)
+
+같은 이슈/에이전트/탐지 여부에서 일자나 지연/비용 수치만 조금 다른 프롬프트는
+응답이 사실상 같으므로, 변동 수치를 구간화한 정규형으로 키를 만들고
+정확히 일치하거나 문자 n-gram 유사도가 기준 이상이면 저장된 응답을 반환한다.
+비활성 상태(기본)에서는 아무 것도 하지 않는다.
+"""
+
+import re
+import json
+import hashlib
+from pathlib import Path
+
+_DAY = re.compile(r'Day (\d+)')
+_MONEY = re.compile(r'\d{1,3}(?:,\d{3})+')
+_DECIMAL = re.compile(r'\d+\.\d+')
+# 이전 대화 구간은 빈 줄에서 끝남 (format_context_for_prompt는 구간 안에 빈 줄을 두지 않음, 뒤의 지시문은 유지)
+_CONTEXT_SECTION = re.compile(r'## 이전 대화 내용\n.*?(?=\n\n|\n## |\Z)', re.S)
+_DETECTED = re.compile(r'탐지 여부: (예|아니오)')
+
+
+class ResponseReuseCache:
+    """정규화 키 + n-gram 유사도 응답 재사용 (모듈 전역 인스턴스 response_cache 사용)"""
+
+    # 기본값: 일자 90일 구간, 소수 0.5 단위, 금액 유효숫자 2자리, 3-gram Jaccard 0.85 이상
+    DAY_BUCKET = 90
+    DECIMAL_STEP = 0.5
+    MONEY_DIGITS = 2
+    NGRAM = 3
+    THRESHOLD = 0.85
+
+    def __init__(self):
+        self.enabled = False
+        self.threshold = self.THRESHOLD
+        self.day_bucket = self.DAY_BUCKET
+        self.clear()
+
+    def enable(self, threshold=None, day_bucket=None):
+        """
+        재사용 시작
+
+        Args:
+            threshold: 유사도 기준 (1.0이면 정규형 완전 일치만 재사용)
+            day_bucket: 일자 구간 크기 (일)
+        """
+        self.enabled = True
+        self.threshold = self.THRESHOLD if threshold is None else threshold
+        self.day_bucket = day_bucket or self.DAY_BUCKET
+
+    def disable(self):
+        self.enabled = False
+
+    def clear(self):
+        """저장된 응답 및 통계 초기화"""
+        self.exact = {}        # 키 -> 응답
+        self.partitions = {}   # 분할 키 -> [(n-gram 집합, 응답)]
+        self.stats = {'exact_hits': 0, 'similar_hits': 0, 'misses': 0, 'stored': 0}
+
+    def canonicalize(self, text):
+        """
+        변동 필드 정규화
+
+        - 이전 대화 내용 구간 제거 (발언마다 달라지는 대화 잡음)
+        - Day N → 구간 시작일, 소수 → DECIMAL_STEP 단위 반올림, 금액 → 유효숫자 MONEY_DIGITS자리
+        """
+        text = _CONTEXT_SECTION.sub('', text)
+        text = _DAY.sub(lambda m: f"Day {int(m.group(1)) // self.day_bucket * self.day_bucket}", text)
+        text = _MONEY.sub(lambda m: self._round_money(int(m.group(0).replace(',', ''))), text)
+        text = _DECIMAL.sub(
+            lambda m: f"{round(float(m.group(0)) / self.DECIMAL_STEP) * self.DECIMAL_STEP:.1f}", text
+        )
+        return text
+
+    def _round_money(self, value):
+        digits = len(str(value)) - self.MONEY_DIGITS
+        return f"{round(value, -digits) if digits > 0 else value:,}"
+
+    @classmethod
+    def _ngrams(cls, text):
+        text = re.sub(r'\s+', ' ', text)
+        return {text[i:i + cls.NGRAM] for i in range(max(1, len(text) - cls.NGRAM + 1))}
+
+    def _keys(self, agent, issue_id, bim_enabled, messages):
+        # 분할: 공통 접두부/역할 프롬프트(정규형)가 같은 호출끼리만 비교, 유사도는 변동분 메시지로 계산
+        fixed = self.canonicalize('\n'.join(message['content'] for message in messages[:-1]))
+        delta = self.canonicalize(messages[-1]['content'])
+        detected = _DETECTED.search(delta)
+        partition = (agent, issue_id, bim_enabled, detected.group(1) if detected else '-',
+                     hashlib.sha256(fixed.encode('utf-8')).hexdigest()[:16])
+        key = hashlib.sha256(repr((partition, delta)).encode('utf-8')).hexdigest()
+        return partition, key, delta
+
+    def lookup(self, agent, issue_id, bim_enabled, messages):
+        """
+        재사용 가능한 응답 조회
+
+        Returns:
+            응답 문자열 또는 None
+        """
+        if not self.enabled:
+            return None
+
+        partition, key, canonical = self._keys(agent, issue_id, bim_enabled, messages)
+        if key in self.exact:
+            self.stats['exact_hits'] += 1
+            return self.exact[key]
+
+        if self.threshold < 1.0:
+            grams = self._ngrams(canonical)
+            best, best_score = None, self.threshold
+            for stored_grams, response in self.partitions.get(partition, []):
+                score = len(grams & stored_grams) / len(grams | stored_grams)
+                if score >= best_score:
+                    best, best_score = response, score
+            if best is not None:
+                self.stats['similar_hits'] += 1
+                return best
+
+        self.stats['misses'] += 1
+        return None
+
+    def store(self, agent, issue_id, bim_enabled, messages, response):
+        """검증된(역할 태그로 시작하는) 응답 저장"""
+        if not self.enabled:
+            return
+
+        partition, key, canonical = self._keys(agent, issue_id, bim_enabled, messages)
+        if key in self.exact:
+            return
+        self.exact[key] = response
+        self.partitions.setdefault(partition, []).append((self._ngrams(canonical), response))
+        self.stats['stored'] += 1
+
+    def get_stats(self):
+        """조회/저장 통계 (reuse_rate: 조회 중 재사용 비율)"""
+        lookups = self.stats['exact_hits'] + self.stats['similar_hits'] + self.stats['misses']
+        hits = self.stats['exact_hits'] + self.stats['similar_hits']
+        return dict(self.stats, lookups=lookups, reuse_rate=hits / lookups if lookups else 0.0)
+
+    def save(self, filepath):
+        """저장된 응답을 JSON으로 저장 (여러 연구에 걸쳐 재사용)"""
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'exact': self.exact,
+            'partitions': [
+                {'partition': list(partition), 'ngrams': sorted(grams), 'response': response}
+                for partition, items in self.partitions.items() for grams, response in items
+            ]
+        }
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        return filepath
+
+    def load(self, filepath):
+        """save()로 저장한 응답 불러오기 (기존 항목에 추가)"""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.exact.update(data['exact'])
+        for entry in data['partitions']:
+            self.partitions.setdefault(tuple(entry['partition']), []).append(
+                (set(entry['ngrams']), entry['response'])
+            )
+
+
+response_cache = ResponseReuseCache()
@@ -0,0 +1,20 @@
+"""
+터미널 표 정렬용 문자열 폭 (한글 등 전각 문자는 2칸)
+"""
+
+import unicodedata
+
+
+def display_width(text):
+    """터미널 표시 폭 (한글 등 전각 문자는 2칸)"""
+    return sum(2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1 for ch in text)
+
+
+def pad(text, width, align='left'):
+    """표시 폭 기준 채우기"""
+    space = max(0, width - display_width(text))
+    if align == 'right':
+        return ' ' * space + text
+    if align == 'center':
+        return ' ' * (space // 2) + text + ' ' * (space - space // 2)
+    return text + ' ' * space
@@ -0,0 +1,40 @@
+"""
+프롬프트 토큰 예산 (토크나이저 없이 근사 계산)
+"""
+
+
+def estimate_tokens(text):
+    """
+    토큰 수 근사
+
+    한글/한자는 글자당 약 1토큰, 그 외(영문, 숫자, 기호, 공백)는 약 4글자당 1토큰
+    """
+    if not text:
+        return 0
+
+    wide = sum(1 for ch in text if ch >= 'ᄀ')
+    return wide + (len(text) - wide + 3) // 4
+
+
+def truncate_to_tokens(text, max_tokens, marker="…"):
+    """
+    토큰 예산에 맞게 문자열 앞부분만 남김
+
+    Args:
+        text: 원문
+        max_tokens: 최대 토큰 수
+        marker: 잘린 경우 끝에 붙일 표시
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    # 토큰 수는 길이에 단조 증가하므로 이분 탐색
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid]) + estimate_tokens(marker) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+
+    return text[:low].rstrip() + marker if low else ""